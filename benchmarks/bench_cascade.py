@@ -0,0 +1,115 @@
+"""Threshold sweep of the model cascade.
+
+Analyzes synthetic transcripts through ModelCascadeAnalyzer with two fake tiers: a
+small model that is fast and cheap but whose confidence varies per transcript, and
+a large model that is slow, expensive and confident. For each --min-confidence it
+reports the escalation rate, mean latency, cost relative to sending everything to
+the large model, and the share of results below the quality bar (the final
+confidence under --quality-bar). Results are written as JSON.
+
+Usage:
+    python benchmarks/bench_cascade.py [--thresholds 0.5,0.6,0.7,0.8,0.9] [--transcripts 200]
+        [--small-latency 0.02] [--large-latency 0.1] [--cost-ratio 10] [--output results.json]
+"""
+import argparse
+import asyncio
+import json
+import pathlib
+import platform
+import random
+import statistics
+import sys
+import time
+
+ROOT = pathlib.Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "src"))
+
+from bench_parser import make_transcript
+from Infrastructure.LLM.cascade_analyzer import ModelCascadeAnalyzer
+from Infrastructure.LLM.fake_provider import DEFAULT_RESPONSE, FakeLLMProvider, FakeProviderRegistry
+from Infrastructure.LLM.provider_pool import ProviderPool
+from Infrastructure.LLM.spoon_client import SpoonLLMClient
+
+
+def make_responder(low, high):
+    """Answer with a confidence that depends only on the transcript, like a model's difficulty would."""
+    def responder(messages):
+        response = json.loads(json.dumps(DEFAULT_RESPONSE))
+        response['risk_analysis']['confidence'] = round(random.Random(messages[1].content).uniform(low, high), 3)
+        return response
+    return responder
+
+
+def make_tier(model, latency, low, high):
+    provider = FakeLLMProvider(latency=latency, responder=make_responder(low, high))
+    pool = ProviderPool(registry=FakeProviderRegistry(provider))
+    return SpoonLLMClient({'provider': 'fake', 'model': model}, pool=pool)
+
+
+async def run_threshold(transcripts, threshold, args):
+    cascade = ModelCascadeAnalyzer([make_tier('small', args.small_latency, 0.4, 1.0),
+                                    make_tier('large', args.large_latency, 0.9, 1.0)], min_confidence=threshold)
+    latencies, confidences = [], []
+
+    async def analyze(transcript):
+        started = time.perf_counter()
+        result = await cascade.analyze(transcript)
+        latencies.append(time.perf_counter() - started)
+        confidences.append(result.confidence)
+
+    await asyncio.gather(*(analyze(t) for t in transcripts))
+    small, large = cascade.stats()['tiers']
+    cost = small['tokens_sent'] + args.cost_ratio * large['tokens_sent']
+    large_only = args.cost_ratio * small['tokens_sent']
+    return {
+        'min_confidence': threshold,
+        'escalation_rate': cascade.stats()['escalation_rate'],
+        'mean_latency_ms': round(1000 * statistics.mean(latencies), 1),
+        'relative_cost': round(cost / large_only, 4),
+        'below_quality_bar': round(sum(c < args.quality_bar for c in confidences) / len(confidences), 4),
+        'tiers': [small, large]
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--thresholds', default='0.5,0.6,0.7,0.8,0.9', help='Comma-separated min_confidence values')
+    parser.add_argument('--transcripts', type=int, default=200, help='Transcripts per threshold')
+    parser.add_argument('--size-kb', type=float, default=2, help='Transcript size in KB')
+    parser.add_argument('--small-latency', type=float, default=0.02, help='Small model latency in seconds')
+    parser.add_argument('--large-latency', type=float, default=0.1, help='Large model latency in seconds')
+    parser.add_argument('--cost-ratio', type=float, default=10.0, help='Large model cost per token over the small one')
+    parser.add_argument('--quality-bar', type=float, default=0.7, help='Confidence counted as good enough')
+    parser.add_argument('--output', help='Write the JSON results here instead of stdout')
+    args = parser.parse_args()
+
+    transcripts = [make_transcript(int(args.size_kb * 1024), seed=i) for i in range(args.transcripts)]
+    runs = []
+    for threshold in (float(t) for t in args.thresholds.split(',')):
+        run = asyncio.run(run_threshold(transcripts, threshold, args))
+        runs.append(run)
+        print(f"min_confidence={threshold}: {100 * run['escalation_rate']:.1f}% escalated, "
+              f"{run['mean_latency_ms']}ms mean, cost x{run['relative_cost']} of the large model, "
+              f"{100 * run['below_quality_bar']:.1f}% below the quality bar", file=sys.stderr)
+
+    report = {
+        'benchmark': 'cascade',
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'transcripts': args.transcripts,
+        'small_latency_seconds': args.small_latency,
+        'large_latency_seconds': args.large_latency,
+        'cost_ratio': args.cost_ratio,
+        'quality_bar': args.quality_bar,
+        'runs': runs
+    }
+    output = json.dumps(report, indent=2)
+    if args.output:
+        pathlib.Path(args.output).write_text(output, encoding='utf-8')
+    else:
+        print(output)
+
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
@@ -0,0 +1,83 @@
+"""Scalar versus batch cost calculation benchmark.
+
+Calculates the costs of synthetic audit results once per result with
+StandardCostCalculator.calculate_costs and once with calculate_costs_batch on
+columnar inputs, checks that every batch element equals the scalar result, and
+times the aggregates (totals, percentiles, per-team rollups). Requires numpy.
+Results are written as JSON.
+
+Usage:
+    python benchmarks/bench_cost.py [--count 200000] [--teams 20] [--repeat 5] [--output results.json]
+"""
+import argparse
+import json
+import pathlib
+import platform
+import random
+import statistics
+import sys
+import time
+
+ROOT = pathlib.Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+
+from Core.Domain.domain_entities import AuditResult
+from Core.Services.standard_cost_calculator import StandardCostCalculator, audit_result_columns
+
+
+def timed(function, repeat):
+    """Return the last result of function and its median run time in seconds."""
+    times = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = function()
+        times.append(time.perf_counter() - started)
+    return result, statistics.median(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--count', type=int, default=200000, help='Audit results per run')
+    parser.add_argument('--teams', type=int, default=20, help='Distinct teams for the rollups')
+    parser.add_argument('--repeat', type=int, default=5, help='Runs per measurement')
+    parser.add_argument('--output', help='Write the JSON results here instead of stdout')
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    results = [AuditResult(risk_score=rng.random(), risk_factors=['factor'] * rng.randint(0, 5),
+                           recommendations=['recommendation'] * rng.randint(0, 8), summary='', confidence=0.8)
+               for _ in range(args.count)]
+    teams = [f'team-{rng.randrange(args.teams)}' for _ in range(args.count)]
+    calculator = StandardCostCalculator()
+
+    scalar, scalar_seconds = timed(lambda: [calculator.calculate_costs(r) for r in results], args.repeat)
+    columns, columns_seconds = timed(lambda: audit_result_columns(results), args.repeat)
+    batch, batch_seconds = timed(lambda: calculator.calculate_costs_batch(*columns, teams=teams), args.repeat)
+    _, aggregate_seconds = timed(batch.aggregates, args.repeat)
+    mismatches = sum(1 for index, expected in enumerate(scalar) if batch.row(index) != expected)
+    print(f"scalar {scalar_seconds * 1000:.1f}ms, batch {batch_seconds * 1000:.1f}ms "
+          f"(+{columns_seconds * 1000:.1f}ms to build columns), aggregates {aggregate_seconds * 1000:.1f}ms, "
+          f"mismatches {mismatches}", file=sys.stderr)
+
+    report = {
+        'benchmark': 'cost',
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'count': args.count,
+        'teams': args.teams,
+        'scalar_ms': round(scalar_seconds * 1000, 3),
+        'columns_ms': round(columns_seconds * 1000, 3),
+        'batch_ms': round(batch_seconds * 1000, 3),
+        'aggregates_ms': round(aggregate_seconds * 1000, 3),
+        'speedup': round(scalar_seconds / batch_seconds, 1),
+        'mismatches': mismatches
+    }
+    output = json.dumps(report, indent=2)
+    if args.output:
+        pathlib.Path(args.output).write_text(output, encoding='utf-8')
+    else:
+        print(output)
+
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
@@ -0,0 +1,106 @@
+"""Tail-latency benchmark of hedged LLM requests.
+
+Analyzes synthetic transcripts through SpoonLLMClient against a FakeLLMProvider
+with long-tailed (lognormal) latency. It runs once without hedging and once
+through HedgedLLMAnalyzer for each --percentiles value. Reports the p50, p95
+and p99 latency, the share of hedged requests and the extra provider calls they
+cost. Results are written as JSON.
+
+Usage:
+    python benchmarks/bench_hedging.py [--percentiles 90,95] [--requests 1000] [--concurrency 8]
+        [--latency 0.05] [--spread 1.0] [--budget 0.1] [--output results.json]
+"""
+import argparse
+import asyncio
+import json
+import pathlib
+import platform
+import sys
+import time
+
+ROOT = pathlib.Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+
+from Core.Services.latency_stats import percentile
+from Infrastructure.LLM.fake_provider import FakeLLMProvider, FakeProviderRegistry, LatencyModel
+from Infrastructure.LLM.hedged_analyzer import HedgedLLMAnalyzer
+from Infrastructure.LLM.provider_pool import ProviderPool
+from Infrastructure.LLM.spoon_client import SpoonLLMClient
+
+# Requests that only gather the latencies the hedge delay is computed from; left out of the percentiles.
+WARMUP_REQUESTS = 20
+
+
+async def run_case(hedge_percentile, args):
+    provider = FakeLLMProvider(latency=LatencyModel('lognormal', args.latency, args.spread, seed=args.seed))
+    analyzer = SpoonLLMClient({'provider': 'fake', 'model': 'fake'},
+                              pool=ProviderPool(registry=FakeProviderRegistry(provider)))
+    if hedge_percentile is not None:
+        analyzer = HedgedLLMAnalyzer(analyzer, percentile=hedge_percentile, max_hedge_ratio=args.budget,
+                                     min_samples=WARMUP_REQUESTS)
+
+    semaphore = asyncio.Semaphore(args.concurrency)
+    latencies = []
+
+    async def analyze(index):
+        async with semaphore:
+            started = time.perf_counter()
+            await analyzer.analyze(f'Sarah: Status update number {index}?')
+            latencies.append(time.perf_counter() - started)
+
+    await asyncio.gather(*(analyze(i) for i in range(args.requests)))
+    measured = latencies[WARMUP_REQUESTS:]
+    run = {
+        'hedge_percentile': hedge_percentile,
+        'latency_ms': {name: round(1000 * percentile(measured, pct), 1)
+                       for name, pct in (('p50', 50), ('p95', 95), ('p99', 99))},
+        'extra_calls_ratio': round(provider.calls / args.requests - 1, 4)
+    }
+    if hedge_percentile is not None:
+        stats = analyzer.stats()
+        run.update(hedge_ratio=stats['hedge_ratio'], hedge_wins=stats['hedge_wins'],
+                   budget_denied=stats['budget_denied'], hedge_delay_seconds=stats['hedge_delay_seconds'])
+    return run
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--percentiles', default='90,95', help='Comma-separated hedge percentiles')
+    parser.add_argument('--requests', type=int, default=1000, help='Requests per run')
+    parser.add_argument('--concurrency', type=int, default=8, help='Requests in flight')
+    parser.add_argument('--latency', type=float, default=0.05, help='Mean fake LLM latency in seconds')
+    parser.add_argument('--spread', type=float, default=1.0, help='Sigma of the lognormal latency (tail weight)')
+    parser.add_argument('--budget', type=float, default=0.1, help='Largest share of requests hedged')
+    parser.add_argument('--seed', type=int, default=0, help='Latency random seed')
+    parser.add_argument('--output', help='Write the JSON results here instead of stdout')
+    args = parser.parse_args()
+
+    runs = []
+    for hedge_percentile in [None] + [float(p) for p in args.percentiles.split(',')]:
+        run = asyncio.run(run_case(hedge_percentile, args))
+        runs.append(run)
+        latency = run['latency_ms']
+        label = f"hedge at p{hedge_percentile:g}" if hedge_percentile is not None else "no hedging"
+        print(f"{label}: p50 {latency['p50']}ms, p95 {latency['p95']}ms, p99 {latency['p99']}ms, "
+              f"{100 * run['extra_calls_ratio']:.1f}% extra calls", file=sys.stderr)
+
+    report = {
+        'benchmark': 'hedging',
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'requests': args.requests,
+        'concurrency': args.concurrency,
+        'latency_seconds': args.latency,
+        'spread': args.spread,
+        'budget': args.budget,
+        'runs': runs
+    }
+    output = json.dumps(report, indent=2)
+    if args.output:
+        pathlib.Path(args.output).write_text(output, encoding='utf-8')
+    else:
+        print(output)
+
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
@@ -0,0 +1,133 @@
+"""Ingest and query benchmark of the SQLite meeting index.
+
+Indexes synthetic analyses (tasks, questions, scheduled meetings and speaker turns
+for a pool of participants) into a fresh MeetingIndex, then times the typical
+cross-meeting queries. Each query is repeated and its median time reported.
+Results are written as JSON.
+
+Usage:
+    python benchmarks/bench_meeting_index.py [--meetings 100000] [--participants 100]
+        [--tasks 3] [--repeat 5] [--no-turns] [--output results.json]
+"""
+import argparse
+import json
+import os
+import pathlib
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+ROOT = pathlib.Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+
+from Infrastructure.Storage.meeting_index import MeetingIndex
+from Infrastructure.Storage.result_codec import record_from_dict
+
+TOPICS = ('payment service', 'release plan', 'load tests', 'vendor contract', 'SSO feature', 'budget',
+          'database migration', 'onboarding docs', 'incident review', 'pricing page')
+
+
+def make_record(index, participants, tasks, rng):
+    """Build one successful analysis record with a dated transcript."""
+    lead, owner, other = rng.sample(participants, 3)
+    topic = rng.choice(TOPICS)
+    date = f"{2020 + index % 5}-{1 + index % 12:02d}-{1 + index % 28:02d}"
+    transcript = (f"Meeting transcript:\nDate: {date}\n"
+                  f"{lead}: Where are we with the {topic}?\n{owner}: It slipped, we need another week.\n"
+                  f"{other}: I can help with the {topic}.\n{lead}: Then {owner} owns it, {other} reviews.\n"
+                  f"{owner}: Agreed.")
+    return record_from_dict({
+        'test_name': f'meeting-{index}',
+        'success': True,
+        'audit_result': {'risk_score': rng.random(), 'risk_factors': [], 'recommendations': [],
+                         'summary': f'Status of the {topic}.', 'confidence': 0.8},
+        'meeting_report': {
+            'questions': [{'questioner': lead, 'responder': owner, 'question': f'Where are we with the {topic}?',
+                           'answer': 'It slipped.'}],
+            'meetings': [{'location': 'Zoom', 'datetime': 'next Tuesday', 'purpose': f'Review the {topic}'}],
+            'tasks': [{'assigner': lead, 'assignee': rng.choice((owner, other)), 'task': f'Finish the {topic} part {n}',
+                       'deadline': f'{2020 + index % 5}-12-{1 + n:02d}', 'status': rng.choice((None, None, 'done'))}
+                      for n in range(tasks)]
+        },
+        'parsed_content': {'word_count': len(transcript.split()), 'paragraph_count': 7, 'key_terms_found': []},
+        'input_transcript': transcript
+    })
+
+
+def timed(function, repeat):
+    times = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        rows = function()
+        times.append(time.perf_counter() - started)
+    return len(rows), statistics.median(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--meetings', type=int, default=100000, help='Meetings to index')
+    parser.add_argument('--participants', type=int, default=100, help='Distinct participant names')
+    parser.add_argument('--tasks', type=int, default=3, help='Tasks per meeting')
+    parser.add_argument('--repeat', type=int, default=5, help='Runs per query')
+    parser.add_argument('--no-turns', action='store_true', help='Do not index speaker turns')
+    parser.add_argument('--output', help='Write the JSON results here instead of stdout')
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    participants = ['Marcus', 'Sarah', 'Elena'] + [f'Participant {i}' for i in range(args.participants - 3)]
+
+    with tempfile.TemporaryDirectory() as workdir:
+        path = os.path.join(workdir, 'meetings.db')
+        index = MeetingIndex(path, index_turns=not args.no_turns)
+        started = time.perf_counter()
+        index.add_records(make_record(i, participants, args.tasks, rng) for i in range(args.meetings))
+        ingest_seconds = time.perf_counter() - started
+        size = os.path.getsize(path)
+
+        queries = {
+            'open tasks of Marcus in the last 500 meetings':
+                lambda: index.tasks(assignee='marcus', open_only=True, last=500, limit=None),
+            'all tasks of Marcus': lambda: index.tasks(assignee='Marcus', limit=None),
+            'tasks of Marcus due before 2022-12-15':
+                lambda: index.tasks(assignee='Marcus', due_before='2022-12-15', limit=None),
+            'tasks matching "migration" for Elena': lambda: index.tasks(assignee='Elena', text='migration', limit=None),
+            'questions asked by Sarah since 2024-06-01':
+                lambda: index.questions(questioner='Sarah', since='2024-06-01', limit=None),
+            'meetings with risk >= 0.99': lambda: index.meetings(min_risk=0.99, limit=None),
+            'meetings Elena spoke in': lambda: index.meetings(speaker='Elena', limit=None),
+            '100 newest meetings': lambda: index.meetings(limit=100)
+        }
+        if not args.no_turns:
+            queries['turns of Sarah matching "slipped"'] = lambda: index.turns(speaker='Sarah', text='slipped',
+                                                                             limit=100)
+        runs = []
+        for name, function in queries.items():
+            rows, seconds = timed(function, args.repeat)
+            runs.append({'query': name, 'rows': rows, 'ms': round(seconds * 1000, 3)})
+            print(f"{name:<50} rows={rows:<6} {seconds * 1000:.2f}ms", file=sys.stderr)
+        stats = index.stats()
+        index.close()
+
+    report = {
+        'benchmark': 'meeting_index',
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'meetings': args.meetings,
+        'ingest_seconds': round(ingest_seconds, 3),
+        'ingest_per_second': round(args.meetings / ingest_seconds, 1),
+        'database_bytes': size,
+        'rows': stats,
+        'runs': runs
+    }
+    output = json.dumps(report, indent=2)
+    if args.output:
+        pathlib.Path(args.output).write_text(output, encoding='utf-8')
+    else:
+        print(output)
+
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
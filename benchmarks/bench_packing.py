@@ -0,0 +1,141 @@
+"""Token and throughput benchmark of prompt packing.
+
+Analyzes short synthetic stand-up transcripts through AnalyzeMeetingUseCase.execute_many.
+It runs once with one request per transcript and once through PackingLLMAnalyzer
+for each --pack-tokens value. The fake provider answers packed prompts with one
+analysis per transcript ID, and --corrupt-rate of those analyses are malformed so
+the fallback path is exercised. At most --provider-concurrency requests are in
+flight, like the connection or rate limit of a real provider; that limit is what
+bounds the throughput of one request per transcript.
+Reports provider requests, prompt tokens sent (estimated from the messages),
+transcripts per second and fallbacks. Results are written as JSON.
+
+Usage:
+    python benchmarks/bench_packing.py [--pack-tokens 1000,2000] [--transcripts 200] [--size-kb 0.5]
+        [--concurrency 32] [--latency 0.2] [--provider-concurrency 4] [--corrupt-rate 0.05] [--output results.json]
+"""
+import argparse
+import asyncio
+import json
+import pathlib
+import platform
+import random
+import re
+import sys
+import time
+
+ROOT = pathlib.Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "src"))
+
+from bench_parser import make_transcript
+from Infrastructure.LLM.fake_provider import DEFAULT_RESPONSE, FakeLLMProvider, FakeProviderRegistry
+from Infrastructure.LLM.packing_analyzer import PackingLLMAnalyzer
+from Infrastructure.LLM.provider_pool import ProviderPool
+from Infrastructure.LLM.rate_limiter import AdaptiveRateLimiter
+from Infrastructure.LLM.spoon_client import SpoonLLMClient
+from Infrastructure.Parsers.token_counter import estimate_tokens
+from src.use_cases.analyze_meeting import AnalyzeMeetingUseCase
+
+PACKED_IDS = re.compile(r'^=== (T\d+) ===$', re.MULTILINE)
+
+
+class PackingResponder:
+    """Answers single prompts with the canned analysis and packed prompts with one per ID."""
+
+    def __init__(self, corrupt_rate, seed=0):
+        self.corrupt_rate = corrupt_rate
+        self.prompt_tokens = 0
+        self._random = random.Random(seed)
+
+    def __call__(self, messages):
+        self.prompt_tokens += sum(estimate_tokens(message.content) for message in messages)
+        ids = PACKED_IDS.findall(messages[1].content)
+        if not ids:
+            return DEFAULT_RESPONSE
+        analyses = {key: DEFAULT_RESPONSE if self._random.random() >= self.corrupt_rate else "not an analysis"
+                    for key in ids}
+        return {'transcripts': analyses}
+
+
+async def run_case(pack_tokens, transcripts, args):
+    responder = PackingResponder(args.corrupt_rate)
+    provider = FakeLLMProvider(latency=args.latency, responder=responder)
+    rate_limiter = AdaptiveRateLimiter(max_concurrency=args.provider_concurrency)
+    client = SpoonLLMClient({'provider': 'fake', 'model': 'fake'}, rate_limiter=rate_limiter,
+                            pool=ProviderPool(pool_size=args.concurrency, registry=FakeProviderRegistry(provider)))
+    analyzer = client
+    if pack_tokens is not None:
+        analyzer = PackingLLMAnalyzer(client, max_pack_tokens=pack_tokens, max_items=args.max_items,
+                                      max_wait=args.max_wait)
+
+    use_case = AnalyzeMeetingUseCase(analyzer)
+    started = time.perf_counter()
+    failed = 0
+    async for result in use_case.execute_many(transcripts, max_concurrency=args.concurrency):
+        failed += not result['success']
+    elapsed = time.perf_counter() - started
+
+    run = {
+        'pack_tokens': pack_tokens,
+        'requests': provider.calls,
+        'prompt_tokens': responder.prompt_tokens,
+        'failed': failed,
+        'wall_time_seconds': round(elapsed, 3),
+        'transcripts_per_second': round(len(transcripts) / elapsed, 2)
+    }
+    if pack_tokens is not None:
+        run.update(analyzer.stats())
+    return run
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--pack-tokens', default='1000,2000', help='Comma-separated packed request token budgets')
+    parser.add_argument('--transcripts', type=int, default=200, help='Transcripts per run')
+    parser.add_argument('--size-kb', type=float, default=0.5, help='Transcript size in KB')
+    parser.add_argument('--concurrency', type=int, default=32, help='Transcripts analyzed concurrently')
+    parser.add_argument('--max-items', type=int, default=8, help='Most transcripts in one packed request')
+    parser.add_argument('--max-wait', type=float, default=0.05, help='Seconds a transcript waits to be packed')
+    parser.add_argument('--latency', type=float, default=0.2, help='Fake LLM latency per request in seconds')
+    parser.add_argument('--provider-concurrency', type=int, default=4, help='Requests the provider serves at once')
+    parser.add_argument('--corrupt-rate', type=float, default=0.05,
+                        help='Share of packed analyses answered malformed')
+    parser.add_argument('--output', help='Write the JSON results here instead of stdout')
+    args = parser.parse_args()
+
+    transcripts = [make_transcript(int(args.size_kb * 1024), seed=i) for i in range(args.transcripts)]
+    runs = []
+    for pack_tokens in [None] + [int(t) for t in args.pack_tokens.split(',')]:
+        run = asyncio.run(run_case(pack_tokens, transcripts, args))
+        if runs:
+            baseline = runs[0]
+            run['prompt_tokens_saved_ratio'] = round(1 - run['prompt_tokens'] / baseline['prompt_tokens'], 4)
+            run['speedup'] = round(run['transcripts_per_second'] / baseline['transcripts_per_second'], 2)
+        runs.append(run)
+        label = f"packed ({pack_tokens} tokens)" if pack_tokens is not None else "one request per transcript"
+        print(f"{label}: {run['requests']} requests, {run['prompt_tokens']} prompt tokens, "
+              f"{run['transcripts_per_second']}/s, {run.get('fallbacks', 0)} fallbacks, {run['failed']} failed",
+              file=sys.stderr)
+
+    report = {
+        'benchmark': 'packing',
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'transcripts': args.transcripts,
+        'transcript_tokens': estimate_tokens(transcripts[0]),
+        'concurrency': args.concurrency,
+        'latency_seconds': args.latency,
+        'provider_concurrency': args.provider_concurrency,
+        'corrupt_rate': args.corrupt_rate,
+        'runs': runs
+    }
+    output = json.dumps(report, indent=2)
+    if args.output:
+        pathlib.Path(args.output).write_text(output, encoding='utf-8')
+    else:
+        print(output)
+
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
@@ -0,0 +1,114 @@
+"""Benchmark SimpleTextParser.parse_transcript against the original multi-pass parser.
+
+Usage:
+    python benchmarks/bench_parser.py [--sizes 1,10,100] [--repeat 3]
+
+Sizes are in megabytes. Every run also checks that both parsers produce identical output;
+the timings cover parse_transcript only, which no longer materializes paragraph and
+sentence strings until they are accessed.
+"""
+import argparse
+import pathlib
+import random
+import re
+import sys
+import time
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent / "src"))
+
+from Infrastructure.Parsers.simple_text_parser import SimpleTextParser
+
+SPEAKERS = ['Sarah', 'Alex', 'Marcus', 'Elena', 'Tom']
+PHRASES = [
+    'Why did the payment gateway go down yesterday?',
+    'It was a memory leak in the legacy microservice.',
+    'Can you take ownership of the rewrite?',
+    'Yes, I will do it by next Friday.',
+    "Let's meet in the War Room tomorrow at 9:00 AM.",
+    'That is a huge risk without documentation!',
+    'We agreed on the solution during the discussion.',
+    'The next step is to address the open issue.',
+    'Sounds good.',
+]
+
+
+def legacy_parse_transcript(text):
+    """The original implementation, kept verbatim as the reference."""
+    paragraphs = [p.strip() for p in text.split('\n') if p.strip()]
+    sentences = re.split(r'[.!?]+', text)
+    sentences = [s.strip() for s in sentences if s.strip()]
+
+    key_terms = ['risk', 'issue', 'problem', 'concern', 'opportunity', 'solution', 'decision']
+    found_terms = [term for term in key_terms if term.lower() in text.lower()]
+
+    def identify(paragraph):
+        text_lower = paragraph.lower()
+        if any(keyword in text_lower for keyword in ['meeting', 'discussion', 'talk', 'confer']):
+            return 'meeting_summary'
+        elif any(keyword in text_lower for keyword in ['risk', 'danger', 'threat', 'concern']):
+            return 'risk_section'
+        elif any(keyword in text_lower for keyword in ['solution', 'fix', 'resolve', 'address']):
+            return 'solution_section'
+        elif any(keyword in text_lower for keyword in ['decision', 'agree', 'determine', 'choose']):
+            return 'decision_section'
+        elif any(keyword in text_lower for keyword in ['action', 'task', 'step', 'do']):
+            return 'action_items'
+        return 'general_content'
+
+    return {
+        'original_text': text,
+        'paragraphs': paragraphs,
+        'sentences': sentences,
+        'word_count': len(text.split()),
+        'char_count': len(text),
+        'paragraph_count': len(paragraphs),
+        'key_terms_found': found_terms,
+        'structured_content': [
+            {'index': i, 'content': p, 'type': identify(p), 'word_count': len(p.split())}
+            for i, p in enumerate(paragraphs)
+        ]
+    }
+
+
+def make_transcript(size_bytes, seed=0):
+    """Generate a synthetic transcript of roughly the requested size."""
+    rng = random.Random(seed)
+    lines = ['Meeting transcript:', 'Attendees: ' + ', '.join(SPEAKERS), '']
+    size = sum(len(line) + 1 for line in lines)
+    while size < size_bytes:
+        line = f"    {rng.choice(SPEAKERS)}: {rng.choice(PHRASES)} {rng.choice(PHRASES)}"
+        if rng.random() < 0.1:
+            line = ''
+        lines.append(line)
+        size += len(line) + 1
+    return '\n'.join(lines)
+
+
+def best_of(func, text, repeat):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func(text)
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', default='1,10,100', help='Comma-separated input sizes in MB')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per size; the best time is reported')
+    args = parser.parse_args()
+
+    text_parser = SimpleTextParser()
+    print(f"{'size_mb':>8} {'legacy_s':>10} {'single_pass_s':>14} {'speedup':>8}")
+    for size_mb in (float(s) for s in args.sizes.split(',')):
+        text = make_transcript(int(size_mb * 1024 * 1024))
+        if legacy_parse_transcript(text) != text_parser.parse_transcript(text):
+            raise SystemExit(f"Output mismatch at {size_mb} MB")
+        legacy = best_of(legacy_parse_transcript, text, args.repeat)
+        current = best_of(text_parser.parse_transcript, text, args.repeat)
+        print(f"{size_mb:>8g} {legacy:>10.3f} {current:>14.3f} {legacy / current:>7.2f}x")
+
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
@@ -0,0 +1,149 @@
+"""Throughput benchmark of the analysis pipeline against an in-process fake LLM provider.
+
+Runs AnalyzeMeetingUseCase.execute_many with SpoonLLMClient talking to FakeLLMProvider,
+so parsing, prompt building, JSON parsing, cost calculation and result serialization
+are measured without network calls. Results are written as JSON.
+
+Usage:
+    python benchmarks/bench_pipeline.py [--sizes-kb 1,16,256] [--concurrency 1,8,32]
+        [--count 200] [--latency lognormal:0.05:0.5] [--output results.json]
+        [--baseline previous.json --tolerance 0.15]
+
+With --baseline the script exits non-zero when the throughput of any matching case
+dropped by more than the tolerance.
+"""
+import argparse
+import asyncio
+import json
+import pathlib
+import platform
+import resource
+import sys
+import time
+
+ROOT = pathlib.Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "src"))
+
+from bench_parser import make_transcript
+from Core.Services.latency_stats import BatchRunStats
+from Infrastructure.LLM.fake_provider import FakeLLMAnalyzer, FakeLLMProvider, FakeProviderRegistry, LatencyModel
+from Infrastructure.LLM.rate_limiter import RetryPolicy
+from src.use_cases.analyze_meeting import AnalyzeMeetingUseCase
+
+
+def parse_latency(spec):
+    """Parse 'distribution:mean[:spread]' into a LatencyModel."""
+    parts = spec.split(':')
+    mean = float(parts[1]) if len(parts) > 1 else 0.0
+    spread = float(parts[2]) if len(parts) > 2 else 0.0
+    return LatencyModel(parts[0], mean, spread, seed=0)
+
+
+def peak_rss_mb():
+    """Process peak resident set size in MB (a high-water mark, it never decreases)."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return round(peak / 1024 / (1024 if sys.platform == 'darwin' else 1), 2)
+
+
+def build_analyzer(mode, latency):
+    if mode == 'analyzer':
+        return FakeLLMAnalyzer(latency=latency)
+    # Imported here so the 'analyzer' mode works without the SpoonAI SDK installed.
+    from Infrastructure.LLM.provider_pool import ProviderPool
+    from Infrastructure.LLM.spoon_client import SpoonLLMClient
+    pool = ProviderPool(registry=FakeProviderRegistry(FakeLLMProvider(latency=latency)))
+    return SpoonLLMClient({'provider': 'fake', 'model': 'fake'}, pool=pool, retry_policy=RetryPolicy(max_attempts=1))
+
+
+async def run_case(mode, size_kb, concurrency, count, latency_spec):
+    text = make_transcript(int(size_kb * 1024), seed=int(size_kb))
+    use_case = AnalyzeMeetingUseCase(build_analyzer(mode, parse_latency(latency_spec)))
+    transcripts = ({'name': f'bench-{i}', 'transcript': text} for i in range(count))
+    stats = BatchRunStats()
+    bytes_out = 0
+
+    started = time.perf_counter()
+    async for result in use_case.execute_many(transcripts, max_concurrency=concurrency, stats=stats):
+        if not result['success']:
+            raise RuntimeError(f"Benchmark analysis failed: {result['error']}")
+        result['parsed_content'] = result['parsed_content'].to_dict()
+        bytes_out += len(json.dumps(result, ensure_ascii=False, default=str))
+    elapsed = time.perf_counter() - started
+
+    summary = stats.as_dict()
+    return {
+        'mode': mode,
+        'size_kb': size_kb,
+        'concurrency': concurrency,
+        'count': count,
+        'latency_model': latency_spec,
+        'wall_time_seconds': round(elapsed, 4),
+        'transcripts_per_second': round(count / elapsed, 2) if elapsed else 0.0,
+        'latency_seconds': summary['latency_seconds'],
+        'result_bytes': bytes_out,
+        'peak_rss_mb': peak_rss_mb()
+    }
+
+
+def check_baseline(runs, baseline_path, tolerance):
+    """Return a list of regressions against a previous results file."""
+    with open(baseline_path, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)
+    previous = {(r['mode'], r['size_kb'], r['concurrency']): r for r in baseline.get('runs', [])}
+    regressions = []
+    for run in runs:
+        old = previous.get((run['mode'], run['size_kb'], run['concurrency']))
+        if old and run['transcripts_per_second'] < old['transcripts_per_second'] * (1 - tolerance):
+            regressions.append(
+                f"{run['mode']} size={run['size_kb']}KB concurrency={run['concurrency']}: "
+                f"{run['transcripts_per_second']}/s vs baseline {old['transcripts_per_second']}/s"
+            )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--mode', choices=('client', 'analyzer'), default='client',
+                        help="'client' runs SpoonLLMClient on a fake provider, 'analyzer' a fake ILLMAnalyzer")
+    parser.add_argument('--sizes-kb', default='1,16,256', help='Comma-separated transcript sizes in KB')
+    parser.add_argument('--concurrency', default='1,8,32', help='Comma-separated concurrency levels')
+    parser.add_argument('--count', type=int, default=200, help='Transcripts per case')
+    parser.add_argument('--latency', default='constant:0',
+                        help="Fake LLM latency as distribution:mean[:spread] (constant, uniform, lognormal)")
+    parser.add_argument('--output', help='Write the JSON results here instead of stdout')
+    parser.add_argument('--baseline', help='Previous results file to compare throughput against')
+    parser.add_argument('--tolerance', type=float, default=0.15, help='Allowed relative throughput drop')
+    args = parser.parse_args()
+
+    runs = []
+    for size_kb in (float(s) for s in args.sizes_kb.split(',')):
+        for concurrency in (int(c) for c in args.concurrency.split(',')):
+            run = asyncio.run(run_case(args.mode, size_kb, concurrency, args.count, args.latency))
+            runs.append(run)
+            print(f"size={size_kb:g}KB concurrency={concurrency}: {run['transcripts_per_second']}/s "
+                  f"p50={run['latency_seconds']['p50']}s p99={run['latency_seconds']['p99']}s "
+                  f"rss={run['peak_rss_mb']}MB", file=sys.stderr)
+
+    report = {
+        'benchmark': 'pipeline',
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'runs': runs
+    }
+    output = json.dumps(report, indent=2)
+    if args.output:
+        pathlib.Path(args.output).write_text(output, encoding='utf-8')
+    else:
+        print(output)
+
+    if args.baseline:
+        regressions = check_baseline(runs, args.baseline, args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}", file=sys.stderr)
+        if regressions:
+            raise SystemExit(1)
+
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
@@ -0,0 +1,146 @@
+"""Memory and time benchmark of DOCX report generation against batch size.
+
+Writes a synthetic JSONL results file per batch size and renders it with the
+in-memory python-docx generator, the streaming generator and the per-meeting file
+generator, each in a fresh subprocess so peak RSS is measured per case. The
+streaming and per-meeting modes are repeated for every --workers value to show the
+speedup of process-pool rendering. Results are written as JSON.
+
+Usage:
+    python benchmarks/bench_report.py [--meetings 10,100,1000] [--transcript-kb 8]
+        [--modes memory,streaming,streaming-no-transcript,per-meeting] [--shard-size 500]
+        [--workers 1,2,4,8] [--output results.json]
+"""
+import argparse
+import json
+import os
+import pathlib
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = pathlib.Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from bench_parser import make_transcript
+
+
+def make_result(index, transcript):
+    """Build one analysis result shaped like the records main.py writes."""
+    return {
+        'test_name': f'bench-{index}',
+        'success': True,
+        'input_transcript': transcript,
+        'latency_seconds': 1.0,
+        'audit_result': {
+            'risk_score': 0.4,
+            'confidence': 0.8,
+            'summary': 'The team reviewed the release plan and agreed on owners for the open issues.',
+            'risk_factors': ['Deadline depends on an external vendor', 'Missing load tests'],
+            'recommendations': ['Schedule a load test before the release']
+        },
+        'cost_analysis': {'base_cost': 1000.0, 'risk_adjustment': 400.0,
+                          'recommendation_cost': 500.0, 'total_cost': 1900.0},
+        'meeting_report': {
+            'questions': [{'questioner': 'Sarah', 'responder': 'Alex',
+                           'question': 'Is the migration done?', 'answer': 'Next week.'}],
+            'meetings': [{'location': 'Room 4', 'datetime': '2024-05-02 10:00', 'purpose': 'Release review'}],
+            'tasks': [{'assigner': 'Sarah', 'assignee': 'Marcus', 'task': 'Rewrite the payment service',
+                       'deadline': 'Friday'}]
+        }
+    }
+
+
+def write_results(path, meetings, transcript_kb):
+    transcript = make_transcript(int(transcript_kb * 1024), seed=0)
+    with open(path, 'w', encoding='utf-8') as f:
+        for index in range(meetings):
+            f.write(json.dumps(make_result(index, transcript), ensure_ascii=False) + '\n')
+
+
+def render(mode, results_path, output_path, shard_size, workers):
+    """Render one report in this process and return its measurements."""
+    import report_generator
+
+    started = time.perf_counter()
+    if mode == 'memory':
+        paths = [report_generator.create_meeting_analysis_report(results_path, output_path)]
+    elif mode == 'per-meeting':
+        paths = report_generator.create_meeting_report_files(results_path, output_path, workers=workers)
+    else:
+        paths = report_generator.create_streaming_report(
+            results_path, output_path, shard_size=shard_size,
+            include_transcript=mode != 'streaming-no-transcript', workers=workers
+        )
+    elapsed = time.perf_counter() - started
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return {
+        'seconds': round(elapsed, 4),
+        'peak_rss_mb': round(peak / 1024 / (1024 if sys.platform == 'darwin' else 1), 2),
+        'files': len(paths),
+        'output_bytes': sum(os.path.getsize(path) for path in paths)
+    }
+
+
+def run_case(mode, results_path, output_path, shard_size, workers):
+    command = [sys.executable, __file__, '--child', mode, results_path, output_path, str(shard_size or 0),
+               str(workers)]
+    completed = subprocess.run(command, check=True, capture_output=True, text=True)
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def main():
+    if len(sys.argv) > 1 and sys.argv[1] == '--child':
+        mode, results_path, output_path, shard_size, workers = sys.argv[2:7]
+        measurements = render(mode, results_path, output_path, int(shard_size) or None, int(workers))
+        print(json.dumps(measurements))
+        return
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--meetings', default='10,100,1000', help='Comma-separated batch sizes')
+    parser.add_argument('--transcript-kb', type=float, default=8, help='Transcript size per meeting in KB')
+    parser.add_argument('--modes', default='memory,streaming,streaming-no-transcript,per-meeting',
+                        help='Comma-separated generators to compare')
+    parser.add_argument('--workers', default='1',
+                        help='Comma-separated rendering process counts for the streaming and per-meeting modes')
+    parser.add_argument('--shard-size', type=int, help='Meetings per DOCX file in the streaming modes')
+    parser.add_argument('--output', help='Write the JSON results here instead of stdout')
+    args = parser.parse_args()
+
+    runs = []
+    with tempfile.TemporaryDirectory() as workdir:
+        for meetings in (int(m) for m in args.meetings.split(',')):
+            results_path = os.path.join(workdir, f'results_{meetings}.jsonl')
+            write_results(results_path, meetings, args.transcript_kb)
+            for mode in args.modes.split(','):
+                shard_size = args.shard_size if mode != 'memory' else None
+                for workers in ([1] if mode == 'memory' else [int(w) for w in args.workers.split(',')]):
+                    output_path = os.path.join(workdir, f'report_{meetings}_{mode}_{workers}')
+                    if mode != 'per-meeting':
+                        output_path += '.docx'
+                    run = {'mode': mode, 'meetings': meetings, 'transcript_kb': args.transcript_kb,
+                           'shard_size': shard_size, 'workers': workers,
+                           **run_case(mode, results_path, output_path, shard_size, workers)}
+                    runs.append(run)
+                    print(f"meetings={meetings} mode={mode} workers={workers}: {run['seconds']}s "
+                          f"rss={run['peak_rss_mb']}MB files={run['files']}", file=sys.stderr)
+
+    report = {
+        'benchmark': 'report',
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'runs': runs
+    }
+    output = json.dumps(report, indent=2)
+    if args.output:
+        pathlib.Path(args.output).write_text(output, encoding='utf-8')
+    else:
+        print(output)
+
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
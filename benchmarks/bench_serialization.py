@@ -0,0 +1,123 @@
+"""Round-trip benchmark of the results serialization formats.
+
+Compares the original path (stdlib json with indent=2 and default=str on the result
+dict) with the typed result codec in stdlib JSON, orjson and MessagePack flavours.
+Reports encode and decode time per record, bytes per record and whether decoding
+gives back the exact record. Formats whose package is not installed are skipped.
+
+Usage:
+    python benchmarks/bench_serialization.py [--count 2000] [--transcript-kb 4] [--items 5]
+"""
+import argparse
+import json
+import pathlib
+import sys
+import time
+
+ROOT = pathlib.Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+
+from bench_parser import make_transcript
+from Core.Domain.domain_entities import AuditResult
+from Core.Services.standard_cost_calculator import StandardCostCalculator
+from Infrastructure.Parsers.simple_text_parser import SimpleTextParser
+from Infrastructure.Storage import result_codec
+
+
+def make_results(count, transcript_kb, items):
+    """Build results shaped like AnalyzeMeetingUseCase.execute_many output."""
+    transcript = make_transcript(int(transcript_kb * 1024), seed=0)
+    parser = SimpleTextParser()
+    calculator = StandardCostCalculator()
+    results = []
+    for index in range(count):
+        report = {
+            'questions': [{'questioner': 'Sarah', 'responder': 'Alex', 'question': f'Question {i}?',
+                           'answer': f'Answer {i}.'} for i in range(items)],
+            'meetings': [{'location': 'Zoom', 'datetime': f'2024-05-{i + 1:02d} 10:00',
+                          'purpose': 'Follow-up'} for i in range(items)],
+            'tasks': [{'assigner': 'Sarah', 'assignee': 'Marcus', 'task': f'Task {i}',
+                       'deadline': 'Friday'} for i in range(items)]
+        }
+        audit_result = AuditResult(
+            risk_score=0.1 + (index % 9) / 10, risk_factors=['Vendor dependency', 'No load tests'],
+            recommendations=['Add load tests'], summary='Release review.', confidence=0.85,
+            raw_report=report
+        )
+        results.append({
+            'test_name': f'bench-{index}',
+            'success': True,
+            'audit_result': audit_result,
+            'cost_analysis': calculator.calculate_costs(audit_result),
+            'parsed_content': parser.parse_transcript(transcript),
+            'input_transcript': transcript,
+            'latency_seconds': 1.0 + index / 1000
+        })
+    return results
+
+
+def legacy_result(result):
+    """The result dict as main.py used to hand it to json.dump."""
+    data = dict(result)
+    data['parsed_content'] = data['parsed_content'].to_dict()
+    data['meeting_report'] = data['audit_result'].raw_report
+    return data
+
+
+def legacy_encode(result):
+    return json.dumps(result, indent=2, ensure_ascii=False, default=str).encode('utf-8')
+
+
+def timed(function, items):
+    started = time.perf_counter()
+    outputs = [function(item) for item in items]
+    return time.perf_counter() - started, outputs
+
+
+def run_format(name, encode, decode, inputs, expected):
+    encode_seconds, payloads = timed(encode, inputs)
+    decode_seconds, decoded = timed(decode, payloads)
+    count = len(inputs)
+    return {
+        'format': name,
+        'encode_us': round(encode_seconds / count * 1e6, 1),
+        'decode_us': round(decode_seconds / count * 1e6, 1),
+        'bytes': round(sum(len(p) for p in payloads) / count),
+        'lossless': decoded == expected
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--count', type=int, default=2000, help='Records per format')
+    parser.add_argument('--transcript-kb', type=float, default=4, help='Transcript size per record in KB')
+    parser.add_argument('--items', type=int, default=5, help='Questions, meetings and tasks per report')
+    args = parser.parse_args()
+
+    results = make_results(args.count, args.transcript_kb, args.items)
+    records = [result_codec.record_from_result(result) for result in results]
+    legacy_results = [legacy_result(result) for result in results]
+    runs = [run_format('legacy-json-indent', legacy_encode, json.loads, legacy_results, records)]
+
+    orjson = result_codec.orjson
+    result_codec.orjson = None
+    try:
+        runs.append(run_format('codec-json-stdlib', result_codec.encode_json, result_codec.decode_json,
+                               records, records))
+    finally:
+        result_codec.orjson = orjson
+    if orjson is not None:
+        runs.append(run_format('codec-json-orjson', result_codec.encode_json, result_codec.decode_json,
+                               records, records))
+    if result_codec.msgpack is not None:
+        runs.append(run_format('codec-msgpack', result_codec.encode_msgpack, result_codec.decode_msgpack,
+                               records, records))
+
+    for run in runs:
+        print(f"{run['format']:<20} encode={run['encode_us']}us decode={run['decode_us']}us "
+              f"bytes={run['bytes']} lossless={run['lossless']}", file=sys.stderr)
+    print(json.dumps({'benchmark': 'serialization', 'count': args.count, 'runs': runs}, indent=2))
+
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
@@ -0,0 +1,133 @@
+"""Startup benchmark of the lightweight command line paths.
+
+Runs the main.py commands that never call the LLM (--help, parse, cost, report)
+in fresh interpreters under ``python -X importtime`` and reports, per command,
+the median import time and wall time and the heavy modules that were imported.
+Exits non-zero when a command imports a module it must not (the LLM stack,
+python-docx outside of in-memory reports, NumPy outside of cost, ...) or its median import time exceeds
+--budget-ms, so it can guard the startup budget. Results are written as JSON.
+
+Usage:
+    python benchmarks/bench_startup.py [--repeat 5] [--budget-ms 150] [--output results.json]
+"""
+import argparse
+import importlib.util
+import json
+import os
+import pathlib
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = pathlib.Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from bench_parser import make_transcript
+from bench_report import write_results
+
+# Modules only the analysis, queue and in-memory report paths may load.
+HEAVY_MODULES = ('spoon_ai', 'dotenv', 'docx', 'redis', 'numpy', 'asyncio', 'sqlite3', 'http.server')
+# Heavy modules a command needs: cost recalculates the whole file as one NumPy batch.
+ALLOWED_MODULES = {'cost': ('numpy',)}
+
+
+def import_profile(stderr):
+    """Return (total top-level import microseconds, imported module names) from -X importtime output."""
+    total = 0
+    modules = set()
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line.split('|')
+        modules.add(name.strip())
+        if not name[1:].startswith(' '):
+            total += int(cumulative)
+    return total, modules
+
+
+def run_command(argv, repeat):
+    imports, walls, modules = [], [], set()
+    for _ in range(repeat):
+        started = time.perf_counter()
+        completed = subprocess.run([sys.executable, '-X', 'importtime', str(ROOT / 'main.py'), *argv],
+                                   stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, cwd=ROOT)
+        walls.append(time.perf_counter() - started)
+        if completed.returncode != 0:
+            raise SystemExit(f"main.py {' '.join(argv)} failed:\n{completed.stderr[-2000:]}")
+        total, imported = import_profile(completed.stderr)
+        imports.append(total)
+        modules |= imported
+    return {
+        'import_ms': round(statistics.median(imports) / 1000, 1),
+        'wall_ms': round(1000 * statistics.median(walls), 1),
+        'modules': len(modules),
+        'heavy_modules': sorted(m for m in HEAVY_MODULES if m in modules)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=5, help='Runs per command (the median is reported)')
+    parser.add_argument('--transcripts', type=int, default=20, help='Transcripts parsed and results costed')
+    parser.add_argument('--budget-ms', type=float, default=150.0,
+                        help='Maximum median import time of each command')
+    parser.add_argument('--output', help='Write the JSON results here instead of stdout')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        transcripts_dir = os.path.join(workdir, 'transcripts')
+        os.makedirs(transcripts_dir)
+        for index in range(args.transcripts):
+            pathlib.Path(transcripts_dir, f'meeting-{index}.txt').write_text(
+                make_transcript(4096, seed=index), encoding='utf-8')
+        results_path = os.path.join(workdir, 'results.jsonl')
+        write_results(results_path, args.transcripts, 4)
+
+        commands = {
+            'help': ['--help'],
+            'parse': ['parse', '--input', transcripts_dir],
+            'cost': ['cost', results_path]
+        }
+        if importlib.util.find_spec('docx') is not None:
+            # The streaming report only reads python-docx's template file.
+            commands['report'] = ['report', results_path, '--output', os.path.join(workdir, 'report.docx'),
+                                  '--no-transcript']
+        else:
+            print("python-docx is not installed; skipping the report command", file=sys.stderr)
+
+        runs = []
+        for name, argv in commands.items():
+            run = {'command': name, **run_command(argv, args.repeat)}
+            runs.append(run)
+            print(f"{name}: {run['import_ms']}ms imports, {run['wall_ms']}ms wall, {run['modules']} modules, "
+                  f"heavy: {', '.join(run['heavy_modules']) or 'none'}", file=sys.stderr)
+
+    report = {
+        'benchmark': 'startup',
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'budget_ms': args.budget_ms,
+        'runs': runs
+    }
+    output = json.dumps(report, indent=2)
+    if args.output:
+        pathlib.Path(args.output).write_text(output, encoding='utf-8')
+    else:
+        print(output)
+
+    unexpected = {run['command']: [m for m in run['heavy_modules'] if m not in ALLOWED_MODULES.get(run['command'], ())]
+                  for run in runs}
+    violations = [f"{command} imported {', '.join(modules)}" for command, modules in unexpected.items() if modules]
+    violations += [f"{run['command']} imports took {run['import_ms']}ms (budget {args.budget_ms}ms)"
+                   for run in runs if run['import_ms'] > args.budget_ms]
+    for violation in violations:
+        print(f"OVER BUDGET {violation}", file=sys.stderr)
+    if violations:
+        raise SystemExit(1)
+
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
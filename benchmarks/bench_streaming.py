@@ -0,0 +1,138 @@
+"""Latency benchmark of streamed LLM responses.
+
+Analyzes a transcript through SpoonLLMClient against FakeLLMProvider, whose latency
+is spread over the chunks of the response, once with analyze() and once with
+analyze_stream(). Reports the time to the first item, the first task and the
+complete result, the overhead of the incremental JSON parser over json.loads, and
+how many items are recovered from responses cut off at random points. Results are
+written as JSON.
+
+Usage:
+    python benchmarks/bench_streaming.py [--latency 2.0] [--tasks 20] [--chunk-chars 16]
+        [--repeat 5] [--output results.json]
+"""
+import argparse
+import asyncio
+import json
+import pathlib
+import platform
+import random
+import statistics
+import sys
+import time
+
+ROOT = pathlib.Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+
+from Infrastructure.LLM.fake_provider import DEFAULT_RESPONSE, FakeLLMProvider, FakeProviderRegistry
+from Infrastructure.LLM.provider_pool import ProviderPool
+from Infrastructure.LLM.spoon_client import RESPONSE_SECTIONS, SpoonLLMClient
+from Infrastructure.Parsers.incremental_json import IncrementalJsonParser, recover_json_object
+
+
+def make_response(tasks):
+    response = json.loads(json.dumps(DEFAULT_RESPONSE))
+    report = response['meeting_report']
+    report['questions'] = [{'questioner': 'Sarah', 'responder': 'Alex', 'question': f'Status of item {i}?',
+                            'answer': 'On track.'} for i in range(tasks // 2)]
+    report['meetings'] = [{'scheduler': 'Elena', 'datetime': 'Friday 10:00', 'location': 'War Room',
+                           'purpose': 'Release review'}]
+    report['tasks'] = [{'assigner': 'Sarah', 'assignee': 'Marcus', 'task': f'Fix issue number {i}',
+                        'deadline': 'Next Friday'} for i in range(tasks)]
+    return response
+
+
+def make_client(response, latency, chunk_chars):
+    provider = FakeLLMProvider(response, latency=latency, stream_chunk_chars=chunk_chars)
+    pool = ProviderPool(registry=FakeProviderRegistry(provider))
+    return SpoonLLMClient({'provider': 'fake', 'model': 'fake'}, pool=pool)
+
+
+async def time_analyze(client):
+    started = time.perf_counter()
+    await client.analyze('Sarah: Where are we?')
+    elapsed = time.perf_counter() - started
+    return {'first_item': elapsed, 'first_task': elapsed, 'complete': elapsed}
+
+
+async def time_stream(client):
+    started = time.perf_counter()
+    timings = {}
+    async for item in client.analyze_stream('Sarah: Where are we?'):
+        now = time.perf_counter() - started
+        timings.setdefault('first_item', now)
+        if item.section == 'tasks':
+            timings.setdefault('first_task', now)
+        if item.is_final:
+            timings['complete'] = now
+    return timings
+
+
+def median_ms(runs, key):
+    return round(1000 * statistics.median(run[key] for run in runs), 1)
+
+
+def parser_overhead(content, chunk_chars, repeat):
+    chunks = [content[i:i + chunk_chars] for i in range(0, len(content), chunk_chars)]
+    started = time.perf_counter()
+    for _ in range(repeat):
+        json.loads(content)
+    loads = (time.perf_counter() - started) / repeat
+    started = time.perf_counter()
+    for _ in range(repeat):
+        parser = IncrementalJsonParser(RESPONSE_SECTIONS)
+        for chunk in chunks:
+            parser.feed(chunk)
+    incremental = (time.perf_counter() - started) / repeat
+    return {'json_loads_ms': round(1000 * loads, 3), 'incremental_ms': round(1000 * incremental, 3)}
+
+
+def truncation_recovery(response, cuts, seed):
+    content = json.dumps(response)
+    total = len(response['meeting_report']['tasks'])
+    rng = random.Random(seed)
+    recovered = []
+    for _ in range(cuts):
+        data, _ = recover_json_object(content[:rng.randrange(len(content) // 2, len(content))], RESPONSE_SECTIONS)
+        recovered.append(len(((data or {}).get('meeting_report') or {}).get('tasks', [])) / total)
+    return {'cuts': cuts, 'mean_tasks_recovered': round(statistics.mean(recovered), 3)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--latency', type=float, default=2.0, help='Fake LLM latency of a full response in seconds')
+    parser.add_argument('--tasks', type=int, default=20, help='Tasks in the response')
+    parser.add_argument('--chunk-chars', type=int, default=16, help='Characters per streamed chunk')
+    parser.add_argument('--repeat', type=int, default=5, help='Runs per mode (the median is reported)')
+    parser.add_argument('--output', help='Write the JSON results here instead of stdout')
+    args = parser.parse_args()
+
+    response = make_response(args.tasks)
+    modes = {}
+    for mode, measure in (('analyze', time_analyze), ('analyze_stream', time_stream)):
+        runs = [asyncio.run(measure(make_client(response, args.latency, args.chunk_chars)))
+                for _ in range(args.repeat)]
+        modes[mode] = {key: median_ms(runs, key) for key in ('first_item', 'first_task', 'complete')}
+        print(f"{mode}: first item {modes[mode]['first_item']}ms, first task {modes[mode]['first_task']}ms, "
+              f"complete {modes[mode]['complete']}ms", file=sys.stderr)
+
+    report = {
+        'benchmark': 'streaming',
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'latency_seconds': args.latency,
+        'response_bytes': len(json.dumps(response)),
+        'chunk_chars': args.chunk_chars,
+        'time_to_ms': modes,
+        'parser': parser_overhead(json.dumps(response), args.chunk_chars, 200),
+        'truncation': truncation_recovery(response, 200, seed=0)
+    }
+    output = json.dumps(report, indent=2)
+    if args.output:
+        pathlib.Path(args.output).write_text(output, encoding='utf-8')
+    else:
+        print(output)
+
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
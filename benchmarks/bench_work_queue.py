@@ -0,0 +1,125 @@
+"""Scaling benchmark of the distributed work-queue mode.
+
+Enqueues synthetic transcripts, then drains the queue with 1, 2, 4, ... worker
+processes, each running QueueWorker over AnalyzeMeetingUseCase with a fake LLM of
+fixed latency. Reports throughput per worker count, the speedup over one worker,
+and the number of LLM calls made beyond one per transcript (double billing), which
+should be zero. Results are written as JSON.
+
+Usage:
+    python benchmarks/bench_work_queue.py [--workers 1,2,4,8] [--jobs 400] [--concurrency 4]
+        [--latency 0.2] [--queue redis://localhost:6379/15] [--output results.json]
+
+Without --queue every run uses a fresh SQLite queue in a temporary directory.
+"""
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import pathlib
+import platform
+import sys
+import tempfile
+import time
+
+ROOT = pathlib.Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "src"))
+
+from bench_parser import make_transcript
+from Infrastructure.LLM.fake_provider import FakeLLMAnalyzer
+from Infrastructure.Queue.redis_work_queue import RedisWorkQueue
+from Infrastructure.Queue.sqlite_work_queue import SqliteWorkQueue
+from src.use_cases.analyze_meeting import AnalyzeMeetingUseCase
+from src.use_cases.queue_worker import QueueWorker
+
+
+def open_queue(url, namespace):
+    if url.startswith('redis://'):
+        return RedisWorkQueue.from_url(url, namespace=namespace)
+    return SqliteWorkQueue(url)
+
+
+def run_worker(url, namespace, index, concurrency, latency, calls):
+    """Worker process: drain the queue and report how many LLM calls it made."""
+    queue = open_queue(url, namespace)
+    analyzer = FakeLLMAnalyzer(latency=latency)
+    worker = QueueWorker(queue, AnalyzeMeetingUseCase(analyzer), worker_id=f'bench-{os.getpid()}-{index}',
+                         concurrency=concurrency, lease_seconds=30.0, poll_interval=0.05)
+    asyncio.run(worker.run(exit_when_empty=True))
+    queue.close()
+    calls.put(analyzer.calls)
+
+
+def run_case(url, namespace, workers, jobs, concurrency, latency, transcript):
+    queue = open_queue(url, namespace)
+    queue.enqueue((f'meeting-{i}', f'{transcript}\nMeeting number {i}.') for i in range(jobs))
+    queue.close()
+
+    calls = multiprocessing.Queue()
+    started = time.perf_counter()
+    processes = [multiprocessing.Process(target=run_worker, args=(url, namespace, i, concurrency, latency, calls))
+                 for i in range(workers)]
+    for process in processes:
+        process.start()
+    total_calls = sum(calls.get() for _ in processes)
+    for process in processes:
+        process.join()
+    elapsed = time.perf_counter() - started
+
+    queue = open_queue(url, namespace)
+    stats = queue.stats()
+    queue.close()
+    return {
+        'workers': workers,
+        'jobs': jobs,
+        'done': stats['done'],
+        'wall_time_seconds': round(elapsed, 3),
+        'transcripts_per_second': round(jobs / elapsed, 2),
+        'llm_calls': total_calls,
+        'duplicate_llm_calls': total_calls - jobs
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--workers', default='1,2,4,8', help='Comma-separated worker process counts')
+    parser.add_argument('--jobs', type=int, default=400, help='Transcripts per run')
+    parser.add_argument('--concurrency', type=int, default=4, help='Jobs in flight per worker')
+    parser.add_argument('--latency', type=float, default=0.2, help='Fake LLM latency in seconds')
+    parser.add_argument('--size-kb', type=float, default=4, help='Transcript size in KB')
+    parser.add_argument('--queue', help='redis:// URL to benchmark instead of SQLite (uses a fresh namespace per run)')
+    parser.add_argument('--output', help='Write the JSON results here instead of stdout')
+    args = parser.parse_args()
+
+    transcript = make_transcript(int(args.size_kb * 1024), seed=0)
+    runs = []
+    with tempfile.TemporaryDirectory() as workdir:
+        for workers in (int(w) for w in args.workers.split(',')):
+            url = args.queue or os.path.join(workdir, f'queue-{workers}.db')
+            run = run_case(url, f'bench-{time.time_ns()}', workers, args.jobs, args.concurrency, args.latency,
+                           transcript)
+            run['speedup'] = round(run['transcripts_per_second'] / runs[0]['transcripts_per_second'], 2) if runs else 1.0
+            runs.append(run)
+            print(f"workers={workers}: {run['transcripts_per_second']}/s (x{run['speedup']}), "
+                  f"{run['duplicate_llm_calls']} duplicate LLM calls", file=sys.stderr)
+
+    report = {
+        'benchmark': 'work_queue',
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'backend': 'redis' if args.queue else 'sqlite',
+        'concurrency': args.concurrency,
+        'latency_seconds': args.latency,
+        'runs': runs
+    }
+    output = json.dumps(report, indent=2)
+    if args.output:
+        pathlib.Path(args.output).write_text(output, encoding='utf-8')
+    else:
+        print(output)
+
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
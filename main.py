@@ -1,133 +1,918 @@
 import os
-import asyncio
+import argparse
+import contextlib
+import json
 import sys
 import pathlib
-from typing import Dict, Any
-import json
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Dict, Any, Iterable, List, Optional, Sequence, Tuple
 from datetime import datetime
 
 src_path = str(pathlib.Path(__file__).parent / "src")
 sys.path.insert(0, str(pathlib.Path(__file__).parent))
 sys.path.insert(0, src_path)
 
-from dotenv import load_dotenv
-load_dotenv()
+# Imported without the src. prefix: the components report to this module's
+# process-wide instrumentation, and src.Core... would be a separate copy of it.
+from Core.Services.instrumentation import Instrumentation, set_instrumentation
+from src.Infrastructure.Parsers.transcript_loader import load_transcripts
+from src.Infrastructure.Storage.jsonl_results_writer import (
+    JsonlResultsWriter,
+    completed_result_names,
+    iter_jsonl_results
+)
+from src.Infrastructure.Storage.result_codec import loads_json, record_from_dict, record_from_result
+
+# The LLM stack (spoon_ai and the provider SDKs it loads), python-docx, asyncio
+# and the queue and index backends are imported by the commands that use them,
+# so parse, cost and report start without paying for them.
+if TYPE_CHECKING:
+    from src.Infrastructure.Cache.analysis_cache import AnalysisCache
+    from src.Infrastructure.Cache.near_duplicate_index import NearDuplicateIndex
+    from src.Infrastructure.LLM.cascade_analyzer import ModelCascadeAnalyzer
+    from src.Infrastructure.LLM.hedged_analyzer import HedgedLLMAnalyzer
+    from src.Infrastructure.LLM.packing_analyzer import PackingLLMAnalyzer
+    from src.Infrastructure.LLM.rate_limiter import AdaptiveRateLimiter
+    from src.Infrastructure.LLM.routing_analyzer import HeuristicRoutingAnalyzer
+    from src.Infrastructure.LLM.spoon_client import SpoonLLMClient
+    from src.use_cases.analyze_meeting import AnalyzeMeetingUseCase
+
+DEFAULT_MODEL = "gpt-3.5-turbo"
+
+SAMPLE_TRANSCRIPTS = [
+    {
+        "name": "Critical Incident Post-Mortem",
+        "transcript": """
+        Meeting transcript:
+        Attendees: Alex (DevOps), Sarah (CTO), Marcus (Backend)
+        Date: 2023-11-02
+
+        Sarah: Why did the payment gateway go down yesterday?
+        Alex: It was a memory leak in the legacy microservice. We ignored the refactoring ticket.
+
+        Sarah: Marcus, can you take ownership of the rewrite?
+        Marcus: Yes, I will do it.
+        Sarah: I need it done by next Friday, November 10th.
+
+        Alex: We should review the architecture before deploying.
+        Sarah: Agreed. Let's meet in the War Room tomorrow at 9:00 AM to review the diagrams.
+        """
+    },
+    {
+        "name": "Sales & Engineering Sync",
+        "transcript": """
+        Meeting transcript:
+        Attendees: Elena (Sales), Tom (Eng)
+        Date: 2023-11-05
+
+        Elena: Can we deliver the SSO feature by next month for the MegaCorp deal?
+        Tom: No, that's impossible without overtime. It's scheduled for Q2.
+
+        Elena: What if we hire contractors?
+        Tom: We don't have documentation for them. It's a huge risk.
+
+        Elena: I'll set up a budget meeting with Finance.
+        Tom: When?
+        Elena: Let's meet next Tuesday at 2 PM via Zoom.
+
+        Tom: Fine. Please send me the contract details.
+        Elena: I will email them to you by end of day today.
+        """
+    }
+]
+
+
+async def collect_results(app: "AnalyzeMeetingUseCase", transcripts: Iterable[Dict[str, Any]],
+                          max_concurrency: int, slim_results: bool, writer: JsonlResultsWriter):
+    """Run the batch, appending each result to the results file as it completes."""
+    async for result in app.execute_many(transcripts, max_concurrency=max_concurrency):
+        record = record_from_result(result, slim=slim_results)
+        writer.write(record)
+
+        if not record.success:
+            print(f"\nError during analysis of {record.test_name}: {record.error}")
+            continue
 
-from src.Infrastructure.LLM.spoon_client import SpoonLLMClient
-from src.use_cases.analyze_meeting import AnalyzeMeetingUseCase
+        print(f"\nCompleted analysis for: {record.test_name} ({record.latency_seconds:.2f}s)")
+        print(f"Risk Score: {record.audit_result.risk_score}")
+        if record.audit_result.truncated:
+            print("Warning: part of the transcript was not analyzed (a response was cut off or a chunk failed); "
+                  "only the items found in the rest were kept")
 
+        meeting_report = record.meeting_report
+        if meeting_report:
+            q_count = len(meeting_report.questions)
+            m_count = len(meeting_report.meetings)
+            t_count = len(meeting_report.tasks)
+            print(f"Extracted: {q_count} Questions, {m_count} Meetings, {t_count} Tasks")
 
-async def run_analysis():
-    """Run transcript analysis using the proper architecture from src."""
+
+@dataclass
+class Pipeline:
+    """The analysis use case and the components whose statistics are reported after a run."""
+
+    app: "AnalyzeMeetingUseCase"
+    spoon_client: "SpoonLLMClient"
+    rate_limiter: Optional["AdaptiveRateLimiter"] = None
+    router: Optional["HeuristicRoutingAnalyzer"] = None
+    cascade: Optional["ModelCascadeAnalyzer"] = None
+    cache: Optional["AnalysisCache"] = None
+    near_duplicates: Optional["NearDuplicateIndex"] = None
+    # One client, and one hedger and packer when those are on, per model.
+    clients: List["SpoonLLMClient"] = field(default_factory=list)
+    hedgers: List["HedgedLLMAnalyzer"] = field(default_factory=list)
+    packers: List["PackingLLMAnalyzer"] = field(default_factory=list)
+
+
+async def build_pipeline(
+    max_concurrency: int = 4,
+    cache_path: Optional[str] = None,
+    cache_ttl: Optional[float] = None,
+    cache_max_entries: Optional[int] = None,
+    cache_bypass: bool = False,
+    chunk_tokens: Optional[int] = None,
+    pool_size: int = 4,
+    requests_per_minute: Optional[float] = None,
+    tokens_per_minute: Optional[float] = None,
+    max_attempts: int = 5,
+    normalize: bool = False,
+    token_budget: Optional[int] = None,
+    dedup_index_path: Optional[str] = None,
+    dedup_threshold: float = 0.9,
+    heuristic_routing: bool = False,
+    heuristic_threshold: float = 0.8,
+    models: Sequence[str] = (DEFAULT_MODEL,),
+    cascade_min_confidence: float = 0.7,
+    cascade_recall: Optional[float] = None,
+    hedge_percentile: Optional[float] = None,
+    hedge_budget: float = 0.05,
+    hedge_initial_delay: Optional[float] = None,
+    pack_tokens: Optional[int] = None,
+    pack_max_items: int = 8,
+    pack_max_wait: float = 0.05
+) -> Pipeline:
+    """Build the LLM client, its decorators and the analysis use case.
+
+    With several ``models`` each transcript goes to the first one and is escalated
+    to the next only when the result has low confidence, is incomplete or failed.
+    With ``hedge_percentile``, calls slower than that percentile of recent calls
+    are sent a second time and the first result is used. With ``pack_tokens``,
+    short transcripts analyzed at the same time share one request.
+    """
+    from dotenv import load_dotenv
+    from src.Infrastructure.Cache.analysis_cache import AnalysisCache
+    from src.Infrastructure.Cache.near_duplicate_index import NearDuplicateIndex
+    from src.Infrastructure.LLM.cached_analyzer import CachedLLMAnalyzer
+    from src.Infrastructure.LLM.cascade_analyzer import ModelCascadeAnalyzer
+    from src.Infrastructure.LLM.chunked_analyzer import ChunkedLLMAnalyzer
+    from src.Infrastructure.LLM.hedged_analyzer import HedgedLLMAnalyzer
+    from src.Infrastructure.LLM.packing_analyzer import PackingLLMAnalyzer
+    from src.Infrastructure.LLM.provider_pool import get_provider_pool
+    from src.Infrastructure.LLM.rate_limiter import AdaptiveRateLimiter, RetryPolicy
+    from src.Infrastructure.LLM.routing_analyzer import HeuristicRoutingAnalyzer
+    from src.Infrastructure.LLM.spoon_client import SpoonLLMClient
+    from src.Infrastructure.Parsers.heuristic_extractor import HeuristicExtractor
+    from src.Infrastructure.Parsers.transcript_chunker import TranscriptChunker
+    from src.Infrastructure.Parsers.transcript_normalizer import TranscriptNormalizer
+    from src.use_cases.analyze_meeting import AnalyzeMeetingUseCase
+
+    load_dotenv()
     print("Initializing SpoonOS Transcript Analysis Agent...")
 
     config = {
         "api_key": os.getenv("SPOON_API_KEY"),
         "provider": "openai",
-        "model": "gpt-3.5-turbo",
+        "model": models[0],
         "base_url": "https://openrouter.ai/api/v1"
     }
 
-    llm_adapter = SpoonLLMClient(config=config)
-    app = AnalyzeMeetingUseCase(llm_adapter)
+    rate_limiter = None
+    if requests_per_minute or tokens_per_minute:
+        rate_limiter = AdaptiveRateLimiter(
+            requests_per_minute=requests_per_minute,
+            tokens_per_minute=tokens_per_minute,
+            max_concurrency=max_concurrency
+        )
 
-    test_transcripts = [
-        {
-            "name": "Critical Incident Post-Mortem",
-            "transcript": """
-            Meeting transcript:
-            Attendees: Alex (DevOps), Sarah (CTO), Marcus (Backend)
-            Date: 2023-11-02
-
-            Sarah: Why did the payment gateway go down yesterday?
-            Alex: It was a memory leak in the legacy microservice. We ignored the refactoring ticket.
-            
-            Sarah: Marcus, can you take ownership of the rewrite?
-            Marcus: Yes, I will do it.
-            Sarah: I need it done by next Friday, November 10th.
-            
-            Alex: We should review the architecture before deploying.
-            Sarah: Agreed. Let's meet in the War Room tomorrow at 9:00 AM to review the diagrams.
-            """
-        },
-        {
-            "name": "Sales & Engineering Sync",
-            "transcript": """
-            Meeting transcript:
-            Attendees: Elena (Sales), Tom (Eng)
-            Date: 2023-11-05
-
-            Elena: Can we deliver the SSO feature by next month for the MegaCorp deal?
-            Tom: No, that's impossible without overtime. It's scheduled for Q2.
-            
-            Elena: What if we hire contractors?
-            Tom: We don't have documentation for them. It's a huge risk.
-            
-            Elena: I'll set up a budget meeting with Finance.
-            Tom: When?
-            Elena: Let's meet next Tuesday at 2 PM via Zoom.
-            
-            Tom: Fine. Please send me the contract details.
-            Elena: I will email them to you by end of day today.
-            """
-        }
+    normalizer = TranscriptNormalizer(token_budget=token_budget) if normalize or token_budget else None
+    clients = [
+        SpoonLLMClient(
+            config={**config, "model": model},
+            pool=get_provider_pool(pool_size),
+            rate_limiter=rate_limiter,
+            retry_policy=RetryPolicy(max_attempts=max_attempts),
+            normalizer=normalizer
+        )
+        for model in models
     ]
+    spoon_client = clients[0]
+    # Larger cascade tiers connect on first use; most transcripts never reach them.
+    try:
+        ready = await spoon_client.warm_up()
+        print(f"Warmed up {ready} provider connection(s)")
+    except ConnectionError as e:
+        print(f"Warning: provider warm-up failed: {e}")
+
+    hedgers = []
+    if hedge_percentile:
+        hedgers = [HedgedLLMAnalyzer(client, percentile=hedge_percentile, max_hedge_ratio=hedge_budget,
+                                     initial_delay=hedge_initial_delay) for client in clients]
+    tiers = hedgers or clients
+
+    packers = []
+    if pack_tokens:
+        # Packed requests go straight to the client; transcripts sent alone are still hedged.
+        packers = tiers = [PackingLLMAnalyzer(client, fallback=tier, max_pack_tokens=pack_tokens,
+                                              max_items=pack_max_items, max_wait=pack_max_wait)
+                           for client, tier in zip(clients, tiers)]
+    llm_adapter = tiers[0]
+
+    cascade = None
+    if len(tiers) > 1:
+        cascade = llm_adapter = ModelCascadeAnalyzer(
+            tiers,
+            min_confidence=cascade_min_confidence,
+            extractor=HeuristicExtractor() if cascade_recall is not None else None,
+            min_recall=cascade_recall or 0.0
+        )
+
+    if chunk_tokens:
+        llm_adapter = ChunkedLLMAnalyzer(llm_adapter, TranscriptChunker(max_tokens=chunk_tokens))
+
+    router = None
+    if heuristic_routing:
+        router = llm_adapter = HeuristicRoutingAnalyzer(llm_adapter, skip_threshold=heuristic_threshold)
+
+    cache = None
+    if cache_path:
+        cache = AnalysisCache(cache_path, ttl_seconds=cache_ttl, max_entries=cache_max_entries)
+        llm_adapter = CachedLLMAnalyzer(llm_adapter, cache, bypass=cache_bypass)
 
-    results = []
-    for transcript_data in test_transcripts:
-        print(f"\nAnalyzing: {transcript_data['name']}")
-        
-        try:
-            result = await app.execute(transcript_data['transcript'])
-            result["test_name"] = transcript_data["name"]
-            
-            audit_result = result.get('audit_result')
-            
-            meeting_report = {}
-            
-            if hasattr(audit_result, 'raw_report'):
-                meeting_report = audit_result.raw_report
-            elif hasattr(audit_result, 'details') and audit_result.details:
-                try:
-                    meeting_report = json.loads(audit_result.details)
-                except:
-                    pass
-            
-            result['meeting_report'] = meeting_report
-            
-            results.append(result)
-
-            print(f"Completed analysis for: {transcript_data['name']}")
-            print(f"Risk Score: {audit_result.risk_score}")
-            
-            if meeting_report:
-                q_count = len(meeting_report.get('questions', []))
-                m_count = len(meeting_report.get('meetings', []))
-                t_count = len(meeting_report.get('tasks', []))
-                print(f"Extracted: {q_count} Questions, {m_count} Meetings, {t_count} Tasks")
-
-        except Exception as e:
-            print(f"Error during analysis: {str(e)}")
-            import traceback
-            traceback.print_exc()
-
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    filename = f"spoonos_results_{timestamp}.json"
-
-    with open(filename, 'w', encoding='utf-8') as f:
-        json.dump(results, f, indent=2, ensure_ascii=False, default=str)
-
-    print(f"\nAnalysis completed. Results saved to {filename}")
+    near_duplicates = None
+    if dedup_index_path:
+        namespace = f"{config['provider']}/{config['model']}/{llm_adapter.PROMPT_TEMPLATE_VERSION}"
+        near_duplicates = NearDuplicateIndex(dedup_index_path, threshold=dedup_threshold, namespace=namespace)
+
+    app = AnalyzeMeetingUseCase(llm_adapter, near_duplicate_index=near_duplicates)
+    return Pipeline(app=app, spoon_client=spoon_client, rate_limiter=rate_limiter, router=router, cascade=cascade,
+                    cache=cache, near_duplicates=near_duplicates, clients=clients, hedgers=hedgers,
+                    packers=packers)
+
+
+def print_pipeline_stats(pipeline: Pipeline):
+    """Print the LLM, routing, cache and near-duplicate statistics and close the stores."""
+    spoon_client, rate_limiter = pipeline.spoon_client, pipeline.rate_limiter
+    if spoon_client.retries or rate_limiter:
+        throttled = rate_limiter.throttled if rate_limiter else 0
+        print(f"LLM retries: {spoon_client.retries}, rate-limited responses: {throttled}")
+    if spoon_client.truncated_responses:
+        print(f"Truncated LLM responses: {spoon_client.truncated_responses} (partial results kept)")
+    if spoon_client.normalizer is not None and spoon_client.transcript_tokens_before:
+        before, after = spoon_client.transcript_tokens_before, spoon_client.transcript_tokens_after
+        print(f"Transcript tokens sent: {after} of {before} ({100 * (before - after) / before:.1f}% saved)")
+
+    if pipeline.cascade:
+        cascade_stats = pipeline.cascade.stats()
+        print(f"Model cascade: {100 * cascade_stats['escalation_rate']:.1f}% of calls escalated")
+        for tier, client in zip(cascade_stats['tiers'], pipeline.clients):
+            escalations = ', '.join(f"{count} {reason}" for reason, count in tier['escalations'].items() if count)
+            print(f"  {tier['name']}: {tier['calls']} calls, {tier['accepted']} accepted, "
+                  f"{tier['escalated']} escalated{f' ({escalations})' if escalations else ''}, "
+                  f"{tier['failed']} failed, {tier['mean_seconds']:.2f}s mean, {client.retries} retries")
+
+    for hedger in pipeline.hedgers:
+        hedge_stats = hedger.stats()
+        if not hedge_stats['requests']:
+            continue
+        latency = hedge_stats['latency_seconds']
+        delay = hedge_stats['hedge_delay_seconds']
+        print(f"Hedging ({hedger.config.get('model', '')}): {hedge_stats['hedges']} of {hedge_stats['requests']} "
+              f"calls hedged, {hedge_stats['hedge_wins']} won by the hedge, {hedge_stats['budget_denied']} over budget; "
+              f"hedge after {f'{delay:.2f}s' if delay is not None else '(not yet known)'}, "
+              f"p50 {latency['p50']:.2f}s, p95 {latency['p95']:.2f}s, p99 {latency['p99']:.2f}s")
+
+    for packer in pipeline.packers:
+        pack_stats = packer.stats()
+        if not pack_stats['packed_requests'] and not pack_stats['single_transcripts']:
+            continue
+        print(f"Packing ({packer.config.get('model', '')}): {pack_stats['packed_transcripts']} transcripts in "
+              f"{pack_stats['packed_requests']} packed requests ({pack_stats['transcripts_per_request']} per request), "
+              f"{pack_stats['single_transcripts']} sent alone, {pack_stats['fallbacks']} re-sent after a bad packed "
+              f"answer; ~{pack_stats['prompt_tokens_saved']} prompt tokens saved")
+
+    if pipeline.router:
+        routing = pipeline.router.stats()
+        print(f"Heuristic routing: {routing['routes']['skip']} resolved without the LLM, "
+              f"{routing['routes']['segments']} sent as unresolved segments, {routing['routes']['full']} sent in full "
+              f"({100 * routing['tokens_saved_ratio']:.1f}% of transcript tokens not sent)")
+
+    if pipeline.cache:
+        cache_stats = pipeline.cache.stats()
+        print(f"Cache: {cache_stats['hits']} hits, {cache_stats['misses']} misses, "
+              f"{cache_stats['entries']} entries ({cache_stats['bytes']} bytes)")
+        pipeline.cache.close()
+
+    if pipeline.near_duplicates:
+        dedup_stats = pipeline.near_duplicates.stats()
+        print(f"Near-duplicates: {dedup_stats['hits']} reused, {pipeline.app.near_duplicates_rejected} rejected on "
+              f"revalidation, {dedup_stats['skipped']} too short to compare, {dedup_stats['entries']} transcripts indexed")
+        pipeline.near_duplicates.close()
+
+
+async def run_analysis(
+    transcripts: Optional[Iterable[Dict[str, Any]]] = None,
+    max_concurrency: int = 4,
+    slim_results: bool = False,
+    output_path: Optional[str] = None,
+    resume: bool = False,
+    report_shard_size: Optional[int] = None,
+    report_include_transcript: bool = True,
+    report_workers: int = 1,
+    meeting_index_path: Optional[str] = None,
+    **pipeline_options
+):
+    """Run transcript analysis using the proper architecture from src.
+
+    Args:
+        pipeline_options: Keyword arguments of build_pipeline (cache, chunking, rate limits, ...)
+    """
+    pipeline = await build_pipeline(max_concurrency=max_concurrency, **pipeline_options)
+    app = pipeline.app
+
+    if transcripts is None:
+        transcripts = SAMPLE_TRANSCRIPTS
+
+    if output_path is None:
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        output_path = f"spoonos_results_{timestamp}.jsonl"
+
+    if resume:
+        completed = completed_result_names(output_path)
+        if completed:
+            print(f"Resuming: skipping {len(completed)} transcript(s) already in {output_path}")
+        transcripts = (t for t in transcripts if t.get('name') not in completed)
 
     try:
-        from report_generator import create_meeting_analysis_report
-        create_meeting_analysis_report(filename)
-        print(f"DOCX report generated: {filename.replace('.json', '_report.docx')}")
-    except ImportError:
-        print("Note: report_generator.py not found.")
+        with JsonlResultsWriter(output_path) as writer:
+            await collect_results(app, transcripts, max_concurrency, slim_results, writer)
+    finally:
+        await pipeline.spoon_client.pool.aclose()
+
+    stats = app.last_batch_stats.as_dict()
+    print(f"\nBatch stats: {stats['succeeded']} succeeded, {stats['failed']} failed "
+          f"in {stats['wall_time_seconds']:.2f}s ({stats['throughput_per_second']:.2f} transcripts/s, "
+          f"p50 {stats['latency_seconds']['p50']:.2f}s, p95 {stats['latency_seconds']['p95']:.2f}s)")
+    print_pipeline_stats(pipeline)
+
+    print(f"\nAnalysis completed. Results saved to {output_path}")
+
+    if meeting_index_path:
+        index_results([output_path], meeting_index_path)
+
+    generate_report(output_path, report_shard_size, report_include_transcript, report_workers)
+
+
+def generate_report(results_path: str, shard_size: Optional[int] = None, include_transcript: bool = True,
+                    workers: int = 1, output_path: Optional[str] = None):
+    """Write the DOCX report of a results file."""
+    try:
+        from report_generator import create_streaming_report
+        report_paths = create_streaming_report(results_path, output_docx_path=output_path, shard_size=shard_size,
+                                               include_transcript=include_transcript,
+                                               workers=workers)
+        print(f"DOCX report generated: {', '.join(report_paths)}")
+    except ImportError as e:
+        print(f"Note: DOCX report not generated: {e}")
     except Exception as e:
         print(f"Error generating DOCX report: {str(e)}")
 
 
+def open_work_queue(url: str):
+    """Open a work queue: ``redis://host:port/db`` for Redis, anything else is a SQLite file path."""
+    if url.startswith(("redis://", "rediss://", "unix://")):
+        from src.Infrastructure.Queue.redis_work_queue import RedisWorkQueue
+        return RedisWorkQueue.from_url(url)
+    from src.Infrastructure.Queue.sqlite_work_queue import SqliteWorkQueue
+    return SqliteWorkQueue(url[len("sqlite:///"):] if url.startswith("sqlite:///") else url)
+
+
+def enqueue_transcripts(queue_url: str, transcripts: Iterable[Dict[str, Any]]):
+    """Add transcripts to a work queue for `worker` processes."""
+    queue = open_work_queue(queue_url)
+    try:
+        added = queue.enqueue((t['name'], t['transcript']) for t in transcripts)
+        stats = queue.stats()
+        print(f"Enqueued {added} new transcript(s); queue: {stats['pending']} pending, {stats['leased']} leased, "
+              f"{stats['done']} done, {stats['failed']} failed")
+    finally:
+        queue.close()
+
+
+async def run_worker(
+    queue_url: str,
+    max_concurrency: int = 4,
+    slim_results: bool = False,
+    lease_seconds: float = 300.0,
+    job_attempts: int = 3,
+    retry_delay: float = 30.0,
+    exit_when_empty: bool = False,
+    worker_id: Optional[str] = None,
+    **pipeline_options
+):
+    """Analyze transcripts claimed from a work queue until it is drained (or forever)."""
+    from src.use_cases.queue_worker import QueueWorker
+
+    pipeline = await build_pipeline(max_concurrency=max_concurrency, **pipeline_options)
+    queue = open_work_queue(queue_url)
+    worker = QueueWorker(queue, pipeline.app, worker_id=worker_id, concurrency=max_concurrency,
+                         lease_seconds=lease_seconds, max_attempts=job_attempts, retry_delay=retry_delay,
+                         slim_results=slim_results)
+    print(f"Worker {worker.worker_id} polling {queue_url}")
+    try:
+        stats = await worker.run(exit_when_empty=exit_when_empty)
+    finally:
+        await pipeline.spoon_client.pool.aclose()
+        queue.close()
+    print(f"\nWorker {worker.worker_id}: {stats['processed']} analyzed, {stats['retried']} retried, "
+          f"{stats['failed']} failed, {stats['duplicates']} already completed elsewhere, "
+          f"{stats['leases_lost']} leases lost")
+    print_pipeline_stats(pipeline)
+
+
+def collect_queue_results(queue_url: str, output_path: str) -> int:
+    """Write the results stored in a work queue, and its permanent failures, to a JSONL results file."""
+    queue = open_work_queue(queue_url)
+    try:
+        stats = queue.stats()
+        # Rewrite the file, so collecting again does not duplicate records.
+        open(output_path, "wb").close()
+        with JsonlResultsWriter(output_path) as writer:
+            for payload in queue.results():
+                writer.write(loads_json(payload))
+            for name, error in queue.failures():
+                writer.write(record_from_result({"test_name": name, "success": False, "error": error}))
+            written = writer.written
+    finally:
+        queue.close()
+    print(f"Wrote {written} result(s) to {output_path}; queue: {stats['pending']} pending, "
+          f"{stats['leased']} leased, {stats['done']} done, {stats['failed']} failed, "
+          f"{len(stats['workers'])} live worker(s)")
+    return written
+
+
+STAGE_TIMING_FIELDS = ("count", "errors", "total_seconds", "mean_seconds", "max_seconds")
+
+
+def configure_instrumentation(args: argparse.Namespace) -> Optional[Instrumentation]:
+    """Enable per-stage instrumentation and its exporters when any telemetry option is given."""
+    if not (args.trace or args.metrics_port is not None or args.metrics_file or args.trace_allocations):
+        return None
+    from src.Infrastructure.Telemetry.exporters import create_exporters
+
+    instrumentation = Instrumentation(track_allocations=args.trace_allocations)
+    create_exporters(instrumentation, trace_path=args.trace, metrics_port=args.metrics_port)
+    set_instrumentation(instrumentation)
+    for exporter in instrumentation.exporters:
+        if hasattr(exporter, "url"):
+            print(f"Serving Prometheus metrics on {exporter.url}")
+    return instrumentation
+
+
+def finish_instrumentation(instrumentation: Instrumentation, metrics_file: Optional[str] = None):
+    """Print where the time went, write the metrics file and close the exporters."""
+    print("\nStage timings (slowest first):")
+    for stage, stats in instrumentation.summary():
+        line = (f"  {stage:<22} {stats['count']:>6} calls {stats['total_seconds']:>9.3f}s total "
+                f"{1000 * stats['mean_seconds']:>9.1f}ms mean {1000 * stats['max_seconds']:>9.1f}ms max")
+        if stats['errors']:
+            line += f", {stats['errors']} errors"
+        counters = {name: value for name, value in stats.items() if name not in STAGE_TIMING_FIELDS}
+        if counters:
+            line += " (" + ", ".join(f"{name}={value:g}" for name, value in counters.items()) + ")"
+        print(line)
+    if metrics_file:
+        from src.Infrastructure.Telemetry.exporters import write_prometheus_textfile
+        write_prometheus_textfile(instrumentation, metrics_file)
+        print(f"Metrics written to {metrics_file}")
+    instrumentation.close()
+
+
+def index_results(results_paths: List[str], db_path: str, index_turns: bool = True):
+    """Add the successful analyses of JSONL results files to a meeting index."""
+    from src.Infrastructure.Storage.meeting_index import MeetingIndex
+
+    index = MeetingIndex(db_path, index_turns=index_turns)
+    try:
+        for path in results_paths:
+            indexed = index.ingest_results(path)
+            print(f"Indexed {indexed} meeting(s) from {path}")
+        stats = index.stats()
+        print(f"Meeting index {db_path}: {stats['meetings']} meetings, {stats['tasks']} tasks, "
+              f"{stats['questions']} questions, {stats['scheduled_meetings']} scheduled meetings, "
+              f"{stats['turns']} speaker turns")
+    finally:
+        index.close()
+
+
+# Query options accepted by each kind of `query`, as MeetingIndex keyword arguments.
+QUERY_OPTIONS = {
+    "tasks": ("assignee", "assigner", "open_only", "due_before", "due_after"),
+    "questions": ("questioner", "responder"),
+    "scheduled": ("scheduler",),
+    "turns": ("speaker",),
+    "meetings": ()
+}
+MEETING_FILTER_OPTIONS = ("speaker", "min_risk", "max_risk", "since", "until", "last")
+
+
+def query_index(args: argparse.Namespace) -> List[Dict[str, Any]]:
+    """Run a `query` command against a meeting index and print the rows."""
+    from src.Infrastructure.Storage.meeting_index import MeetingIndex
+
+    options = {name: getattr(args, name) for name in QUERY_OPTIONS[args.kind] + MEETING_FILTER_OPTIONS}
+    options = {name: value for name, value in options.items() if value not in (None, False)}
+    index = MeetingIndex(args.db)
+    try:
+        find = {
+            "tasks": index.tasks,
+            "questions": index.questions,
+            "scheduled": index.scheduled_meetings,
+            "turns": index.turns,
+            "meetings": index.meetings
+        }[args.kind]
+        rows = find(text=args.text, limit=args.limit or None, **options)
+    finally:
+        index.close()
+
+    print_rows(rows, as_json=args.json)
+    return rows
+
+
+def print_rows(rows: List[Dict[str, Any]], as_json: bool = False):
+    """Print rows as one JSON object per line, or as tab-separated columns under a header."""
+    if as_json:
+        for row in rows:
+            print(json.dumps(row, ensure_ascii=False))
+    elif rows:
+        print("\t".join(rows[0]))
+        for row in rows:
+            print("\t".join("" if value is None else ",".join(value) if isinstance(value, list) else str(value)
+                            for value in row.values()))
+
+
+def parse_transcripts(transcripts: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Parse transcripts without analyzing them and return their structure statistics."""
+    from src.Infrastructure.Parsers.simple_text_parser import SimpleTextParser
+    from src.Infrastructure.Parsers.token_counter import estimate_tokens
+
+    parser = SimpleTextParser()
+    rows = []
+    for transcript in transcripts:
+        parsed = parser.parse_transcript(transcript["transcript"])
+        rows.append({
+            "name": transcript["name"],
+            "chars": parsed.char_count,
+            "words": parsed.word_count,
+            "paragraphs": parsed.paragraph_count,
+            "sentences": len(parsed.sentences),
+            "estimated_tokens": estimate_tokens(transcript["transcript"]),
+            "key_terms": list(parsed.key_terms_found)
+        })
+    return rows
+
+
+def calculate_result_costs(results_paths: List[str], by_file: bool = False,
+                           **cost_model_options) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+    """Recalculate the costs of the successful analyses in results files in one batch.
+
+    Args:
+        results_paths: JSONL results files written by analyze or collect
+        by_file: Roll the costs up per results file (e.g. one file per team)
+        cost_model_options: CostModel fields overriding the defaults (base_cost, risk_weight, ...)
+
+    Returns:
+        (one row per meeting, the batch aggregates: totals, percentiles and per-file rollups)
+    """
+    from src.Core.Services.standard_cost_calculator import CostModel, StandardCostCalculator
+
+    calculator = StandardCostCalculator(CostModel(**cost_model_options))
+    names, audit_results, files = [], [], []
+    for path in results_paths:
+        for data in iter_jsonl_results(path):
+            record = record_from_dict(data)
+            if not record.success or record.audit_result is None:
+                continue
+            names.append(record.test_name)
+            audit_results.append(record.audit_result)
+            files.append(path)
+
+    batch = calculator.calculate_costs_for(audit_results, teams=files if by_file else None)
+    rows = [
+        {
+            "name": name,
+            "risk_score": batch.risk_score.item(index),
+            "base_cost": batch.base_cost.item(index),
+            "risk_adjustment": batch.risk_adjustment.item(index),
+            "recommendation_cost": batch.recommendation_cost.item(index),
+            "total_cost": batch.total_cost.item(index)
+        }
+        for index, name in enumerate(names)
+    ]
+    return rows, batch.aggregates()
+
+
+def print_cost_aggregates(aggregates: Dict[str, Any]):
+    """Print the totals, total cost percentiles and per-file rollups of a cost batch."""
+    count = aggregates["count"]
+    print(f"\n{count} meeting(s), total cost {aggregates['total_cost']:.2f}, "
+          f"mean {aggregates['mean_total_cost']:.2f}, max {aggregates['max_total_cost']:.2f}")
+    print(f"base {aggregates['base_cost']:.2f}, risk adjustment {aggregates['risk_adjustment']:.2f}, "
+          f"recommendations {aggregates['recommendation_cost']:.2f}")
+    print("total cost " + ", ".join(f"{name} {value:.2f}" for name, value in aggregates["percentiles"].items()))
+    if "by_team" in aggregates:
+        print()
+        print_rows([{"file": name, **{key: round(value, 2) if isinstance(value, float) else value
+                                      for key, value in rollup.items()}}
+                    for name, rollup in aggregates["by_team"].items()])
+
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    """Build the command line interface."""
+    parser = argparse.ArgumentParser(description="SpoonOS Transcript Analyzer")
+    subparsers = parser.add_subparsers(dest="command")
+
+    # Options shared by the commands that run analyses.
+    pipeline = argparse.ArgumentParser(add_help=False)
+    pipeline.add_argument("--max-concurrency", type=int, default=4,
+                          help="Maximum number of transcripts analyzed concurrently")
+    pipeline.add_argument("--cache", help="Path of the SQLite cache of analysis results")
+    pipeline.add_argument("--cache-ttl", type=float, default=7 * 24 * 3600,
+                          help="Seconds before a cached analysis expires")
+    pipeline.add_argument("--cache-max-entries", type=int, default=10000,
+                          help="Maximum number of cached analyses kept (least recently used are evicted)")
+    pipeline.add_argument("--cache-bypass", action="store_true",
+                          help="Ignore cached analyses and refresh them from the LLM")
+    pipeline.add_argument("--chunk-tokens", type=int,
+                          help="Split transcripts longer than this many tokens into chunks analyzed in parallel")
+    pipeline.add_argument("--slim-results", action="store_true",
+                          help="Leave the raw transcript text out of the results file")
+    pipeline.add_argument("--pool-size", type=int, default=4,
+                          help="Number of pooled provider connections per provider configuration")
+    pipeline.add_argument("--rpm", type=float, help="Requests-per-minute budget for LLM calls")
+    pipeline.add_argument("--tpm", type=float, help="Tokens-per-minute budget for LLM calls")
+    pipeline.add_argument("--max-attempts", type=int, default=5,
+                          help="Attempts per LLM call before a transient failure is reported")
+    pipeline.add_argument("--dedup-index", help="Path of the SQLite near-duplicate index; transcripts similar to "
+                                                "an indexed one reuse its analysis")
+    pipeline.add_argument("--dedup-threshold", type=float, default=0.9,
+                          help="Minimum estimated Jaccard similarity for reusing an analysis")
+    pipeline.add_argument("--heuristic-routing", action="store_true",
+                          help="Extract simple transcripts with rules and send only unresolved turns to the LLM")
+    pipeline.add_argument("--heuristic-threshold", type=float, default=0.8,
+                          help="Minimum rule-based extraction confidence for skipping the LLM")
+    pipeline.add_argument("--models", default=DEFAULT_MODEL,
+                          help="Model, or comma-separated models from cheapest to largest; each transcript goes "
+                               "to the next model only when the previous result is not good enough")
+    pipeline.add_argument("--cascade-min-confidence", type=float, default=0.7,
+                          help="Lowest result confidence accepted without escalating to the next model")
+    pipeline.add_argument("--cascade-recall", type=float,
+                          help="Also escalate reports with fewer than this share of the items the rules find")
+    pipeline.add_argument("--hedge-percentile", type=float,
+                          help="Send a second request when an LLM call runs past this percentile of recent "
+                               "latencies (e.g. 95); the first result is used")
+    pipeline.add_argument("--hedge-budget", type=float, default=0.05,
+                          help="Largest share of LLM calls that may be hedged")
+    pipeline.add_argument("--hedge-initial-delay", type=float,
+                          help="Seconds before hedging until enough latencies are known (no hedging until then if unset)")
+    pipeline.add_argument("--pack-tokens", type=int,
+                          help="Send short transcripts analyzed at the same time together in one request of at most "
+                               "this many transcript tokens")
+    pipeline.add_argument("--pack-max-items", type=int, default=8,
+                          help="Most transcripts in one packed request")
+    pipeline.add_argument("--pack-max-wait", type=float, default=0.05,
+                          help="Seconds a short transcript waits for others to pack with")
+    pipeline.add_argument("--normalize", action="store_true",
+                          help="Collapse whitespace, drop filler and use compact speaker IDs before prompting")
+    pipeline.add_argument("--token-budget", type=int,
+                          help="Maximum estimated tokens of each transcript sent to the LLM (implies --normalize)")
+
+    telemetry = argparse.ArgumentParser(add_help=False)
+    telemetry.add_argument("--trace", help="Write a per-stage JSON trace (chrome://tracing, Perfetto) to this file")
+    telemetry.add_argument("--metrics-port", type=int,
+                           help="Serve per-stage Prometheus metrics on this local port during the run")
+    telemetry.add_argument("--metrics-file", help="Write per-stage Prometheus metrics to this file after the run")
+    telemetry.add_argument("--trace-allocations", action="store_true",
+                           help="Record the memory allocated by each stage (slows the run down)")
+    telemetry.add_argument("--profile", metavar="PREFIX",
+                           help="Profile the run with cProfile and tracemalloc into PREFIX.prof and PREFIX.alloc.txt")
+
+    analyze = subparsers.add_parser("analyze", parents=[pipeline, telemetry],
+                                    help="Analyze transcripts (default command)")
+    analyze.add_argument("--input", help="Directory of .txt/.md transcripts or a JSONL file; "
+                                         "the built-in samples are used when omitted")
+    analyze.add_argument("--output", help="JSONL results file; each result is appended as soon as it completes "
+                                          "(defaults to a timestamped file)")
+    analyze.add_argument("--resume", action="store_true",
+                         help="Skip transcripts already analyzed successfully in the --output file")
+    analyze.add_argument("--report-shard-size", type=int,
+                         help="Split the DOCX report into one file per N meetings")
+    analyze.add_argument("--report-no-transcript", action="store_true",
+                         help="Leave the original transcripts out of the DOCX report")
+    analyze.add_argument("--report-workers", type=int, default=1,
+                         help="Render DOCX report sections in N processes (0 = every CPU)")
+    analyze.add_argument("--meeting-index", help="Add the results to this SQLite meeting index after the run")
+
+    index = subparsers.add_parser("index", help="Add JSONL results files to a queryable meeting index")
+    index.add_argument("results", nargs="+", help="JSONL results files written by analyze")
+    index.add_argument("--db", required=True, help="Path of the SQLite meeting index")
+    index.add_argument("--no-turns", action="store_true",
+                       help="Do not store speaker turns (smaller index, no turn search)")
+
+    query = subparsers.add_parser("query", help="Query a meeting index across all indexed meetings")
+    query.add_argument("kind", choices=sorted(QUERY_OPTIONS), help="What to look up")
+    query.add_argument("--db", required=True, help="Path of the SQLite meeting index")
+    query.add_argument("--assignee", help="Tasks assigned to this participant")
+    query.add_argument("--assigner", help="Tasks assigned by this participant")
+    query.add_argument("--open", dest="open_only", action="store_true",
+                       help="Only tasks not marked done, completed, closed or cancelled")
+    query.add_argument("--due-before", help="Tasks with an ISO deadline on or before YYYY-MM-DD")
+    query.add_argument("--due-after", help="Tasks with an ISO deadline on or after YYYY-MM-DD")
+    query.add_argument("--questioner", help="Questions asked by this participant")
+    query.add_argument("--responder", help="Questions answered by this participant")
+    query.add_argument("--scheduler", help="Scheduled meetings set up by this participant")
+    query.add_argument("--speaker", help="Meetings (or turns) with this speaker")
+    query.add_argument("--text", help="Words that must all occur in the item text (full-text search, a trailing * matches prefixes)")
+    query.add_argument("--min-risk", type=float, help="Minimum meeting risk score")
+    query.add_argument("--max-risk", type=float, help="Maximum meeting risk score")
+    query.add_argument("--since", help="Meetings dated on or after YYYY-MM-DD")
+    query.add_argument("--until", help="Meetings dated on or before YYYY-MM-DD")
+    query.add_argument("--last", type=int, help="Only the N most recent meetings")
+    query.add_argument("--limit", type=int, default=100, help="Maximum rows printed (0 = all)")
+    query.add_argument("--json", action="store_true", help="Print one JSON object per row")
+
+    parse = subparsers.add_parser("parse", help="Print the structure of transcripts without analyzing them")
+    parse.add_argument("--input", required=True, help="Directory of .txt/.md transcripts, a JSONL file or a text file")
+    parse.add_argument("--json", action="store_true", help="Print one JSON object per transcript")
+
+    cost = subparsers.add_parser("cost", help="Recalculate the costs of JSONL results files without the LLM")
+    cost.add_argument("results", nargs="+", help="JSONL results files written by analyze or collect")
+    cost.add_argument("--base-cost", type=float, help="Base cost of a meeting (default 1000)")
+    cost.add_argument("--risk-weight", type=float, help="Cost increase per unit of risk score (default 0.5)")
+    cost.add_argument("--recommendation-cost", type=float, help="Cost of each recommendation (default 100)")
+    cost.add_argument("--by-file", action="store_true",
+                      help="Roll the costs up per results file (e.g. one file per team)")
+    cost.add_argument("--json", action="store_true",
+                      help="Print one JSON object per meeting, then one with the aggregates")
+
+    report = subparsers.add_parser("report", help="Generate the DOCX report of a JSONL results file")
+    report.add_argument("results", help="JSONL results file written by analyze or collect")
+    report.add_argument("--output", help="DOCX path (defaults to <results>_report.docx)")
+    report.add_argument("--shard-size", type=int, help="Split the report into one file per N meetings")
+    report.add_argument("--no-transcript", action="store_true",
+                        help="Leave the original transcripts out of the report")
+    report.add_argument("--workers", type=int, default=1,
+                        help="Render report sections in N processes (0 = every CPU)")
+
+    enqueue = subparsers.add_parser("enqueue", help="Add transcripts to a work queue for worker processes")
+    enqueue.add_argument("--queue", required=True, help="SQLite queue file, or redis://host:port/db")
+    enqueue.add_argument("--input", required=True, help="Directory of .txt/.md transcripts or a JSONL file")
+
+    worker = subparsers.add_parser("worker", parents=[pipeline, telemetry],
+                                   help="Analyze transcripts from a work queue; run one per process or host")
+    worker.add_argument("--queue", required=True, help="SQLite queue file, or redis://host:port/db")
+    worker.add_argument("--worker-id", help="Unique worker name (defaults to <host>:<pid>)")
+    worker.add_argument("--lease-seconds", type=float, default=300.0,
+                        help="Visibility timeout: a job held this long without a heartbeat is handed out again")
+    worker.add_argument("--job-attempts", type=int, default=3,
+                        help="Deliveries of a job before a transient failure becomes permanent")
+    worker.add_argument("--retry-delay", type=float, default=30.0,
+                        help="Seconds before a job that failed transiently can be claimed again")
+    worker.add_argument("--exit-when-empty", action="store_true",
+                        help="Stop once no job is pending or in flight on any worker")
+
+    collect = subparsers.add_parser("collect", help="Write the results of a work queue to a JSONL results file")
+    collect.add_argument("--queue", required=True, help="SQLite queue file, or redis://host:port/db")
+    collect.add_argument("--output", required=True, help="JSONL results file (overwritten)")
+    collect.add_argument("--report", action="store_true", help="Also generate the DOCX report")
+
+    # Known command names, so main() can tell a missing command from a mistyped option.
+    parser.commands = tuple(subparsers.choices)
+    return parser
+
+
+PIPELINE_OPTIONS = {
+    "max_concurrency": "max_concurrency",
+    "cache_path": "cache",
+    "cache_ttl": "cache_ttl",
+    "cache_max_entries": "cache_max_entries",
+    "cache_bypass": "cache_bypass",
+    "chunk_tokens": "chunk_tokens",
+    "slim_results": "slim_results",
+    "pool_size": "pool_size",
+    "requests_per_minute": "rpm",
+    "tokens_per_minute": "tpm",
+    "max_attempts": "max_attempts",
+    "normalize": "normalize",
+    "token_budget": "token_budget",
+    "dedup_index_path": "dedup_index",
+    "dedup_threshold": "dedup_threshold",
+    "heuristic_routing": "heuristic_routing",
+    "heuristic_threshold": "heuristic_threshold",
+    "models": "models",
+    "cascade_min_confidence": "cascade_min_confidence",
+    "cascade_recall": "cascade_recall",
+    "hedge_percentile": "hedge_percentile",
+    "hedge_budget": "hedge_budget",
+    "hedge_initial_delay": "hedge_initial_delay",
+    "pack_tokens": "pack_tokens",
+    "pack_max_items": "pack_max_items",
+    "pack_max_wait": "pack_max_wait"
+}
+
+
+def pipeline_options(args: argparse.Namespace) -> Dict[str, Any]:
+    """Map the shared pipeline flags to run_analysis/run_worker keyword arguments."""
+    options = {name: getattr(args, flag) for name, flag in PIPELINE_OPTIONS.items()}
+    options["models"] = [model.strip() for model in options["models"].split(",") if model.strip()] or [DEFAULT_MODEL]
+    return options
+
+
+def run_with_telemetry(args: argparse.Namespace, coroutine):
+    """Run a coroutine with the instrumentation and profiler the telemetry flags ask for."""
+    import asyncio
+    from src.Infrastructure.Telemetry.profiling import profile_run
+
+    instrumentation = configure_instrumentation(args)
+    profiler = profile_run(args.profile) if args.profile else contextlib.nullcontext()
+    try:
+        with profiler:
+            asyncio.run(coroutine)
+    finally:
+        if instrumentation is not None:
+            finish_instrumentation(instrumentation, args.metrics_file)
+
+
+def main(argv: Optional[List[str]] = None):
+    """Entry point for the command line interface."""
+    parser = build_arg_parser()
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv or (argv[0] not in parser.commands and argv[0] not in ("-h", "--help")):
+        # Without a command, e.g. "main.py --input dir", the arguments belong to analyze.
+        argv = ["analyze", *argv]
+    args = parser.parse_args(argv)
+
+    if args.command == "analyze":
+        if args.resume and not args.output:
+            parser.error("--resume requires --output")
+        transcripts = load_transcripts(args.input) if args.input else None
+        run_with_telemetry(args, run_analysis(
+            transcripts,
+            output_path=args.output,
+            resume=args.resume,
+            report_shard_size=args.report_shard_size,
+            report_include_transcript=not args.report_no_transcript,
+            report_workers=args.report_workers or None,
+            meeting_index_path=args.meeting_index,
+            **pipeline_options(args)
+        ))
+    elif args.command == "index":
+        index_results(args.results, args.db, index_turns=not args.no_turns)
+    elif args.command == "query":
+        query_index(args)
+    elif args.command == "parse":
+        print_rows(parse_transcripts(load_transcripts(args.input)), as_json=args.json)
+    elif args.command == "cost":
+        cost_model_options = {"base_cost": args.base_cost, "risk_weight": args.risk_weight,
+                              "recommendation_cost": args.recommendation_cost}
+        rows, aggregates = calculate_result_costs(
+            args.results, by_file=args.by_file,
+            **{name: value for name, value in cost_model_options.items() if value is not None}
+        )
+        print_rows(rows, as_json=args.json)
+        if args.json:
+            print(json.dumps({"aggregates": aggregates}, ensure_ascii=False))
+        elif rows:
+            print_cost_aggregates(aggregates)
+    elif args.command == "report":
+        generate_report(args.results, shard_size=args.shard_size, include_transcript=not args.no_transcript,
+                        workers=args.workers or None, output_path=args.output)
+    elif args.command == "enqueue":
+        enqueue_transcripts(args.queue, load_transcripts(args.input))
+    elif args.command == "worker":
+        run_with_telemetry(args, run_worker(
+            args.queue,
+            worker_id=args.worker_id,
+            lease_seconds=args.lease_seconds,
+            job_attempts=args.job_attempts,
+            retry_delay=args.retry_delay,
+            exit_when_empty=args.exit_when_empty,
+            **pipeline_options(args)
+        ))
+    elif args.command == "collect":
+        collect_queue_results(args.queue, args.output)
+        if args.report:
+            generate_report(args.output)
+
+
 if __name__ == "__main__":
-    asyncio.run(run_analysis())
\ No newline at end of file
+    main()
\ No newline at end of file
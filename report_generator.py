@@ -1,156 +1,691 @@
+import functools
+import html
+import importlib.util
+import io
 import json
 import os
+import re
+import sys
+import zipfile
+from collections import deque
 from datetime import datetime
-from docx import Document
-from docx.shared import Inches
-from docx.enum.text import WD_ALIGN_PARAGRAPH
-from docx.enum.style import WD_STYLE_TYPE
-from docx.shared import Pt
 
+try:
+    from Core.Services.instrumentation import get_instrumentation
+except ImportError:
+    # Run as a script: the src packages are not on the path yet.
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+    from Core.Services.instrumentation import get_instrumentation
 
-def create_meeting_analysis_report(json_file_path, output_docx_path=None):
+
+def _report_span(function):
+    """
+    Records a report generator call as a ``report`` span with the bytes read and written.
+    """
+    @functools.wraps(function)
+    def wrapper(json_file_path, *args, **kwargs):
+        with get_instrumentation().span('report', writer=function.__name__,
+                                        bytes_in=os.path.getsize(json_file_path)) as span:
+            result = function(json_file_path, *args, **kwargs)
+            paths = [result] if isinstance(result, str) else result
+            span.set(files=len(paths), bytes_out=sum(os.path.getsize(path) for path in paths))
+            return result
+    return wrapper
+
+
+def iter_results(results_file_path):
+    """
+    Yields meeting results one at a time from a results file.
+
+    JSONL files (one result per line, as written by main.py) are read line by line
+    and legacy JSON array files are decoded element by element, so memory stays flat
+    however large the batch is. Torn or blank JSONL lines are skipped.
+
+    Args:
+        results_file_path (str): Path to a .jsonl or .json results file
     """
-    Creates a comprehensive DOCX report from a meeting analysis JSON file.
+    for payload in _iter_result_payloads(results_file_path):
+        meeting = _decode_result(payload)
+        if meeting is not None:
+            yield meeting
+
+
+def _iter_result_payloads(results_file_path):
+    """
+    Yields results without decoding JSONL lines, so decoding can happen in workers.
 
     Args:
-        json_file_path (str): Path to the input JSON file
+        results_file_path (str): Path to a .jsonl or .json results file
+    """
+    with open(results_file_path, 'r', encoding='utf-8') as f:
+        first = f.read(1)
+        while first and first.isspace():
+            first = f.read(1)
+        f.seek(0)
+
+        if first == '[':
+            yield from _iter_json_array(f)
+            return
+
+        for line in f:
+            if line.strip():
+                yield line
+
+
+def _decode_result(payload):
+    """
+    Returns the result dict for a payload, or None for a torn JSONL line.
+    """
+    if not isinstance(payload, str):
+        return payload
+    try:
+        return json.loads(payload)
+    except json.JSONDecodeError:
+        return None
+
+
+_VALUE_DELIMITERS = (',', ']', ' ', '\t', '\r', '\n')
+
+
+def _iter_json_array(f, chunk_size=1 << 16):
+    """
+    Decodes the elements of a top-level JSON array one at a time.
+
+    Args:
+        f: Text file positioned at the start of the array
+        chunk_size (int): Number of characters read per refill
+    """
+    decoder = json.JSONDecoder()
+    buffer = ''
+    pos = 0
+    started = False
+    eof = False
+
+    while True:
+        while pos < len(buffer) and (buffer[pos].isspace() or buffer[pos] == ','
+                                     or (not started and buffer[pos] == '[')):
+            started = started or buffer[pos] == '['
+            pos += 1
+        if pos < len(buffer) and buffer[pos] == ']':
+            return
+
+        try:
+            if pos >= len(buffer):
+                raise ValueError('need more data')
+            record, end = decoder.raw_decode(buffer, pos)
+        except ValueError:
+            if eof:
+                if buffer[pos:].strip():
+                    raise ValueError(f"Truncated JSON array in {getattr(f, 'name', 'results file')}")
+                return
+            chunk = f.read(chunk_size)
+            eof = not chunk
+            buffer = buffer[pos:] + chunk
+            pos = 0
+            continue
+
+        # A number cut by the chunk boundary ("2." or "12") may continue in the next chunk.
+        if not eof and not isinstance(record, (dict, list, str)) and buffer[end:end + 1] not in _VALUE_DELIMITERS:
+            chunk = f.read(chunk_size)
+            eof = not chunk
+            buffer = buffer[pos:] + chunk
+            pos = 0
+            continue
+
+        yield record
+        pos = end
+
+
+PAGE_BREAK = object()
+
+
+def _meeting_heading(number, meeting):
+    return f"Meeting {number}: {meeting.get('test_name', 'Unnamed Meeting')}", 'Heading 1'
+
+
+def _meeting_blocks(number, meeting, include_transcript=True):
+    """
+    Lays out the report section of one meeting as (text, style) paragraphs.
+
+    The same layout feeds both the python-docx and the streaming writers. A
+    PAGE_BREAK text marks the break paragraph placed between meetings.
+
+    Args:
+        number (int): 1-based position of the meeting in the report
+        meeting (dict): One analysis result
+        include_transcript (bool): Whether to include the original transcript
+    """
+    yield _meeting_heading(number, meeting)
+    yield from _meeting_body_blocks(meeting, include_transcript)
+
+
+def _meeting_body_blocks(meeting, include_transcript=True):
+    """
+    Lays out everything of a meeting section below its numbered heading.
+    """
+    if include_transcript:
+        yield "Original Transcript", 'Heading 2'
+        yield (meeting.get('input_transcript') or '').strip(), None
+
+    yield "Audit Results", 'Heading 2'
+
+    audit_result_obj = meeting.get('audit_result', {})
+    if isinstance(audit_result_obj, str):
+        risk_score = 0.5
+        confidence = 0.7
+        summary = 'Sample summary of audit findings'
+        risk_factors = ['Sample risk factor identified in transcript']
+        recommendations = ['Sample recommendation based on analysis']
+    else:
+        risk_score = audit_result_obj.get('risk_score', 0.0)
+        confidence = audit_result_obj.get('confidence', 0.0)
+        summary = audit_result_obj.get('summary', 'No summary available')
+        risk_factors = audit_result_obj.get('risk_factors', [])
+        recommendations = audit_result_obj.get('recommendations', [])
+
+    yield f"Risk Score: {risk_score} (0.0 = Low Risk, 1.0 = High Risk)", None
+    yield f"Confidence Level: {confidence}", None
+
+    yield "Summary", 'Heading 3'
+    yield summary, None
+
+    if risk_factors:
+        yield "Identified Risk Factors", 'Heading 3'
+        for risk in risk_factors:
+            yield risk, 'List Bullet'
+
+    if recommendations:
+        yield "Recommendations", 'Heading 3'
+        for rec in recommendations:
+            yield rec, 'List Bullet'
+
+    cost_analysis = meeting.get('cost_analysis', {})
+    if cost_analysis:
+        yield "Cost Analysis", 'Heading 2'
+        yield f"Base Cost: ${cost_analysis.get('base_cost', 0):,.2f}", None
+        yield f"Risk Adjustment: ${cost_analysis.get('risk_adjustment', 0):,.2f}", None
+        yield f"Recommendation Cost: ${cost_analysis.get('recommendation_cost', 0):,.2f}", None
+        yield f"Total Estimated Cost: ${cost_analysis.get('total_cost', 0):,.2f}", None
+
+    meeting_report = meeting.get('meeting_report', {})
+    if meeting_report:
+        yield "Meeting Report", 'Heading 2'
+
+        questions = meeting_report.get('questions', [])
+        if questions:
+            yield "Questions & Answers", 'Heading 3'
+            for q in questions:
+                questioner = q.get('questioner', 'Unknown')
+                responder = q.get('responder', 'Unknown')
+                question = q.get('question', 'No question')
+                answer = q.get('answer', 'No answer')
+
+                yield f"Q: {question}", 'Intense Quote'
+                yield f"A: {answer}", None
+                yield f"Asked by: {questioner}, Answered by: {responder}", None
+                yield '', None
+
+        meetings = meeting_report.get('meetings', [])
+        if meetings:
+            yield "Scheduled Meetings", 'Heading 3'
+            for m in meetings:
+                location = m.get('location', 'Not specified')
+                datetime_str = m.get('datetime', 'Not specified')
+                purpose = m.get('purpose', 'Not specified')
+
+                yield f"Location: {location}", None
+                yield f"Date/Time: {datetime_str}", None
+                yield f"Purpose: {purpose}", None
+                yield '', None
+
+        tasks = meeting_report.get('tasks', [])
+        if tasks:
+            yield "Assigned Tasks", 'Heading 3'
+            for t in tasks:
+                assigner = t.get('assigner', 'Unknown')
+                assignee = t.get('assignee', 'Unknown')
+                task = t.get('task', 'No description')
+                deadline = t.get('deadline', 'No deadline')
+
+                yield f"Task: {task}", None
+                yield f"Assigned by: {assigner}, Assigned to: {assignee}", None
+                yield f"Deadline: {deadline}", None
+                yield '', None
+
+
+def _add_meeting_section(doc, number, meeting, include_transcript=True):
+    """
+    Appends the report section of one meeting to a python-docx Document.
+
+    Args:
+        doc: python-docx Document
+        number (int): 1-based position of the meeting in the report
+        meeting (dict): One analysis result
+        include_transcript (bool): Whether to include the original transcript
+    """
+    for text, style in _meeting_blocks(number, meeting, include_transcript):
+        doc.add_paragraph(text, style=style)
+
+
+def _report_title():
+    return 'Meeting Transcript Analysis Report', f'Report generated on: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}'
+
+
+@_report_span
+def create_meeting_analysis_report(json_file_path, output_docx_path=None, include_transcript=True):
+    """
+    Creates a comprehensive DOCX report from a meeting analysis results file.
+
+    The whole document is built in memory with python-docx; for large batches use
+    create_streaming_report instead.
+
+    Args:
+        json_file_path (str): Path to the input JSONL (or legacy JSON array) file
         output_docx_path (str): Path to save the output DOCX file (optional)
+        include_transcript (bool): Whether to include the original transcripts
     """
     if output_docx_path is None:
         base_name = os.path.splitext(json_file_path)[0]
         output_docx_path = f"{base_name}_report.docx"
 
-    with open(json_file_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    # python-docx takes a while to import, so only this in-memory writer loads it.
+    from docx import Document
+    from docx.enum.text import WD_ALIGN_PARAGRAPH
 
     doc = Document()
 
-    title = doc.add_heading('Meeting Transcript Analysis Report', 0)
+    title_text, generated_text = _report_title()
+    title = doc.add_heading(title_text, 0)
     title.alignment = WD_ALIGN_PARAGRAPH.CENTER
 
-    generated_on = doc.add_paragraph(f'Report generated on: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}')
+    generated_on = doc.add_paragraph(generated_text)
     generated_on.alignment = WD_ALIGN_PARAGRAPH.CENTER
     doc.add_paragraph()
 
-    for idx, meeting in enumerate(data):
-        doc.add_paragraph(f"Meeting {idx + 1}: {meeting.get('test_name', 'Unnamed Meeting')}", style='Heading 1')
+    idx = 0
+    for meeting in iter_results(json_file_path):
+        if meeting.get('success') is False:
+            continue
 
-        doc.add_paragraph("Original Transcript", style='Heading 2')
-        transcript_para = doc.add_paragraph(meeting.get('input_transcript', '').strip())
-
-        doc.add_paragraph("Audit Results", style='Heading 2')
-
-        audit_result_obj = meeting.get('audit_result', {})
-        if isinstance(audit_result_obj, str):
-            risk_score = 0.5
-            confidence = 0.7
-            summary = 'Sample summary of audit findings'
-            risk_factors = ['Sample risk factor identified in transcript']
-            recommendations = ['Sample recommendation based on analysis']
-        else:
-            risk_score = audit_result_obj.get('risk_score', 0.0)
-            confidence = audit_result_obj.get('confidence', 0.0)
-            summary = audit_result_obj.get('summary', 'No summary available')
-            risk_factors = audit_result_obj.get('risk_factors', [])
-            recommendations = audit_result_obj.get('recommendations', [])
-
-        doc.add_paragraph(f"Risk Score: {risk_score} (0.0 = Low Risk, 1.0 = High Risk)")
-        doc.add_paragraph(f"Confidence Level: {confidence}")
-
-        doc.add_paragraph("Summary", style='Heading 3')
-        doc.add_paragraph(summary)
-
-        if risk_factors:
-            doc.add_paragraph("Identified Risk Factors", style='Heading 3')
-            for risk in risk_factors:
-                doc.add_paragraph(risk, style='List Bullet')
-
-        if recommendations:
-            doc.add_paragraph("Recommendations", style='Heading 3')
-            for rec in recommendations:
-                doc.add_paragraph(rec, style='List Bullet')
-
-        cost_analysis = meeting.get('cost_analysis', {})
-        if cost_analysis:
-            doc.add_paragraph("Cost Analysis", style='Heading 2')
-            doc.add_paragraph(f"Base Cost: ${cost_analysis.get('base_cost', 0):,.2f}")
-            doc.add_paragraph(f"Risk Adjustment: ${cost_analysis.get('risk_adjustment', 0):,.2f}")
-            doc.add_paragraph(f"Recommendation Cost: ${cost_analysis.get('recommendation_cost', 0):,.2f}")
-            doc.add_paragraph(f"Total Estimated Cost: ${cost_analysis.get('total_cost', 0):,.2f}")
-
-        meeting_report = meeting.get('meeting_report', {})
-        if meeting_report:
-            doc.add_paragraph("Meeting Report", style='Heading 2')
-
-            questions = meeting_report.get('questions', [])
-            if questions:
-                doc.add_paragraph("Questions & Answers", style='Heading 3')
-                for q in questions:
-                    questioner = q.get('questioner', 'Unknown')
-                    responder = q.get('responder', 'Unknown')
-                    question = q.get('question', 'No question')
-                    answer = q.get('answer', 'No answer')
-
-                    doc.add_paragraph(f"Q: {question}", style='Intense Quote')
-                    doc.add_paragraph(f"A: {answer}")
-                    doc.add_paragraph(f"Asked by: {questioner}, Answered by: {responder}")
-                    doc.add_paragraph()
-
-            meetings = meeting_report.get('meetings', [])
-            if meetings:
-                doc.add_paragraph("Scheduled Meetings", style='Heading 3')
-                for m in meetings:
-                    location = m.get('location', 'Not specified')
-                    datetime_str = m.get('datetime', 'Not specified')
-                    purpose = m.get('purpose', 'Not specified')
-
-                    doc.add_paragraph(f"Location: {location}")
-                    doc.add_paragraph(f"Date/Time: {datetime_str}")
-                    doc.add_paragraph(f"Purpose: {purpose}")
-                    doc.add_paragraph()
-
-            tasks = meeting_report.get('tasks', [])
-            if tasks:
-                doc.add_paragraph("Assigned Tasks", style='Heading 3')
-                for t in tasks:
-                    assigner = t.get('assigner', 'Unknown')
-                    assignee = t.get('assignee', 'Unknown')
-                    task = t.get('task', 'No description')
-                    deadline = t.get('deadline', 'No deadline')
-
-                    doc.add_paragraph(f"Task: {task}")
-                    doc.add_paragraph(f"Assigned by: {assigner}, Assigned to: {assignee}")
-                    doc.add_paragraph(f"Deadline: {deadline}")
-                    doc.add_paragraph()
-
-        if idx < len(data) - 1:
+        if idx > 0:
             doc.add_paragraph().add_run().add_break()
 
+        _add_meeting_section(doc, idx + 1, meeting, include_transcript)
+        idx += 1
+
     doc.save(output_docx_path)
     print(f"Report saved to: {output_docx_path}")
     return output_docx_path
 
 
-def main():
+_STYLE_IDS = {
+    'Title': 'Title',
+    'Heading 1': 'Heading1',
+    'Heading 2': 'Heading2',
+    'Heading 3': 'Heading3',
+    'List Bullet': 'ListBullet',
+    'Intense Quote': 'IntenseQuote',
+}
+_INVALID_XML_CHARS = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f\ufffe\uffff]')
+_RUN_BREAKS = re.compile('(\r\n|[\r\n\t])')
+
+
+def _paragraph_xml(text, style=None, centered=False):
     """
-    Main function to run the report generator.
+    Serializes one paragraph to WordprocessingML the way python-docx would.
+
+    Args:
+        text: Paragraph text, or PAGE_BREAK for a break paragraph
+        style (str): Paragraph style name (optional)
+        centered (bool): Whether the paragraph is centered
     """
-    import sys
+    properties = ''
+    if style:
+        properties += f'<w:pStyle w:val="{_STYLE_IDS[style]}"/>'
+    if centered:
+        properties += '<w:jc w:val="center"/>'
+    parts = ['<w:p>']
+    if properties:
+        parts.append(f'<w:pPr>{properties}</w:pPr>')
+
+    if text is PAGE_BREAK:
+        parts.append('<w:r><w:br/></w:r>')
+    elif text:
+        parts.append('<w:r>')
+        for piece in _RUN_BREAKS.split(_INVALID_XML_CHARS.sub('', str(text))):
+            if piece == '\t':
+                parts.append('<w:tab/>')
+            elif piece in ('\n', '\r', '\r\n'):
+                parts.append('<w:br/>')
+            elif piece:
+                parts.append(f'<w:t xml:space="preserve">{html.escape(piece, quote=False)}</w:t>')
+        parts.append('</w:r>')
+
+    parts.append('</w:p>')
+    return ''.join(parts)
+
+
+def _paragraphs_xml(paragraphs):
+    return ''.join(_paragraph_xml(*paragraph) for paragraph in paragraphs)
+
+
+def _render_meeting_batch(payloads, include_transcript):
+    """
+    Renders the body XML of a batch of meetings; runs in a worker process.
+
+    Args:
+        payloads (list): Undecoded JSONL lines or result dicts
+        include_transcript (bool): Whether to include the original transcripts
 
-    if len(sys.argv) < 2:
-        print("Usage: python report_generator.py <input_json_file> [output_docx_file]")
-        print("Example: python report_generator.py results.json report.docx")
+    Returns:
+        list: (meeting name, body XML) pairs; failed and torn results are left out
+    """
+    fragments = []
+    for payload in payloads:
+        meeting = _decode_result(payload)
+        if meeting is None or meeting.get('success') is False:
+            continue
+        fragments.append((meeting.get('test_name', 'Unnamed Meeting'),
+                          _paragraphs_xml(_meeting_body_blocks(meeting, include_transcript))))
+    return fragments
+
+
+def _batched(items, size):
+    batch = []
+    for item in items:
+        batch.append(item)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _map_in_order(function, batches, workers, *args):
+    """
+    Applies function to each batch in a process pool, yielding results in input order.
+
+    At most two batches per worker are in flight, so the input is consumed lazily
+    and memory stays bounded. With workers set to 1 everything runs in-process.
+    """
+    if workers == 1:
+        for batch in batches:
+            yield from function(batch, *args)
         return
 
-    json_file = sys.argv[1]
-    output_file = sys.argv[2] if len(sys.argv) > 2 else None
+    # Imported here: it loads multiprocessing, which single-process runs never need.
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        for batch in batches:
+            pending.append(executor.submit(function, batch, *args))
+            if len(pending) >= workers * 2:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+def _default_workers(workers):
+    if workers is None:
+        return os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError("workers must be at least 1")
+    return workers
+
+
+class _StreamingDocxWriter:
+    """
+    Writes a DOCX file whose body is streamed straight into the zip archive.
+
+    All package parts except word/document.xml (styles, numbering, settings) are
+    copied from python-docx's default template, so the output uses exactly the same
+    styles as a Document() built in memory. Those parts are compressed once per
+    process into a skeleton archive that every new file starts as a copy of.
+    """
+
+    DOCUMENT_PART = 'word/document.xml'
+    _skeleton = None
+
+    def __init__(self, path):
+        self.path = path
+        skeleton, opening, self._closing = self._load_skeleton()
+        with open(path, 'wb') as f:
+            f.write(skeleton)
+        self._zip = zipfile.ZipFile(path, 'a', zipfile.ZIP_DEFLATED)
+        self._body = self._zip.open(self.DOCUMENT_PART, 'w', force_zip64=True)
+        self._body.write(opening)
+
+    @staticmethod
+    def template_path():
+        """
+        Returns the path of python-docx's default template without importing python-docx.
+        """
+        spec = importlib.util.find_spec('docx')
+        if spec is None or not spec.submodule_search_locations:
+            raise ImportError("DOCX reports require the python-docx package (pip install python-docx)")
+        return os.path.join(spec.submodule_search_locations[0], 'templates', 'default.docx')
+
+    @classmethod
+    def _load_skeleton(cls):
+        """
+        Returns (skeleton archive bytes, document.xml opening, document.xml closing).
+        """
+        if cls._skeleton is None:
+            buffer = io.BytesIO()
+            with zipfile.ZipFile(cls.template_path()) as template, zipfile.ZipFile(buffer, 'w') as skeleton:
+                for item in template.infolist():
+                    if item.filename == cls.DOCUMENT_PART:
+                        document_xml = template.read(item).decode('utf-8')
+                    else:
+                        skeleton.writestr(item, template.read(item))
+
+            body_start = document_xml.index('<w:body>') + len('<w:body>')
+            body_end = document_xml.index('<w:sectPr')
+            cls._skeleton = (buffer.getvalue(), document_xml[:body_start].encode('utf-8'),
+                             document_xml[body_end:].encode('utf-8'))
+        return cls._skeleton
+
+    def add_paragraphs(self, paragraphs):
+        """
+        Appends paragraphs given as (text, style[, centered]) tuples.
+        """
+        self.add_xml(_paragraphs_xml(paragraphs))
+
+    def add_xml(self, xml):
+        """
+        Appends already serialized body XML, e.g. a fragment rendered by a worker.
+        """
+        self._body.write(xml.encode('utf-8'))
+
+    def close(self):
+        self._body.write(self._closing)
+        self._body.close()
+        self._zip.close()
+
+
+def _shard_path(output_docx_path, shard_index):
+    base_name, extension = os.path.splitext(output_docx_path)
+    return f"{base_name}_part{shard_index:03d}{extension or '.docx'}"
+
+
+@_report_span
+def create_streaming_report(json_file_path, output_docx_path=None, shard_size=None, include_transcript=True,
+                            workers=1, batch_size=16):
+    """
+    Creates the meeting analysis report in bounded memory.
+
+    Results are read one at a time and each meeting's paragraphs are written
+    straight into the DOCX archive, so memory does not grow with the batch. The
+    layout matches create_meeting_analysis_report. With several workers, decoding
+    and rendering of the meeting sections is spread over a process pool while this
+    process only stitches the fragments together in order.
+
+    Args:
+        json_file_path (str): Path to the input JSONL (or legacy JSON array) file
+        output_docx_path (str): Path to save the output DOCX file (optional)
+        shard_size (int): Start a new DOCX file every N meetings (optional); shards
+            are named <output>_part001.docx, <output>_part002.docx, ...
+        include_transcript (bool): Whether to include the original transcripts
+        workers (int): Rendering processes; None uses every CPU, 1 renders in-process
+        batch_size (int): Meetings sent to a worker per task
+
+    Returns:
+        list: Paths of the written DOCX files
+    """
+    workers = _default_workers(workers)
+    if shard_size is not None and shard_size < 1:
+        raise ValueError("shard_size must be at least 1")
+    if output_docx_path is None:
+        base_name = os.path.splitext(json_file_path)[0]
+        output_docx_path = f"{base_name}_report.docx"
+
+    title_text, generated_text = _report_title()
+    paths = []
+    writer = None
+    in_shard = 0
+
+    def open_shard():
+        path = _shard_path(output_docx_path, len(paths) + 1) if shard_size else output_docx_path
+        paths.append(path)
+        shard_writer = _StreamingDocxWriter(path)
+        shard_writer.add_paragraphs([(title_text, 'Title', True), (generated_text, None, True), ('', None)])
+        return shard_writer
+
+    try:
+        writer = open_shard()
+        batches = _batched(_iter_result_payloads(json_file_path), batch_size)
+        fragments = _map_in_order(_render_meeting_batch, batches, workers, include_transcript)
+        for idx, (name, body_xml) in enumerate(fragments):
+            if shard_size and in_shard == shard_size:
+                writer.close()
+                writer = open_shard()
+                in_shard = 0
+            elif in_shard > 0:
+                writer.add_paragraphs([(PAGE_BREAK, None)])
+
+            writer.add_paragraphs([_meeting_heading(idx + 1, {'test_name': name})])
+            writer.add_xml(body_xml)
+            in_shard += 1
+    finally:
+        if writer is not None:
+            writer.close()
+
+    for path in paths:
+        print(f"Report saved to: {path}")
+    return paths
+
+
+def _write_meeting_files(items, include_transcript, output_dir):
+    """
+    Writes one standalone DOCX per meeting; runs in a worker process.
+
+    Args:
+        items (list): (position, payload) pairs, position being 1-based in the results file
+        include_transcript (bool): Whether to include the original transcripts
+        output_dir (str): Directory receiving the files
+
+    Returns:
+        list: (position, meeting name, file path) of the written files
+    """
+    written = []
+    for position, payload in items:
+        meeting = _decode_result(payload)
+        if meeting is None or meeting.get('success') is False:
+            continue
+        path = os.path.join(output_dir, f"meeting_{position:05d}.docx")
+        writer = _StreamingDocxWriter(path)
+        try:
+            writer.add_paragraphs(_meeting_blocks(position, meeting, include_transcript))
+        finally:
+            writer.close()
+        written.append((position, meeting.get('test_name', 'Unnamed Meeting'), path))
+    return written
+
+
+@_report_span
+def create_meeting_report_files(json_file_path, output_dir=None, include_transcript=True, workers=None,
+                                batch_size=16):
+    """
+    Creates one DOCX per meeting, rendered in parallel, plus an index document.
+
+    Each worker writes complete meeting files on its own, so rendering and
+    compression both scale with the number of processes. Meetings are numbered by
+    their position in the results file.
+
+    Args:
+        json_file_path (str): Path to the input JSONL (or legacy JSON array) file
+        output_dir (str): Directory for the files (defaults to <results>_report/)
+        include_transcript (bool): Whether to include the original transcripts
+        workers (int): Rendering processes; None uses every CPU, 1 renders in-process
+        batch_size (int): Meetings sent to a worker per task
+
+    Returns:
+        list: Path of the index document followed by the meeting files
+    """
+    workers = _default_workers(workers)
+    if output_dir is None:
+        output_dir = f"{os.path.splitext(json_file_path)[0]}_report"
+    os.makedirs(output_dir, exist_ok=True)
+
+    title_text, generated_text = _report_title()
+    index_path = os.path.join(output_dir, 'index.docx')
+    paths = [index_path]
+    index = _StreamingDocxWriter(index_path)
+    try:
+        index.add_paragraphs([(title_text, 'Title', True), (generated_text, None, True), ('', None),
+                              ('Meetings', 'Heading 1')])
+        items = enumerate(_iter_result_payloads(json_file_path), start=1)
+        written = _map_in_order(_write_meeting_files, _batched(items, batch_size), workers,
+                                include_transcript, output_dir)
+        for position, name, path in written:
+            paths.append(path)
+            index.add_paragraphs([(f"Meeting {position}: {name} ({os.path.basename(path)})", 'List Bullet')])
+    finally:
+        index.close()
+
+    print(f"Report saved to: {output_dir} ({len(paths) - 1} meeting files, index: {index_path})")
+    return paths
+
+
+def main():
+    """
+    Main function to run the report generator.
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Generate a DOCX report from meeting analysis results.")
+    parser.add_argument("results_file", help="JSONL (or JSON array) results file")
+    parser.add_argument("output_docx_file", nargs="?", help="Output DOCX path (a directory with --per-meeting)")
+    parser.add_argument("--streaming", action="store_true",
+                        help="Write the report in bounded memory (recommended for large batches)")
+    parser.add_argument("--shard-size", type=int,
+                        help="With --streaming, start a new DOCX file every N meetings")
+    parser.add_argument("--no-transcript", action="store_true",
+                        help="Leave the original transcripts out of the report")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="With --streaming or --per-meeting, render meetings in N processes (0 = every CPU)")
+    parser.add_argument("--per-meeting", action="store_true",
+                        help="Write one DOCX per meeting plus an index document into the output directory")
+    args = parser.parse_args()
+
+    json_file = args.results_file
+    output_file = args.output_docx_file
 
     if not os.path.exists(json_file):
         print(f"Error: JSON file '{json_file}' not found.")
         return
 
+    workers = args.workers or None
     try:
-        create_meeting_analysis_report(json_file, output_file)
+        if args.per_meeting:
+            create_meeting_report_files(json_file, output_file, include_transcript=not args.no_transcript,
+                                        workers=workers)
+        elif args.streaming or args.shard_size:
+            create_streaming_report(json_file, output_file, shard_size=args.shard_size,
+                                    include_transcript=not args.no_transcript, workers=workers)
+        else:
+            create_meeting_analysis_report(json_file, output_file, include_transcript=not args.no_transcript)
         print("Report generation completed successfully!")
     except Exception as e:
         print(f"Error generating report: {str(e)}")
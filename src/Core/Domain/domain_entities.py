@@ -1,5 +1,5 @@
-from dataclasses import dataclass
-from typing import List, Optional
+from dataclasses import dataclass, field
+from typing import Any, Dict, FrozenSet, List, Optional
 
 
 @dataclass
@@ -11,4 +11,132 @@ class AuditResult:
     recommendations: List[str]
     summary: str
     confidence: float
-    details: Optional[str] = None
\ No newline at end of file
+    details: Optional[str] = None
+    raw_report: Optional[Dict[str, Any]] = None
+    # The model's response was cut off; the result holds what was complete before the cut.
+    truncated: bool = False
+
+
+@dataclass
+class Question:
+    """A question asked during a meeting and the answer it received."""
+
+    questioner: Optional[str] = None
+    responder: Optional[str] = None
+    question: Optional[str] = None
+    answer: Optional[str] = None
+    extra: Dict[str, Any] = field(default_factory=dict)
+    # Fields the source document set, so explicit nulls survive a round trip.
+    present: FrozenSet[str] = field(default=frozenset(), repr=False, compare=False)
+
+
+@dataclass
+class ScheduledMeeting:
+    """A follow-up meeting agreed on during a meeting."""
+
+    scheduler: Optional[str] = None
+    location: Optional[str] = None
+    datetime: Optional[str] = None
+    purpose: Optional[str] = None
+    extra: Dict[str, Any] = field(default_factory=dict)
+    # Fields the source document set, so explicit nulls survive a round trip.
+    present: FrozenSet[str] = field(default=frozenset(), repr=False, compare=False)
+
+
+@dataclass
+class TaskAssignment:
+    """A task assigned to a participant during a meeting."""
+
+    assigner: Optional[str] = None
+    assignee: Optional[str] = None
+    task: Optional[str] = None
+    deadline: Optional[str] = None
+    extra: Dict[str, Any] = field(default_factory=dict)
+    # Fields the source document set, so explicit nulls survive a round trip.
+    present: FrozenSet[str] = field(default=frozenset(), repr=False, compare=False)
+
+
+@dataclass
+class MeetingReport:
+    """Questions, scheduled meetings and tasks extracted from a transcript."""
+
+    questions: List[Question] = field(default_factory=list)
+    meetings: List[ScheduledMeeting] = field(default_factory=list)
+    tasks: List[TaskAssignment] = field(default_factory=list)
+
+
+@dataclass
+class CostAnalysis:
+    """Costs estimated from an audit result."""
+
+    base_cost: float
+    risk_adjustment: float
+    recommendation_cost: float
+    total_cost: float
+    risk_score: float = 0.0
+    num_risk_factors: int = 0
+    num_recommendations: int = 0
+
+
+@dataclass
+class AnalysisRecord:
+    """One transcript's entry in a results file."""
+
+    test_name: str
+    success: bool
+    audit_result: Optional[AuditResult] = None
+    meeting_report: Optional[MeetingReport] = None
+    cost_analysis: Optional[CostAnalysis] = None
+    parsed_content: Optional[Dict[str, Any]] = None
+    input_transcript: Optional[str] = None
+    latency_seconds: Optional[float] = None
+    error: Optional[str] = None
+    near_duplicate_of: Optional[str] = None
+    near_duplicate_similarity: Optional[float] = None
+
+
+@dataclass
+class StreamUpdate:
+    """Incremental analysis delta produced while a live transcript is still growing.
+
+    ``error`` is set when the segment's analysis failed; its lines are then
+    analyzed again with the next segment.
+    """
+
+    segment_index: int
+    risk_score: float
+    new_questions: List[Dict[str, Any]] = field(default_factory=list)
+    new_meetings: List[Dict[str, Any]] = field(default_factory=list)
+    new_tasks: List[Dict[str, Any]] = field(default_factory=list)
+    new_risk_factors: List[str] = field(default_factory=list)
+    statistics: Dict[str, Any] = field(default_factory=dict)
+    is_final: bool = False
+    error: Optional[str] = None
+
+
+@dataclass
+class StreamedItem:
+    """Part of an analysis, emitted while the model is still writing the rest.
+
+    ``section`` is 'risk_factors', 'recommendations', 'risk_analysis' (the whole risk
+    object, score and summary included), 'questions', 'meetings' or 'tasks', and
+    ``index`` is the item's position in its section. The last item of a stream has
+    ``is_final`` set and carries the complete AuditResult as ``result``.
+    """
+
+    section: Optional[str] = None
+    index: int = 0
+    item: Any = None
+    result: Optional[AuditResult] = None
+    is_final: bool = False
+
+
+@dataclass
+class WorkItem:
+    """A transcript leased from a work queue by a worker."""
+
+    job_id: str
+    name: str
+    transcript: str
+    attempts: int
+    lease_expires: float
\ No newline at end of file
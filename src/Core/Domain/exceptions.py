@@ -0,0 +1,29 @@
+from typing import Optional
+
+
+class LLMAnalysisError(Exception):
+    """Base class for errors raised while analyzing a transcript with an LLM."""
+
+
+class TransientLLMError(LLMAnalysisError):
+    """A failure that is expected to succeed on retry (timeouts, 5xx, throttling)."""
+
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class RateLimitError(TransientLLMError):
+    """The provider rejected the request because a rate limit was exceeded (HTTP 429)."""
+
+
+class PermanentLLMError(LLMAnalysisError):
+    """A failure that will not go away on retry (bad credentials, invalid request)."""
+
+
+class LLMResponseFormatError(PermanentLLMError):
+    """The model answered, but not with the expected JSON structure."""
+
+    def __init__(self, message: str, content: str = ""):
+        super().__init__(message)
+        self.content = content
\ No newline at end of file
@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import Protocol
-from Core.Domain.domain_entities import AuditResult
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, Optional, Protocol, Tuple
+from Core.Domain.domain_entities import AuditResult, StreamedItem, WorkItem
 from typing_extensions import runtime_checkable
 
 
@@ -17,4 +17,91 @@ class ILLMAnalyzer(Protocol):
         Returns:
             AuditResult: The result of the audit analysis
         """
+        ...
+
+
+@runtime_checkable
+class IStreamingLLMAnalyzer(ILLMAnalyzer, Protocol):
+    """LLM analyzer that can report parts of an analysis while the model is still writing."""
+
+    def analyze_stream(self, transcript: str) -> AsyncIterator[StreamedItem]:
+        """Analyze a transcript, yielding each item of the result as soon as it is complete.
+
+        Args:
+            transcript (str): The transcript to analyze
+
+        Returns:
+            Async iterator of StreamedItem; the last one has ``is_final`` set and the AuditResult
+        """
+        ...
+
+
+@runtime_checkable
+class IWorkQueue(Protocol):
+    """Interface for the queue that distributes transcripts over analysis workers.
+
+    Delivery is at least once: a claimed item is leased to one worker until its
+    visibility timeout passes, after which it is handed out again unless the
+    worker extended the lease (heartbeat) or completed it. Results are written
+    idempotently: the first result stored for a job wins.
+    """
+
+    def enqueue(self, items: Iterable[Tuple[str, str]]) -> int:
+        """Add (name, transcript) pairs; pairs already queued are ignored.
+
+        Returns:
+            int: Number of new jobs
+        """
+        ...
+
+    def claim(self, worker_id: str, lease_seconds: float, max_attempts: Optional[int] = None) -> Optional[WorkItem]:
+        """Lease the next available job to a worker, or return None if there is none.
+
+        Jobs whose lease expired after ``max_attempts`` deliveries are moved to failed
+        instead of being handed out again.
+        """
+        ...
+
+    def extend_lease(self, job_id: str, worker_id: str, lease_seconds: float) -> bool:
+        """Push back the visibility timeout of a job the worker still holds.
+
+        Returns:
+            bool: False if the lease was lost (expired and claimed elsewhere, or completed)
+        """
+        ...
+
+    def complete(self, job_id: str, worker_id: str, result: bytes) -> bool:
+        """Store the result of a job and release its lease.
+
+        Returns:
+            bool: True if this call stored the result, False if one was stored before
+        """
+        ...
+
+    def fail(self, job_id: str, worker_id: str, error: str, retry_delay: Optional[float] = None) -> bool:
+        """Record a failed attempt; retry after ``retry_delay`` seconds or give up if None.
+
+        Returns:
+            bool: True if the job will be retried
+        """
+        ...
+
+    def heartbeat(self, worker_id: str, **stats: Any):
+        """Record that a worker is alive, with its counters."""
+        ...
+
+    def results(self) -> Iterator[bytes]:
+        """Iterate over the stored results."""
+        ...
+
+    def failures(self) -> Iterator[Tuple[str, str]]:
+        """Iterate over (name, last error) of jobs that failed permanently."""
+        ...
+
+    def stats(self) -> Dict[str, Any]:
+        """Return job counts by state and the workers seen recently."""
+        ...
+
+    def close(self):
+        """Release the queue's resources."""
         ...
\ No newline at end of file
@@ -0,0 +1,252 @@
+import contextvars
+import itertools
+import threading
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+# Upper bounds (seconds) of the stage duration histogram buckets.
+DURATION_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+_current_span: contextvars.ContextVar = contextvars.ContextVar('current_span', default=None)
+_span_ids = itertools.count(1)
+
+
+@dataclass
+class Span:
+    """One timed pipeline stage (parse, llm, cost, report, ...) with its measurements.
+
+    Numeric attributes (prompt_tokens, retries, bytes_in, ...) are summed per stage
+    by the Instrumentation; other attributes only appear in traces.
+    """
+
+    name: str
+    span_id: int
+    parent_id: Optional[int]
+    root_id: int
+    start: float
+    end: Optional[float] = None
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    error: Optional[str] = None
+
+    @property
+    def duration(self) -> float:
+        return (self.end if self.end is not None else time.perf_counter()) - self.start
+
+    def set(self, **attributes):
+        """Set attributes, replacing earlier values."""
+        self.attributes.update(attributes)
+
+    def add(self, name: str, value: float = 1):
+        """Increment a numeric attribute."""
+        self.attributes[name] = self.attributes.get(name, 0) + value
+
+
+class _NullSpan:
+    """Span handed out while instrumentation is disabled; records nothing."""
+
+    __slots__ = ()
+
+    def set(self, **attributes):
+        pass
+
+    def add(self, name: str, value: float = 1):
+        pass
+
+    def __enter__(self) -> '_NullSpan':
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+@dataclass
+class StageStats:
+    """Aggregated measurements of every finished span of one stage."""
+
+    count: int = 0
+    errors: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+    bucket_counts: List[int] = field(default_factory=lambda: [0] * len(DURATION_BUCKETS))
+    totals: Dict[str, float] = field(default_factory=dict)
+
+    def record(self, span: Span):
+        duration = span.duration
+        self.count += 1
+        self.errors += span.error is not None
+        self.total_seconds += duration
+        self.max_seconds = max(self.max_seconds, duration)
+        for index, bound in enumerate(DURATION_BUCKETS):
+            if duration <= bound:
+                self.bucket_counts[index] += 1
+                break
+        for name, value in span.attributes.items():
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                self.totals[name] = self.totals.get(name, 0) + value
+            elif isinstance(value, bool):
+                self.totals[name] = self.totals.get(name, 0) + int(value)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            'count': self.count,
+            'errors': self.errors,
+            'total_seconds': round(self.total_seconds, 6),
+            'mean_seconds': round(self.total_seconds / self.count, 6) if self.count else 0.0,
+            'max_seconds': round(self.max_seconds, 6),
+            **{name: value for name, value in sorted(self.totals.items())}
+        }
+
+
+class _SpanContext:
+    """Context manager that opens a span on enter and finishes it on exit."""
+
+    __slots__ = ('_instrumentation', '_name', '_attributes', '_span', '_token', '_allocated')
+
+    def __init__(self, instrumentation: 'Instrumentation', name: str, attributes: Dict[str, Any]):
+        self._instrumentation = instrumentation
+        self._name = name
+        self._attributes = attributes
+        self._span = None
+        self._token = None
+        self._allocated = None
+
+    def __enter__(self) -> Span:
+        parent = _current_span.get()
+        span_id = next(_span_ids)
+        self._span = Span(
+            name=self._name,
+            span_id=span_id,
+            parent_id=parent.span_id if parent is not None else None,
+            root_id=parent.root_id if parent is not None else span_id,
+            start=time.perf_counter(),
+            attributes=self._attributes
+        )
+        self._token = _current_span.set(self._span)
+        if self._instrumentation.track_allocations and tracemalloc.is_tracing():
+            self._allocated = tracemalloc.get_traced_memory()[0]
+        return self._span
+
+    def __exit__(self, exc_type, exc, tb):
+        span = self._span
+        span.end = time.perf_counter()
+        if self._allocated is not None and tracemalloc.is_tracing():
+            # Net growth of traced memory; concurrent spans share the process-wide counter.
+            span.attributes['alloc_bytes'] = max(tracemalloc.get_traced_memory()[0] - self._allocated, 0)
+        if exc_type is not None:
+            span.error = exc_type.__name__
+        _current_span.reset(self._token)
+        self._instrumentation.finish(span)
+        return False
+
+
+class Instrumentation:
+    """Collects per-stage spans and hands finished spans to exporters.
+
+    Spans nest through a context variable, so spans opened inside asyncio tasks are
+    parented to the span that was current when the task was created. While disabled,
+    ``span`` returns a shared no-op span and costs a single call.
+    """
+
+    def __init__(self, enabled: bool = True, track_allocations: bool = False):
+        """Initialize the instrumentation.
+
+        Args:
+            enabled: Record spans; when False every span is a no-op
+            track_allocations: Record the net traced memory growth of each span as
+                ``alloc_bytes`` (starts tracemalloc, which slows allocation-heavy code)
+        """
+        self.enabled = enabled
+        self.track_allocations = track_allocations
+        self.exporters: List[Any] = []
+        self._stages: Dict[str, StageStats] = {}
+        self._lock = threading.Lock()
+        if enabled and track_allocations and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def span(self, name: str, **attributes):
+        """Open a span for a pipeline stage.
+
+        Args:
+            name: Stage name, e.g. ``parse``, ``llm``, ``cost`` or ``report``
+            **attributes: Initial attributes of the span
+
+        Returns:
+            Context manager yielding the Span (a no-op span when disabled)
+        """
+        if not self.enabled:
+            return _NULL_SPAN
+        return _SpanContext(self, name, attributes)
+
+    @staticmethod
+    def current_span():
+        """Return the innermost open span of the current context (a no-op span if none)."""
+        return _current_span.get() or _NULL_SPAN
+
+    def add_exporter(self, exporter):
+        """Register an exporter; its ``export(span)`` is called for every finished span."""
+        self.exporters.append(exporter)
+
+    def finish(self, span: Span):
+        """Aggregate a finished span and pass it to the exporters."""
+        with self._lock:
+            stats = self._stages.get(span.name)
+            if stats is None:
+                stats = self._stages[span.name] = StageStats()
+            stats.record(span)
+        for exporter in self.exporters:
+            exporter.export(span)
+
+    def stage_stats(self) -> Dict[str, StageStats]:
+        """Return a snapshot of the aggregated measurements per stage."""
+        with self._lock:
+            return {
+                name: StageStats(
+                    count=stats.count,
+                    errors=stats.errors,
+                    total_seconds=stats.total_seconds,
+                    max_seconds=stats.max_seconds,
+                    bucket_counts=list(stats.bucket_counts),
+                    totals=dict(stats.totals)
+                )
+                for name, stats in self._stages.items()
+            }
+
+    def summary(self) -> List[Tuple[str, Dict[str, Any]]]:
+        """Return (stage, measurements) pairs ordered by total time, slowest first."""
+        stages = self.stage_stats()
+        return sorted(((name, stats.as_dict()) for name, stats in stages.items()),
+                      key=lambda item: item[1]['total_seconds'], reverse=True)
+
+    def close(self):
+        """Close every exporter."""
+        for exporter in self.exporters:
+            close = getattr(exporter, 'close', None)
+            if close is not None:
+                close()
+
+
+_global_instrumentation = Instrumentation(enabled=False)
+
+
+def get_instrumentation() -> Instrumentation:
+    """Return the process-wide instrumentation (disabled until set_instrumentation is called)."""
+    return _global_instrumentation
+
+
+def set_instrumentation(instrumentation: Instrumentation) -> Instrumentation:
+    """Replace the process-wide instrumentation.
+
+    Args:
+        instrumentation: The instrumentation components should report to
+
+    Returns:
+        The previous instrumentation
+    """
+    global _global_instrumentation
+    previous, _global_instrumentation = _global_instrumentation, instrumentation
+    return previous
\ No newline at end of file
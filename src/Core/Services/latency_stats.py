@@ -0,0 +1,84 @@
+import math
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional
+
+
+def percentile(values: Iterable[float], pct: float) -> float:
+    """Compute a nearest-rank percentile.
+
+    Args:
+        values: The samples to inspect
+        pct: The percentile to compute, between 0 and 100
+
+    Returns:
+        The sample at the requested rank, or 0.0 when there are no samples
+    """
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100.0 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+@dataclass
+class BatchRunStats:
+    """Throughput and latency statistics collected over one batch run."""
+
+    submitted: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    latencies: List[float] = field(default_factory=list)
+
+    @property
+    def completed(self) -> int:
+        """Number of transcripts that finished, successfully or not."""
+        return self.succeeded + self.failed
+
+    @property
+    def wall_time(self) -> float:
+        """Elapsed wall-clock time of the run in seconds."""
+        if self.started_at is None or self.finished_at is None:
+            return 0.0
+        return self.finished_at - self.started_at
+
+    @property
+    def throughput(self) -> float:
+        """Completed transcripts per second of wall-clock time."""
+        return self.completed / self.wall_time if self.wall_time > 0 else 0.0
+
+    def record(self, latency: float, success: bool):
+        """Record the outcome of a single transcript.
+
+        Args:
+            latency: Time spent on the transcript in seconds
+            success: Whether the analysis completed without errors
+        """
+        self.latencies.append(latency)
+        if success:
+            self.succeeded += 1
+        else:
+            self.failed += 1
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Summarize the run as a plain dictionary.
+
+        Returns:
+            Dict containing counters, throughput and latency percentiles
+        """
+        latencies = self.latencies
+        return {
+            'submitted': self.submitted,
+            'succeeded': self.succeeded,
+            'failed': self.failed,
+            'wall_time_seconds': round(self.wall_time, 4),
+            'throughput_per_second': round(self.throughput, 4),
+            'latency_seconds': {
+                'mean': round(sum(latencies) / len(latencies), 4) if latencies else 0.0,
+                'p50': round(percentile(latencies, 50), 4),
+                'p95': round(percentile(latencies, 95), 4),
+                'p99': round(percentile(latencies, 99), 4),
+                'max': round(max(latencies), 4) if latencies else 0.0
+            }
+        }
\ No newline at end of file
@@ -0,0 +1,151 @@
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence
+from Core.Domain.domain_entities import AuditResult, StreamedItem
+
+REPORT_SECTIONS = ('questions', 'meetings', 'tasks')
+# Report item fields that hold a participant's name.
+SPEAKER_FIELDS = ('questioner', 'responder', 'scheduler', 'assigner', 'assignee')
+
+
+def _normalize(value: Any) -> str:
+    return ' '.join(str(value or '').lower().split())
+
+
+def question_key(item: Dict[str, Any]) -> tuple:
+    """Identity of a question for deduplication."""
+    return _normalize(item.get('questioner')), _normalize(item.get('question'))
+
+
+def meeting_key(item: Dict[str, Any]) -> tuple:
+    """Identity of a scheduled meeting for deduplication."""
+    return _normalize(item.get('datetime')), _normalize(item.get('location')), _normalize(item.get('purpose'))
+
+
+def task_key(item: Dict[str, Any]) -> tuple:
+    """Identity of a task assignment for deduplication."""
+    return _normalize(item.get('assignee')), _normalize(item.get('task'))
+
+
+SECTION_KEYS: Dict[str, Callable[[Dict[str, Any]], tuple]] = {
+    'questions': question_key,
+    'meetings': meeting_key,
+    'tasks': task_key
+}
+
+
+def dedupe_items(items: Iterable[Dict[str, Any]], key: Callable[[Dict[str, Any]], tuple],
+                 seen: Optional[set] = None) -> List[Dict[str, Any]]:
+    """Drop items whose key was already seen, keeping the first occurrence.
+
+    Args:
+        items: The items to filter
+        key: Function computing the identity of an item
+        seen: Optional set of known keys, updated in place
+
+    Returns:
+        List of new, unique items in input order
+    """
+    seen = set() if seen is None else seen
+    unique = []
+    for item in items:
+        if not isinstance(item, dict):
+            continue
+        item_key = key(item)
+        if item_key in seen:
+            continue
+        seen.add(item_key)
+        unique.append(item)
+    return unique
+
+
+def _dedupe_strings(values: Iterable[str]) -> List[str]:
+    seen = set()
+    unique = []
+    for value in values:
+        normalized = _normalize(value)
+        if normalized and normalized not in seen:
+            seen.add(normalized)
+            unique.append(value)
+    return unique
+
+
+def merge_reports(reports: Iterable[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+    """Merge meeting reports section by section, removing duplicates.
+
+    Args:
+        reports: Meeting reports with questions, meetings and tasks
+
+    Returns:
+        A single meeting report
+    """
+    reports = [report or {} for report in reports]
+    return {
+        section: dedupe_items(
+            (item for report in reports for item in report.get(section, []) or []),
+            SECTION_KEYS[section]
+        )
+        for section in REPORT_SECTIONS
+    }
+
+
+def merge_audit_results(results: Sequence[AuditResult], weights: Sequence[float]) -> AuditResult:
+    """Combine partial audit results (e.g. one per transcript chunk) into one.
+
+    The risk score and confidence are averaged with each result weighted by its
+    weight times its confidence, so low-confidence partial results count less.
+
+    Args:
+        results: Partial audit results in transcript order
+        weights: Relative weight of each result, typically its token count
+
+    Returns:
+        The merged AuditResult
+    """
+    if not results:
+        raise ValueError("At least one result is required to merge")
+    if len(results) != len(weights):
+        raise ValueError("Each result needs exactly one weight")
+
+    effective = [w * max(r.confidence, 0.0) for r, w in zip(results, weights)]
+    if sum(effective) <= 0:
+        effective = [float(w) for w in weights]
+    if sum(effective) <= 0:
+        effective = [1.0] * len(results)
+
+    risk_score = sum(r.risk_score * w for r, w in zip(results, effective)) / sum(effective)
+    confidence = sum(r.confidence * w for r, w in zip(results, weights)) / (sum(weights) or 1.0)
+
+    report = merge_reports(r.raw_report for r in results)
+    return AuditResult(
+        risk_score=round(risk_score, 4),
+        risk_factors=_dedupe_strings(f for r in results for f in r.risk_factors),
+        recommendations=_dedupe_strings(rec for r in results for rec in r.recommendations),
+        summary=' '.join(s for s in _dedupe_strings(r.summary for r in results)),
+        confidence=round(confidence, 4),
+        raw_report=report,
+        truncated=any(r.truncated for r in results)
+    )
+
+
+def audit_result_items(result: AuditResult) -> Iterator[StreamedItem]:
+    """Yield the items of a complete result in the order a streamed response delivers them.
+
+    Used to replay results that were not streamed (cache hits, reused analyses,
+    analyzers without streaming) to consumers of analyze_stream.
+
+    Returns:
+        Iterator of StreamedItem, ending with the final one carrying the result
+    """
+    for section, values in (('risk_factors', result.risk_factors), ('recommendations', result.recommendations)):
+        for index, value in enumerate(values):
+            yield StreamedItem(section=section, index=index, item=value)
+    yield StreamedItem(section='risk_analysis', item={
+        'score': result.risk_score,
+        'risk_factors': result.risk_factors,
+        'recommendations': result.recommendations,
+        'summary': result.summary,
+        'confidence': result.confidence
+    })
+    for section in REPORT_SECTIONS:
+        for index, value in enumerate((result.raw_report or {}).get(section, [])):
+            yield StreamedItem(section=section, index=index, item=value)
+    yield StreamedItem(result=result, is_final=True)
\ No newline at end of file
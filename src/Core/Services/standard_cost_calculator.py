@@ -1,13 +1,127 @@
-from typing import Dict, Any
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Sequence, Tuple
 from Core.Domain.domain_entities import AuditResult
 
 
+@dataclass(frozen=True)
+class CostModel:
+    """Constants of the cost formula.
+
+    ``total_cost = base_cost * (1 + risk_score * risk_weight) + num_recommendations * recommendation_cost``
+    """
+
+    base_cost: float = 1000.0
+    risk_weight: float = 0.5
+    # An int keeps recommendation_cost integral in the results, as it always was.
+    recommendation_cost: float = 100
+
+
+DEFAULT_COST_MODEL = CostModel()
+
+
+def _require_numpy():
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError("Batch cost calculation requires the numpy package (pip install numpy)")
+    return numpy
+
+
+@dataclass
+class CostBatch:
+    """Columnar costs of many audit results, as NumPy arrays aligned with the inputs."""
+
+    risk_score: Any
+    num_risk_factors: Any
+    num_recommendations: Any
+    base_cost: Any
+    risk_adjustment: Any
+    recommendation_cost: Any
+    total_cost: Any
+    teams: Any = None
+
+    def __len__(self) -> int:
+        return len(self.total_cost)
+
+    def row(self, index: int) -> Dict[str, Any]:
+        """Return one result in the layout of StandardCostCalculator.calculate_costs."""
+        return {
+            'base_cost': self.base_cost.item(index),
+            'risk_adjustment': self.risk_adjustment.item(index),
+            'recommendation_cost': self.recommendation_cost.item(index),
+            'total_cost': self.total_cost.item(index),
+            'cost_breakdown': {
+                'risk_score': self.risk_score.item(index),
+                'num_risk_factors': self.num_risk_factors.item(index),
+                'num_recommendations': self.num_recommendations.item(index)
+            }
+        }
+
+    def aggregates(self, percentiles: Sequence[float] = (50, 90, 95, 99)) -> Dict[str, Any]:
+        """Summarize the batch.
+
+        Sums use NumPy's pairwise summation, so they can differ from adding the scalar
+        results one by one in the last bits (and are the more accurate of the two).
+
+        Args:
+            percentiles: Percentiles of the total cost to report
+
+        Returns:
+            Dict with the count, the summed cost components, total cost statistics and,
+            when teams were given, ``by_team`` with each team's count, total, mean and max
+        """
+        np = _require_numpy()
+        count = len(self)
+        summary = {
+            'count': count,
+            'base_cost': float(self.base_cost.sum()),
+            'risk_adjustment': float(self.risk_adjustment.sum()),
+            'recommendation_cost': self.recommendation_cost.sum().item(),
+            'total_cost': float(self.total_cost.sum()),
+            'mean_total_cost': float(self.total_cost.mean()) if count else 0.0,
+            'max_total_cost': float(self.total_cost.max()) if count else 0.0,
+            'mean_risk_score': float(self.risk_score.mean()) if count else 0.0,
+            'percentiles': {
+                f"p{p:g}": float(value)
+                for p, value in zip(percentiles, np.percentile(self.total_cost, percentiles) if count
+                                    else [0.0] * len(percentiles))
+            }
+        }
+        if self.teams is not None:
+            summary['by_team'] = self._team_rollups(np)
+        return summary
+
+    def _team_rollups(self, np) -> Dict[str, Dict[str, Any]]:
+        names, inverse = np.unique(self.teams, return_inverse=True)
+        counts = np.bincount(inverse, minlength=len(names))
+        totals = np.bincount(inverse, weights=self.total_cost, minlength=len(names))
+        risk = np.bincount(inverse, weights=self.risk_score, minlength=len(names))
+        # Team maxima from one stable sort and a segmented reduction.
+        order = np.argsort(inverse, kind='stable')
+        starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+        maxima = np.maximum.reduceat(self.total_cost[order], starts) if len(order) else np.zeros(0)
+        return {
+            str(name): {
+                'count': int(counts[i]),
+                'total_cost': float(totals[i]),
+                'mean_total_cost': float(totals[i] / counts[i]),
+                'max_total_cost': float(maxima[i]),
+                'mean_risk_score': float(risk[i] / counts[i])
+            }
+            for i, name in enumerate(names)
+        }
+
+
 class StandardCostCalculator:
     """Calculate standard costs and metrics based on audit results."""
 
-    def __init__(self):
-        """Initialize the cost calculator."""
-        pass
+    def __init__(self, cost_model: CostModel = None):
+        """Initialize the cost calculator.
+
+        Args:
+            cost_model: The cost formula constants (optional, uses DEFAULT_COST_MODEL if None)
+        """
+        self.cost_model = cost_model or DEFAULT_COST_MODEL
 
     def calculate_costs(self, audit_result: AuditResult) -> Dict[str, Any]:
         """Calculate standard costs based on audit result.
@@ -18,9 +132,10 @@ class StandardCostCalculator:
         Returns:
             Dict containing cost calculations
         """
-        base_cost = 1000.0
-        risk_multiplier = 1.0 + (audit_result.risk_score * 0.5)
-        recommendation_factor = len(audit_result.recommendations) * 100
+        model = self.cost_model
+        base_cost = model.base_cost
+        risk_multiplier = 1.0 + (audit_result.risk_score * model.risk_weight)
+        recommendation_factor = len(audit_result.recommendations) * model.recommendation_cost
 
         total_cost = base_cost * risk_multiplier + recommendation_factor
 
@@ -34,4 +149,94 @@ class StandardCostCalculator:
                 'num_risk_factors': len(audit_result.risk_factors),
                 'num_recommendations': len(audit_result.recommendations)
             }
-        }
\ No newline at end of file
+        }
+
+    def calculate_costs_batch(self, risk_scores, num_recommendations, num_risk_factors=None,
+                              teams=None) -> CostBatch:
+        """Calculate the costs of many audit results at once from columnar inputs.
+
+        Every element equals what calculate_costs returns for the same inputs, bit for
+        bit: the formula runs the same IEEE operations in the same order, only on whole
+        arrays instead of one Python float at a time.
+
+        Args:
+            risk_scores: Risk score of each result (array-like of floats)
+            num_recommendations: Number of recommendations of each result (array-like of ints)
+            num_risk_factors: Number of risk factors of each result (optional, zeros if None)
+            teams: Team (or any group key) of each result, enabling per-team rollups (optional)
+
+        Returns:
+            CostBatch with one element per result
+
+        Raises:
+            ImportError: If numpy is not installed
+            ValueError: If the input columns differ in length
+        """
+        np = _require_numpy()
+        model = self.cost_model
+        risk_scores = np.asarray(risk_scores, dtype=np.float64)
+        num_recommendations = np.asarray(num_recommendations, dtype=np.int64)
+        num_risk_factors = (np.zeros(len(risk_scores), dtype=np.int64) if num_risk_factors is None
+                            else np.asarray(num_risk_factors, dtype=np.int64))
+        if teams is not None:
+            teams = np.asarray(teams)
+        lengths = {len(risk_scores), len(num_recommendations), len(num_risk_factors)}
+        if teams is not None:
+            lengths.add(len(teams))
+        if len(lengths) > 1:
+            raise ValueError("All input columns must have the same length")
+
+        base_cost = np.full(len(risk_scores), model.base_cost, dtype=np.float64)
+        risk_multiplier = 1.0 + risk_scores * model.risk_weight
+        # Integer constants stay integer, matching len(...) * int on the scalar path.
+        recommendation_cost = num_recommendations * model.recommendation_cost
+        return CostBatch(
+            risk_score=risk_scores,
+            num_risk_factors=num_risk_factors,
+            num_recommendations=num_recommendations,
+            base_cost=base_cost,
+            risk_adjustment=base_cost * (risk_multiplier - 1.0),
+            recommendation_cost=recommendation_cost,
+            total_cost=base_cost * risk_multiplier + recommendation_cost,
+            teams=teams
+        )
+
+    def calculate_costs_for(self, audit_results: Iterable[AuditResult], teams=None) -> CostBatch:
+        """Batch-calculate the costs of audit result objects.
+
+        Args:
+            audit_results: The audit results
+            teams: Team of each result (optional)
+
+        Returns:
+            CostBatch with one element per result
+        """
+        return self.calculate_costs_batch(*audit_result_columns(audit_results), teams=teams)
+
+
+def audit_result_columns(audit_results: Iterable[AuditResult]) -> Tuple[Any, Any, Any]:
+    """Extract the cost inputs of audit results as (risk_scores, num_recommendations, num_risk_factors) arrays."""
+    np = _require_numpy()
+    audit_results = audit_results if isinstance(audit_results, Sequence) else list(audit_results)
+    count = len(audit_results)
+    return (
+        np.fromiter((r.risk_score for r in audit_results), dtype=np.float64, count=count),
+        np.fromiter((len(r.recommendations) for r in audit_results), dtype=np.int64, count=count),
+        np.fromiter((len(r.risk_factors) for r in audit_results), dtype=np.int64, count=count)
+    )
+
+
+def cost_breakdown_columns(cost_analyses: Iterable[Dict[str, Any]]) -> Tuple[Any, Any, Any]:
+    """Extract the cost inputs from stored ``cost_analysis`` dicts (e.g. a results file).
+
+    Returns:
+        (risk_scores, num_recommendations, num_risk_factors) arrays
+    """
+    np = _require_numpy()
+    breakdowns = [cost.get('cost_breakdown') or {} for cost in cost_analyses]
+    count = len(breakdowns)
+    return (
+        np.fromiter((b.get('risk_score', 0.0) for b in breakdowns), dtype=np.float64, count=count),
+        np.fromiter((b.get('num_recommendations', 0) for b in breakdowns), dtype=np.int64, count=count),
+        np.fromiter((b.get('num_risk_factors', 0) for b in breakdowns), dtype=np.int64, count=count)
+    )
\ No newline at end of file
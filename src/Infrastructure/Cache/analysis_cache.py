@@ -0,0 +1,194 @@
+import dataclasses
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional
+from Core.Domain.domain_entities import AuditResult
+
+
+class AnalysisCache:
+    """Persistent SQLite cache of LLM analysis results with TTL and LRU eviction."""
+
+    def __init__(
+        self,
+        path: str,
+        ttl_seconds: Optional[float] = 7 * 24 * 3600,
+        max_entries: Optional[int] = 10000,
+        max_bytes: Optional[int] = None
+    ):
+        """Initialize the cache.
+
+        Args:
+            path: Path of the SQLite database file (created if missing)
+            ttl_seconds: Entries older than this are treated as misses; None disables expiry
+            max_entries: Maximum number of stored entries; None disables the limit
+            max_bytes: Maximum total payload size in bytes; None disables the limit
+        """
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS analysis_cache ("
+            " key TEXT PRIMARY KEY,"
+            " payload TEXT NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " created_at REAL NOT NULL,"
+            " last_access REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_analysis_cache_last_access ON analysis_cache (last_access)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def normalize_transcript(transcript: str) -> str:
+        """Normalize a transcript so that whitespace-only differences share a cache entry.
+
+        Args:
+            transcript: The raw transcript
+
+        Returns:
+            The transcript with runs of whitespace collapsed and blank lines removed
+        """
+        lines = (' '.join(line.split()) for line in transcript.splitlines())
+        return '\n'.join(line for line in lines if line)
+
+    @classmethod
+    def make_key(cls, transcript: str, model: str, provider: str, prompt_version: str) -> str:
+        """Build the content-addressed key for a transcript and analyzer configuration.
+
+        Args:
+            transcript: The raw transcript
+            model: The model name used for the analysis
+            provider: The provider name used for the analysis
+            prompt_version: Version of the prompt template
+
+        Returns:
+            Hex SHA-256 digest identifying the analysis
+        """
+        material = json.dumps(
+            [prompt_version, provider, model, cls.normalize_transcript(transcript)],
+            ensure_ascii=False
+        )
+        return hashlib.sha256(material.encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[AuditResult]:
+        """Look up a cached result, refreshing its LRU position on a hit.
+
+        Args:
+            key: The cache key
+
+        Returns:
+            The cached AuditResult, or None on a miss or expired entry
+        """
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload, created_at FROM analysis_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or self._is_expired(row[1], now):
+                if row is not None:
+                    self._conn.execute("DELETE FROM analysis_cache WHERE key = ?", (key,))
+                    self._conn.commit()
+                    self.evictions += 1
+                self.misses += 1
+                return None
+            self._conn.execute("UPDATE analysis_cache SET last_access = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+            self.hits += 1
+        return self._decode(row[0])
+
+    def put(self, key: str, result: AuditResult):
+        """Store a result and evict expired or least recently used entries.
+
+        Args:
+            key: The cache key
+            result: The analysis result to store
+        """
+        payload = self._encode(result)
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO analysis_cache (key, payload, size, created_at, last_access)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (key, payload, len(payload.encode('utf-8')), now, now)
+            )
+            self._evict(now)
+            self._conn.commit()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters and current occupancy.
+
+        Returns:
+            Dict containing hits, misses, evictions, hit rate, entries and bytes
+        """
+        with self._lock:
+            entries, total_bytes = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM analysis_cache"
+            ).fetchone()
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'entries': entries,
+            'bytes': total_bytes
+        }
+
+    def close(self):
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def _is_expired(self, created_at: float, now: float) -> bool:
+        return self.ttl_seconds is not None and now - created_at > self.ttl_seconds
+
+    def _evict(self, now: float):
+        """Drop expired entries, then least recently used ones until within limits."""
+        if self.ttl_seconds is not None:
+            cursor = self._conn.execute(
+                "DELETE FROM analysis_cache WHERE created_at < ?", (now - self.ttl_seconds,)
+            )
+            self.evictions += max(cursor.rowcount, 0)
+
+        if self.max_entries is not None:
+            cursor = self._conn.execute(
+                "DELETE FROM analysis_cache WHERE key IN ("
+                " SELECT key FROM analysis_cache ORDER BY last_access DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,)
+            )
+            self.evictions += max(cursor.rowcount, 0)
+
+        if self.max_bytes is not None:
+            total_bytes = self._conn.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM analysis_cache"
+            ).fetchone()[0]
+            rows = self._conn.execute(
+                "SELECT key, size FROM analysis_cache ORDER BY last_access ASC"
+            )
+            stale = []
+            for key, size in rows:
+                if total_bytes <= self.max_bytes:
+                    break
+                stale.append((key,))
+                total_bytes -= size
+            self._conn.executemany("DELETE FROM analysis_cache WHERE key = ?", stale)
+            self.evictions += len(stale)
+
+    @staticmethod
+    def _encode(result: AuditResult) -> str:
+        return json.dumps(dataclasses.asdict(result), ensure_ascii=False)
+
+    @staticmethod
+    def _decode(payload: str) -> AuditResult:
+        return AuditResult(**json.loads(payload))
\ No newline at end of file
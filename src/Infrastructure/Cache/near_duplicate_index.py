@@ -0,0 +1,321 @@
+import dataclasses
+import hashlib
+import json
+import random
+import re
+import sqlite3
+import threading
+import time
+from array import array
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from Core.Domain.domain_entities import AuditResult
+from Infrastructure.Parsers.simple_text_parser import SimpleTextParser
+
+# Mersenne prime 2^61 - 1, the modulus of the universal hash permutations.
+_MERSENNE_PRIME = (1 << 61) - 1
+# Letters and digits of any script, so non-Latin transcripts get shingles too.
+_WORD_PATTERN = re.compile(r"[^\W_]+(?:'[^\W_]+)?")
+
+
+@dataclass
+class NearDuplicateMatch:
+    """A previously analyzed transcript similar enough to reuse its analysis."""
+
+    doc_id: str
+    similarity: float
+    result: AuditResult
+
+
+class MinHasher:
+    """MinHash signatures over word shingles of a transcript."""
+
+    def __init__(self, num_perm: int = 128, shingle_size: int = 5, seed: int = 1,
+                 text_parser: SimpleTextParser = None):
+        """Initialize the hasher.
+
+        Args:
+            num_perm: Number of hash permutations, i.e. signature length
+            shingle_size: Number of consecutive words per shingle
+            seed: Seed of the permutations; signatures are only comparable for equal seeds
+            text_parser: The parser used to split transcripts into lines (optional, will create default if None)
+        """
+        if num_perm < 1 or shingle_size < 1:
+            raise ValueError("num_perm and shingle_size must be at least 1")
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        self.text_parser = text_parser or SimpleTextParser()
+        rng = random.Random(seed)
+        self._permutations = [
+            (rng.randrange(1, _MERSENNE_PRIME), rng.randrange(0, _MERSENNE_PRIME)) for _ in range(num_perm)
+        ]
+
+    def shingles(self, transcript: str) -> set:
+        """Return the set of hashed word shingles of a transcript.
+
+        Words are lowercased with punctuation removed, so formatting differences
+        between exports of the same meeting do not change the shingles.
+        """
+        words = [word for line in self.text_parser.split_paragraphs(transcript.lower())
+                 for word in _WORD_PATTERN.findall(line)]
+        size = min(self.shingle_size, len(words)) or 1
+        return {
+            int.from_bytes(hashlib.blake2b(' '.join(words[i:i + size]).encode('utf-8'), digest_size=8).digest(),
+                           'little') & _MERSENNE_PRIME
+            for i in range(max(len(words) - size + 1, 1 if words else 0))
+        }
+
+    def signature(self, transcript: str) -> Tuple[int, ...]:
+        """Compute the MinHash signature of a transcript.
+
+        Args:
+            transcript: The raw transcript
+
+        Returns:
+            Tuple of num_perm minimum hash values (all maximal for an empty transcript)
+        """
+        return self.signature_of(self.shingles(transcript))
+
+    def signature_of(self, hashes: set) -> Tuple[int, ...]:
+        """Compute the MinHash signature of a set of hashed shingles."""
+        if not hashes:
+            return (_MERSENNE_PRIME,) * self.num_perm
+        return tuple(min((a * h + b) % _MERSENNE_PRIME for h in hashes) for a, b in self._permutations)
+
+    @staticmethod
+    def similarity(first: Sequence[int], second: Sequence[int]) -> float:
+        """Estimate the Jaccard similarity of two transcripts from their signatures."""
+        if len(first) != len(second):
+            raise ValueError("Signatures must have the same length")
+        return sum(1 for a, b in zip(first, second) if a == b) / len(first)
+
+
+def optimal_bands(num_perm: int, threshold: float) -> Tuple[int, int]:
+    """Choose the LSH band count and rows per band for a similarity threshold.
+
+    Pairs with similarity s become candidates with probability 1 - (1 - s^r)^b,
+    an S-curve with its midpoint at (1/b)^(1/r). The midpoint is placed well below
+    the threshold, so pairs at the threshold are almost always candidates; false
+    candidates only cost a signature comparison.
+
+    Args:
+        num_perm: Signature length
+        threshold: Target Jaccard similarity
+
+    Returns:
+        (bands, rows) with bands * rows <= num_perm
+    """
+    target = max(2 * threshold - 1, threshold / 2)
+    best = None
+    for rows in range(1, num_perm + 1):
+        bands = num_perm // rows
+        distance = abs((1 / bands) ** (1 / rows) - target)
+        if best is None or distance < best[0]:
+            best = (distance, bands, rows)
+    return best[1], best[2]
+
+
+class NearDuplicateIndex:
+    """Persistent MinHash/LSH index of analyzed transcripts.
+
+    Each transcript's signature is split into bands; transcripts sharing any band
+    are candidates, and candidates whose estimated similarity reaches the threshold
+    are near-duplicates whose AuditResult can be reused.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        threshold: float = 0.9,
+        num_perm: int = 128,
+        shingle_size: int = 5,
+        namespace: str = '',
+        hasher: MinHasher = None,
+        min_shingles: int = 8
+    ):
+        """Initialize the index.
+
+        Args:
+            path: Path of the SQLite database file (created if missing)
+            threshold: Minimum estimated Jaccard similarity for a match
+            num_perm: Signature length (ignored when a hasher is given)
+            shingle_size: Words per shingle (ignored when a hasher is given)
+            namespace: Analyzer configuration (e.g. model and prompt version); matches never cross namespaces
+            hasher: The MinHasher to use (optional, will create default if None)
+            min_shingles: Fewest shingles a transcript needs to be looked up or indexed; shorter
+                transcripts share too few words for their similarity to mean anything
+        """
+        if not 0.0 < threshold <= 1.0:
+            raise ValueError("threshold must be in (0, 1]")
+        self.path = path
+        self.threshold = threshold
+        self.namespace = namespace
+        self.hasher = hasher or MinHasher(num_perm=num_perm, shingle_size=shingle_size)
+        self.min_shingles = max(min_shingles, 1)
+        self.bands, self.rows = optimal_bands(self.hasher.num_perm, threshold)
+        self.hits = 0
+        self.misses = 0
+        self.skipped = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS near_duplicate_documents ("
+            " doc_id TEXT NOT NULL,"
+            " namespace TEXT NOT NULL,"
+            " signature BLOB NOT NULL,"
+            " payload TEXT NOT NULL,"
+            " created_at REAL NOT NULL,"
+            " PRIMARY KEY (namespace, doc_id))"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS near_duplicate_buckets ("
+            " bucket INTEGER NOT NULL,"
+            " doc_id TEXT NOT NULL,"
+            " PRIMARY KEY (bucket, doc_id)) WITHOUT ROWID"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS near_duplicate_meta (key TEXT PRIMARY KEY, value INTEGER NOT NULL)"
+        )
+        self._load_parameters()
+        self._conn.commit()
+
+    @staticmethod
+    def make_doc_id(transcript: str) -> str:
+        """Content-addressed ID of a transcript (whitespace-insensitive)."""
+        normalized = '\n'.join(' '.join(line.split()) for line in transcript.splitlines() if line.strip())
+        return hashlib.sha256(normalized.encode('utf-8')).hexdigest()
+
+    def find(self, transcript: str) -> Optional[NearDuplicateMatch]:
+        """Return the most similar indexed transcript at or above the threshold.
+
+        Args:
+            transcript: The raw transcript
+
+        Returns:
+            NearDuplicateMatch, or None if no indexed transcript is similar enough
+            or the transcript has fewer than ``min_shingles`` shingles
+        """
+        signature = self._signature(transcript)
+        if signature is None:
+            self.skipped += 1
+            return None
+        buckets = self._buckets(signature)
+        with self._lock:
+            placeholders = ','.join('?' * len(buckets))
+            rows = self._conn.execute(
+                "SELECT d.doc_id, d.signature, d.payload FROM near_duplicate_documents d"
+                f" WHERE d.namespace = ? AND d.doc_id IN ("
+                f"  SELECT doc_id FROM near_duplicate_buckets WHERE bucket IN ({placeholders}))",
+                (self.namespace, *buckets)
+            ).fetchall()
+
+            best = None
+            for doc_id, blob, payload in rows:
+                similarity = self.hasher.similarity(signature, array('Q', blob))
+                if similarity >= self.threshold and (best is None or similarity > best[1]):
+                    best = (doc_id, similarity, payload)
+            if best is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return NearDuplicateMatch(doc_id=best[0], similarity=best[1], result=self._decode(best[2]))
+
+    def add(self, transcript: str, result: AuditResult, doc_id: Optional[str] = None) -> Optional[str]:
+        """Index an analyzed transcript; re-adding a transcript replaces its result.
+
+        Args:
+            transcript: The raw transcript
+            result: Its analysis result
+            doc_id: ID to store it under (optional, content hash if None)
+
+        Returns:
+            The document ID, or None if the transcript has fewer than ``min_shingles``
+            shingles and was not indexed
+        """
+        signature = self._signature(transcript)
+        if signature is None:
+            return None
+        doc_id = doc_id or self.make_doc_id(transcript)
+        buckets = self._buckets(signature)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO near_duplicate_documents (doc_id, namespace, signature, payload, created_at)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (doc_id, self.namespace, array('Q', signature).tobytes(), self._encode(result), time.time())
+            )
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO near_duplicate_buckets (bucket, doc_id) VALUES (?, ?)",
+                [(bucket, doc_id) for bucket in buckets]
+            )
+            self._conn.commit()
+        return doc_id
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters and the number of indexed transcripts."""
+        with self._lock:
+            entries = self._conn.execute(
+                "SELECT COUNT(*) FROM near_duplicate_documents WHERE namespace = ?", (self.namespace,)
+            ).fetchone()[0]
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'skipped': self.skipped,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'entries': entries,
+            'bands': self.bands,
+            'rows': self.rows
+        }
+
+    def close(self):
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def _load_parameters(self):
+        """Reuse the LSH layout of an existing index so its buckets stay valid.
+
+        Raises:
+            ValueError: If the index was built with a different signature layout
+        """
+        stored = dict(self._conn.execute("SELECT key, value FROM near_duplicate_meta"))
+        if not stored:
+            self._conn.executemany(
+                "INSERT INTO near_duplicate_meta (key, value) VALUES (?, ?)",
+                [('num_perm', self.hasher.num_perm), ('shingle_size', self.hasher.shingle_size),
+                 ('bands', self.bands), ('rows', self.rows)]
+            )
+            return
+        if (stored['num_perm'], stored['shingle_size']) != (self.hasher.num_perm, self.hasher.shingle_size):
+            raise ValueError(
+                f"{self.path} was built with num_perm={stored['num_perm']} and "
+                f"shingle_size={stored['shingle_size']}"
+            )
+        self.bands, self.rows = stored['bands'], stored['rows']
+
+    def _signature(self, transcript: str) -> Optional[Tuple[int, ...]]:
+        """Return the signature of a transcript, or None if it has too few shingles."""
+        hashes = self.hasher.shingles(transcript)
+        if len(hashes) < self.min_shingles:
+            return None
+        return self.hasher.signature_of(hashes)
+
+    def _buckets(self, signature: Sequence[int]) -> List[int]:
+        """Hash each band of the signature (with the namespace) to a bucket ID."""
+        buckets = []
+        for band in range(self.bands):
+            values = signature[band * self.rows:(band + 1) * self.rows]
+            digest = hashlib.blake2b(
+                f"{self.namespace}|{band}|{','.join(map(str, values))}".encode('utf-8'), digest_size=8
+            ).digest()
+            buckets.append(int.from_bytes(digest, 'little', signed=True))
+        return buckets
+
+    @staticmethod
+    def _encode(result: AuditResult) -> str:
+        return json.dumps(dataclasses.asdict(result), ensure_ascii=False)
+
+    @staticmethod
+    def _decode(payload: str) -> AuditResult:
+        return AuditResult(**json.loads(payload))
\ No newline at end of file
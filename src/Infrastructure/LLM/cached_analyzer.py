@@ -0,0 +1,79 @@
+from typing import AsyncIterator
+from Core.Domain.domain_entities import AuditResult, StreamedItem
+from Core.Interfaces.interfaces import ILLMAnalyzer
+from Core.Services.instrumentation import Instrumentation, get_instrumentation
+from Core.Services.report_merger import audit_result_items
+from Infrastructure.Cache.analysis_cache import AnalysisCache
+
+
+class CachedLLMAnalyzer:
+    """ILLMAnalyzer decorator that serves repeated transcripts from an AnalysisCache."""
+
+    def __init__(self, analyzer: ILLMAnalyzer, cache: AnalysisCache, bypass: bool = False,
+                 instrumentation: Instrumentation = None):
+        """Initialize the cached analyzer.
+
+        Args:
+            analyzer: The analyzer to call on a cache miss
+            cache: The persistent result cache
+            bypass: Skip cache lookups and always call the analyzer; fresh results are still stored
+            instrumentation: Counts cache hits and misses on the current span
+                (optional, uses the process-wide instrumentation if None)
+        """
+        self.analyzer = analyzer
+        self.cache = cache
+        self.bypass = bypass
+        self.instrumentation = instrumentation or get_instrumentation()
+        config = getattr(analyzer, 'config', {}) or {}
+        self.model = config.get('model', '')
+        self.provider = config.get('provider', '')
+        self.prompt_version = getattr(analyzer, 'PROMPT_TEMPLATE_VERSION', 'unversioned')
+        # Caching does not change results, so the wrapped configuration and prompt version pass through.
+        self.config = config
+        self.PROMPT_TEMPLATE_VERSION = self.prompt_version
+
+    async def analyze(self, transcript: str) -> AuditResult:
+        """Return the cached result for the transcript, analyzing it on a miss."""
+        key = self.cache.make_key(transcript, self.model, self.provider, self.prompt_version)
+        if not self.bypass:
+            cached = self.cache.get(key)
+            if cached is not None:
+                self.instrumentation.current_span().add('cache_hits')
+                return cached
+
+        self.instrumentation.current_span().add('cache_misses')
+        result = await self.analyzer.analyze(transcript)
+        self._store(key, result)
+        return result
+
+    async def analyze_stream(self, transcript: str) -> AsyncIterator[StreamedItem]:
+        """Replay the cached result for the transcript, or stream the analysis on a miss.
+
+        Analyzers without analyze_stream are called with analyze and their result replayed.
+        """
+        key = self.cache.make_key(transcript, self.model, self.provider, self.prompt_version)
+        if not self.bypass:
+            cached = self.cache.get(key)
+            if cached is not None:
+                self.instrumentation.current_span().add('cache_hits')
+                for item in audit_result_items(cached):
+                    yield item
+                return
+
+        self.instrumentation.current_span().add('cache_misses')
+        stream = getattr(self.analyzer, 'analyze_stream', None)
+        if stream is None:
+            result = await self.analyzer.analyze(transcript)
+            self._store(key, result)
+            for item in audit_result_items(result):
+                yield item
+            return
+        async for item in stream(transcript):
+            if item.is_final:
+                self._store(key, item.result)
+            yield item
+
+    def _store(self, key: str, result: AuditResult):
+        # Failed analyses carry no meeting report and truncated ones miss part of it; neither is replayed.
+        if result.raw_report is not None and not result.truncated:
+            self.cache.put(key, result)
\ No newline at end of file
@@ -0,0 +1,149 @@
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Sequence
+from Core.Domain.domain_entities import AuditResult
+from Core.Domain.exceptions import LLMAnalysisError
+from Core.Interfaces.interfaces import ILLMAnalyzer
+from Core.Services.instrumentation import Instrumentation, get_instrumentation
+from Core.Services.report_merger import REPORT_SECTIONS
+from Infrastructure.Parsers.heuristic_extractor import HeuristicExtractor
+from Infrastructure.Parsers.token_counter import estimate_tokens
+
+ESCALATE_ERROR = 'error'
+ESCALATE_TRUNCATED = 'truncated'
+ESCALATE_INCOMPLETE = 'incomplete'
+ESCALATE_LOW_CONFIDENCE = 'low_confidence'
+ESCALATION_REASONS = (ESCALATE_ERROR, ESCALATE_TRUNCATED, ESCALATE_INCOMPLETE, ESCALATE_LOW_CONFIDENCE)
+
+
+@dataclass
+class TierStats:
+    """Counters of one model tier of a cascade."""
+
+    name: str
+    calls: int = 0
+    accepted: int = 0
+    failed: int = 0
+    total_seconds: float = 0.0
+    tokens_sent: int = 0
+    escalations: Dict[str, int] = field(default_factory=lambda: {reason: 0 for reason in ESCALATION_REASONS})
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            'name': self.name,
+            'calls': self.calls,
+            'accepted': self.accepted,
+            'escalated': sum(self.escalations.values()),
+            'escalations': dict(self.escalations),
+            'failed': self.failed,
+            'acceptance_rate': round(self.accepted / self.calls, 4) if self.calls else 0.0,
+            'mean_seconds': round(self.total_seconds / self.calls, 6) if self.calls else 0.0,
+            'tokens_sent': self.tokens_sent
+        }
+
+
+class ModelCascadeAnalyzer:
+    """ILLMAnalyzer that tries models from cheapest to largest and stops at the first good result.
+
+    A tier's result is accepted unless the call failed, the response was cut off,
+    the report is incomplete or its confidence is below ``min_confidence``; only
+    then is the transcript sent to the next tier. The last tier's result is
+    returned whatever its quality. With an ``extractor``, a report is also
+    incomplete when it holds fewer than ``min_recall`` times the items the rules
+    find with high confidence.
+
+    Each tier call is recorded as a ``cascade_tier<N>`` span with ``accepted`` and
+    the escalation reason, and counted in stats(), to tune the thresholds.
+    """
+
+    def __init__(
+        self,
+        tiers: Sequence[ILLMAnalyzer],
+        min_confidence: float = 0.7,
+        extractor: HeuristicExtractor = None,
+        min_recall: float = 0.5,
+        instrumentation: Instrumentation = None
+    ):
+        """Initialize the cascade.
+
+        Args:
+            tiers: Analyzers ordered from cheapest to largest model
+            min_confidence: Lowest confidence accepted from any but the last tier
+            extractor: Rule-based extractor used to check that reports are complete (optional)
+            min_recall: Share of the high-confidence rule items a report must match
+            instrumentation: Receives a span per tier call (optional, uses the process-wide instrumentation if None)
+        """
+        if not tiers:
+            raise ValueError("A cascade needs at least one tier")
+        self.tiers = list(tiers)
+        self.min_confidence = min_confidence
+        self.extractor = extractor
+        self.min_recall = min_recall
+        self.instrumentation = instrumentation or get_instrumentation()
+        names = [getattr(tier, 'config', {}).get('model') or f"tier{index}" for index, tier in enumerate(self.tiers)]
+        self.tier_stats = [TierStats(name) for name in names]
+        # Results depend on every tier and the thresholds, so they are part of the cache key.
+        self.config = {**getattr(self.tiers[0], 'config', {}), 'model': '>'.join(names)}
+        inner_version = getattr(self.tiers[0], 'PROMPT_TEMPLATE_VERSION', 'unversioned')
+        self.PROMPT_TEMPLATE_VERSION = (f"{inner_version}+cascade-{min_confidence}"
+                                        f"{f'-recall-{min_recall}' if extractor is not None else ''}")
+
+    def escalation_reason(self, result: AuditResult, transcript: str) -> Optional[str]:
+        """Return why a tier's result is not good enough, or None to accept it."""
+        if result.truncated:
+            return ESCALATE_TRUNCATED
+        report = result.raw_report
+        if not isinstance(report, dict) or not all(isinstance(report.get(s), list) for s in REPORT_SECTIONS):
+            return ESCALATE_INCOMPLETE
+        if self.extractor is not None:
+            extraction = self.extractor.extract(transcript)
+            expected = sum(1 for item in extraction.items if item.confidence >= self.extractor.min_item_confidence)
+            found = sum(len(report[section]) for section in REPORT_SECTIONS)
+            if found < self.min_recall * expected:
+                return ESCALATE_INCOMPLETE
+        if result.confidence < self.min_confidence:
+            return ESCALATE_LOW_CONFIDENCE
+        return None
+
+    async def analyze(self, transcript: str) -> AuditResult:
+        """Analyze the transcript with each tier in turn until a result is accepted.
+
+        Raises:
+            LLMAnalysisError: If the last tier failed
+            ConnectionError: If the last tier's provider could not be initialized
+        """
+        tokens = estimate_tokens(transcript)
+        last = len(self.tiers) - 1
+        for index, tier in enumerate(self.tiers):
+            stats = self.tier_stats[index]
+            stats.calls += 1
+            stats.tokens_sent += tokens
+            started = time.perf_counter()
+            with self.instrumentation.span(f'cascade_tier{index}', model=stats.name) as span:
+                try:
+                    result = await tier.analyze(transcript)
+                except (LLMAnalysisError, ConnectionError):
+                    stats.total_seconds += time.perf_counter() - started
+                    if index == last:
+                        stats.failed += 1
+                        raise
+                    stats.escalations[ESCALATE_ERROR] += 1
+                    span.set(escalated=True, error_escalated=True)
+                    continue
+                stats.total_seconds += time.perf_counter() - started
+
+                reason = self.escalation_reason(result, transcript) if index < last else None
+                if reason is None:
+                    stats.accepted += 1
+                    span.set(accepted=True)
+                    return result
+                stats.escalations[reason] += 1
+                span.set(escalated=True, **{f'{reason}_escalated': True})
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the counters of every tier and the share of transcripts that needed more than the first."""
+        first = self.tier_stats[0]
+        return {
+            'tiers': [stats.as_dict() for stats in self.tier_stats],
+            'escalation_rate': round(1 - first.accepted / first.calls, 4) if first.calls else 0.0
+        }
\ No newline at end of file
@@ -0,0 +1,65 @@
+import asyncio
+from Core.Domain.domain_entities import AuditResult
+from Core.Interfaces.interfaces import ILLMAnalyzer
+from Core.Services.report_merger import merge_audit_results
+from Infrastructure.Parsers.transcript_chunker import TranscriptChunker
+
+
+class ChunkedLLMAnalyzer:
+    """ILLMAnalyzer decorator that map-reduces transcripts too long for one prompt.
+
+    When some chunks fail, the chunks that succeeded are still merged: the result
+    is marked ``truncated`` (so it is not cached) and its confidence is scaled by
+    the share of tokens analyzed. Only when every chunk fails is the first error raised.
+    """
+
+    def __init__(self, analyzer: ILLMAnalyzer, chunker: TranscriptChunker = None, max_concurrency: int = 4):
+        """Initialize the chunked analyzer.
+
+        Args:
+            analyzer: The analyzer applied to each chunk
+            chunker: The chunker splitting transcripts (optional, will create default if None)
+            max_concurrency: Maximum number of chunks of one transcript analyzed at once
+        """
+        self.analyzer = analyzer
+        self.chunker = chunker or TranscriptChunker()
+        self.max_concurrency = max_concurrency
+        self.failed_chunks = 0
+        # Expose the wrapped configuration so outer decorators (e.g. the cache) can key on it.
+        self.config = getattr(analyzer, 'config', {})
+        inner_version = getattr(analyzer, 'PROMPT_TEMPLATE_VERSION', 'unversioned')
+        self.PROMPT_TEMPLATE_VERSION = f"{inner_version}+chunked-{self.chunker.max_tokens}"
+
+    async def analyze(self, transcript: str) -> AuditResult:
+        """Analyze the transcript directly, or chunk by chunk when it exceeds the budget."""
+        if not self.chunker.needs_chunking(transcript):
+            return await self.analyzer.analyze(transcript)
+
+        chunks = self.chunker.split(transcript)
+        if len(chunks) == 1:
+            return await self.analyzer.analyze(chunks[0].text)
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def analyze_chunk(text: str) -> AuditResult:
+            async with semaphore:
+                return await self.analyzer.analyze(text)
+
+        outcomes = await asyncio.gather(*(analyze_chunk(chunk.text) for chunk in chunks), return_exceptions=True)
+        errors = [outcome for outcome in outcomes if isinstance(outcome, BaseException)]
+        if not errors:
+            return merge_audit_results(outcomes, [chunk.tokens for chunk in chunks])
+        for error in errors:
+            if not isinstance(error, Exception):
+                raise error
+        self.failed_chunks += len(errors)
+        analyzed = [(outcome, chunk.tokens) for outcome, chunk in zip(outcomes, chunks)
+                    if not isinstance(outcome, BaseException)]
+        if not analyzed:
+            raise errors[0]
+
+        merged = merge_audit_results([result for result, _ in analyzed], [tokens for _, tokens in analyzed])
+        covered = sum(tokens for _, tokens in analyzed) / (sum(chunk.tokens for chunk in chunks) or 1)
+        merged.confidence = round(merged.confidence * covered, 4)
+        merged.truncated = True
+        return merged
\ No newline at end of file
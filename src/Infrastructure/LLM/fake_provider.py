@@ -0,0 +1,223 @@
+import asyncio
+import itertools
+import json
+import math
+import random
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Sequence, Union
+from Core.Domain.domain_entities import AuditResult
+from Infrastructure.Parsers.token_counter import CHARS_PER_TOKEN
+
+
+class FakeProviderError(Exception):
+    """HTTP-style error raised by FakeLLMProvider, shaped like provider SDK errors."""
+
+    def __init__(self, status_code: int, message: str = "", retry_after: Optional[float] = None):
+        super().__init__(message or f"HTTP {status_code}")
+        self.status_code = status_code
+        self.headers = {'retry-after': str(retry_after)} if retry_after is not None else {}
+
+
+class FakeResponse:
+    """Minimal stand-in for a provider chat response."""
+
+    def __init__(self, content: str):
+        self.content = content
+
+
+class FakeChunk:
+    """Minimal stand-in for a chunk of a streamed provider response."""
+
+    def __init__(self, delta: str):
+        self.delta = delta
+
+
+DEFAULT_RESPONSE = {
+    "risk_analysis": {
+        "score": 0.5,
+        "risk_factors": ["Deadline pressure"],
+        "recommendations": ["Track the assigned tasks"],
+        "summary": "Canned analysis produced by the fake provider.",
+        "confidence": 0.9
+    },
+    "meeting_report": {
+        "questions": [],
+        "meetings": [],
+        "tasks": []
+    }
+}
+
+
+class LatencyModel:
+    """Seeded latency distribution for fake LLM calls."""
+
+    DISTRIBUTIONS = ('constant', 'uniform', 'lognormal')
+
+    def __init__(self, distribution: str = 'constant', mean: float = 0.0, spread: float = 0.0, seed: int = 0):
+        """Initialize the latency model.
+
+        Args:
+            distribution: One of 'constant', 'uniform' or 'lognormal'
+            mean: Mean latency in seconds
+            spread: Half-width for 'uniform', sigma of the underlying normal for 'lognormal'
+            seed: Random seed, so runs are reproducible
+        """
+        if distribution not in self.DISTRIBUTIONS:
+            raise ValueError(f"Unknown latency distribution '{distribution}'")
+        self.distribution = distribution
+        self.mean = mean
+        self.spread = spread
+        self._random = random.Random(seed)
+
+    def sample(self) -> float:
+        """Draw one latency in seconds."""
+        if self.distribution == 'uniform':
+            return max(0.0, self._random.uniform(self.mean - self.spread, self.mean + self.spread))
+        if self.distribution == 'lognormal' and self.mean > 0:
+            # Choose mu so that the distribution mean equals self.mean; the tail grows with spread.
+            mu = math.log(self.mean) - self.spread ** 2 / 2
+            return self._random.lognormvariate(mu, self.spread)
+        return self.mean
+
+
+def _as_latency_model(latency: Union[float, LatencyModel]) -> LatencyModel:
+    return latency if isinstance(latency, LatencyModel) else LatencyModel('constant', float(latency or 0.0))
+
+
+class FakeLLMProvider:
+    """In-process provider with canned responses, configurable latency and scripted failures.
+
+    Used to exercise retries and rate limiting locally and to benchmark the pipeline
+    without calling a real API. Like a real provider, responses are cut off at
+    ``max_tokens`` (estimated), taken from the call or the provider configuration.
+    """
+
+    def __init__(
+        self,
+        response: Union[Dict[str, Any], Sequence[Dict[str, Any]]] = None,
+        failures: List[Exception] = None,
+        latency: Union[float, LatencyModel] = 0.0,
+        responder: Callable[[Any], Union[str, Dict[str, Any]]] = None,
+        stream_chunk_chars: int = 16
+    ):
+        """Initialize the fake provider.
+
+        Args:
+            response: JSON document, or list of documents used in rotation, returned by successful calls
+                (optional, uses a canned report)
+            failures: Exceptions raised, in order, by the first calls before responses succeed
+            latency: Seconds each call takes, or a LatencyModel to sample from
+            responder: Function building the response from the chat messages; overrides ``response``
+            stream_chunk_chars: Characters per chunk of chat_stream, which spreads the latency over the chunks
+        """
+        responses = response or DEFAULT_RESPONSE
+        if isinstance(responses, dict):
+            responses = [responses]
+        self._responses = itertools.cycle([json.dumps(r) for r in responses])
+        self.responder = responder
+        self.failures = list(failures or [])
+        self.latency = _as_latency_model(latency)
+        self.stream_chunk_chars = max(1, stream_chunk_chars)
+        self.max_tokens: Optional[int] = None
+        self.calls = 0
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    async def initialize(self, config: Dict[str, Any] = None):
+        """Accept the provider configuration; only ``max_tokens`` is used."""
+        self.max_tokens = (config or {}).get('max_tokens')
+
+    async def chat(self, messages, **kwargs) -> FakeResponse:
+        """Return the canned response, or raise the next scripted failure."""
+        self.calls += 1
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            delay = self.latency.sample()
+            if delay:
+                await asyncio.sleep(delay)
+            if self.failures:
+                raise self.failures.pop(0)
+            return FakeResponse(self._content(messages, kwargs.get('max_tokens')))
+        finally:
+            self.in_flight -= 1
+
+    async def chat_stream(self, messages, **kwargs) -> AsyncIterator[FakeChunk]:
+        """Yield the canned response in chunks, the call's latency spread evenly over them."""
+        self.calls += 1
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            delay = self.latency.sample()
+            if self.failures:
+                if delay:
+                    await asyncio.sleep(delay)
+                raise self.failures.pop(0)
+            content = self._content(messages, kwargs.get('max_tokens'))
+            size = self.stream_chunk_chars
+            chunks = max(1, math.ceil(len(content) / size))
+            loop = asyncio.get_running_loop()
+            started = loop.time()
+            for index, start in enumerate(range(0, len(content), size)):
+                if delay:
+                    # Sleep until the chunk's share of the latency has passed, so timer overshoot does not add up.
+                    await asyncio.sleep(max(0.0, started + delay * (index + 1) / chunks - loop.time()))
+                yield FakeChunk(content[start:start + size])
+        finally:
+            self.in_flight -= 1
+
+    def _content(self, messages, max_tokens: Optional[int] = None) -> str:
+        if self.responder is not None:
+            content = self.responder(messages)
+            content = content if isinstance(content, str) else json.dumps(content)
+        else:
+            content = next(self._responses)
+        max_tokens = max_tokens or self.max_tokens
+        return content[:int(max_tokens * CHARS_PER_TOKEN)] if max_tokens else content
+
+    async def cleanup(self):
+        """Nothing to release."""
+        return None
+
+
+class FakeProviderRegistry:
+    """Registry handing out a fixed fake provider, for use with ProviderPool."""
+
+    def __init__(self, provider: FakeLLMProvider = None):
+        self.provider = provider or FakeLLMProvider()
+
+    def get_provider(self, name: str, config: Dict[str, Any] = None) -> FakeLLMProvider:
+        return self.provider
+
+
+class FakeLLMAnalyzer:
+    """Deterministic ILLMAnalyzer that returns a canned AuditResult after a simulated delay."""
+
+    def __init__(self, response: Dict[str, Any] = None, latency: Union[float, LatencyModel] = 0.0):
+        """Initialize the fake analyzer.
+
+        Args:
+            response: JSON document in the LLM output schema (optional, uses a canned report)
+            latency: Seconds each analysis takes, or a LatencyModel to sample from
+        """
+        self.response = response or DEFAULT_RESPONSE
+        self.latency = _as_latency_model(latency)
+        self.config = {'provider': 'fake', 'model': 'fake'}
+        self.calls = 0
+
+    async def analyze(self, transcript: str) -> AuditResult:
+        """Return the canned analysis for any transcript."""
+        self.calls += 1
+        delay = self.latency.sample()
+        if delay:
+            await asyncio.sleep(delay)
+        risk_data = self.response.get('risk_analysis', {})
+        report_data = json.loads(json.dumps(self.response.get('meeting_report', {})))
+        result = AuditResult(
+            risk_score=risk_data.get('score', 0.5),
+            risk_factors=list(risk_data.get('risk_factors', [])),
+            recommendations=list(risk_data.get('recommendations', [])),
+            summary=risk_data.get('summary', 'No summary provided'),
+            confidence=risk_data.get('confidence', 0.5),
+            raw_report=report_data
+        )
+        return result
\ No newline at end of file
@@ -0,0 +1,156 @@
+import asyncio
+import collections
+import time
+from typing import Any, Dict, Optional
+from Core.Domain.domain_entities import AuditResult
+from Core.Interfaces.interfaces import ILLMAnalyzer
+from Core.Services.instrumentation import Instrumentation, get_instrumentation
+from Core.Services.latency_stats import percentile as latency_percentile
+
+
+class HedgedLLMAnalyzer:
+    """ILLMAnalyzer decorator that sends a second request when the first is slower than usual.
+
+    If an analysis has not finished after the ``percentile`` of recent latencies,
+    the transcript is sent again, to ``fallback`` when one is given, and the first
+    successful result wins; the other request is cancelled. A failed request does
+    not end the race while the other one is still running.
+
+    Hedges are paid for, so they are capped at ``max_hedge_ratio`` of the requests:
+    every request earns that fraction of a hedge, and up to ``burst`` unused hedges
+    are kept. Until ``min_samples`` latencies have been seen, ``initial_delay`` is
+    used (no hedging if it is None).
+    """
+
+    def __init__(
+        self,
+        analyzer: ILLMAnalyzer,
+        fallback: ILLMAnalyzer = None,
+        percentile: float = 95.0,
+        max_hedge_ratio: float = 0.05,
+        burst: float = 5.0,
+        min_delay: float = 0.0,
+        initial_delay: Optional[float] = None,
+        window: int = 500,
+        min_samples: int = 20,
+        instrumentation: Instrumentation = None
+    ):
+        """Initialize the hedged analyzer.
+
+        Args:
+            analyzer: The analyzer that receives every request
+            fallback: The analyzer that receives the hedges (optional, hedges go to ``analyzer`` if None)
+            percentile: Percentile of recent latencies after which a request is hedged
+            max_hedge_ratio: Largest share of requests that may be hedged
+            burst: Unused hedges kept for bursts of slow requests
+            min_delay: Shortest wait before hedging, whatever the latencies
+            initial_delay: Wait before hedging until enough latencies are known (optional)
+            window: Number of recent latencies the percentile is computed over
+            min_samples: Latencies needed before the percentile is used
+            instrumentation: Counts hedges on the current span (optional, uses the process-wide instrumentation if None)
+        """
+        if not 0 < percentile < 100:
+            raise ValueError("percentile must be between 0 and 100")
+        if max_hedge_ratio < 0:
+            raise ValueError("max_hedge_ratio must not be negative")
+        self.analyzer = analyzer
+        self.fallback = fallback
+        self.percentile = percentile
+        self.max_hedge_ratio = max_hedge_ratio
+        self.burst = burst
+        self.min_delay = min_delay
+        self.initial_delay = initial_delay
+        self.min_samples = min_samples
+        self.instrumentation = instrumentation or get_instrumentation()
+        # Hedging does not change results, so the wrapped configuration and prompt version pass through.
+        self.config = getattr(analyzer, 'config', {})
+        self.PROMPT_TEMPLATE_VERSION = getattr(analyzer, 'PROMPT_TEMPLATE_VERSION', 'unversioned')
+        self._latencies = collections.deque(maxlen=window)
+        self._delay: Optional[float] = initial_delay
+        self._credits = burst
+        self.requests = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+        self.budget_denied = 0
+        self.request_latencies = collections.deque(maxlen=window)
+
+    def hedge_delay(self) -> Optional[float]:
+        """Return the seconds a request may take before it is hedged, or None while hedging is off."""
+        return self._delay
+
+    def _record_latency(self, seconds: float):
+        self._latencies.append(seconds)
+        if len(self._latencies) >= self.min_samples:
+            self._delay = max(self.min_delay, latency_percentile(self._latencies, self.percentile))
+
+    def _take_hedge(self) -> bool:
+        if self._credits >= 1:
+            self._credits -= 1
+            return True
+        self.budget_denied += 1
+        return False
+
+    async def _timed(self, analyzer: ILLMAnalyzer, transcript: str):
+        started = time.perf_counter()
+        result = await analyzer.analyze(transcript)
+        return result, time.perf_counter() - started
+
+    async def analyze(self, transcript: str) -> AuditResult:
+        """Analyze the transcript, hedging the request if it runs past the hedge delay."""
+        self.requests += 1
+        self._credits = min(self.burst, self._credits + self.max_hedge_ratio)
+        started = time.perf_counter()
+        primary = asyncio.ensure_future(self._timed(self.analyzer, transcript))
+        tasks = [primary]
+        try:
+            delay = self._delay
+            if delay is not None:
+                done, _ = await asyncio.wait(tasks, timeout=delay)
+                if not done and self._take_hedge():
+                    self.hedges += 1
+                    self.instrumentation.current_span().add('hedges')
+                    tasks.append(asyncio.ensure_future(self._timed(self.fallback or self.analyzer, transcript)))
+
+            pending = set(tasks)
+            first_error = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in tasks:
+                    if task not in done:
+                        continue
+                    if task.exception() is not None:
+                        first_error = first_error or task.exception()
+                        continue
+                    result, latency = task.result()
+                    self._record_latency(latency)
+                    if task is not primary:
+                        if not primary.done():
+                            # The slow primary is cancelled below; its elapsed time is a lower bound
+                            # of its latency, and leaving it out would shrink the tail the delay is read from.
+                            self._record_latency(time.perf_counter() - started)
+                        self.hedge_wins += 1
+                        self.instrumentation.current_span().add('hedge_wins')
+                    self.request_latencies.append(time.perf_counter() - started)
+                    return result
+            raise first_error
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the hedging counters, the current hedge delay and the latency percentiles of recent requests."""
+        latencies = self.request_latencies
+        return {
+            'requests': self.requests,
+            'hedges': self.hedges,
+            'hedge_wins': self.hedge_wins,
+            'budget_denied': self.budget_denied,
+            'hedge_ratio': round(self.hedges / self.requests, 4) if self.requests else 0.0,
+            'hedge_delay_seconds': round(self._delay, 4) if self._delay is not None else None,
+            'latency_seconds': {
+                'p50': round(latency_percentile(latencies, 50), 4),
+                'p95': round(latency_percentile(latencies, 95), 4),
+                'p99': round(latency_percentile(latencies, 99), 4)
+            }
+        }
\ No newline at end of file
@@ -0,0 +1,154 @@
+import asyncio
+from typing import Any, Dict, List, Optional, Tuple
+from Core.Domain.domain_entities import AuditResult
+from Core.Interfaces.interfaces import ILLMAnalyzer
+from Infrastructure.LLM.spoon_client import PACKED_STATIC_PROMPT_TOKENS, STATIC_PROMPT_TOKENS, SpoonLLMClient
+from Infrastructure.Parsers.token_counter import estimate_tokens
+
+
+class PackingLLMAnalyzer:
+    """ILLMAnalyzer that bundles concurrent short transcripts into one packed request.
+
+    Short transcripts (stand-ups) are smaller than the fixed instructions and
+    schema, so each one sent alone mostly pays for the prompt. Transcripts of at
+    most ``max_transcript_tokens`` are queued, and the queue is sent through
+    SpoonLLMClient.analyze_packed once it holds ``max_items`` transcripts, would
+    exceed ``max_pack_tokens``, or its oldest transcript has waited ``max_wait``
+    seconds. Longer transcripts, queues of one, and every transcript whose packed
+    analysis is missing or malformed go to ``fallback`` on their own.
+    """
+
+    def __init__(
+        self,
+        client: SpoonLLMClient,
+        fallback: ILLMAnalyzer = None,
+        max_pack_tokens: int = 2000,
+        max_transcript_tokens: Optional[int] = None,
+        max_items: int = 8,
+        max_wait: float = 0.05
+    ):
+        """Initialize the packing analyzer.
+
+        Args:
+            client: The client sending the packed requests
+            fallback: The analyzer for transcripts sent on their own (optional, uses ``client`` if None)
+            max_pack_tokens: Largest estimated transcript tokens in one packed request
+            max_transcript_tokens: Longest transcript that is packed (optional, half of ``max_pack_tokens`` if None)
+            max_items: Most transcripts in one packed request
+            max_wait: Seconds a transcript waits for others before its request is sent
+        """
+        if max_items < 1:
+            raise ValueError("max_items must be at least 1")
+        self.client = client
+        self.fallback = fallback or client
+        self.max_pack_tokens = max_pack_tokens
+        self.max_transcript_tokens = max_transcript_tokens or max_pack_tokens // 2
+        self.max_items = max_items
+        self.max_wait = max_wait
+        self.config = getattr(client, 'config', {})
+        # Packed answers come from a different prompt, so they are cached apart from single ones.
+        self.PROMPT_TEMPLATE_VERSION = f"{getattr(client, 'PROMPT_TEMPLATE_VERSION', 'unversioned')}+packed"
+        self._queue: List[Tuple[str, asyncio.Future]] = []
+        self._queue_tokens = 0
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._requests = set()
+        self.packed_requests = 0
+        self.packed_transcripts = 0
+        self.single_transcripts = 0
+        self.fallbacks = 0
+        self.failed_packs = 0
+        self.prompt_tokens_saved = 0
+
+    async def analyze(self, transcript: str) -> AuditResult:
+        """Analyze the transcript in a packed request, or on its own if it is too long."""
+        tokens = estimate_tokens(transcript)
+        if tokens > self.max_transcript_tokens:
+            self.single_transcripts += 1
+            return await self.fallback.analyze(transcript)
+
+        if self._queue and self._queue_tokens + tokens > self.max_pack_tokens:
+            self._flush()
+        future = asyncio.get_running_loop().create_future()
+        self._queue.append((transcript, future))
+        self._queue_tokens += tokens
+        if len(self._queue) >= self.max_items:
+            self._flush()
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(self.max_wait, self._flush)
+        return await future
+
+    def _flush(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._queue, self._queue_tokens = self._queue, [], 0
+        if not batch:
+            return
+        request = asyncio.ensure_future(self._send(batch))
+        # Keep a reference until the request is done, so it is not garbage collected mid-flight.
+        self._requests.add(request)
+        request.add_done_callback(self._requests.discard)
+
+    async def _send(self, batch: List[Tuple[str, asyncio.Future]]):
+        batch = [(transcript, future) for transcript, future in batch if not future.done()]
+        try:
+            if len(batch) == 1:
+                self.single_transcripts += 1
+                await self._analyze_alone(*batch[0])
+            elif batch:
+                await self._send_packed(batch)
+        finally:
+            # Never leave a caller waiting, e.g. when the loop shuts down mid-request.
+            for _, future in batch:
+                if not future.done():
+                    future.cancel()
+
+    async def _send_packed(self, batch: List[Tuple[str, asyncio.Future]]):
+        try:
+            results = await self.client.analyze_packed([transcript for transcript, _ in batch])
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.failed_packs += 1
+            results = [None] * len(batch)
+        else:
+            packed = sum(result is not None for result in results)
+            self.packed_requests += 1
+            self.packed_transcripts += packed
+            # Only delivered results spared a single request; a pack that delivered too few
+            # saved nothing, and its transcripts are counted as fallbacks below.
+            self.prompt_tokens_saved += max(0, packed * STATIC_PROMPT_TOKENS - PACKED_STATIC_PROMPT_TOKENS)
+
+        retries = []
+        for (transcript, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if result is not None:
+                future.set_result(result)
+            else:
+                self.fallbacks += 1
+                retries.append(self._analyze_alone(transcript, future))
+        await asyncio.gather(*retries)
+
+    async def _analyze_alone(self, transcript: str, future: asyncio.Future):
+        try:
+            result = await self.fallback.analyze(transcript)
+        except Exception as e:
+            if not future.done():
+                future.set_exception(e)
+            return
+        if not future.done():
+            future.set_result(result)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the packed requests and transcripts, the fallbacks and the estimated prompt tokens saved."""
+        return {
+            'packed_requests': self.packed_requests,
+            'packed_transcripts': self.packed_transcripts,
+            'transcripts_per_request': (round(self.packed_transcripts / self.packed_requests, 2)
+                                        if self.packed_requests else 0.0),
+            'single_transcripts': self.single_transcripts,
+            'fallbacks': self.fallbacks,
+            'failed_packs': self.failed_packs,
+            'prompt_tokens_saved': self.prompt_tokens_saved
+        }
\ No newline at end of file
@@ -0,0 +1,227 @@
+import asyncio
+import hashlib
+import inspect
+import json
+from typing import Any, Dict, List, Optional
+
+
+class _PoolEntry:
+    """Providers created for one provider configuration."""
+
+    def __init__(self, config: Dict[str, Any]):
+        self.config = dict(config)
+        self.providers: List[Any] = []
+        self.next_index = 0
+        self.lock = asyncio.Lock()
+
+
+class ProviderPool:
+    """Process-wide pool of initialized SpoonAI providers keyed by provider configuration.
+
+    Providers hold the HTTP clients (and their keep-alive connections), so sharing
+    them across SpoonLLMClient instances avoids paying provider setup and TLS
+    handshakes on every job. Each configuration gets up to ``pool_size`` providers,
+    handed out round-robin.
+    """
+
+    def __init__(self, pool_size: int = 4, registry=None):
+        """Initialize the pool.
+
+        Args:
+            pool_size: Maximum number of providers kept per configuration
+            registry: The SpoonAI provider registry (optional, uses the global registry if None)
+        """
+        if pool_size < 1:
+            raise ValueError("pool_size must be at least 1")
+        self.pool_size = pool_size
+        self.registry = registry
+        self._entries: Dict[str, _PoolEntry] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._closing = set()
+
+    @staticmethod
+    def config_key(config: Dict[str, Any]) -> str:
+        """Build the pool key of a provider configuration (secrets are only hashed).
+
+        Args:
+            config: The provider configuration
+
+        Returns:
+            Hex SHA-256 digest of the configuration
+        """
+        material = json.dumps(config, sort_keys=True, default=str)
+        return hashlib.sha256(material.encode('utf-8')).hexdigest()
+
+    async def acquire(self, config: Dict[str, Any]):
+        """Return an initialized provider for the configuration.
+
+        New providers are created until the pool is full; after that existing
+        providers are reused round-robin.
+
+        Args:
+            config: The provider configuration
+
+        Returns:
+            An initialized SpoonAI provider
+        """
+        entry = self._entry(config)
+        if len(entry.providers) >= self.pool_size:
+            return self._next_provider(entry)
+
+        async with entry.lock:
+            if len(entry.providers) < self.pool_size:
+                provider = await self._create_provider(entry.config)
+                entry.providers.append(provider)
+                return provider
+        return self._next_provider(entry)
+
+    async def warm_up(self, config: Dict[str, Any], count: Optional[int] = None) -> int:
+        """Create and initialize providers ahead of the first request.
+
+        Args:
+            config: The provider configuration
+            count: Number of providers to have ready (defaults to the pool size)
+
+        Returns:
+            Number of providers ready for the configuration
+        """
+        entry = self._entry(config)
+        target = min(count or self.pool_size, self.pool_size)
+        async with entry.lock:
+            missing = target - len(entry.providers)
+            if missing > 0:
+                created = await asyncio.gather(
+                    *(self._create_provider(entry.config) for _ in range(missing))
+                )
+                entry.providers.extend(created)
+            return len(entry.providers)
+
+    async def health_check(self) -> Dict[str, Dict[str, int]]:
+        """Check every pooled provider and drop the unhealthy ones.
+
+        Providers exposing a ``health_check`` coroutine are asked directly; the
+        others are assumed healthy. Dropped providers are recreated on demand.
+
+        Returns:
+            Per-configuration counts of healthy and removed providers
+        """
+        self._check_loop()
+        report = {}
+        for key, entry in self._entries.items():
+            async with entry.lock:
+                healthy = []
+                removed = 0
+                for provider in entry.providers:
+                    if await self._is_healthy(provider):
+                        healthy.append(provider)
+                    else:
+                        removed += 1
+                        await self._close_provider(provider)
+                entry.providers = healthy
+                entry.next_index = 0
+            report[key] = {'healthy': len(healthy), 'removed': removed}
+        return report
+
+    async def aclose(self):
+        """Close every pooled provider and empty the pool."""
+        entries, self._entries = self._entries, {}
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(*(task for task in self._closing if task.get_loop() is loop))
+        for entry in entries.values():
+            for provider in entry.providers:
+                await self._close_provider(provider)
+
+    def stats(self) -> Dict[str, int]:
+        """Return the number of pooled providers per configuration key."""
+        return {key: len(entry.providers) for key, entry in self._entries.items()}
+
+    def _entry(self, config: Dict[str, Any]) -> _PoolEntry:
+        self._check_loop()
+        key = self.config_key(config)
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = self._entries[key] = _PoolEntry(config)
+        return entry
+
+    def _check_loop(self):
+        """Replace providers bound to a previous event loop (e.g. after another asyncio.run).
+
+        The old providers are closed in the background on the current loop, so their
+        HTTP clients are released rather than leaked; failures are logged.
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            stale = [provider for entry in self._entries.values() for provider in entry.providers]
+            self._entries = {}
+            self._loop = loop
+            if stale:
+                task = loop.create_task(self._close_providers(stale))
+                # Keep a reference until the close is done, so it is not garbage collected mid-flight.
+                self._closing.add(task)
+                task.add_done_callback(self._closing.discard)
+
+    @classmethod
+    async def _close_providers(cls, providers: List[Any]):
+        for provider in providers:
+            await cls._close_provider(provider)
+
+    @staticmethod
+    def _next_provider(entry: _PoolEntry):
+        provider = entry.providers[entry.next_index % len(entry.providers)]
+        entry.next_index += 1
+        return provider
+
+    async def _create_provider(self, config: Dict[str, Any]):
+        if self.registry is None:
+            # spoon_ai loads every provider SDK, so it is imported with the first provider.
+            from spoon_ai.llm import get_global_registry
+            self.registry = get_global_registry()
+        provider_name = config.get('provider', 'openai')
+        provider = self.registry.get_provider(provider_name, config)
+        await provider.initialize(config)
+        return provider
+
+    @staticmethod
+    async def _is_healthy(provider) -> bool:
+        check = getattr(provider, 'health_check', None)
+        if check is None:
+            return True
+        try:
+            result = check()
+            if inspect.isawaitable(result):
+                result = await result
+            return bool(result)
+        except Exception:
+            return False
+
+    @staticmethod
+    async def _close_provider(provider):
+        for name in ('cleanup', 'aclose', 'close'):
+            close = getattr(provider, name, None)
+            if close is None:
+                continue
+            try:
+                result = close()
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as e:
+                print(f"Failed to close provider: {e}")
+            return
+
+
+_global_pool: Optional[ProviderPool] = None
+
+
+def get_provider_pool(pool_size: Optional[int] = None) -> ProviderPool:
+    """Return the process-wide provider pool, creating it on first use.
+
+    Args:
+        pool_size: Pool size to use when the pool is created; ignored afterwards
+
+    Returns:
+        The shared ProviderPool
+    """
+    global _global_pool
+    if _global_pool is None:
+        _global_pool = ProviderPool(pool_size=pool_size or 4)
+    return _global_pool
\ No newline at end of file
@@ -0,0 +1,225 @@
+import asyncio
+import random
+import time
+from contextlib import asynccontextmanager
+from typing import Optional
+from Core.Domain.exceptions import (
+    LLMAnalysisError,
+    PermanentLLMError,
+    RateLimitError,
+    TransientLLMError
+)
+
+TRANSIENT_STATUS_CODES = {408, 409, 425, 500, 502, 503, 504, 529}
+TRANSIENT_MARKERS = ('timeout', 'timed out', 'temporarily', 'overloaded', 'connection reset', 'unavailable')
+RATE_LIMIT_MARKERS = ('429', 'rate limit', 'rate_limit', 'too many requests')
+
+
+class TokenBucket:
+    """Token bucket refilled continuously at a per-minute rate."""
+
+    def __init__(self, rate_per_minute: float, capacity: Optional[float] = None):
+        """Initialize the bucket.
+
+        Args:
+            rate_per_minute: Tokens added per minute
+            capacity: Maximum burst size (defaults to one minute worth of tokens)
+        """
+        if rate_per_minute <= 0:
+            raise ValueError("rate_per_minute must be positive")
+        self.rate = rate_per_minute / 60.0
+        self.capacity = capacity or rate_per_minute
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, amount: float = 1.0):
+        """Wait until ``amount`` tokens are available and take them.
+
+        Requests larger than the capacity are clamped to it so they cannot wait forever.
+
+        Args:
+            amount: Number of tokens to take
+        """
+        amount = min(amount, self.capacity)
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self.blocked_until:
+                    await asyncio.sleep(self.blocked_until - now)
+                    continue
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= amount:
+                    self.tokens -= amount
+                    return
+                await asyncio.sleep((amount - self.tokens) / self.rate)
+
+    def pause(self, seconds: float):
+        """Stop handing out tokens for the given time (e.g. to honor Retry-After)."""
+        self.blocked_until = max(self.blocked_until, time.monotonic() + seconds)
+
+
+class AdaptiveRateLimiter:
+    """Request/token budgets plus an AIMD-adjusted concurrency limit for LLM calls.
+
+    The concurrency limit grows by roughly one slot per window of successful calls
+    (additive increase) and is cut by ``decrease_factor`` whenever the provider
+    throttles us (multiplicative decrease).
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None,
+        max_concurrency: int = 16,
+        min_concurrency: int = 1,
+        initial_concurrency: Optional[int] = None,
+        decrease_factor: float = 0.5
+    ):
+        """Initialize the limiter.
+
+        Args:
+            requests_per_minute: Request budget (optional, unlimited if None)
+            tokens_per_minute: Prompt plus completion token budget (optional, unlimited if None)
+            max_concurrency: Upper bound of the adaptive concurrency limit
+            min_concurrency: Lower bound of the adaptive concurrency limit
+            initial_concurrency: Starting concurrency limit (defaults to max_concurrency)
+            decrease_factor: Factor applied to the limit when throttled
+        """
+        self.request_bucket = TokenBucket(requests_per_minute) if requests_per_minute else None
+        self.token_bucket = TokenBucket(tokens_per_minute) if tokens_per_minute else None
+        self.max_concurrency = max_concurrency
+        self.min_concurrency = max(1, min_concurrency)
+        self.decrease_factor = decrease_factor
+        self.limit = float(initial_concurrency or max_concurrency)
+        self.in_flight = 0
+        self.throttled = 0
+        self._condition = asyncio.Condition()
+
+    @asynccontextmanager
+    async def slot(self, tokens: float = 0.0):
+        """Hold a concurrency slot and the request/token budget for one call.
+
+        Args:
+            tokens: Estimated prompt plus completion tokens of the call
+        """
+        async with self._condition:
+            await self._condition.wait_for(lambda: self.in_flight < int(self.limit))
+            self.in_flight += 1
+        try:
+            if self.request_bucket:
+                await self.request_bucket.acquire(1)
+            if self.token_bucket and tokens:
+                await self.token_bucket.acquire(tokens)
+            yield
+        finally:
+            async with self._condition:
+                self.in_flight -= 1
+                self._condition.notify_all()
+
+    def on_success(self):
+        """Additively increase the concurrency limit after a successful call."""
+        self.limit = min(float(self.max_concurrency), self.limit + 1.0 / max(self.limit, 1.0))
+
+    def on_throttle(self, retry_after: Optional[float] = None):
+        """Multiplicatively decrease the concurrency limit and honor Retry-After.
+
+        Args:
+            retry_after: Seconds the provider asked us to wait (optional)
+        """
+        self.throttled += 1
+        self.limit = max(float(self.min_concurrency), self.limit * self.decrease_factor)
+        if retry_after:
+            for bucket in (self.request_bucket, self.token_bucket):
+                if bucket:
+                    bucket.pause(retry_after)
+
+
+class RetryPolicy:
+    """Exponential backoff with full jitter for transient LLM failures."""
+
+    def __init__(self, max_attempts: int = 5, base_delay: float = 1.0, max_delay: float = 60.0, jitter: bool = True):
+        """Initialize the policy.
+
+        Args:
+            max_attempts: Total number of attempts, including the first one
+            base_delay: Delay before the first retry, in seconds
+            max_delay: Upper bound of a single delay, in seconds
+            jitter: Randomize delays between zero and the exponential bound
+        """
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.jitter = jitter
+
+    def delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """Compute how long to wait before retrying.
+
+        Args:
+            attempt: Zero-based index of the attempt that just failed
+            retry_after: Seconds the provider asked us to wait (optional)
+
+        Returns:
+            Delay in seconds; never shorter than ``retry_after``
+        """
+        bound = min(self.max_delay, self.base_delay * (2 ** attempt))
+        delay = random.uniform(0, bound) if self.jitter else bound
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        return delay
+
+
+def _status_code(error: Exception) -> Optional[int]:
+    for source in (error, getattr(error, 'response', None)):
+        for attribute in ('status_code', 'status', 'http_status'):
+            value = getattr(source, attribute, None)
+            if isinstance(value, int):
+                return value
+    return None
+
+
+def _retry_after(error: Exception) -> Optional[float]:
+    value = getattr(error, 'retry_after', None)
+    if value is None:
+        for source in (error, getattr(error, 'response', None)):
+            headers = getattr(source, 'headers', None)
+            if headers:
+                value = headers.get('retry-after') or headers.get('Retry-After')
+                if value is not None:
+                    break
+    try:
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def classify_error(error: Exception) -> LLMAnalysisError:
+    """Map a provider exception onto the typed LLM error hierarchy.
+
+    Args:
+        error: The exception raised by the provider
+
+    Returns:
+        A RateLimitError, TransientLLMError or PermanentLLMError wrapping the original message
+    """
+    if isinstance(error, LLMAnalysisError):
+        return error
+
+    message = f"{type(error).__name__}: {error}"
+    retry_after = _retry_after(error)
+    status = _status_code(error)
+    lowered = message.lower()
+
+    if status == 429 or (status is None and any(marker in lowered for marker in RATE_LIMIT_MARKERS)):
+        return RateLimitError(message, retry_after=retry_after)
+    if status in TRANSIENT_STATUS_CODES or (status is not None and status >= 500):
+        return TransientLLMError(message, retry_after=retry_after)
+    if status is not None:
+        return PermanentLLMError(message)
+    if isinstance(error, (asyncio.TimeoutError, TimeoutError, ConnectionError)):
+        return TransientLLMError(message, retry_after=retry_after)
+    if any(marker in lowered for marker in TRANSIENT_MARKERS):
+        return TransientLLMError(message, retry_after=retry_after)
+    return PermanentLLMError(message)
\ No newline at end of file
@@ -0,0 +1,109 @@
+from typing import Any, Dict, Optional, Tuple
+from Core.Domain.domain_entities import AuditResult
+from Core.Interfaces.interfaces import ILLMAnalyzer
+from Core.Services.report_merger import merge_audit_results
+from Infrastructure.Parsers.heuristic_extractor import (
+    EXTRACTOR_VERSION,
+    HeuristicExtraction,
+    HeuristicExtractor,
+    segment_text
+)
+from Infrastructure.Parsers.token_counter import estimate_tokens
+
+ROUTE_SKIP = 'skip'
+ROUTE_SEGMENTS = 'segments'
+ROUTE_FULL = 'full'
+
+
+class HeuristicRoutingAnalyzer:
+    """ILLMAnalyzer decorator that only calls the LLM for what the rules cannot extract.
+
+    Every transcript first goes through the HeuristicExtractor. Transcripts it
+    resolves with confidence of at least ``skip_threshold`` never reach the LLM;
+    transcripts it extracts nothing from are always analyzed in full.
+    When only some turns are unresolved and those turns (with context) are at most
+    ``max_segment_ratio`` of the transcript, only they are sent and the LLM result
+    is merged with the rule-based one. Everything else is analyzed in full.
+    """
+
+    def __init__(
+        self,
+        analyzer: ILLMAnalyzer,
+        extractor: HeuristicExtractor = None,
+        skip_threshold: float = 0.8,
+        max_segment_ratio: float = 0.5,
+        context_turns: int = 1
+    ):
+        """Initialize the routing analyzer.
+
+        Args:
+            analyzer: The analyzer used for unresolved segments and full transcripts
+            extractor: The rule-based extractor (optional, will create default if None)
+            skip_threshold: Minimum extraction confidence for skipping the LLM
+            max_segment_ratio: Largest share of the transcript's tokens sent as segments
+            context_turns: Turns kept around each unresolved turn
+        """
+        self.analyzer = analyzer
+        self.extractor = extractor or HeuristicExtractor()
+        self.skip_threshold = skip_threshold
+        self.max_segment_ratio = max_segment_ratio
+        self.context_turns = context_turns
+        self.config = getattr(analyzer, 'config', {})
+        inner_version = getattr(analyzer, 'PROMPT_TEMPLATE_VERSION', 'unversioned')
+        self.PROMPT_TEMPLATE_VERSION = (f"{inner_version}+heuristic-{EXTRACTOR_VERSION}"
+                                        f"-{skip_threshold}-{max_segment_ratio}-{context_turns}")
+        self.routes = {ROUTE_SKIP: 0, ROUTE_SEGMENTS: 0, ROUTE_FULL: 0}
+        self.tokens_total = 0
+        self.tokens_sent = 0
+
+    def route(self, extraction: HeuristicExtraction, transcript_tokens: int) -> Tuple[str, Optional[str]]:
+        """Decide how a transcript is analyzed.
+
+        Args:
+            extraction: The rule-based extraction of the transcript
+            transcript_tokens: Estimated tokens of the transcript
+
+        Returns:
+            (route, text of the unresolved segments or None)
+        """
+        if not extraction.turns or not extraction.items:
+            # The rules found nothing, which says nothing about the transcript.
+            return ROUTE_FULL, None
+        if not extraction.unresolved_turns:
+            if extraction.confidence >= self.skip_threshold:
+                return ROUTE_SKIP, None
+            return ROUTE_FULL, None
+        text, tokens = segment_text(extraction.turns, extraction.unresolved_turns, self.context_turns)
+        if tokens <= self.max_segment_ratio * transcript_tokens:
+            return ROUTE_SEGMENTS, text
+        return ROUTE_FULL, None
+
+    async def analyze(self, transcript: str) -> AuditResult:
+        """Analyze a transcript with the rules, the LLM on its unresolved segments, or the LLM alone."""
+        extraction = self.extractor.extract(transcript)
+        tokens = estimate_tokens(transcript)
+        route, segments = self.route(extraction, tokens)
+        self.routes[route] += 1
+        self.tokens_total += tokens
+
+        if route == ROUTE_SKIP:
+            return extraction.to_audit_result()
+        if route == ROUTE_FULL:
+            self.tokens_sent += tokens
+            return await self.analyzer.analyze(transcript)
+
+        segment_tokens = estimate_tokens(segments)
+        self.tokens_sent += segment_tokens
+        llm_result = await self.analyzer.analyze(segments)
+        # Low-confidence rule items come from the unresolved turns the LLM just read.
+        rule_result = extraction.to_audit_result(min_confidence=self.extractor.min_item_confidence)
+        return merge_audit_results([rule_result, llm_result], [max(tokens - segment_tokens, 1), segment_tokens])
+
+    def stats(self) -> Dict[str, Any]:
+        """Return how many transcripts took each route and the share of tokens sent."""
+        return {
+            'routes': dict(self.routes),
+            'tokens_total': self.tokens_total,
+            'tokens_sent': self.tokens_sent,
+            'tokens_saved_ratio': 1 - self.tokens_sent / self.tokens_total if self.tokens_total else 0.0
+        }
\ No newline at end of file
@@ -1,134 +1,559 @@
 import asyncio
 import json
 import re
-from typing import Dict, Any
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Sequence
 from Core.Interfaces.interfaces import ILLMAnalyzer
-from Core.Domain.domain_entities import AuditResult
-from spoon_ai.llm import get_global_registry
-from spoon_ai.schema import Message
+from Core.Domain.domain_entities import AuditResult, StreamedItem
+from Core.Domain.exceptions import LLMResponseFormatError, RateLimitError, TransientLLMError
+from Core.Services.instrumentation import Instrumentation, get_instrumentation
+from Infrastructure.LLM.provider_pool import ProviderPool, get_provider_pool
+from Infrastructure.LLM.rate_limiter import AdaptiveRateLimiter, RetryPolicy, classify_error
+from Infrastructure.Parsers.incremental_json import IncrementalJsonParser, recover_json_object
+from Infrastructure.Parsers.token_counter import estimate_tokens
+from Infrastructure.Parsers.transcript_normalizer import TranscriptNormalizer
+
+
+DEFAULT_COMPLETION_TOKENS = 1000
+
+SYSTEM_INSTRUCTION = (
+    "You are an expert Project Management Auditor and Meeting Analyst. "
+    "Your goal is to extract structured data from meeting transcripts."
+)
+
+# The schema of one analysis, shared by the single and the packed prompt.
+RESPONSE_SCHEMA = """{
+    "risk_analysis": {
+        "score": <float 0.0-1.0>,
+        "risk_factors": ["<string>", ...],
+        "recommendations": ["<string>", ...],
+        "summary": "<string>",
+        "confidence": <float 0.0-1.0>
+    },
+    "meeting_report": {
+        "questions": [
+            { "questioner": "<name>", "responder": "<name>", "question": "<text>", "answer": "<text>" }
+        ],
+        "meetings": [
+            { "scheduler": "<name>", "datetime": "<date/time>", "location": "<text>", "purpose": "<text>" }
+        ],
+        "tasks": [
+            { "assigner": "<name>", "assignee": "<name>", "task": "<text>", "deadline": "<date/time or 'None'>" }
+        ]
+    }
+}"""
+
+INSTRUCTIONS = """INSTRUCTIONS:
+1. Identify risks, issues, and overall sentiment.
+2. Extract specific interactions:
+   - **Questions**: Who asked, who answered, and what was said.
+   - **Meetings**: New meetings scheduled (who, when, where, purpose).
+   - **Tasks**: Tasks assigned (who assigned, to whom, description, deadline).
+3. If the transcript starts with a "Speakers:" legend, speakers are referred to
+   by their IDs (S1, S2, ...); use the IDs in name fields."""
+
+# Everything before the transcript is identical for every call, so it is built once.
+PROMPT_PREFIX = f"""Analyze the meeting transcript at the end of this message.
+
+{INSTRUCTIONS}
+
+OUTPUT FORMAT:
+You MUST respond with a VALID JSON object ONLY. Do not wrap it in markdown code blocks.
+Use the following structure:
+{RESPONSE_SCHEMA}
+
+TRANSCRIPT:
+"""
+
+# Prompt of packed requests: several short transcripts, each analyzed on its own and keyed by its ID.
+PACKED_PROMPT_PREFIX = f"""Analyze each of the meeting transcripts at the end of this message separately.
+Each transcript starts with a line "=== <ID> ===" (T1, T2, ...).
+
+{INSTRUCTIONS}
+4. Never mix information from different transcripts.
+
+OUTPUT FORMAT:
+You MUST respond with a VALID JSON object ONLY. Do not wrap it in markdown code blocks.
+Use the following structure, with one entry per transcript ID:
+{{
+    "transcripts": {{
+        "T1": <analysis>,
+        "T2": <analysis>,
+        ...
+    }}
+}}
+where each <analysis> has this structure:
+{RESPONSE_SCHEMA}
+
+TRANSCRIPTS:
+"""
+STATIC_PROMPT_TOKENS = estimate_tokens(SYSTEM_INSTRUCTION) + estimate_tokens(PROMPT_PREFIX)
+PACKED_STATIC_PROMPT_TOKENS = estimate_tokens(SYSTEM_INSTRUCTION) + estimate_tokens(PACKED_PROMPT_PREFIX)
+
+# Parts of the response reported while it streams, keyed by their path in the JSON schema.
+RESPONSE_SECTIONS = {
+    ('risk_analysis', 'risk_factors'): 'risk_factors',
+    ('risk_analysis', 'recommendations'): 'recommendations',
+    ('risk_analysis',): 'risk_analysis',
+    ('meeting_report', 'questions'): 'questions',
+    ('meeting_report', 'meetings'): 'meetings',
+    ('meeting_report', 'tasks'): 'tasks'
+}
+
+
+def response_usage(response) -> Dict[str, int]:
+    """Return the token usage a provider reported for a response, if any.
+
+    Providers expose usage either as an object or a dict with OpenAI-style
+    ``prompt_tokens``/``completion_tokens`` or Anthropic-style ``input_tokens``/``output_tokens``.
+
+    Returns:
+        Dict with ``prompt_tokens`` and ``completion_tokens``, or an empty dict
+    """
+    usage = getattr(response, 'usage', None)
+    if usage is None:
+        return {}
+
+    def read(*names):
+        for name in names:
+            value = usage.get(name) if isinstance(usage, dict) else getattr(usage, name, None)
+            if isinstance(value, int):
+                return value
+        return None
+
+    prompt_tokens = read('prompt_tokens', 'input_tokens')
+    completion_tokens = read('completion_tokens', 'output_tokens')
+    if prompt_tokens is None or completion_tokens is None:
+        return {}
+    return {'prompt_tokens': prompt_tokens, 'completion_tokens': completion_tokens}
+
+
+def chunk_text(chunk) -> str:
+    """Return the text a streamed response chunk adds: the chunk itself, its ``delta`` or its ``content``."""
+    if isinstance(chunk, str):
+        return chunk
+    delta = getattr(chunk, 'delta', None)
+    if isinstance(delta, str):
+        return delta
+    return getattr(chunk, 'content', None) or ''
+
+
+def restore_speaker_names(value: Any, speakers: Dict[str, str]) -> Any:
+    """Replace compact speaker IDs by the original names in every string of a model output value.
+
+    The model refers to speakers by their IDs not only in name fields but also in
+    free text ("S2 will rewrite the service"), so every string is rewritten.
+
+    Args:
+        value: A string, or a list or dict of the model's output (nested to any depth)
+        speakers: Speaker ID -> original name
+
+    Returns:
+        The value with the IDs replaced; lists and dicts are copied, other values returned as is
+    """
+    if not speakers:
+        return value
+    pattern = re.compile(r"\b(" + '|'.join(re.escape(speaker_id) for speaker_id in speakers) + r")\b")
+
+    def restore(item: Any) -> Any:
+        if isinstance(item, str):
+            return pattern.sub(lambda m: speakers[m.group(1)], item)
+        if isinstance(item, list):
+            return [restore(element) for element in item]
+        if isinstance(item, dict):
+            return {key: restore(element) for key, element in item.items()}
+        return item
+
+    return restore(value)
+
+
+def restore_result_speaker_names(result: AuditResult, speakers: Dict[str, str]):
+    """Replace compact speaker IDs by the original names throughout an AuditResult, in place.
+
+    Args:
+        result: The analysis of a normalized transcript
+        speakers: Speaker ID -> original name
+    """
+    if not speakers:
+        return
+    result.summary = restore_speaker_names(result.summary, speakers)
+    result.risk_factors = restore_speaker_names(result.risk_factors, speakers)
+    result.recommendations = restore_speaker_names(result.recommendations, speakers)
+    result.raw_report = restore_speaker_names(result.raw_report, speakers)
 
 
 class SpoonLLMClient:
     """SpoonAI LLM Client implementing the ILLMAnalyzer interface."""
 
-    def __init__(self, config: Dict[str, Any] = None):
+    # Bump whenever the prompt changes so cached analyses are not reused across versions.
+    PROMPT_TEMPLATE_VERSION = "2"
+
+    def __init__(
+        self,
+        config: Dict[str, Any] = None,
+        pool: ProviderPool = None,
+        rate_limiter: AdaptiveRateLimiter = None,
+        retry_policy: RetryPolicy = None,
+        normalizer: TranscriptNormalizer = None,
+        instrumentation: Instrumentation = None
+    ):
+        """Initialize the client.
+
+        Args:
+            config: The provider configuration (provider, model, api_key, base_url, ...)
+            pool: The provider pool to draw providers from (optional, uses the process-wide pool if None)
+            rate_limiter: Limiter shared by all calls (optional, calls are not throttled if None)
+            retry_policy: Backoff policy for transient failures (optional, will create default if None)
+            normalizer: Shrinks transcripts before they are sent (optional, transcripts are sent verbatim if None)
+            instrumentation: Receives an ``llm`` span per call with tokens, retries and bytes
+                (optional, uses the process-wide instrumentation if None)
+        """
         self.config = config or {}
-        self.registry = get_global_registry()
+        self.pool = pool or get_provider_pool()
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.normalizer = normalizer
+        self.instrumentation = instrumentation or get_instrumentation()
         self.provider = None
+        self.retries = 0
+        self.truncated_responses = 0
+        self.transcript_tokens_before = 0
+        self.transcript_tokens_after = 0
+        if normalizer is not None:
+            self.PROMPT_TEMPLATE_VERSION = f"{SpoonLLMClient.PROMPT_TEMPLATE_VERSION}+norm-{normalizer.signature}"
 
     async def initialize(self):
         """Initialize the SpoonAI provider."""
+        self.provider = await self._acquire_provider()
+
+    async def warm_up(self) -> int:
+        """Initialize the pooled providers for this configuration ahead of the first request.
+
+        Returns:
+            Number of providers ready
+        """
+        try:
+            return await self.pool.warm_up(self.config)
+        except Exception as e:
+            raise ConnectionError(f"Failed to initialize SpoonAI provider: {str(e)}")
+
+    async def _acquire_provider(self):
         try:
-            provider_name = self.config.get('provider', 'openai')
-            self.provider = self.registry.get_provider(provider_name, self.config)
-            await self.provider.initialize(self.config)
+            return await self.pool.acquire(self.config)
         except Exception as e:
             raise ConnectionError(f"Failed to initialize SpoonAI provider: {str(e)}")
 
     async def analyze(self, transcript: str) -> AuditResult:
-        """Analyze a transcript using SpoonAI and return an audit result."""
-        if not self.provider:
-            await self.initialize()
+        """Analyze a transcript using SpoonAI and return an audit result.
+
+        Raises:
+            ConnectionError: If no provider could be initialized
+            LLMAnalysisError: If the call failed permanently, kept failing after retries,
+                or the model did not answer with the expected JSON
+        """
+        with self.instrumentation.span('llm', model=self.config.get('model', '')) as span:
+            return await self._analyze(transcript, span)
+
+    async def _analyze(self, transcript: str, span) -> AuditResult:
+        provider = await self._acquire_provider()
+        self.provider = provider
+        messages, estimated_tokens, normalized = self._build_messages(transcript)
+
+        response = await self._chat_with_retries(provider, messages, estimated_tokens)
+        self._record_usage(span, response_usage(response), response.content or '', messages,
+                           estimated_tokens - self.config.get('max_tokens', DEFAULT_COMPLETION_TOKENS))
 
+        result = self._parse_llm_json(response.content)
+        if normalized is not None:
+            restore_result_speaker_names(result, normalized.speakers)
+        self._count_truncated(result, span)
+        return result
+
+    async def analyze_stream(self, transcript: str) -> AsyncIterator[StreamedItem]:
+        """Analyze a transcript, yielding each part of the analysis as soon as the model has written it.
+
+        Risk factors, recommendations, the risk analysis, and each question, meeting and
+        task are parsed incrementally from the provider's ``chat_stream`` and yielded
+        when complete; providers without streaming are called with ``chat`` and their
+        items yielded at once. The last item carries the AuditResult. Output cut off by
+        the model, or by a failure after the first item was yielded, gives a result
+        marked ``truncated`` that holds every item completed before the cut.
+
+        Raises:
+            ConnectionError: If no provider could be initialized
+            LLMAnalysisError: If the call failed before any item was yielded, or the
+                response contained no JSON object
+        """
+        # The call runs in its own task, so its span is not left open in the consumer's context between items.
+        items: asyncio.Queue = asyncio.Queue()
+        call = asyncio.ensure_future(self._analyze_streaming(transcript, items.put_nowait))
+        call.add_done_callback(lambda _: items.put_nowait(None))
         try:
-            system_instruction = (
-                "You are an expert Project Management Auditor and Meeting Analyst. "
-                "Your goal is to extract structured data from meeting transcripts."
-            )
+            while True:
+                item = await items.get()
+                if item is None:
+                    break
+                yield item
+            yield StreamedItem(result=call.result(), is_final=True)
+        finally:
+            call.cancel()
+
+    async def _analyze_streaming(self, transcript: str, emit: Callable[[StreamedItem], None]) -> AuditResult:
+        with self.instrumentation.span('llm', model=self.config.get('model', ''), streamed=True) as span:
+            provider = await self._acquire_provider()
+            self.provider = provider
+            messages, estimated_tokens, normalized = self._build_messages(transcript)
+            speakers = normalized.speakers if normalized is not None else None
+
+            attempt = 0
+            while True:
+                parser = IncrementalJsonParser(RESPONSE_SECTIONS)
+                pieces = []
+                usage = {}
+                emitted = 0
+
+                async def consume():
+                    nonlocal usage, emitted
+                    async for chunk in self._stream_chunks(provider, messages):
+                        text = chunk_text(chunk)
+                        pieces.append(text)
+                        usage = response_usage(chunk) or usage
+                        for section, index, item in parser.feed(text):
+                            if speakers:
+                                item = restore_speaker_names(item, speakers)
+                            emit(StreamedItem(section=section, index=index, item=item))
+                            emitted += 1
+
+                try:
+                    if self.rate_limiter is None:
+                        await consume()
+                    else:
+                        async with self.rate_limiter.slot(estimated_tokens):
+                            await consume()
+                        self.rate_limiter.on_success()
+                    break
+                except Exception as e:
+                    if not emitted:
+                        attempt += 1
+                        await asyncio.sleep(self._retry_delay(e, attempt))
+                        continue
+                    # Items already reached the consumer; keep them instead of starting over.
+                    span.set(stream_errors=1)
+                    break
+
+            content = ''.join(pieces)
+            self._record_usage(span, usage, content, messages,
+                               estimated_tokens - self.config.get('max_tokens', DEFAULT_COMPLETION_TOKENS))
+            result = self._result_from_json(parser.partial(), parser.done, content)
+            if speakers:
+                restore_result_speaker_names(result, speakers)
+            self._count_truncated(result, span)
+            return result
+
+    async def analyze_packed(self, transcripts: Sequence[str]) -> List[Optional[AuditResult]]:
+        """Analyze several short transcripts in one request, sharing the instructions and schema.
 
-            user_prompt = f"""
-            Analyze the following meeting transcript.
-            
-            TRANSCRIPT:
-            {transcript}
-
-            INSTRUCTIONS:
-            1. Identify risks, issues, and overall sentiment.
-            2. Extract specific interactions:
-               - **Questions**: Who asked, who answered, and what was said.
-               - **Meetings**: New meetings scheduled (who, when, where, purpose).
-               - **Tasks**: Tasks assigned (who assigned, to whom, description, deadline).
-            
-            OUTPUT FORMAT:
-            You MUST respond with a VALID JSON object ONLY. Do not wrap it in markdown code blocks. 
-            Use the following structure:
-            {{
-                "risk_analysis": {{
-                    "score": <float 0.0-1.0>,
-                    "risk_factors": ["<string>", ...],
-                    "recommendations": ["<string>", ...],
-                    "summary": "<string>",
-                    "confidence": <float 0.0-1.0>
-                }},
-                "meeting_report": {{
-                    "questions": [
-                        {{ "questioner": "<name>", "responder": "<name>", "question": "<text>", "answer": "<text>" }}
-                    ],
-                    "meetings": [
-                        {{ "scheduler": "<name>", "datetime": "<date/time>", "location": "<text>", "purpose": "<text>" }}
-                    ],
-                    "tasks": [
-                        {{ "assigner": "<name>", "assignee": "<name>", "task": "<text>", "deadline": "<date/time or 'None'>" }}
-                    ]
-                }}
-            }}
-            """
+        The transcripts are sent under the IDs T1, T2, ... and the model answers with
+        one analysis per ID. Analyses that are missing, malformed or cut off are
+        returned as None, so the caller can analyze those transcripts on their own.
 
+        Returns:
+            One AuditResult (or None) per transcript, in order
+
+        Raises:
+            ConnectionError: If no provider could be initialized
+            LLMAnalysisError: If the call failed permanently or kept failing after retries
+        """
+        with self.instrumentation.span('llm', model=self.config.get('model', ''),
+                                       packed_transcripts=len(transcripts)) as span:
+            provider = await self._acquire_provider()
+            self.provider = provider
+            prepared = [self._prepare_transcript(transcript) for transcript in transcripts]
+
+            from spoon_ai.schema import Message
+
+            body = ''.join(f"=== T{index} ===\n{text}\n\n" for index, (text, _) in enumerate(prepared, 1))
             messages = [
-                Message(role="system", content=system_instruction),
-                Message(role="user", content=user_prompt)
+                Message(role="system", content=SYSTEM_INSTRUCTION),
+                Message(role="user", content=PACKED_PROMPT_PREFIX + body)
             ]
+            prompt_tokens = PACKED_STATIC_PROMPT_TOKENS + estimate_tokens(body)
+            # Each analysis needs the completion budget of a single call, so the limit is raised for the pack.
+            completion_tokens = self.config.get('max_tokens', DEFAULT_COMPLETION_TOKENS) * len(transcripts)
+            estimated_tokens = prompt_tokens + completion_tokens
 
-            response = await self.provider.chat(messages)
-            
-            return self._parse_llm_json(response.content)
+            response = await self._chat_with_retries(provider, messages, estimated_tokens, max_tokens=completion_tokens)
+            content = response.content or ''
+            self._record_usage(span, response_usage(response), content, messages, prompt_tokens)
 
-        except Exception as e:
-            print(f"Analysis failed: {e}")
-            return AuditResult(
-                risk_score=0.0,
-                risk_factors=["Analysis Failed"],
-                recommendations=["Check LLM connection or prompt"],
-                summary=f"Error during analysis: {str(e)}",
-                confidence=0.0,
-                details="{}"
-            )
+            # Only analyses whose object was closed are used; a cut-off response keeps the ones before the cut.
+            parser = IncrementalJsonParser({('transcripts', f"T{index}"): f"T{index}"
+                                            for index in range(1, len(transcripts) + 1)})
+            analyses = {key: value for key, _, value in parser.feed(content)}
+            results: List[Optional[AuditResult]] = []
+            for index, (_, normalized) in enumerate(prepared, 1):
+                try:
+                    result = self._result_from_json(analyses.get(f"T{index}"), True, content)
+                except LLMResponseFormatError:
+                    result = None
+                if result is not None and normalized is not None:
+                    restore_result_speaker_names(result, normalized.speakers)
+                results.append(result)
+            span.set(packed_missing=sum(result is None for result in results))
+            return results
+
+    def _prepare_transcript(self, transcript: str):
+        """Return the transcript text to send and its normalization (None without a normalizer)."""
+        if self.normalizer is None:
+            return transcript, None
+        normalized = self.normalizer.normalize(transcript)
+        self.transcript_tokens_before += normalized.tokens_before
+        self.transcript_tokens_after += normalized.tokens_after
+        return normalized.text, normalized
+
+    def _build_messages(self, transcript: str):
+        """Return the chat messages, the tokens to reserve for the call and the normalized transcript (or None)."""
+        prompt_transcript, normalized = self._prepare_transcript(transcript)
+
+        # Imported on the first call: spoon_ai is slow to import and only needed to talk to a provider.
+        from spoon_ai.schema import Message
+
+        # The static prefix comes first so provider-side prompt caching can reuse it.
+        messages = [
+            Message(role="system", content=SYSTEM_INSTRUCTION),
+            Message(role="user", content=PROMPT_PREFIX + prompt_transcript)
+        ]
+
+        estimated_tokens = (
+            STATIC_PROMPT_TOKENS
+            + estimate_tokens(prompt_transcript)
+            + self.config.get('max_tokens', DEFAULT_COMPLETION_TOKENS)
+        )
+        return messages, estimated_tokens, normalized
+
+    def _record_usage(self, span, usage: Dict[str, int], content: str, messages, prompt_tokens: int):
+        """Record the reported token usage, or estimates (``prompt_tokens`` for the prompt) without it."""
+        if usage:
+            span.set(**usage)
+        else:
+            span.set(prompt_tokens=prompt_tokens, completion_tokens=estimate_tokens(content), tokens_estimated=True)
+        span.set(bytes_out=len(messages[1].content.encode('utf-8')), bytes_in=len(content.encode('utf-8')))
+
+    def _count_truncated(self, result: AuditResult, span):
+        if result.truncated:
+            self.truncated_responses += 1
+            span.set(truncated=True)
+
+    async def _chat_with_retries(self, provider, messages, estimated_tokens: int, **kwargs):
+        """Send a chat request, retrying transient failures with exponential backoff.
+
+        Args:
+            provider: The provider to call
+            messages: The chat messages
+            estimated_tokens: Estimated prompt plus completion tokens, charged to the rate limiter
+            **kwargs: Request options passed to the provider (e.g. ``max_tokens``)
+
+        Returns:
+            The provider response
+
+        Raises:
+            PermanentLLMError: If the failure is not retryable
+            TransientLLMError: If the failure persisted through every attempt
+        """
+        attempt = 0
+        while True:
+            try:
+                if self.rate_limiter is None:
+                    return await self._chat(provider, messages, **kwargs)
+                async with self.rate_limiter.slot(estimated_tokens):
+                    response = await self._chat(provider, messages, **kwargs)
+                self.rate_limiter.on_success()
+                return response
+            except Exception as e:
+                attempt += 1
+                await asyncio.sleep(self._retry_delay(e, attempt))
+
+    def _retry_delay(self, e: Exception, attempt: int) -> float:
+        """Return the backoff before retrying a failed call, or raise the failure if it is not retryable.
+
+        Args:
+            e: The exception the call raised
+            attempt: Number of failed attempts so far
+
+        Raises:
+            PermanentLLMError: If the failure is not retryable
+            TransientLLMError: If the failure persisted through every attempt
+        """
+        error = classify_error(e)
+        if isinstance(error, RateLimitError) and self.rate_limiter is not None:
+            self.rate_limiter.on_throttle(error.retry_after)
+        if not isinstance(error, TransientLLMError) or attempt >= self.retry_policy.max_attempts:
+            if error is e:
+                raise e
+            raise error from e
+        self.retries += 1
+        self.instrumentation.current_span().add('retries')
+        return self.retry_policy.delay(attempt - 1, error.retry_after)
+
+    async def _chat(self, provider, messages, **kwargs):
+        timeout = self.config.get('request_timeout')
+        if timeout:
+            return await asyncio.wait_for(provider.chat(messages, **kwargs), timeout)
+        return await provider.chat(messages, **kwargs)
+
+    async def _stream_chunks(self, provider, messages) -> AsyncIterator[Any]:
+        """Yield the chunks of a streamed response; ``request_timeout`` bounds the wait for each chunk."""
+        stream = getattr(provider, 'chat_stream', None)
+        if stream is None:
+            yield await self._chat(provider, messages)
+            return
+        timeout = self.config.get('request_timeout')
+        chunks = stream(messages).__aiter__()
+        while True:
+            try:
+                if timeout:
+                    chunk = await asyncio.wait_for(chunks.__anext__(), timeout)
+                else:
+                    chunk = await chunks.__anext__()
+            except StopAsyncIteration:
+                return
+            yield chunk
 
     def _parse_llm_json(self, content: str) -> AuditResult:
-        """Parse the JSON response from LLM and convert to AuditResult."""
+        """Parse the JSON response from LLM and convert to AuditResult.
+
+        When json.loads rejects the response, the JSON object is recovered from it:
+        text around the object is ignored, and an object cut off by the model gives a
+        truncated result holding everything completed before the cut.
+        """
+        clean_content = (content or '').strip()
+        if clean_content.startswith("```json"):
+            clean_content = clean_content[7:]
+        if clean_content.endswith("```"):
+            clean_content = clean_content[:-3]
+
+        try:
+            return self._result_from_json(json.loads(clean_content), True, content)
+        except json.JSONDecodeError:
+            data, complete = recover_json_object(clean_content, RESPONSE_SECTIONS)
+            return self._result_from_json(data, complete, content)
+
+    @staticmethod
+    def _result_from_json(data: Optional[Dict[str, Any]], complete: bool, content: str) -> AuditResult:
+        """Build the AuditResult of a parsed response; ``complete`` is False for a cut-off one."""
+        if not data:
+            raise LLMResponseFormatError("The model returned an invalid JSON format: no JSON object found", content)
         try:
-            clean_content = content.strip()
-            if clean_content.startswith("```json"):
-                clean_content = clean_content[7:]
-            if clean_content.endswith("```"):
-                clean_content = clean_content[:-3]
-            
-            data = json.loads(clean_content)
-            
             risk_data = data.get("risk_analysis", {})
             report_data = data.get("meeting_report", {})
 
-            result = AuditResult(
+            return AuditResult(
                 risk_score=risk_data.get("score", 0.5),
                 risk_factors=risk_data.get("risk_factors", []),
                 recommendations=risk_data.get("recommendations", []),
                 summary=risk_data.get("summary", "No summary provided"),
                 confidence=risk_data.get("confidence", 0.5),
-                details=json.dumps(report_data) 
+                raw_report=report_data,
+                truncated=not complete
             )
-            
-            result.raw_report = report_data 
-            
-            return result
-
-        except json.JSONDecodeError:
-            print("Failed to parse JSON from LLM response. Raw content:")
-            print(content)
-            return AuditResult(
-                risk_score=0.5,
-                risk_factors=["JSON Parsing Error"],
-                recommendations=["Review LLM output format"],
-                summary="The model returned an invalid JSON format.",
-                confidence=0.0,
-                details="{}"
-            )
\ No newline at end of file
+        except (AttributeError, TypeError) as e:
+            raise LLMResponseFormatError(f"The model returned an invalid JSON format: {e}", content)
\ No newline at end of file
@@ -0,0 +1,454 @@
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+from Core.Domain.domain_entities import AuditResult
+from Infrastructure.Parsers.simple_text_parser import SimpleTextParser
+from Infrastructure.Parsers.token_counter import estimate_tokens
+from Infrastructure.Parsers.transcript_chunker import SPEAKER_TURN_PATTERN
+
+# Bumped whenever a rule changes what is extracted, so cached results are not reused.
+EXTRACTOR_VERSION = "2"
+
+# "Label:" lines that look like speaker turns but belong to the header.
+HEADER_LABELS = frozenset({
+    'attendees', 'participants', 'present', 'date', 'time', 'location', 'agenda', 'subject', 'title',
+    'meeting', 'meeting transcript', 'transcript', 'notes', 'minutes'
+})
+
+_DAY = r"(?:monday|tuesday|wednesday|thursday|friday|saturday|sunday)"
+_MONTH = (r"(?:jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may|june?|july?|aug(?:ust)?|"
+          r"sep(?:t(?:ember)?)?|oct(?:ober)?|nov(?:ember)?|dec(?:ember)?)")
+_CALENDAR_DATE = rf"(?:{_MONTH}\.? \d{{1,2}}(?:st|nd|rd|th)?|\d{{4}}-\d{{2}}-\d{{2}}|\d{{1,2}}/\d{{1,2}}(?:/\d{{2,4}})?)"
+_RELATIVE_DAY = (rf"(?:(?:next |this |on )?{_DAY}|tomorrow|today|tonight|"
+                 rf"(?:the )?end of (?:the )?(?:day|week|month|sprint|quarter)(?: today)?|eod|eow|"
+                 rf"next (?:week|month|sprint)|q[1-4])")
+_CLOCK = r"\d{1,2}(?::\d{2})?\s*(?:am|pm|a\.m\.|p\.m\.)|\d{1,2}:\d{2}|noon|midnight"
+
+DEADLINE_PATTERN = re.compile(
+    rf"\b(?:by|before|until|due|no later than)\s+(?P<deadline>(?:{_RELATIVE_DAY})(?:,? {_CALENDAR_DATE})?"
+    rf"(?: (?:at )?(?:{_CLOCK}))?|{_CALENDAR_DATE})",
+    re.IGNORECASE
+)
+DAY_PATTERN = re.compile(
+    rf"\b(?:(?:next |this |on )?{_DAY}|tomorrow|today|tonight|{_CALENDAR_DATE})"
+    rf"(?: (?:morning|afternoon|evening))?",
+    re.IGNORECASE
+)
+TIME_PATTERN = re.compile(rf"\b(?:at |around )?(?:{_CLOCK})", re.IGNORECASE)
+
+# "Marcus, can you ...?" / "Could you ...?" / "Please ..."
+REQUEST_PATTERN = re.compile(
+    r"^(?:(?P<name>[A-Z][\w'-]*(?: [A-Z][\w'-]*)?),\s+)?"
+    r"(?:(?:can|could|would|will) you(?: please)?|please)\s+(?P<task>[^?.!]+)",
+    re.IGNORECASE
+)
+COMMITMENT_PATTERN = re.compile(
+    r"\b(?P<strength>I will|I'll|I am going to|I'm going to|I can|I'll try to|I will try to)\s+"
+    r"(?P<task>[^.!?]+)",
+    re.IGNORECASE
+)
+AFFIRMATIVE_PATTERN = re.compile(
+    r"^(?:yes|yeah|yep|sure|ok|okay|will do|i will|i'll|absolutely|of course|fine|no problem|on it|agreed)\b",
+    re.IGNORECASE
+)
+NEGATIVE_PATTERN = re.compile(r"^(?:no|nope|i can't|i cannot|can't|not)\b|\bimpossible\b", re.IGNORECASE)
+MEETING_CUE_PATTERN = re.compile(
+    r"\b(?:let's|let us|we should|shall we|we'll|we will)\s+(?:meet|sync|catch up|get together|reconvene|"
+    r"have (?:a|another) (?:call|meeting|sync))\b"
+    r"|\b(?:schedule|set up|book|arrange|organi[sz]e)\s+(?:a |an |the |another )?(?:[\w-]+ ){0,2}"
+    r"(?:meeting|call|sync|review|session)\b",
+    re.IGNORECASE
+)
+LOCATION_PATTERN = re.compile(
+    r"\b(?i:via|on|over|using) (?P<tool>(?i:zoom|teams|google meet|meet|slack|skype|webex|the phone|phone))\b"
+    r"|\b(?:in|at) (?:the )?(?P<place>[A-Z][\w-]*(?: [A-Z][\w-]*)*(?: room| office)?)",
+)
+PURPOSE_PATTERN = re.compile(r"\bto (?P<purpose>(?!be\b)[^.!?]+)", re.IGNORECASE)
+# Assignments the rules cannot attribute; such turns are left to the LLM.
+VAGUE_ASSIGNMENT_PATTERN = re.compile(
+    r"\b(?:someone|somebody|anyone|who (?:will|can|wants to)|whoever|we need (?:someone|somebody)|"
+    r"should (?:handle|own|take|look into)|action item)\b",
+    re.IGNORECASE
+)
+# Ownership and due-date phrasings the task rules do not parse ("assigned to Marcus", "Tom owns ...").
+OWNERSHIP_PATTERN = re.compile(
+    r"\b(?:assigned to|assignee|owns?|owner of|responsible for|in charge of|due|deadline|action items?)\b",
+    re.IGNORECASE
+)
+# The rules only read English; turns without Latin letters are left to the LLM.
+LATIN_PATTERN = re.compile(r"[A-Za-z]")
+RISK_CUES = ('risk', 'issue', 'problem', 'blocker', 'blocked', 'delay', 'delayed', 'outage', 'down', 'leak',
+             'bug', 'incident', 'impossible', 'overtime', 'concern', 'fail', 'failed', 'failure', 'broke',
+             'broken', 'late', 'missed', 'ignored', 'slipped', 'behind')
+SEVERE_RISK_CUES = frozenset({'outage', 'down', 'leak', 'incident', 'impossible', 'failure', 'broken', 'critical'})
+RISK_CUE_PATTERN = re.compile(r"\b(?:" + '|'.join(RISK_CUES) + r"|critical)\b", re.IGNORECASE)
+RECOMMENDATION_PATTERN = re.compile(r"\b(?:we|you|they) (?:should|need to|must|have to)\b", re.IGNORECASE)
+SENTENCE_SPLIT_PATTERN = re.compile(r"(?<=[.!?])\s+")
+LEADING_ADVERB_PATTERN = re.compile(r"^(?:also|just|then|still|quickly)\s+", re.IGNORECASE)
+PRONOUN_TASK_PATTERN = re.compile(r"^(?:do|handle|take care of|send|finish|fix) (?:it|this|that|them)\b",
+                                  re.IGNORECASE)
+
+
+@dataclass
+class SpeakerTurn:
+    """One turn of the transcript: the speaker and what they said."""
+
+    index: int
+    speaker: str
+    text: str
+
+
+@dataclass
+class HeuristicItem:
+    """An extracted question, meeting or task with the turns it was read from."""
+
+    section: str
+    data: Dict[str, Any]
+    confidence: float
+    turns: Tuple[int, ...]
+
+
+@dataclass
+class HeuristicExtraction:
+    """Result of the rule-based pass over a transcript."""
+
+    turns: List[SpeakerTurn]
+    items: List[HeuristicItem] = field(default_factory=list)
+    unresolved_turns: List[int] = field(default_factory=list)
+    risk_factors: List[str] = field(default_factory=list)
+    recommendations: List[str] = field(default_factory=list)
+    severe_risks: int = 0
+    confidence: float = 0.0
+
+    def report(self, min_confidence: float = 0.0) -> Dict[str, List[Dict[str, Any]]]:
+        """Build the meeting report in the LLM schema, each item with its ``confidence``.
+
+        Args:
+            min_confidence: Leave out items below this confidence
+
+        Returns:
+            Dict with ``questions``, ``meetings`` and ``tasks`` lists
+        """
+        report: Dict[str, List[Dict[str, Any]]] = {'questions': [], 'meetings': [], 'tasks': []}
+        for item in self.items:
+            if item.confidence >= min_confidence:
+                report[item.section].append({**item.data, 'confidence': round(item.confidence, 2)})
+        return report
+
+    def to_audit_result(self, min_confidence: float = 0.0) -> AuditResult:
+        """Build an AuditResult from the extraction alone.
+
+        The risk score grows with the number of risk cues found, severe ones
+        (outages, leaks, incidents) counting double.
+
+        Args:
+            min_confidence: Leave report items below this confidence out
+
+        Returns:
+            AuditResult with the heuristic report and the extraction confidence
+        """
+        report = self.report(min_confidence)
+        speakers = list(dict.fromkeys(turn.speaker for turn in self.turns))
+        risk_score = min(0.9, 0.1 + 0.15 * len(self.risk_factors) + 0.1 * self.severe_risks)
+        summary = (f"Rule-based extraction: {len(report['questions'])} questions, "
+                   f"{len(report['meetings'])} meetings and {len(report['tasks'])} tasks"
+                   f"{' among ' + ', '.join(speakers) if speakers else ''}.")
+        return AuditResult(
+            risk_score=round(risk_score, 4),
+            risk_factors=list(self.risk_factors),
+            recommendations=list(self.recommendations),
+            summary=summary,
+            confidence=round(self.confidence, 4),
+            raw_report=report
+        )
+
+
+class HeuristicExtractor:
+    """Deterministic extraction of questions, meetings and tasks from speaker turns.
+
+    Recognizes questions ("X: ...?") answered by the next speaker, requests
+    ("Marcus, can you ...?") accepted in the addressee's next turn, commitments
+    ("I will ... by Friday") and meeting proposals ("let's meet ... at ...").
+    Each item gets a confidence; items below ``min_item_confidence``, turns with
+    cues the rules cannot attribute, turns no item accounts for that mention an
+    owner or a date, and turns not in English are reported as unresolved. The
+    transcript's confidence is the lowest item confidence, scaled down for
+    transcripts longer than ``short_turns`` turns, where the rules are more likely
+    to miss something. A transcript without any item has confidence 0: finding
+    nothing is no evidence that there is nothing to find.
+    """
+
+    def __init__(self, min_item_confidence: float = 0.7, short_turns: int = 20,
+                 text_parser: SimpleTextParser = None):
+        """Initialize the extractor.
+
+        Args:
+            min_item_confidence: Items below this confidence mark their turns unresolved
+            short_turns: Transcripts with more turns get a proportionally lower confidence
+            text_parser: The parser used to split transcripts into lines (optional, will create default if None)
+        """
+        self.min_item_confidence = min_item_confidence
+        self.short_turns = short_turns
+        self.text_parser = text_parser or SimpleTextParser()
+
+    def split_turns(self, transcript: str) -> List[SpeakerTurn]:
+        """Split a transcript into speaker turns; header lines and unlabelled lines before the first turn are skipped."""
+        turns: List[SpeakerTurn] = []
+        for line in self.text_parser.split_paragraphs(transcript):
+            match = SPEAKER_TURN_PATTERN.match(line)
+            speaker = line[:match.end()].rstrip()[:-1].strip() if match else None
+            if speaker and speaker.lower() not in HEADER_LABELS:
+                turns.append(SpeakerTurn(len(turns), speaker, line[match.end():].strip()))
+            elif not match and turns:
+                turns[-1].text += ' ' + line
+        return turns
+
+    def extract(self, transcript: str) -> HeuristicExtraction:
+        """Run the rules over a transcript.
+
+        Args:
+            transcript: The raw transcript
+
+        Returns:
+            HeuristicExtraction with the items, unresolved turns and confidence
+        """
+        turns = self.split_turns(transcript)
+        extraction = HeuristicExtraction(turns=turns)
+        if not turns:
+            return extraction
+
+        vague: List[int] = []
+        claimed_commitments = set()
+        for turn in turns:
+            sentences = SENTENCE_SPLIT_PATTERN.split(turn.text)
+            following = turns[turn.index + 1] if turn.index + 1 < len(turns) else None
+            self._questions(turn, sentences, following, extraction)
+            self._requests(turn, sentences, turns, extraction, claimed_commitments)
+            self._risks(sentences, extraction)
+            if VAGUE_ASSIGNMENT_PATTERN.search(turn.text):
+                vague.append(turn.index)
+
+        for turn in turns:
+            if turn.index not in claimed_commitments:
+                self._commitments(turn, turns, extraction)
+        self._meetings(turns, extraction)
+        self._late_deadlines(turns, extraction)
+
+        unresolved = set(vague)
+        accounted = set()
+        for item in extraction.items:
+            accounted.update(item.turns)
+            if item.confidence < self.min_item_confidence:
+                unresolved.update(item.turns)
+        # The rules only read English, so an item taken from another language may miss what the turn says.
+        unresolved.update(turn.index for turn in turns if not LATIN_PATTERN.search(turn.text)
+                          or (turn.index not in accounted and self._unaccounted_cues(turn.text)))
+        extraction.unresolved_turns = sorted(unresolved)
+
+        if not extraction.items:
+            return extraction
+        confidence = min(item.confidence for item in extraction.items)
+        if unresolved:
+            confidence = min(confidence, 0.5)
+        extraction.confidence = confidence * min(1.0, self.short_turns / len(turns))
+        return extraction
+
+    @staticmethod
+    def _unaccounted_cues(text: str) -> bool:
+        """Whether a turn no item came from may still hold a task or a meeting."""
+        return (not LATIN_PATTERN.search(text) or OWNERSHIP_PATTERN.search(text) is not None
+                or DAY_PATTERN.search(text) is not None)
+
+    @staticmethod
+    def _questions(turn: SpeakerTurn, sentences: List[str], following: Optional[SpeakerTurn],
+                   extraction: HeuristicExtraction):
+        questions = [s for s in sentences if s.endswith('?') and len(s.split()) > 2]
+        if not questions:
+            return
+        data = {'questioner': turn.speaker, 'responder': None, 'question': ' '.join(questions), 'answer': None}
+        answered = following is not None and following.speaker != turn.speaker
+        if answered:
+            data['responder'] = following.speaker
+            data['answer'] = following.text
+        extraction.items.append(HeuristicItem(
+            'questions', data, 0.9 if answered else 0.55,
+            (turn.index, following.index) if answered else (turn.index,)
+        ))
+
+    def _requests(self, turn: SpeakerTurn, sentences: List[str], turns: List[SpeakerTurn],
+                  extraction: HeuristicExtraction, claimed_commitments: set):
+        """Tasks asked of another participant, accepted (or not) in their next turn."""
+        for sentence in sentences:
+            match = REQUEST_PATTERN.match(sentence)
+            if not match:
+                continue
+            addressee = match.group('name')
+            reply = self._next_turn_of(turns, turn.index, addressee)
+            if addressee is None and reply is not None:
+                addressee = reply.speaker
+            if addressee is None or addressee == turn.speaker:
+                continue
+            task, deadline = self._split_deadline(match.group('task'))
+            if reply is not None and NEGATIVE_PATTERN.search(reply.text.split('.')[0]):
+                continue
+
+            confidence = 0.5
+            item_turns = (turn.index,)
+            if reply is not None and AFFIRMATIVE_PATTERN.match(reply.text):
+                confidence = 0.85
+                item_turns = (turn.index, reply.index)
+            elif reply is not None and COMMITMENT_PATTERN.search(reply.text):
+                confidence = 0.8
+                item_turns = (turn.index, reply.index)
+            if reply is not None and len(item_turns) == 2:
+                claimed_commitments.add(reply.index)
+                if deadline is None:
+                    deadline = self._deadline(reply.text)
+            extraction.items.append(HeuristicItem('tasks', {
+                'assigner': turn.speaker, 'assignee': addressee, 'task': task, 'deadline': deadline
+            }, confidence, item_turns))
+
+    def _commitments(self, turn: SpeakerTurn, turns: List[SpeakerTurn], extraction: HeuristicExtraction):
+        """Tasks a participant takes on by themselves ("I will ... by Friday")."""
+        for match in COMMITMENT_PATTERN.finditer(turn.text):
+            task, deadline = self._split_deadline(match.group('task'))
+            if MEETING_CUE_PATTERN.search(task) and not deadline:
+                continue
+            strength = match.group('strength').lower()
+            confidence = 0.8 if deadline else 0.72
+            if strength == 'i can' or 'try' in strength:
+                confidence = 0.55
+            if PRONOUN_TASK_PATTERN.match(task):
+                # "I will do it" only makes sense with the request it answers.
+                confidence = min(confidence, 0.5)
+            previous = turns[turn.index - 1] if turn.index > 0 else None
+            assigner = previous.speaker if previous is not None and previous.speaker != turn.speaker \
+                and REQUEST_PATTERN.search(previous.text) else turn.speaker
+            extraction.items.append(HeuristicItem('tasks', {
+                'assigner': assigner, 'assignee': turn.speaker, 'task': task, 'deadline': deadline
+            }, confidence, (turn.index,)))
+
+    def _meetings(self, turns: List[SpeakerTurn], extraction: HeuristicExtraction):
+        """Meetings proposed in a turn; a proposal without a time borrows it from the next two turns."""
+        pending: Optional[HeuristicItem] = None
+        for turn in turns:
+            cue = MEETING_CUE_PATTERN.search(turn.text)
+            if not cue:
+                continue
+            sentence = next(s for s in SENTENCE_SPLIT_PATTERN.split(turn.text) if MEETING_CUE_PATTERN.search(s))
+            when = self._datetime(sentence)
+            location = LOCATION_PATTERN.search(sentence)
+            purpose = PURPOSE_PATTERN.search(sentence[cue.end():])
+            data = {
+                'scheduler': turn.speaker,
+                'datetime': when,
+                'location': (location.group('tool') or location.group('place')) if location else None,
+                'purpose': purpose.group('purpose').strip() if purpose else self._meeting_subject(cue.group(0))
+            }
+            if pending is not None and turn.index - pending.turns[-1] <= 2 and pending.data['datetime'] is None:
+                # "I'll set up a budget meeting." ... "Let's meet next Tuesday at 2 PM."
+                data = {key: value or pending.data.get(key) for key, value in data.items()}
+                data['scheduler'] = pending.data['scheduler']
+                extraction.items.remove(pending)
+                item_turns = pending.turns + (turn.index,)
+            else:
+                item_turns = (turn.index,)
+            confidence = 0.5 if data['datetime'] is None else (0.9 if data['location'] else 0.8)
+            pending = HeuristicItem('meetings', data, confidence, item_turns)
+            extraction.items.append(pending)
+
+    def _late_deadlines(self, turns: List[SpeakerTurn], extraction: HeuristicExtraction):
+        """Attach deadlines stated a turn or two after the task ("I need it done by Friday")."""
+        for item in extraction.items:
+            if item.section != 'tasks' or item.data['deadline']:
+                continue
+            last = item.turns[-1]
+            for turn in turns[last + 1:last + 3]:
+                if COMMITMENT_PATTERN.search(turn.text) or REQUEST_PATTERN.search(turn.text):
+                    break
+                deadline = self._deadline(turn.text)
+                if deadline:
+                    item.data['deadline'] = deadline
+                    item.turns = item.turns + (turn.index,)
+                    break
+
+    @staticmethod
+    def _risks(sentences: List[str], extraction: HeuristicExtraction):
+        for sentence in sentences:
+            cues = {cue.lower() for cue in RISK_CUE_PATTERN.findall(sentence)}
+            if cues and sentence not in extraction.risk_factors:
+                extraction.risk_factors.append(sentence)
+                extraction.severe_risks += bool(cues & SEVERE_RISK_CUES)
+            if RECOMMENDATION_PATTERN.search(sentence) and sentence not in extraction.recommendations:
+                extraction.recommendations.append(sentence)
+
+    @staticmethod
+    def _next_turn_of(turns: List[SpeakerTurn], index: int, speaker: Optional[str]) -> Optional[SpeakerTurn]:
+        """The next turn by speaker within two turns (any other speaker's next turn if speaker is None)."""
+        asker = turns[index].speaker
+        for turn in turns[index + 1:index + 3]:
+            if speaker is None and turn.speaker != asker:
+                return turn
+            if speaker is not None and turn.speaker.lower() == speaker.lower():
+                return turn
+        return None
+
+    @staticmethod
+    def _deadline(text: str) -> Optional[str]:
+        match = DEADLINE_PATTERN.search(text)
+        return match.group('deadline').strip() if match else None
+
+    @classmethod
+    def _split_deadline(cls, task: str) -> Tuple[str, Optional[str]]:
+        """Separate a trailing "by <deadline>" from a task description."""
+        task = LEADING_ADVERB_PATTERN.sub('', task.strip())
+        match = DEADLINE_PATTERN.search(task)
+        if not match:
+            return task.strip(' ,'), None
+        return task[:match.start()].strip(' ,'), match.group('deadline').strip()
+
+    @staticmethod
+    def _datetime(sentence: str) -> Optional[str]:
+        day = DAY_PATTERN.search(sentence)
+        clock = TIME_PATTERN.search(sentence)
+        parts = [re.sub(r"^on ", '', day.group(0).strip(), flags=re.IGNORECASE) if day else None,
+                 re.sub(r"^(?:at|around) ", '', clock.group(0).strip(), flags=re.IGNORECASE) if clock else None]
+        return ' '.join(part for part in parts if part) or None
+
+    @staticmethod
+    def _meeting_subject(cue: str) -> Optional[str]:
+        """The kind of meeting named by the cue ("set up a budget meeting" -> "budget meeting")."""
+        match = re.search(r"(?:a |an |the |another )?((?:[\w-]+ ){0,2}(?:meeting|call|sync|review|session))$",
+                          cue, re.IGNORECASE)
+        subject = match.group(1) if match else None
+        return subject if subject and subject.lower() not in ('meeting', 'call', 'sync', 'review', 'session') \
+            else None
+
+
+def segment_text(turns: List[SpeakerTurn], indexes: List[int], context_turns: int = 1) -> Tuple[str, int]:
+    """Render the given turns plus context as transcript text, marking skipped turns.
+
+    Args:
+        turns: All turns of the transcript
+        indexes: Indexes of the turns to keep
+        context_turns: Neighbouring turns kept around each one
+
+    Returns:
+        (text, estimated tokens) of the segments
+    """
+    keep = sorted({
+        neighbour
+        for index in indexes
+        for neighbour in range(max(0, index - context_turns), min(len(turns), index + context_turns + 1))
+    })
+    lines = []
+    previous = -1
+    for index in keep:
+        if index > previous + 1:
+            lines.append(f"[... {index - previous - 1} turns omitted ...]")
+        lines.append(f"{turns[index].speaker}: {turns[index].text}")
+        previous = index
+    if keep and previous < len(turns) - 1:
+        lines.append(f"[... {len(turns) - 1 - previous} turns omitted ...]")
+    text = '\n'.join(lines)
+    return text, estimate_tokens(text)
\ No newline at end of file
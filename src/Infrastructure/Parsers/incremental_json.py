@@ -0,0 +1,247 @@
+import re
+from json.decoder import JSONDecodeError, scanstring
+from typing import Any, Dict, List, Optional, Tuple
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+_NUMBER_CHARS = re.compile(r'[-+0-9.eE]+')
+_NUMBER = re.compile(r'-?(?:0|[1-9]\d*)(?:\.\d+)?(?:[eE][-+]?\d+)?')
+_LITERALS = (('true', True), ('false', False), ('null', None))
+
+# Path segment of array elements; object members are addressed by their key.
+ELEMENT = '[]'
+
+
+class _Frame:
+    """An array or object that is still open."""
+
+    __slots__ = ('container', 'path', 'key', 'expect')
+
+    def __init__(self, container, path: Tuple[str, ...]):
+        self.container = container
+        self.path = path
+        self.key = None
+        # What comes next: 'value', 'key', 'colon' or 'comma' (a separator or the closing bracket).
+        self.expect = 'value' if isinstance(container, list) else 'key'
+
+
+class IncrementalJsonParser:
+    """Parses a JSON object fed in arbitrary chunks, e.g. tokens streamed by an LLM.
+
+    Anything before the first ``{`` (code fences, a preamble) and after the root
+    object closes is ignored. Elements of the arrays listed in ``watch`` are
+    reported by feed() as soon as they are complete, and so are objects listed
+    there, so consumers can act on them before the document ends. partial()
+    returns the structure parsed so far with every open array and object closed
+    and incomplete values dropped, which recovers truncated output.
+    """
+
+    def __init__(self, watch: Optional[Dict[Tuple[str, ...], str]] = None):
+        """Initialize the parser.
+
+        Args:
+            watch: Path of an array (or object) -> name reported with its elements (or itself);
+                paths are tuples of object keys from the root, e.g. ``('meeting_report', 'tasks')``
+        """
+        self.watch = watch or {}
+        self.error: Optional[str] = None
+        self._buffer = ''
+        self._stack: List[_Frame] = []
+        self._root = None
+        self._started = False
+        self._done = False
+
+    @property
+    def done(self) -> bool:
+        """Whether the root object has been closed."""
+        return self._done
+
+    def feed(self, chunk: str) -> List[Tuple[str, int, Any]]:
+        """Consume the next piece of the document.
+
+        Args:
+            chunk: Text following everything fed before
+
+        Returns:
+            (name, index, value) of each watched value completed by this chunk, in
+            document order; index is the element's position in its array (0 for objects)
+        """
+        if self._done or self.error is not None:
+            return []
+        buffer = self._buffer + chunk
+        if not self._started:
+            start = buffer.find('{')
+            if start < 0:
+                self._buffer = ''
+                return []
+            self._started = True
+            self._stack.append(_Frame({}, ()))
+            buffer = buffer[start + 1:]
+        completed: List[Tuple[str, int, Any]] = []
+        position = self._parse(buffer, completed)
+        self._buffer = '' if self._done else buffer[position:]
+        return completed
+
+    def partial(self) -> Optional[Dict[str, Any]]:
+        """Return the document parsed so far, with open containers closed.
+
+        Incomplete values are dropped, and so are incomplete elements of watched
+        arrays: a task cut off halfway is left out rather than reported half empty.
+
+        Returns:
+            The root object, or None if no ``{`` has been seen
+        """
+        if self._done:
+            return self._root
+        if not self._stack:
+            return None
+        value = None
+        for depth in range(len(self._stack) - 1, -1, -1):
+            frame = self._stack[depth]
+            container = list(frame.container) if isinstance(frame.container, list) else dict(frame.container)
+            if value is not None:
+                if isinstance(container, dict):
+                    container[frame.key] = value
+                elif frame.path not in self.watch:
+                    container.append(value)
+            value = container
+        return value
+
+    def _parse(self, buffer: str, completed: List[Tuple[str, int, Any]]) -> int:
+        """Consume as many complete tokens of the buffer as possible and return where it stopped."""
+        position = 0
+        length = len(buffer)
+        stack = self._stack
+        while stack:
+            position = _WHITESPACE.match(buffer, position).end()
+            if position >= length:
+                break
+            frame = stack[-1]
+            char = buffer[position]
+            expect = frame.expect
+
+            if expect == 'comma':
+                if char == ',':
+                    frame.expect = 'key' if isinstance(frame.container, dict) else 'value'
+                    position += 1
+                elif char == ('}' if isinstance(frame.container, dict) else ']'):
+                    position += 1
+                    self._close(completed)
+                else:
+                    return self._fail(f"Expected ',' or a closing bracket at {char!r}", position)
+            elif expect == 'key':
+                if char == '"':
+                    if self._string_end(buffer, position) is None:
+                        break
+                    try:
+                        frame.key, position = scanstring(buffer, position + 1, False)
+                    except JSONDecodeError as e:
+                        return self._fail(str(e), position)
+                    frame.expect = 'colon'
+                elif char == '}':
+                    position += 1
+                    self._close(completed)
+                else:
+                    return self._fail(f"Expected an object key at {char!r}", position)
+            elif expect == 'colon':
+                if char != ':':
+                    return self._fail(f"Expected ':' at {char!r}", position)
+                frame.expect = 'value'
+                position += 1
+            elif char == '{' or char == '[':
+                key = ELEMENT if isinstance(frame.container, list) else frame.key
+                stack.append(_Frame({} if char == '{' else [], frame.path + (key,)))
+                position += 1
+            elif char == ']' and isinstance(frame.container, list):
+                position += 1
+                self._close(completed)
+            elif char == '"':
+                if self._string_end(buffer, position) is None:
+                    break
+                try:
+                    value, position = scanstring(buffer, position + 1, False)
+                except JSONDecodeError as e:
+                    return self._fail(str(e), position)
+                self._add(value, completed)
+            else:
+                match = _NUMBER_CHARS.match(buffer, position)
+                if match:
+                    # A number is only complete once something follows it.
+                    if match.end() >= length:
+                        break
+                    text = match.group()
+                    if not _NUMBER.fullmatch(text):
+                        return self._fail(f"Invalid number {text!r}", position)
+                    position = match.end()
+                    self._add(float(text) if '.' in text or 'e' in text or 'E' in text else int(text), completed)
+                    continue
+                for literal, value in _LITERALS:
+                    if buffer.startswith(literal, position):
+                        position += len(literal)
+                        self._add(value, completed)
+                        break
+                    if literal.startswith(buffer[position:]):
+                        return position
+                else:
+                    return self._fail(f"Unexpected character {char!r}", position)
+        return position
+
+    @staticmethod
+    def _string_end(buffer: str, start: int) -> Optional[int]:
+        """Return the index of the quote closing the string opened at start, or None if it is not in the buffer."""
+        position = start + 1
+        while True:
+            quote = buffer.find('"', position)
+            if quote < 0:
+                return None
+            backslashes = 0
+            while buffer[quote - 1 - backslashes] == '\\':
+                backslashes += 1
+            if backslashes % 2 == 0:
+                return quote
+            position = quote + 1
+
+    def _add(self, value: Any, completed: List[Tuple[str, int, Any]]):
+        """Store a completed value in the innermost open container."""
+        frame = self._stack[-1]
+        container = frame.container
+        if isinstance(container, list):
+            container.append(value)
+            name = self.watch.get(frame.path)
+            if name is not None:
+                completed.append((name, len(container) - 1, value))
+        else:
+            container[frame.key] = value
+            if isinstance(value, dict):
+                name = self.watch.get(frame.path + (frame.key,))
+                if name is not None:
+                    completed.append((name, 0, value))
+        frame.expect = 'comma'
+
+    def _close(self, completed: List[Tuple[str, int, Any]]):
+        frame = self._stack.pop()
+        if self._stack:
+            self._add(frame.container, completed)
+        else:
+            self._root = frame.container
+            self._done = True
+
+    def _fail(self, message: str, position: int) -> int:
+        self.error = message
+        return position
+
+
+def recover_json_object(text: str, watch: Optional[Dict[Tuple[str, ...], str]] = None
+                        ) -> Tuple[Optional[Dict[str, Any]], bool]:
+    """Extract the JSON object from a model response that json.loads rejects.
+
+    Args:
+        text: The response, possibly wrapped in prose or code fences, or cut off
+        watch: Arrays whose incomplete elements are dropped (see IncrementalJsonParser)
+
+    Returns:
+        (object, complete): the object (None if none was found) and whether it was
+        closed; when it was not, the object holds the values completed before the cut
+    """
+    parser = IncrementalJsonParser(watch)
+    parser.feed(text)
+    return parser.partial(), parser.done
\ No newline at end of file
@@ -0,0 +1,203 @@
+import re
+from array import array
+from collections.abc import Mapping, Sequence
+from typing import Any, Dict, Iterator, List, Tuple
+
+SENTENCE_PATTERN = re.compile(r'[.!?]+')
+
+_KEYS = (
+    'original_text',
+    'paragraphs',
+    'sentences',
+    'word_count',
+    'char_count',
+    'paragraph_count',
+    'key_terms_found',
+    'structured_content'
+)
+
+
+class TextSpans(Sequence):
+    """Read-only sequence of substrings of a text, materialized on access."""
+
+    __slots__ = ('_text', '_starts', '_ends')
+
+    def __init__(self, text: str, starts: array, ends: array):
+        self._text = text
+        self._starts = starts
+        self._ends = ends
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        return self._text[self._starts[index]:self._ends[index]]
+
+    def __iter__(self) -> Iterator[str]:
+        text = self._text
+        for start, end in zip(self._starts, self._ends):
+            yield text[start:end]
+
+    def spans(self) -> Iterator[Tuple[int, int]]:
+        """Iterate over the (start, end) offsets of the substrings."""
+        return zip(self._starts, self._ends)
+
+
+class ParsedTranscript(Mapping):
+    """Parse result that keeps the transcript text once plus compact offset indexes.
+
+    Paragraphs, sentences and structured content are sliced out of the text only
+    when accessed. The object behaves like the dict ``SimpleTextParser`` used to
+    return, so ``parsed['paragraphs']`` still yields a list of strings.
+    """
+
+    __slots__ = (
+        'text',
+        'word_count',
+        'key_terms_found',
+        '_paragraph_starts',
+        '_paragraph_ends',
+        '_paragraph_types',
+        '_paragraph_words',
+        '_type_names',
+        '_sentence_starts',
+        '_sentence_ends'
+    )
+
+    def __init__(self, text: str, paragraph_starts: array, paragraph_ends: array, paragraph_types: array,
+                 paragraph_words: array, word_count: int, key_terms_found: List[str], type_names: Tuple[str, ...]):
+        """Initialize the parse result.
+
+        Args:
+            text: The original transcript
+            paragraph_starts: Offset of each stripped paragraph in the text
+            paragraph_ends: End offset of each stripped paragraph in the text
+            paragraph_types: Index into ``type_names`` of each paragraph
+            paragraph_words: Word count of each paragraph
+            word_count: Total word count of the transcript
+            key_terms_found: Key terms present in the transcript
+            type_names: Names of the paragraph types
+        """
+        self.text = text
+        self.word_count = word_count
+        self.key_terms_found = key_terms_found
+        self._paragraph_starts = paragraph_starts
+        self._paragraph_ends = paragraph_ends
+        self._paragraph_types = paragraph_types
+        self._paragraph_words = paragraph_words
+        self._type_names = type_names
+        self._sentence_starts = None
+        self._sentence_ends = None
+
+    @property
+    def char_count(self) -> int:
+        return len(self.text)
+
+    @property
+    def paragraph_count(self) -> int:
+        return len(self._paragraph_starts)
+
+    @property
+    def paragraphs(self) -> TextSpans:
+        """Lazy view over the non-empty, stripped lines of the transcript."""
+        return TextSpans(self.text, self._paragraph_starts, self._paragraph_ends)
+
+    @property
+    def sentences(self) -> TextSpans:
+        """Lazy view over the sentences of the transcript; offsets are indexed on first use."""
+        if self._sentence_starts is None:
+            self._index_sentences()
+        return TextSpans(self.text, self._sentence_starts, self._sentence_ends)
+
+    def iter_structured_content(self, include_content: bool = True) -> Iterator[Dict[str, Any]]:
+        """Iterate over per-paragraph records with index, type and word count.
+
+        Args:
+            include_content: Whether to include the paragraph text in each record
+
+        Returns:
+            Iterator of paragraph dicts in transcript order
+        """
+        text = self.text
+        type_names = self._type_names
+        records = zip(self._paragraph_starts, self._paragraph_ends, self._paragraph_types, self._paragraph_words)
+        for index, (start, end, type_index, words) in enumerate(records):
+            record = {'index': index}
+            if include_content:
+                record['content'] = text[start:end]
+            else:
+                record['start'] = start
+                record['end'] = end
+            record['type'] = type_names[type_index]
+            record['word_count'] = words
+            yield record
+
+    def to_dict(self, slim: bool = False) -> Dict[str, Any]:
+        """Materialize the parse result as plain, JSON-serializable data.
+
+        Args:
+            slim: Leave out the raw text and every copy of it (paragraphs, sentences and
+                paragraph contents); paragraphs are then referenced by character offsets
+
+        Returns:
+            Dict with the same keys as the legacy parse result, minus the text in slim mode
+        """
+        if not slim:
+            return dict(self.items())
+        return {
+            'word_count': self.word_count,
+            'char_count': self.char_count,
+            'paragraph_count': self.paragraph_count,
+            'key_terms_found': list(self.key_terms_found),
+            'structured_content': list(self.iter_structured_content(include_content=False))
+        }
+
+    def __getitem__(self, key: str) -> Any:
+        if key == 'original_text':
+            return self.text
+        if key == 'paragraphs':
+            return list(self.paragraphs)
+        if key == 'sentences':
+            return list(self.sentences)
+        if key == 'structured_content':
+            return list(self.iter_structured_content())
+        if key in ('word_count', 'char_count', 'paragraph_count'):
+            return getattr(self, key)
+        if key == 'key_terms_found':
+            return list(self.key_terms_found)
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(_KEYS)
+
+    def __len__(self) -> int:
+        return len(_KEYS)
+
+    def __repr__(self) -> str:
+        return (f"ParsedTranscript(char_count={self.char_count}, paragraph_count={self.paragraph_count}, "
+                f"word_count={self.word_count})")
+
+    def _index_sentences(self):
+        """Record the offsets of the stripped, non-empty pieces between sentence delimiters."""
+        text = self.text
+        starts = array('q')
+        ends = array('q')
+        position = 0
+        for delimiter in SENTENCE_PATTERN.finditer(text):
+            self._add_stripped_span(text, position, delimiter.start(), starts, ends)
+            position = delimiter.end()
+        self._add_stripped_span(text, position, len(text), starts, ends)
+        self._sentence_starts = starts
+        self._sentence_ends = ends
+
+    @staticmethod
+    def _add_stripped_span(text: str, start: int, end: int, starts: array, ends: array):
+        piece = text[start:end]
+        stripped = piece.lstrip()
+        if not stripped:
+            return
+        start += len(piece) - len(stripped)
+        starts.append(start)
+        ends.append(start + len(stripped.rstrip()))
\ No newline at end of file
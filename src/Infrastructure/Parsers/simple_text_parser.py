@@ -1,67 +1,129 @@
-import re
+from array import array
 from typing import Dict, List, Any
+from Infrastructure.Parsers.parsed_transcript import ParsedTranscript
+
+# Paragraph categories in priority order: the first category with a keyword match wins.
+PARAGRAPH_TYPES = (
+    ('meeting_summary', ('meeting', 'discussion', 'talk', 'confer')),
+    ('risk_section', ('risk', 'danger', 'threat', 'concern')),
+    ('solution_section', ('solution', 'fix', 'resolve', 'address')),
+    ('decision_section', ('decision', 'agree', 'determine', 'choose')),
+    ('action_items', ('action', 'task', 'step', 'do')),
+)
+DEFAULT_PARAGRAPH_TYPE = 'general_content'
+KEY_TERMS = ['risk', 'issue', 'problem', 'concern', 'opportunity', 'solution', 'decision']
+
+PARAGRAPH_TYPE_NAMES = tuple(name for name, _ in PARAGRAPH_TYPES) + (DEFAULT_PARAGRAPH_TYPE,)
+DEFAULT_PARAGRAPH_RANK = len(PARAGRAPH_TYPES)
+_RANKED_PARAGRAPH_TYPES = [(rank, keywords) for rank, (_, keywords) in enumerate(PARAGRAPH_TYPES)]
 
 
 class SimpleTextParser:
     """Simple text parser for extracting structured information from raw text."""
 
+    KEY_TERMS = KEY_TERMS
+
     def __init__(self):
         """Initialize the text parser."""
         pass
 
-    def parse_transcript(self, text: str) -> Dict[str, Any]:
+    def parse_transcript(self, text: str) -> ParsedTranscript:
         """Parse a transcript and extract structured information.
 
+        The text is lowercased and split once. Keywords that never occur anywhere in
+        the text are dropped up front with a C-level substring search, so the
+        per-paragraph classification only checks keywords that can actually match.
+        Paragraphs are recorded as offsets into the text rather than copies.
+
         Args:
             text: The raw text to parse
 
         Returns:
-            Dict containing structured information from the text
+            ParsedTranscript exposing the structured information from the text
+        """
+        lowered = text.lower()
+        active_types = self._active_paragraph_types(lowered)
+
+        starts = array('q')
+        ends = array('q')
+        types = array('B')
+        words = array('L')
+        word_count = 0
+        offset = 0
+        for line, line_lower in zip(text.split('\n'), lowered.split('\n')):
+            line_start = offset
+            offset += len(line) + 1
+            paragraph = line.strip()
+            if not paragraph:
+                continue
+            paragraph_words = len(paragraph.split())
+            word_count += paragraph_words
+            start = line_start + len(line) - len(line.lstrip())
+            starts.append(start)
+            ends.append(start + len(paragraph))
+            types.append(self._classify(line_lower, active_types))
+            words.append(paragraph_words)
+
+        return ParsedTranscript(
+            text,
+            paragraph_starts=starts,
+            paragraph_ends=ends,
+            paragraph_types=types,
+            paragraph_words=words,
+            word_count=word_count,
+            key_terms_found=[term for term in KEY_TERMS if term in lowered],
+            type_names=PARAGRAPH_TYPE_NAMES
+        )
+
+    def parse_increment(self, lines: List[str], state: Dict[str, Any] = None) -> Dict[str, Any]:
+        """Fold newly arrived transcript lines into running statistics.
+
+        Only the new lines are scanned, so statistics for a live transcript can be
+        kept up to date without re-parsing everything received so far.
+
+        Args:
+            lines: The newly arrived lines
+            state: Statistics returned by the previous call (optional for the first call)
+
+        Returns:
+            Dict containing the updated statistics
         """
-        paragraphs = [p.strip() for p in text.split('\n') if p.strip()]
-        sentences = re.split(r'[.!?]+', text)
-        sentences = [s.strip() for s in sentences if s.strip()]
-
-        word_count = len(text.split())
-        char_count = len(text)
-        paragraph_count = len(paragraphs)
-
-        key_terms = ['risk', 'issue', 'problem', 'concern', 'opportunity', 'solution', 'decision']
-        found_terms = []
-        for term in key_terms:
-            if term.lower() in text.lower():
-                found_terms.append(term)
-
-        return {
-            'original_text': text,
-            'paragraphs': paragraphs,
-            'sentences': sentences,
-            'word_count': word_count,
-            'char_count': char_count,
-            'paragraph_count': paragraph_count,
-            'key_terms_found': found_terms,
-            'structured_content': self._structure_content(paragraphs)
+        state = dict(state) if state else {
+            'word_count': 0,
+            'char_count': 0,
+            'paragraph_count': 0,
+            'key_terms_found': [],
+            'paragraph_types': {}
         }
+        found_terms = set(state['key_terms_found'])
+        paragraph_types = dict(state['paragraph_types'])
+
+        for line in lines:
+            state['word_count'] += len(line.split())
+            state['char_count'] += len(line) + 1
+            paragraph = line.strip()
+            if not paragraph:
+                continue
+            state['paragraph_count'] += 1
+            para_type = self._identify_paragraph_type(paragraph)
+            paragraph_types[para_type] = paragraph_types.get(para_type, 0) + 1
+            paragraph_lower = paragraph.lower()
+            found_terms.update(term for term in KEY_TERMS if term in paragraph_lower)
+
+        state['key_terms_found'] = [term for term in KEY_TERMS if term in found_terms]
+        state['paragraph_types'] = paragraph_types
+        return state
 
-    def _structure_content(self, paragraphs: List[str]) -> List[Dict[str, Any]]:
-        """Structure the content by identifying paragraph types.
+    def split_paragraphs(self, text: str) -> List[str]:
+        """Split text into non-empty, stripped lines (one speaker turn per line).
 
         Args:
-            paragraphs: List of paragraphs
+            text: The raw text to split
 
         Returns:
-            List of dictionaries containing structured paragraph information
+            List of paragraphs in transcript order
         """
-        structured = []
-        for i, paragraph in enumerate(paragraphs):
-            para_type = self._identify_paragraph_type(paragraph)
-            structured.append({
-                'index': i,
-                'content': paragraph,
-                'type': para_type,
-                'word_count': len(paragraph.split())
-            })
-        return structured
+        return [p.strip() for p in text.split('\n') if p.strip()]
 
     def _identify_paragraph_type(self, text: str) -> str:
         """Identify the type of paragraph based on content.
@@ -72,17 +134,30 @@ class SimpleTextParser:
         Returns:
             String representing the identified type
         """
-        text_lower = text.lower()
-
-        if any(keyword in text_lower for keyword in ['meeting', 'discussion', 'talk', 'confer']):
-            return 'meeting_summary'
-        elif any(keyword in text_lower for keyword in ['risk', 'danger', 'threat', 'concern']):
-            return 'risk_section'
-        elif any(keyword in text_lower for keyword in ['solution', 'fix', 'resolve', 'address']):
-            return 'solution_section'
-        elif any(keyword in text_lower for keyword in ['decision', 'agree', 'determine', 'choose']):
-            return 'decision_section'
-        elif any(keyword in text_lower for keyword in ['action', 'task', 'step', 'do']):
-            return 'action_items'
-        else:
-            return 'general_content'
\ No newline at end of file
+        return PARAGRAPH_TYPE_NAMES[self._classify(text.lower(), _RANKED_PARAGRAPH_TYPES)]
+
+    @staticmethod
+    def _active_paragraph_types(text_lower: str) -> List[tuple]:
+        """Restrict the paragraph type keywords to those present in the text.
+
+        Args:
+            text_lower: The lowercased text
+
+        Returns:
+            (rank, keywords) pairs in priority order, keeping only keywords found in the text
+        """
+        active = []
+        for rank, (_, keywords) in enumerate(PARAGRAPH_TYPES):
+            present = tuple(keyword for keyword in keywords if keyword in text_lower)
+            if present:
+                active.append((rank, present))
+        return active
+
+    @staticmethod
+    def _classify(text_lower: str, paragraph_types: List[tuple]) -> int:
+        """Return the rank of the first paragraph type with a keyword in the lowercased text."""
+        for rank, keywords in paragraph_types:
+            for keyword in keywords:
+                if keyword in text_lower:
+                    return rank
+        return DEFAULT_PARAGRAPH_RANK
\ No newline at end of file
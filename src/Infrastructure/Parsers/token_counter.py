@@ -0,0 +1,16 @@
+import math
+
+# Rough average for English text with the GPT-style BPE tokenizers used by our providers.
+CHARS_PER_TOKEN = 4.0
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the number of LLM tokens in a piece of text.
+
+    Args:
+        text: The text to measure
+
+    Returns:
+        Estimated token count
+    """
+    return math.ceil(len(text) / CHARS_PER_TOKEN) if text else 0
\ No newline at end of file
@@ -0,0 +1,101 @@
+import re
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+from Infrastructure.Parsers.simple_text_parser import SimpleTextParser
+from Infrastructure.Parsers.token_counter import estimate_tokens
+
+SPEAKER_TURN_PATTERN = re.compile(r"^[^:\n]{1,60}:\s")
+
+
+@dataclass
+class TranscriptChunk:
+    """A window of consecutive speaker turns taken from a transcript."""
+
+    index: int
+    text: str
+    first_turn: int
+    last_turn: int
+    tokens: int
+
+
+class TranscriptChunker:
+    """Split long transcripts into overlapping windows of speaker turns under a token budget."""
+
+    def __init__(self, max_tokens: int = 3000, overlap_turns: int = 2,
+                 text_parser: SimpleTextParser = None):
+        """Initialize the chunker.
+
+        Args:
+            max_tokens: Token budget of a single chunk, including the repeated preamble
+            overlap_turns: Number of trailing turns repeated at the start of the next chunk
+            text_parser: The text parser used to find speaker turns
+        """
+        if max_tokens < 1:
+            raise ValueError("max_tokens must be positive")
+        self.max_tokens = max_tokens
+        self.overlap_turns = max(0, overlap_turns)
+        self.text_parser = text_parser or SimpleTextParser()
+
+    def needs_chunking(self, text: str) -> bool:
+        """Check whether the transcript exceeds the chunk budget."""
+        return estimate_tokens(text) > self.max_tokens
+
+    def split(self, text: str) -> List[TranscriptChunk]:
+        """Split a transcript into overlapping chunks.
+
+        Lines before the first speaker turn (title, attendees, date) form a preamble
+        that is repeated at the top of every chunk so each one keeps its context.
+        A "Label:" line counts as a turn only if the label starts at least two lines,
+        so one-off headers such as "Attendees: ..." or "Date: ..." stay in the preamble.
+        A single turn larger than the budget becomes a chunk of its own.
+
+        Args:
+            text: The raw transcript
+
+        Returns:
+            List of chunks in transcript order
+        """
+        paragraphs = self.text_parser.split_paragraphs(text)
+        labels = [self._label(line) for line in paragraphs]
+        counts: Dict[str, int] = {}
+        for label in labels:
+            if label:
+                counts[label] = counts.get(label, 0) + 1
+        preamble_size = 0
+        while preamble_size < len(paragraphs) and counts.get(labels[preamble_size], 0) < 2:
+            preamble_size += 1
+        if preamble_size == len(paragraphs):
+            preamble_size = 0
+
+        preamble = paragraphs[:preamble_size]
+        turns = paragraphs[preamble_size:]
+        preamble_tokens = sum(estimate_tokens(line) + 1 for line in preamble)
+        turn_tokens = [estimate_tokens(turn) + 1 for turn in turns]
+        budget = max(self.max_tokens - preamble_tokens, 1)
+
+        chunks = []
+        start = 0
+        while start < len(turns):
+            end = start
+            used = 0
+            while end < len(turns) and (end == start or used + turn_tokens[end] <= budget):
+                used += turn_tokens[end]
+                end += 1
+            chunk_text = '\n'.join(preamble + turns[start:end])
+            chunks.append(TranscriptChunk(
+                index=len(chunks),
+                text=chunk_text,
+                first_turn=start,
+                last_turn=end - 1,
+                tokens=estimate_tokens(chunk_text)
+            ))
+            if end >= len(turns):
+                break
+            start = max(end - self.overlap_turns, start + 1)
+
+        return chunks
+
+    @staticmethod
+    def _label(line: str) -> Optional[str]:
+        match = SPEAKER_TURN_PATTERN.match(line)
+        return line[:match.end()].rstrip()[:-1].strip() if match else None
\ No newline at end of file
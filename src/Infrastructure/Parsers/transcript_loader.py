@@ -0,0 +1,46 @@
+import json
+import pathlib
+from typing import Dict, Iterator, Union
+
+TRANSCRIPT_SUFFIXES = ('.txt', '.md')
+
+
+def load_transcripts(source: Union[str, pathlib.Path]) -> Iterator[Dict[str, str]]:
+    """Lazily load transcripts from a directory, a JSONL file or a single text file.
+
+    Directories yield one transcript per ``.txt``/``.md`` file, named after the file stem.
+    JSONL files yield one transcript per line; each line must contain a ``transcript``
+    (or ``text``) field and may contain a ``name`` (or ``id``) field.
+
+    Args:
+        source: Path to the directory or file to read
+
+    Returns:
+        Iterator of dicts with ``name`` and ``transcript`` keys
+    """
+    path = pathlib.Path(source)
+    if path.is_dir():
+        for file_path in sorted(path.iterdir()):
+            if file_path.is_file() and file_path.suffix.lower() in TRANSCRIPT_SUFFIXES:
+                yield {
+                    'name': file_path.stem,
+                    'transcript': file_path.read_text(encoding='utf-8')
+                }
+    elif path.suffix.lower() == '.jsonl':
+        with open(path, 'r', encoding='utf-8') as f:
+            for line_number, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError as e:
+                    raise ValueError(f"Invalid JSON on line {line_number} of {path}: {e}")
+                transcript = record.get('transcript', record.get('text'))
+                if transcript is None:
+                    raise ValueError(f"Line {line_number} of {path} has no 'transcript' field")
+                name = record.get('name', record.get('id', f"{path.stem}-{line_number}"))
+                yield {'name': str(name), 'transcript': transcript}
+    elif path.is_file():
+        yield {'name': path.stem, 'transcript': path.read_text(encoding='utf-8')}
+    else:
+        raise FileNotFoundError(f"Transcript source '{source}' not found")
\ No newline at end of file
@@ -0,0 +1,199 @@
+import re
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+from Infrastructure.Parsers.simple_text_parser import SimpleTextParser
+from Infrastructure.Parsers.token_counter import estimate_tokens
+from Infrastructure.Parsers.transcript_chunker import SPEAKER_TURN_PATTERN
+
+# Hesitations and backchannels that carry no content on their own ("Um, mm-hmm.").
+# Short answers such as "Yes." or "Okay." are kept: they may accept a task.
+FILLER_WORDS = frozenset({'um', 'uh', 'erm', 'er', 'hmm', 'mm', 'mhm', 'mm-hmm', 'uh-huh', 'ah', 'oh', 'so', 'well'})
+# Hesitations removed from inside otherwise meaningful lines.
+INLINE_FILLER_PATTERN = re.compile(r",?\s*(?<![\w'-])(?:um+|uh+|erm+|hmm+|mm+)(?![\w'-]),?", re.IGNORECASE)
+SPACE_BEFORE_PUNCTUATION = re.compile(r"\s+([.,!?;:])")
+# Header and recording-tool lines that say nothing about the meeting itself.
+BOILERPLATE_PATTERN = re.compile(
+    r"^(?:meeting transcript:?|transcript:?|\[?(?:recording|transcription) (?:started|stopped|ended)\]?\.?"
+    r"|\[(?:inaudible|crosstalk|silence|music|noise|laughter)\]\.?)$",
+    re.IGNORECASE
+)
+OMISSION_MARKER = "[... {count} lines omitted ...]"
+
+
+@dataclass
+class NormalizedTranscript:
+    """A transcript prepared for the prompt, with its size before and after."""
+
+    text: str
+    tokens_before: int
+    tokens_after: int
+    speakers: Dict[str, str] = field(default_factory=dict)
+    dropped_lines: int = 0
+    truncated: bool = False
+
+    @property
+    def tokens_saved(self) -> int:
+        return self.tokens_before - self.tokens_after
+
+
+class TranscriptNormalizer:
+    """Shrink a transcript before it is sent to the LLM.
+
+    Lines come from SimpleTextParser.split_paragraphs (stripped, blank lines dropped).
+    Runs of whitespace are collapsed, hesitations and filler-only turns are removed,
+    recording boilerplate is dropped and speaker names are replaced by compact IDs
+    (S1, S2, ...) listed once in a legend. When a token budget is set, lines are
+    taken alternately from the start and the end of the meeting until the budget is
+    spent, since decisions and action items cluster at the end.
+    """
+
+    def __init__(
+        self,
+        token_budget: Optional[int] = None,
+        compact_speakers: bool = True,
+        drop_filler: bool = True,
+        text_parser: SimpleTextParser = None
+    ):
+        """Initialize the normalizer.
+
+        Args:
+            token_budget: Maximum estimated tokens of the normalized transcript (optional, unlimited if None)
+            compact_speakers: Replace speaker names by short IDs
+            drop_filler: Remove hesitations, filler-only turns and boilerplate lines
+            text_parser: The parser used to split the transcript into lines (optional, will create default if None)
+        """
+        if token_budget is not None and token_budget < 1:
+            raise ValueError("token_budget must be at least 1")
+        self.token_budget = token_budget
+        self.compact_speakers = compact_speakers
+        self.drop_filler = drop_filler
+        self.text_parser = text_parser or SimpleTextParser()
+
+    @property
+    def signature(self) -> str:
+        """Settings that change the prompt, for prompt template versioning."""
+        return (f"b{self.token_budget or 0}"
+                f"{'s' if self.compact_speakers else ''}{'f' if self.drop_filler else ''}")
+
+    def normalize(self, transcript: str) -> NormalizedTranscript:
+        """Normalize a transcript.
+
+        Args:
+            transcript: The raw transcript
+
+        Returns:
+            NormalizedTranscript with the prompt text, the speaker legend and token counts
+        """
+        lines: List[str] = []
+        dropped = 0
+        for line in self.text_parser.split_paragraphs(transcript):
+            line = ' '.join(line.split())
+            if self.drop_filler:
+                line = self._strip_filler(line)
+                if line is None:
+                    dropped += 1
+                    continue
+            lines.append(line)
+
+        speakers: Dict[str, str] = {}
+        if self.compact_speakers:
+            lines = self._compact_speakers(lines, speakers)
+
+        legend = self._legend(speakers)
+        truncated = False
+        if self.token_budget is not None:
+            lines, truncated = self._fit_budget(lines, self.token_budget - estimate_tokens(legend))
+
+        text = '\n'.join(([legend] if legend else []) + lines)
+        return NormalizedTranscript(
+            text=text,
+            tokens_before=estimate_tokens(transcript),
+            tokens_after=estimate_tokens(text),
+            speakers=speakers,
+            dropped_lines=dropped,
+            truncated=truncated
+        )
+
+    @staticmethod
+    def _strip_filler(line: str) -> Optional[str]:
+        """Return the line without hesitations, or None if nothing meaningful is left."""
+        if BOILERPLATE_PATTERN.match(line):
+            return None
+        prefix = ''
+        match = SPEAKER_TURN_PATTERN.match(line)
+        if match:
+            prefix, line = line[:match.end()], line[match.end():]
+        stripped = SPACE_BEFORE_PUNCTUATION.sub(r'\1', ' '.join(INLINE_FILLER_PATTERN.sub(' ', line).split()))
+        words = [word.strip('.,!?;:"\'').lower() for word in stripped.split()]
+        if all(not word or word in FILLER_WORDS for word in words):
+            return None
+        if INLINE_FILLER_PATTERN.match(line):
+            stripped = stripped[:1].upper() + stripped[1:]
+        return prefix + stripped
+
+    @classmethod
+    def _compact_speakers(cls, lines: List[str], speakers: Dict[str, str]) -> List[str]:
+        """Replace speaker names by IDs, filling speakers with ID -> name.
+
+        Only names that start at least two turns get an ID, which leaves one-off
+        header lines such as "Date: ..." or "Attendees: ..." alone.
+        """
+        turns = []
+        counts: Dict[str, int] = {}
+        for line in lines:
+            match = SPEAKER_TURN_PATTERN.match(line)
+            name = line[:match.end()].rstrip()[:-1].strip() if match else None
+            turns.append((name, line[match.end():] if match else line))
+            if name:
+                counts[name] = counts.get(name, 0) + 1
+
+        ids: Dict[str, str] = {}
+        compacted = []
+        saved = 0
+        for (name, utterance), line in zip(turns, lines):
+            if not name or counts[name] < 2:
+                compacted.append(line)
+                continue
+            speaker_id = ids.get(name)
+            if speaker_id is None:
+                speaker_id = ids[name] = f"S{len(ids) + 1}"
+                speakers[speaker_id] = name
+            saved += len(line) - len(utterance) - len(speaker_id) - 2
+            compacted.append(f"{speaker_id}: {utterance}")
+
+        # IDs only pay off when the names they replace outweigh the legend.
+        if saved <= len(cls._legend(speakers)):
+            speakers.clear()
+            return lines
+        return compacted
+
+    @staticmethod
+    def _legend(speakers: Dict[str, str]) -> str:
+        if not speakers:
+            return ''
+        return 'Speakers: ' + '; '.join(f"{speaker_id}={name}" for speaker_id, name in speakers.items())
+
+    @staticmethod
+    def _fit_budget(lines: List[str], budget: int):
+        """Keep lines from both ends of the meeting within the token budget."""
+        costs = [estimate_tokens(line) + 1 for line in lines]
+        if sum(costs) <= budget:
+            return lines, False
+
+        budget -= estimate_tokens(OMISSION_MARKER.format(count=len(lines))) + 1
+        head, tail = 0, len(lines)
+        spent = 0
+        take_head = True
+        while head < tail:
+            index = head if take_head else tail - 1
+            if spent + costs[index] > budget:
+                break
+            spent += costs[index]
+            if take_head:
+                head += 1
+            else:
+                tail -= 1
+            take_head = not take_head
+
+        omitted = tail - head
+        return lines[:head] + [OMISSION_MARKER.format(count=omitted)] + lines[tail:], True
\ No newline at end of file
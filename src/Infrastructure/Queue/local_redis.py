@@ -0,0 +1,282 @@
+import heapq
+import threading
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+try:
+    from redis.exceptions import WatchError
+except ImportError:
+    class WatchError(Exception):
+        """A watched key changed before the transaction was executed."""
+
+
+def _bytes(value: Any) -> bytes:
+    if isinstance(value, bytes):
+        return value
+    if isinstance(value, str):
+        return value.encode('utf-8')
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return str(value).encode('utf-8')
+
+
+def _bound(value) -> Tuple[float, bool]:
+    """Parse a sorted-set score bound: a number, ``-inf``/``+inf`` or ``(x`` for exclusive."""
+    text = value.decode() if isinstance(value, bytes) else value
+    if isinstance(text, str) and text.startswith('('):
+        return float(text[1:]), True
+    return float(text), False
+
+
+class _SortedSet(dict):
+    """Member -> score dict with a lazily invalidated heap for the lowest-score lookups queues make."""
+
+    def __init__(self):
+        super().__init__()
+        self._heap: List[Tuple[float, bytes]] = []
+
+    def __setitem__(self, member: bytes, score: float):
+        super().__setitem__(member, score)
+        heapq.heappush(self._heap, (score, member))
+        if len(self._heap) > 2 * len(self) + 64:
+            self._heap = [(value, key) for key, value in self.items()]
+            heapq.heapify(self._heap)
+
+    def lowest(self) -> Optional[Tuple[bytes, float]]:
+        """Return the member with the lowest score (ties by member), dropping stale heap entries."""
+        heap = self._heap
+        while heap:
+            score, member = heap[0]
+            if self.get(member) == score:
+                return member, score
+            heapq.heappop(heap)
+        return None
+
+
+class LocalRedis:
+    """In-process stand-in for the redis-py client commands RedisWorkQueue uses.
+
+    Implements hashes, sorted sets and WATCH/MULTI/EXEC pipelines with the same
+    return values as redis-py without ``decode_responses`` (bytes), so the queue
+    can run without a Redis server: in tests, benchmarks, or one process with many
+    worker tasks. Data lives in memory and is not shared between processes.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._data: Dict[bytes, Any] = {}
+        self._versions: Dict[bytes, int] = {}
+
+    def _touch(self, name: bytes):
+        self._versions[name] = self._versions.get(name, 0) + 1
+
+    def _hash(self, name, create: bool = False) -> Optional[Dict[bytes, bytes]]:
+        key = _bytes(name)
+        value = self._data.get(key)
+        if value is None and create:
+            value = self._data[key] = {}
+        return value
+
+    def _zset(self, name, create: bool = False) -> Optional[_SortedSet]:
+        key = _bytes(name)
+        value = self._data.get(key)
+        if value is None and create:
+            value = self._data[key] = _SortedSet()
+        return value
+
+    def _drop_if_empty(self, name):
+        key = _bytes(name)
+        if key in self._data and not self._data[key]:
+            del self._data[key]
+
+    # Hashes
+
+    def hset(self, name, key=None, value=None, mapping: Dict[Any, Any] = None) -> int:
+        with self._lock:
+            items = dict(mapping or {})
+            if key is not None:
+                items[key] = value
+            hash_ = self._hash(name, create=True)
+            added = 0
+            for field, field_value in items.items():
+                added += _bytes(field) not in hash_
+                hash_[_bytes(field)] = _bytes(field_value)
+            self._touch(_bytes(name))
+            return added
+
+    def hsetnx(self, name, key, value) -> int:
+        with self._lock:
+            hash_ = self._hash(name, create=True)
+            if _bytes(key) in hash_:
+                return 0
+            hash_[_bytes(key)] = _bytes(value)
+            self._touch(_bytes(name))
+            return 1
+
+    def hget(self, name, key) -> Optional[bytes]:
+        with self._lock:
+            return (self._hash(name) or {}).get(_bytes(key))
+
+    def hexists(self, name, key) -> bool:
+        with self._lock:
+            return _bytes(key) in (self._hash(name) or {})
+
+    def hdel(self, name, *keys) -> int:
+        with self._lock:
+            hash_ = self._hash(name) or {}
+            removed = sum(1 for key in keys if hash_.pop(_bytes(key), None) is not None)
+            if removed:
+                self._touch(_bytes(name))
+                self._drop_if_empty(name)
+            return removed
+
+    def hincrby(self, name, key, amount: int = 1) -> int:
+        with self._lock:
+            hash_ = self._hash(name, create=True)
+            value = int(hash_.get(_bytes(key), b'0')) + amount
+            hash_[_bytes(key)] = _bytes(value)
+            self._touch(_bytes(name))
+            return value
+
+    def hlen(self, name) -> int:
+        with self._lock:
+            return len(self._hash(name) or {})
+
+    def hgetall(self, name) -> Dict[bytes, bytes]:
+        with self._lock:
+            return dict(self._hash(name) or {})
+
+    def hscan_iter(self, name, count: int = 100) -> Iterator[Tuple[bytes, bytes]]:
+        with self._lock:
+            items = list((self._hash(name) or {}).items())
+        yield from items
+
+    # Sorted sets
+
+    def zadd(self, name, mapping: Dict[Any, float], nx: bool = False, xx: bool = False) -> int:
+        with self._lock:
+            zset = self._zset(name, create=True)
+            added = 0
+            for member, score in mapping.items():
+                member = _bytes(member)
+                exists = member in zset
+                if (nx and exists) or (xx and not exists):
+                    continue
+                added += not exists
+                zset[member] = float(score)
+            self._touch(_bytes(name))
+            self._drop_if_empty(name)
+            return added
+
+    def zrem(self, name, *members) -> int:
+        with self._lock:
+            zset = self._zset(name) or {}
+            removed = sum(1 for member in members if zset.pop(_bytes(member), None) is not None)
+            if removed:
+                self._touch(_bytes(name))
+                self._drop_if_empty(name)
+            return removed
+
+    def zscore(self, name, member) -> Optional[float]:
+        with self._lock:
+            return (self._zset(name) or {}).get(_bytes(member))
+
+    def zcard(self, name) -> int:
+        with self._lock:
+            return len(self._zset(name) or {})
+
+    def _in_range(self, name, min, max) -> List[Tuple[bytes, float]]:
+        low, low_exclusive = _bound(min)
+        high, high_exclusive = _bound(max)
+        members = sorted((self._zset(name) or {}).items(), key=lambda item: (item[1], item[0]))
+        return [
+            (member, score) for member, score in members
+            if (score > low if low_exclusive else score >= low) and (score < high if high_exclusive else score <= high)
+        ]
+
+    def zrangebyscore(self, name, min, max, start: Optional[int] = None, num: Optional[int] = None,
+                      withscores: bool = False) -> List[Any]:
+        with self._lock:
+            if start == 0 and num == 1 and not withscores:
+                lowest = (self._zset(name) or _SortedSet()).lowest()
+                if lowest is None:
+                    return []
+                member, score = lowest
+                low, low_exclusive = _bound(min)
+                high, high_exclusive = _bound(max)
+                if score > low or (score == low and not low_exclusive):
+                    # Every other member scores at least as high, so only this one can be first.
+                    return [member] if score < high or (score == high and not high_exclusive) else []
+            members = self._in_range(name, min, max)
+            if start is not None and num is not None:
+                members = members[start:start + num] if num >= 0 else members[start:]
+            return list(members) if withscores else [member for member, _ in members]
+
+    def zcount(self, name, min, max) -> int:
+        with self._lock:
+            return len(self._in_range(name, min, max))
+
+    # Keys and transactions
+
+    def delete(self, *names) -> int:
+        with self._lock:
+            removed = 0
+            for name in names:
+                if self._data.pop(_bytes(name), None) is not None:
+                    self._touch(_bytes(name))
+                    removed += 1
+            return removed
+
+    def pipeline(self, transaction: bool = True) -> '_LocalPipeline':
+        return _LocalPipeline(self)
+
+
+class _LocalPipeline:
+    """redis-py style pipeline: commands run immediately while watching, are queued after
+    ``multi()`` (or from the start when nothing is watched) and run atomically on ``execute()``.
+    """
+
+    def __init__(self, client: LocalRedis):
+        self._client = client
+        self._watched: Dict[bytes, int] = {}
+        self._queued: List[Tuple[str, tuple, dict]] = []
+        self._immediate = False
+
+    def __enter__(self) -> '_LocalPipeline':
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.reset()
+
+    def reset(self):
+        self._watched = {}
+        self._queued = []
+        self._immediate = False
+
+    def watch(self, *names):
+        with self._client._lock:
+            for name in names:
+                self._watched[_bytes(name)] = self._client._versions.get(_bytes(name), 0)
+        self._immediate = True
+
+    def multi(self):
+        self._immediate = False
+
+    def execute(self) -> List[Any]:
+        client = self._client
+        with client._lock:
+            try:
+                if any(client._versions.get(name, 0) != version for name, version in self._watched.items()):
+                    raise WatchError("Watched variable changed.")
+                return [getattr(client, command)(*args, **kwargs) for command, args, kwargs in self._queued]
+            finally:
+                self.reset()
+
+    def __getattr__(self, command: str):
+        function = getattr(self._client, command)
+
+        def call(*args, **kwargs):
+            if self._immediate:
+                return function(*args, **kwargs)
+            self._queued.append((command, args, kwargs))
+            return self
+        return call
\ No newline at end of file
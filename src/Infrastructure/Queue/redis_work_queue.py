@@ -0,0 +1,216 @@
+import json
+import socket
+import time
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
+from Core.Domain.domain_entities import WorkItem
+from Infrastructure.Queue.local_redis import WatchError
+from Infrastructure.Queue.work_items import WORKER_TIMEOUT_SECONDS, make_job_id
+
+
+def _text(value) -> Optional[str]:
+    return value.decode('utf-8') if isinstance(value, bytes) else value
+
+
+class RedisWorkQueue:
+    """Work queue on Redis, shared by workers on any number of hosts.
+
+    Keys (under ``namespace``): ``jobs`` hash of job payloads, ``pending`` sorted
+    set scored by the time a job becomes available, ``leases`` sorted set scored by
+    lease expiry with ``owners`` naming the worker, ``results`` and ``failed``
+    hashes, and ``workers`` with the last heartbeat of each worker. Claims are
+    optimistic WATCH/MULTI transactions, so a job is leased to one worker at a
+    time and a job whose lease expired is claimed again. Results are written with
+    HSETNX, so only the first result of a job is kept.
+
+    Works with a redis-py client (``redis.Redis.from_url(...)``) or LocalRedis.
+    """
+
+    def __init__(self, client, namespace: str = 'transcript-analyzer', max_claim_retries: int = 50):
+        """Initialize the queue.
+
+        Args:
+            client: A redis-py compatible client returning bytes
+            namespace: Prefix of every key, so several queues can share a server
+            max_claim_retries: Transactions retried when other workers claim concurrently
+        """
+        self.client = client
+        self.namespace = namespace
+        self.max_claim_retries = max_claim_retries
+        self._keys = {name: f"{namespace}:{name}" for name in
+                      ('jobs', 'pending', 'leases', 'owners', 'attempts', 'results', 'failed', 'errors', 'workers')}
+
+    @classmethod
+    def from_url(cls, url: str, namespace: str = 'transcript-analyzer') -> 'RedisWorkQueue':
+        """Connect to a Redis server, e.g. ``redis://host:6379/0``.
+
+        Raises:
+            ImportError: If the optional redis package is not installed
+        """
+        try:
+            import redis
+        except ImportError:
+            raise ImportError("The Redis work queue requires the redis package (pip install redis)")
+        return cls(redis.Redis.from_url(url), namespace=namespace)
+
+    def enqueue(self, items: Iterable[Tuple[str, str]]) -> int:
+        """Add (name, transcript) pairs; pairs already queued or analyzed are ignored.
+
+        Returns:
+            Number of new jobs
+        """
+        keys = self._keys
+        added = 0
+        for name, transcript in items:
+            job_id = make_job_id(name, transcript)
+            payload = json.dumps({'name': name, 'transcript': transcript}, ensure_ascii=False)
+            if self.client.hsetnx(keys['jobs'], job_id, payload):
+                self.client.zadd(keys['pending'], {job_id: time.time()})
+                added += 1
+        return added
+
+    def claim(self, worker_id: str, lease_seconds: float, max_attempts: Optional[int] = None) -> Optional[WorkItem]:
+        """Lease a job whose previous lease expired or, failing that, the oldest pending job.
+
+        Jobs whose lease expired after ``max_attempts`` deliveries are failed instead
+        of delivered again (see SqliteWorkQueue.claim).
+        """
+        keys = self._keys
+        for _ in range(self.max_claim_retries):
+            with self.client.pipeline() as pipe:
+                try:
+                    pipe.watch(keys['pending'], keys['leases'])
+                    now = time.time()
+                    # Jobs of workers that died go first; they have waited longest.
+                    source = keys['leases']
+                    ids = pipe.zrangebyscore(source, '-inf', now, start=0, num=1)
+                    if not ids:
+                        source = keys['pending']
+                        ids = pipe.zrangebyscore(source, '-inf', now, start=0, num=1)
+                    if not ids:
+                        return None
+                    job_id = _text(ids[0])
+                    if source == keys['leases'] and max_attempts is not None:
+                        attempts = int(pipe.hget(keys['attempts'], job_id) or 0)
+                        if attempts >= max_attempts:
+                            error = f"Lease expired after {attempts} attempts without a result"
+                            pipe.multi()
+                            pipe.zrem(keys['leases'], job_id)
+                            pipe.hdel(keys['owners'], job_id)
+                            pipe.hset(keys['errors'], job_id, error)
+                            pipe.hset(keys['failed'], job_id, error)
+                            pipe.execute()
+                            continue
+                    expires = now + lease_seconds
+                    pipe.multi()
+                    pipe.zrem(source, job_id)
+                    pipe.zadd(keys['leases'], {job_id: expires})
+                    pipe.hset(keys['owners'], job_id, worker_id)
+                    pipe.hincrby(keys['attempts'], job_id, 1)
+                    pipe.hget(keys['jobs'], job_id)
+                    pipe.hexists(keys['results'], job_id)
+                    attempts, payload, has_result = pipe.execute()[3:]
+                except WatchError:
+                    continue
+            if has_result or payload is None:
+                # Completed by a worker whose lease had expired; nothing left to analyze.
+                self._release(job_id)
+                continue
+            job = json.loads(payload)
+            return WorkItem(job_id=job_id, name=job['name'], transcript=job['transcript'],
+                            attempts=int(attempts), lease_expires=expires)
+        return None
+
+    def _owned_by(self, pipe, job_id: str, worker_id: str) -> bool:
+        pipe.watch(self._keys['owners'])
+        return _text(pipe.hget(self._keys['owners'], job_id)) == worker_id
+
+    def extend_lease(self, job_id: str, worker_id: str, lease_seconds: float) -> bool:
+        keys = self._keys
+        for _ in range(self.max_claim_retries):
+            with self.client.pipeline() as pipe:
+                try:
+                    if not self._owned_by(pipe, job_id, worker_id):
+                        return False
+                    pipe.multi()
+                    pipe.zadd(keys['leases'], {job_id: time.time() + lease_seconds}, xx=True)
+                    pipe.execute()
+                    return True
+                except WatchError:
+                    continue
+        return False
+
+    def _release(self, job_id: str):
+        keys = self._keys
+        with self.client.pipeline() as pipe:
+            pipe.zrem(keys['leases'], job_id)
+            pipe.zrem(keys['pending'], job_id)
+            pipe.hdel(keys['owners'], job_id)
+            pipe.execute()
+
+    def complete(self, job_id: str, worker_id: str, result: bytes) -> bool:
+        """Store a job's result unless one was stored before, and release the job."""
+        stored = bool(self.client.hsetnx(self._keys['results'], job_id, result))
+        self.client.hdel(self._keys['failed'], job_id)
+        self._release(job_id)
+        return stored
+
+    def fail(self, job_id: str, worker_id: str, error: str, retry_delay: Optional[float] = None) -> bool:
+        """Release a job after a failed attempt; ignored if the worker no longer holds its lease."""
+        keys = self._keys
+        for _ in range(self.max_claim_retries):
+            with self.client.pipeline() as pipe:
+                try:
+                    if not self._owned_by(pipe, job_id, worker_id):
+                        return False
+                    pipe.multi()
+                    pipe.zrem(keys['leases'], job_id)
+                    pipe.hdel(keys['owners'], job_id)
+                    pipe.hset(keys['errors'], job_id, error)
+                    if retry_delay is not None:
+                        pipe.zadd(keys['pending'], {job_id: time.time() + retry_delay})
+                    else:
+                        pipe.hset(keys['failed'], job_id, error)
+                    pipe.execute()
+                    return retry_delay is not None
+                except WatchError:
+                    continue
+        return False
+
+    def heartbeat(self, worker_id: str, **stats: Any):
+        self.client.hset(self._keys['workers'], worker_id, json.dumps(
+            {'host': socket.gethostname(), 'heartbeat_at': time.time(), **stats}))
+
+    def results(self) -> Iterator[bytes]:
+        for _, payload in self.client.hscan_iter(self._keys['results']):
+            yield payload
+
+    def failures(self) -> Iterator[Tuple[str, str]]:
+        for job_id, error in self.client.hscan_iter(self._keys['failed']):
+            payload = self.client.hget(self._keys['jobs'], job_id)
+            name = json.loads(payload)['name'] if payload else _text(job_id)
+            yield name, _text(error)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return job counts by state (expired leases count as pending) and the live workers."""
+        keys = self._keys
+        now = time.time()
+        expired = self.client.zcount(keys['leases'], '-inf', now)
+        workers = []
+        for worker_id, payload in sorted(self.client.hgetall(keys['workers']).items()):
+            worker = json.loads(payload)
+            heartbeat_at = worker.pop('heartbeat_at')
+            if heartbeat_at >= now - WORKER_TIMEOUT_SECONDS:
+                workers.append({'worker_id': _text(worker_id), 'host': worker.pop('host'),
+                                'seconds_since_heartbeat': round(now - heartbeat_at, 1), **worker})
+        return {
+            'pending': self.client.zcard(keys['pending']) + expired,
+            'leased': self.client.zcard(keys['leases']) - expired,
+            'done': self.client.hlen(keys['results']),
+            'failed': self.client.hlen(keys['failed']),
+            'workers': workers
+        }
+
+    def close(self):
+        close = getattr(self.client, 'close', None)
+        if close is not None:
+            close()
\ No newline at end of file
@@ -0,0 +1,238 @@
+import json
+import socket
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
+from Core.Domain.domain_entities import WorkItem
+from Infrastructure.Queue.work_items import WORKER_TIMEOUT_SECONDS, make_job_id
+
+STATE_PENDING = 'pending'
+STATE_LEASED = 'leased'
+STATE_DONE = 'done'
+STATE_FAILED = 'failed'
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS jobs ("
+    " id TEXT PRIMARY KEY,"
+    " name TEXT NOT NULL,"
+    " transcript TEXT NOT NULL,"
+    " state TEXT NOT NULL,"
+    " available_at REAL NOT NULL,"
+    " lease_owner TEXT,"
+    " lease_expires REAL,"
+    " attempts INTEGER NOT NULL DEFAULT 0,"
+    " last_error TEXT,"
+    " enqueued_at REAL NOT NULL,"
+    " finished_at REAL)",
+    "CREATE INDEX IF NOT EXISTS idx_jobs_pending ON jobs (available_at) WHERE state = 'pending'",
+    "CREATE INDEX IF NOT EXISTS idx_jobs_leases ON jobs (lease_expires) WHERE state = 'leased'",
+    "CREATE TABLE IF NOT EXISTS results ("
+    " job_id TEXT PRIMARY KEY,"
+    " worker_id TEXT NOT NULL,"
+    " payload BLOB NOT NULL,"
+    " completed_at REAL NOT NULL)",
+    "CREATE TABLE IF NOT EXISTS workers ("
+    " worker_id TEXT PRIMARY KEY,"
+    " host TEXT NOT NULL,"
+    " started_at REAL NOT NULL,"
+    " heartbeat_at REAL NOT NULL,"
+    " stats TEXT NOT NULL)"
+)
+
+
+class SqliteWorkQueue:
+    """Work queue in a SQLite database shared by the worker processes of one host.
+
+    Claims run in ``BEGIN IMMEDIATE`` transactions, so each job is leased to a
+    single worker at a time; jobs whose lease expired are claimable again, which
+    makes delivery at-least-once without a separate reaper. Results are keyed by
+    job, and only the first one stored is kept. For workers on several hosts use
+    RedisWorkQueue, as SQLite locking is not reliable on network file systems.
+    """
+
+    def __init__(self, path: str, busy_timeout: float = 30.0):
+        """Initialize the queue.
+
+        Args:
+            path: Path of the SQLite database file (created if missing)
+            busy_timeout: Seconds a call waits for another process's write lock
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=busy_timeout, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        for statement in _SCHEMA:
+            self._conn.execute(statement)
+
+    def _transaction(self):
+        return _Transaction(self._conn, self._lock)
+
+    def enqueue(self, items: Iterable[Tuple[str, str]]) -> int:
+        """Add (name, transcript) pairs; pairs already queued or analyzed are ignored.
+
+        Returns:
+            Number of new jobs
+        """
+        now = time.time()
+        added = 0
+        with self._transaction():
+            for name, transcript in items:
+                cursor = self._conn.execute(
+                    "INSERT OR IGNORE INTO jobs (id, name, transcript, state, available_at, enqueued_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (make_job_id(name, transcript), name, transcript, STATE_PENDING, now, now)
+                )
+                added += cursor.rowcount
+        return added
+
+    def claim(self, worker_id: str, lease_seconds: float, max_attempts: Optional[int] = None) -> Optional[WorkItem]:
+        """Lease a job whose previous lease expired or, failing that, the oldest pending job.
+
+        Jobs whose lease expired after ``max_attempts`` deliveries are failed instead
+        of delivered again: their workers died without reporting, and a job that
+        keeps crashing workers would otherwise be redelivered (and paid for) forever.
+        """
+        now = time.time()
+        with self._transaction():
+            if max_attempts is not None:
+                self._conn.execute(
+                    "UPDATE jobs SET state = 'failed', lease_owner = NULL, lease_expires = NULL, finished_at = ?, "
+                    "last_error = 'Lease expired after ' || attempts || ' attempts without a result' "
+                    "WHERE state = 'leased' AND lease_expires < ? AND attempts >= ?",
+                    (now, now, max_attempts)
+                )
+            # Jobs of workers that died go first; they have waited longest.
+            row = self._conn.execute(
+                "SELECT id FROM jobs WHERE state = 'leased' AND lease_expires < ? ORDER BY lease_expires LIMIT 1",
+                (now,)
+            ).fetchone()
+            if row is None:
+                row = self._conn.execute(
+                    "SELECT id FROM jobs WHERE state = 'pending' AND available_at <= ? ORDER BY available_at LIMIT 1",
+                    (now,)
+                ).fetchone()
+            if row is None:
+                return None
+            name, transcript, attempts = self._conn.execute(
+                "UPDATE jobs SET state = 'leased', lease_owner = ?, lease_expires = ?, attempts = attempts + 1 "
+                "WHERE id = ? RETURNING name, transcript, attempts",
+                (worker_id, now + lease_seconds, row[0])
+            ).fetchone()
+        return WorkItem(job_id=row[0], name=name, transcript=transcript, attempts=attempts,
+                        lease_expires=now + lease_seconds)
+
+    def extend_lease(self, job_id: str, worker_id: str, lease_seconds: float) -> bool:
+        with self._transaction():
+            cursor = self._conn.execute(
+                "UPDATE jobs SET lease_expires = ? WHERE id = ? AND state = 'leased' AND lease_owner = ?",
+                (time.time() + lease_seconds, job_id, worker_id)
+            )
+        return cursor.rowcount == 1
+
+    def complete(self, job_id: str, worker_id: str, result: bytes) -> bool:
+        """Store a job's result unless one was stored before, and mark the job done."""
+        now = time.time()
+        with self._transaction():
+            cursor = self._conn.execute(
+                "INSERT OR IGNORE INTO results (job_id, worker_id, payload, completed_at) VALUES (?, ?, ?, ?)",
+                (job_id, worker_id, result, now)
+            )
+            self._conn.execute(
+                "UPDATE jobs SET state = 'done', lease_owner = NULL, lease_expires = NULL, finished_at = ? "
+                "WHERE id = ?",
+                (now, job_id)
+            )
+        return cursor.rowcount == 1
+
+    def fail(self, job_id: str, worker_id: str, error: str, retry_delay: Optional[float] = None) -> bool:
+        """Release a job after a failed attempt; ignored if the worker no longer holds its lease."""
+        now = time.time()
+        with self._transaction():
+            if retry_delay is not None:
+                cursor = self._conn.execute(
+                    "UPDATE jobs SET state = 'pending', available_at = ?, lease_owner = NULL, lease_expires = NULL, "
+                    "last_error = ? WHERE id = ? AND state = 'leased' AND lease_owner = ?",
+                    (now + retry_delay, error, job_id, worker_id)
+                )
+            else:
+                cursor = self._conn.execute(
+                    "UPDATE jobs SET state = 'failed', lease_owner = NULL, lease_expires = NULL, last_error = ?, "
+                    "finished_at = ? WHERE id = ? AND state = 'leased' AND lease_owner = ?",
+                    (error, now, job_id, worker_id)
+                )
+        return retry_delay is not None and cursor.rowcount == 1
+
+    def heartbeat(self, worker_id: str, **stats: Any):
+        now = time.time()
+        with self._transaction():
+            self._conn.execute(
+                "INSERT INTO workers (worker_id, host, started_at, heartbeat_at, stats) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT (worker_id) DO UPDATE SET heartbeat_at = excluded.heartbeat_at, stats = excluded.stats",
+                (worker_id, socket.gethostname(), now, now, json.dumps(stats))
+            )
+
+    def results(self) -> Iterator[bytes]:
+        """Iterate over the stored results in completion order."""
+        cursor = self._conn.execute("SELECT payload FROM results ORDER BY completed_at, job_id")
+        for (payload,) in cursor:
+            yield bytes(payload)
+
+    def failures(self) -> Iterator[Tuple[str, str]]:
+        cursor = self._conn.execute(
+            "SELECT name, last_error FROM jobs WHERE state = 'failed' ORDER BY finished_at, id"
+        )
+        yield from cursor
+
+    def stats(self) -> Dict[str, Any]:
+        """Return job counts by state (expired leases count as pending) and the live workers."""
+        now = time.time()
+        counts = {STATE_PENDING: 0, STATE_LEASED: 0, STATE_DONE: 0, STATE_FAILED: 0}
+        with self._lock:
+            for state, count in self._conn.execute("SELECT state, COUNT(*) FROM jobs GROUP BY state"):
+                counts[state] = count
+            expired = self._conn.execute(
+                "SELECT COUNT(*) FROM jobs WHERE state = 'leased' AND lease_expires < ?", (now,)
+            ).fetchone()[0]
+            workers = self._conn.execute(
+                "SELECT worker_id, host, heartbeat_at, stats FROM workers WHERE heartbeat_at >= ? ORDER BY worker_id",
+                (now - WORKER_TIMEOUT_SECONDS,)
+            ).fetchall()
+        counts[STATE_PENDING] += expired
+        counts[STATE_LEASED] -= expired
+        return {
+            **counts,
+            'workers': [
+                {'worker_id': worker_id, 'host': host, 'seconds_since_heartbeat': round(now - heartbeat_at, 1),
+                 **json.loads(stats)}
+                for worker_id, host, heartbeat_at, stats in workers
+            ]
+        }
+
+    def close(self):
+        """Close the database connection."""
+        self._conn.close()
+
+
+class _Transaction:
+    """Serializes the connection between threads and wraps an immediate (write-locking) transaction."""
+
+    def __init__(self, conn: sqlite3.Connection, lock: threading.Lock):
+        self._conn = conn
+        self._lock = lock
+
+    def __enter__(self):
+        self._lock.acquire()
+        try:
+            self._conn.execute("BEGIN IMMEDIATE")
+        except BaseException:
+            self._lock.release()
+            raise
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            self._conn.execute("ROLLBACK" if exc_type is not None else "COMMIT")
+        finally:
+            self._lock.release()
+        return False
\ No newline at end of file
@@ -0,0 +1,28 @@
+import hashlib
+import os
+import socket
+
+# Workers that have not sent a heartbeat for this long are reported as gone.
+WORKER_TIMEOUT_SECONDS = 60.0
+
+
+def make_job_id(name: str, transcript: str) -> str:
+    """Build the content-addressed ID of a job, so enqueueing the same transcript twice is a no-op.
+
+    Args:
+        name: The transcript name
+        transcript: The transcript text
+
+    Returns:
+        Hex SHA-256 digest of the name and transcript
+    """
+    digest = hashlib.sha256()
+    digest.update(name.encode('utf-8'))
+    digest.update(b'\0')
+    digest.update(transcript.encode('utf-8'))
+    return digest.hexdigest()
+
+
+def default_worker_id() -> str:
+    """Return a worker ID unique across hosts and processes: ``<host>:<pid>``."""
+    return f"{socket.gethostname()}:{os.getpid()}"
\ No newline at end of file
@@ -0,0 +1,107 @@
+import os
+from typing import Any, Dict, Iterator, Set, Union
+from Core.Domain.domain_entities import AnalysisRecord
+from Infrastructure.Storage.result_codec import encode_json, loads_json
+
+
+class JsonlResultsWriter:
+    """Append-only JSONL sink that persists every result as soon as it completes."""
+
+    def __init__(self, path: str, fsync: bool = False):
+        """Open the results file for appending.
+
+        A trailing partial line left behind by a crash is truncated, so new records
+        always start on a fresh line.
+
+        Args:
+            path: Path of the JSONL file (created if missing)
+            fsync: Force each record to disk, not just to the OS, after writing it
+        """
+        self.path = path
+        self.fsync = fsync
+        self.written = 0
+        self._repair_partial_line()
+        self._file = open(path, 'ab')
+
+    def write(self, record: Union[AnalysisRecord, Dict[str, Any]]):
+        """Append one result and flush it.
+
+        Args:
+            record: Typed record, or a dict of JSON-native values
+        """
+        self._file.write(encode_json(record) + b'\n')
+        self._file.flush()
+        if self.fsync:
+            os.fsync(self._file.fileno())
+        self.written += 1
+
+    def close(self):
+        """Close the results file."""
+        self._file.close()
+
+    def __enter__(self) -> 'JsonlResultsWriter':
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def _repair_partial_line(self):
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, 'rb+') as f:
+            f.seek(0, os.SEEK_END)
+            size = f.tell()
+            if size == 0:
+                return
+            f.seek(size - 1)
+            if f.read(1) == b'\n':
+                return
+            # Walk back to the last complete line and drop the torn record after it.
+            position = size - 1
+            while position > 0:
+                step = min(65536, position)
+                f.seek(position - step)
+                chunk = f.read(step)
+                newline = chunk.rfind(b'\n')
+                if newline != -1:
+                    f.truncate(position - step + newline + 1)
+                    return
+                position -= step
+            f.truncate(0)
+
+
+def iter_jsonl_results(path: str) -> Iterator[Dict[str, Any]]:
+    """Read results from a JSONL file one record at a time, skipping torn lines.
+
+    Args:
+        path: Path of the JSONL file
+
+    Returns:
+        Iterator of result dicts in file order
+    """
+    with open(path, 'rb') as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                yield loads_json(line)
+            except ValueError:
+                continue
+
+
+def completed_result_names(path: str) -> Set[str]:
+    """Collect the names of transcripts already analyzed successfully in a results file.
+
+    Args:
+        path: Path of the JSONL file (a missing file means nothing is completed)
+
+    Returns:
+        Set of ``test_name`` values of successful records
+    """
+    if not os.path.exists(path):
+        return set()
+    return {
+        record['test_name']
+        for record in iter_jsonl_results(path)
+        if record.get('success') and 'test_name' in record
+    }
\ No newline at end of file
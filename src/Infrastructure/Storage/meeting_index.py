@@ -0,0 +1,545 @@
+import re
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from Core.Domain.domain_entities import AnalysisRecord
+from Infrastructure.Parsers.simple_text_parser import SimpleTextParser
+from Infrastructure.Parsers.transcript_chunker import SPEAKER_TURN_PATTERN
+from Infrastructure.Storage.jsonl_results_writer import iter_jsonl_results
+from Infrastructure.Storage.result_codec import record_from_dict
+
+ISO_DATE_PATTERN = re.compile(r"\b(\d{4}-\d{2}-\d{2})\b")
+MEETING_DATE_PATTERN = re.compile(r"^\s*date:\s*(\d{4}-\d{2}-\d{2})", re.IGNORECASE | re.MULTILINE)
+# Task statuses (from the model's optional "status" key) that no longer count as open.
+CLOSED_TASK_STATUSES = ('done', 'completed', 'closed', 'cancelled', 'canceled')
+
+# Item tables: name -> (columns, full-text indexed columns, indexed lookup columns).
+_ITEM_TABLES = {
+    'tasks': (
+        ('assigner', 'assignee', 'task', 'deadline', 'deadline_date', 'status'),
+        ('task', 'deadline'),
+        ('assignee', 'assigner', 'deadline_date')
+    ),
+    'questions': (
+        ('questioner', 'responder', 'question', 'answer'),
+        ('question', 'answer'),
+        ('questioner', 'responder')
+    ),
+    'scheduled_meetings': (
+        ('scheduler', 'location', 'datetime', 'purpose'),
+        ('purpose', 'location'),
+        ('scheduler',)
+    ),
+    'turns': (
+        ('turn_index', 'speaker', 'utterance'),
+        ('utterance',),
+        ('speaker',)
+    )
+}
+# Name columns compare case-insensitively ("marcus" finds "Marcus").
+_NOCASE_COLUMNS = {'assigner', 'assignee', 'status', 'questioner', 'responder', 'scheduler', 'speaker'}
+
+
+class MeetingIndex:
+    """Queryable SQLite store of the questions, meetings and tasks of many analyses.
+
+    Each successful analysis becomes a row in ``meetings`` (risk score, summary,
+    meeting date and parser metadata) with its extracted items and speaker turns in
+    child tables. Assignee, assigner, deadline, scheduler, speaker and risk score are
+    B-tree indexed and the free text is indexed with FTS5, so cross-meeting questions are
+    answered without reading the results files again.
+    """
+
+    def __init__(self, path: str, index_turns: bool = True, text_parser: SimpleTextParser = None):
+        """Initialize the index.
+
+        Args:
+            path: Path of the SQLite database file (created if missing)
+            index_turns: Store every speaker turn of the transcripts (needed for turn search)
+            text_parser: The parser used to split transcripts into lines (optional, will create default if None)
+        """
+        self.path = path
+        self.index_turns = index_turns
+        self.text_parser = text_parser or SimpleTextParser()
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA foreign_keys=ON")
+        self._create_schema()
+        self._conn.commit()
+
+    def add_record(self, record: AnalysisRecord) -> bool:
+        """Index one analysis, replacing an earlier analysis with the same name.
+
+        Args:
+            record: The AnalysisRecord
+
+        Returns:
+            True if the record was indexed, False if it was a failed analysis
+        """
+        return self.add_records([record]) == 1
+
+    def add_records(self, records: Iterable[AnalysisRecord], batch_size: int = 1000) -> int:
+        """Index analyses in transactions of batch_size records.
+
+        Args:
+            records: AnalysisRecords to index; failed analyses are skipped
+            batch_size: Records committed per transaction
+
+        Returns:
+            Number of records indexed
+        """
+        indexed = 0
+        pending = 0
+        with self._lock:
+            try:
+                for record in records:
+                    if not record.success or record.audit_result is None:
+                        continue
+                    self._insert(record)
+                    indexed += 1
+                    pending += 1
+                    if pending >= batch_size:
+                        self._conn.commit()
+                        pending = 0
+                self._conn.commit()
+            except BaseException:
+                self._conn.rollback()
+                raise
+        return indexed
+
+    def ingest_results(self, path: str, batch_size: int = 1000) -> int:
+        """Index every successful analysis of a JSONL results file.
+
+        Args:
+            path: Path of the JSONL results file written by ``main.py analyze``
+            batch_size: Records committed per transaction
+
+        Returns:
+            Number of records indexed
+        """
+        return self.add_records((record_from_dict(data) for data in iter_jsonl_results(path)), batch_size)
+
+    def tasks(
+        self,
+        assignee: Optional[str] = None,
+        assigner: Optional[str] = None,
+        text: Optional[str] = None,
+        open_only: bool = False,
+        due_before: Optional[str] = None,
+        due_after: Optional[str] = None,
+        limit: Optional[int] = 100,
+        **meeting_filters
+    ) -> List[Dict[str, Any]]:
+        """Find extracted tasks.
+
+        Args:
+            assignee: Assignee name (case-insensitive)
+            assigner: Assigner name (case-insensitive)
+            text: Words that must all occur in the task or deadline text
+            open_only: Leave out tasks whose status is one of CLOSED_TASK_STATUSES
+            due_before: Only tasks with an ISO deadline on or before this date (YYYY-MM-DD)
+            due_after: Only tasks with an ISO deadline on or after this date (YYYY-MM-DD)
+            limit: Maximum number of rows (None for all)
+            **meeting_filters: Filters on the meeting, see meetings()
+
+        Returns:
+            List of task dicts with the meeting name, date and risk score, newest meetings first
+        """
+        where, params = self._equal_filters('i', assignee=assignee, assigner=assigner)
+        if open_only:
+            where.append(f"(i.status IS NULL OR i.status NOT IN ({','.join('?' * len(CLOSED_TASK_STATUSES))}))")
+            params.extend(CLOSED_TASK_STATUSES)
+        if due_before is not None:
+            where.append("i.deadline_date <= ?")
+            params.append(due_before)
+        if due_after is not None:
+            where.append("i.deadline_date >= ?")
+            params.append(due_after)
+        return self._query_items('tasks', where, params, text, limit, meeting_filters)
+
+    def questions(
+        self,
+        questioner: Optional[str] = None,
+        responder: Optional[str] = None,
+        text: Optional[str] = None,
+        limit: Optional[int] = 100,
+        **meeting_filters
+    ) -> List[Dict[str, Any]]:
+        """Find extracted questions.
+
+        Args:
+            questioner: Name of the participant who asked (case-insensitive)
+            responder: Name of the participant who answered (case-insensitive)
+            text: Words that must all occur in the question or answer text
+            limit: Maximum number of rows (None for all)
+            **meeting_filters: Filters on the meeting, see meetings()
+
+        Returns:
+            List of question dicts with the meeting name, date and risk score, newest meetings first
+        """
+        where, params = self._equal_filters('i', questioner=questioner, responder=responder)
+        return self._query_items('questions', where, params, text, limit, meeting_filters)
+
+    def scheduled_meetings(
+        self,
+        scheduler: Optional[str] = None,
+        text: Optional[str] = None,
+        limit: Optional[int] = 100,
+        **meeting_filters
+    ) -> List[Dict[str, Any]]:
+        """Find follow-up meetings scheduled during the indexed meetings.
+
+        Args:
+            scheduler: Name of the participant who scheduled the meeting (case-insensitive)
+            text: Words that must all occur in the purpose or location
+            limit: Maximum number of rows (None for all)
+            **meeting_filters: Filters on the meeting, see meetings()
+
+        Returns:
+            List of scheduled meeting dicts, newest meetings first
+        """
+        where, params = self._equal_filters('i', scheduler=scheduler)
+        return self._query_items('scheduled_meetings', where, params, text, limit, meeting_filters)
+
+    def turns(
+        self,
+        speaker: Optional[str] = None,
+        text: Optional[str] = None,
+        limit: Optional[int] = 100,
+        **meeting_filters
+    ) -> List[Dict[str, Any]]:
+        """Find speaker turns of the indexed transcripts.
+
+        Args:
+            speaker: Speaker name (case-insensitive)
+            text: Words that must all occur in the utterance
+            limit: Maximum number of rows (None for all)
+            **meeting_filters: Filters on the meeting, see meetings()
+
+        Returns:
+            List of turn dicts in transcript order, newest meetings first
+        """
+        where, params = self._equal_filters('i', speaker=speaker)
+        return self._query_items('turns', where, params, text, limit, meeting_filters)
+
+    def meetings(
+        self,
+        speaker: Optional[str] = None,
+        min_risk: Optional[float] = None,
+        max_risk: Optional[float] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        last: Optional[int] = None,
+        text: Optional[str] = None,
+        limit: Optional[int] = 100
+    ) -> List[Dict[str, Any]]:
+        """Find indexed meetings.
+
+        Args:
+            speaker: Only meetings this participant spoke in or was named in (case-insensitive)
+            min_risk: Minimum risk score
+            max_risk: Maximum risk score
+            since: Only meetings dated on or after this date (YYYY-MM-DD)
+            until: Only meetings dated on or before this date (YYYY-MM-DD)
+            last: Only the N newest meetings (by meeting date, then indexing order)
+            text: Words that must all occur in the summary
+            limit: Maximum number of rows (None for all)
+
+        Returns:
+            List of meeting dicts, newest first
+        """
+        where, params = self._meeting_filters(speaker, min_risk, max_risk, since, until, last)
+        if text:
+            where.append("m.id IN (SELECT rowid FROM meetings_fts WHERE meetings_fts MATCH ?)")
+            params.append(self._match_query(text))
+        sql = (
+            "SELECT m.id AS meeting_id, m.name AS meeting, m.meeting_date, m.risk_score, m.confidence,"
+            " m.summary, m.word_count, m.paragraph_count, m.key_terms FROM meetings m"
+            f"{self._where(where)} ORDER BY m.meeting_date DESC, m.id DESC{self._limit(limit, params)}"
+        )
+        return self._fetch(sql, params)
+
+    def stats(self) -> Dict[str, int]:
+        """Return the number of indexed meetings, items and turns."""
+        with self._lock:
+            counts = {'meetings': self._conn.execute("SELECT COUNT(*) FROM meetings").fetchone()[0]}
+            for table in _ITEM_TABLES:
+                counts[table] = self._conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+        return counts
+
+    def close(self):
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def _create_schema(self):
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS meetings ("
+            " id INTEGER PRIMARY KEY,"
+            " name TEXT NOT NULL UNIQUE,"
+            " meeting_date TEXT,"
+            " risk_score REAL,"
+            " confidence REAL,"
+            " summary TEXT,"
+            " word_count INTEGER,"
+            " paragraph_count INTEGER,"
+            " key_terms TEXT,"
+            " indexed_at REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_meetings_recency ON meetings (meeting_date, id)")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_meetings_risk ON meetings (risk_score)")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS participants ("
+            " speaker TEXT NOT NULL COLLATE NOCASE,"
+            " meeting_id INTEGER NOT NULL REFERENCES meetings (id) ON DELETE CASCADE,"
+            " turns INTEGER NOT NULL,"
+            " PRIMARY KEY (speaker, meeting_id)) WITHOUT ROWID"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_participants_meeting ON participants (meeting_id)")
+        self._create_fts('meetings', ('summary',))
+
+        for table, (columns, text_columns, lookup_columns) in _ITEM_TABLES.items():
+            definitions = {
+                column: f"{column} {'INTEGER' if column == 'turn_index' else 'TEXT'}"
+                        f"{' COLLATE NOCASE' if column in _NOCASE_COLUMNS else ''}"
+                for column in columns
+            }
+            self._conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {table} ("
+                " id INTEGER PRIMARY KEY,"
+                " meeting_id INTEGER NOT NULL REFERENCES meetings (id) ON DELETE CASCADE,"
+                f" {', '.join(definitions.values())})"
+            )
+            # Indexes built before a column was added get it empty for the rows already stored.
+            existing = {row['name'] for row in self._conn.execute(f"PRAGMA table_info({table})")}
+            for column, definition in definitions.items():
+                if column not in existing:
+                    self._conn.execute(f"ALTER TABLE {table} ADD COLUMN {definition}")
+            self._conn.execute(f"CREATE INDEX IF NOT EXISTS idx_{table}_meeting ON {table} (meeting_id)")
+            for column in lookup_columns:
+                self._conn.execute(
+                    f"CREATE INDEX IF NOT EXISTS idx_{table}_{column} ON {table} ({column}, meeting_id)"
+                )
+            self._create_fts(table, text_columns)
+
+    def _create_fts(self, table: str, columns: Tuple[str, ...]):
+        """Create an external-content FTS5 table kept in sync with its table by triggers."""
+        column_list = ', '.join(columns)
+        new_values = ', '.join(f"new.{column}" for column in columns)
+        old_values = ', '.join(f"old.{column}" for column in columns)
+        self._conn.execute(
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {table}_fts USING fts5("
+            f"{column_list}, content='{table}', content_rowid='id')"
+        )
+        self._conn.execute(
+            f"CREATE TRIGGER IF NOT EXISTS {table}_fts_insert AFTER INSERT ON {table} BEGIN"
+            f" INSERT INTO {table}_fts (rowid, {column_list}) VALUES (new.id, {new_values}); END"
+        )
+        self._conn.execute(
+            f"CREATE TRIGGER IF NOT EXISTS {table}_fts_delete AFTER DELETE ON {table} BEGIN"
+            f" INSERT INTO {table}_fts ({table}_fts, rowid, {column_list})"
+            f" VALUES ('delete', old.id, {old_values}); END"
+        )
+        self._conn.execute(
+            f"CREATE TRIGGER IF NOT EXISTS {table}_fts_update AFTER UPDATE ON {table} BEGIN"
+            f" INSERT INTO {table}_fts ({table}_fts, rowid, {column_list})"
+            f" VALUES ('delete', old.id, {old_values});"
+            f" INSERT INTO {table}_fts (rowid, {column_list}) VALUES (new.id, {new_values}); END"
+        )
+
+    def _insert(self, record: AnalysisRecord):
+        """Insert or replace one record's rows (the caller holds the lock and commits)."""
+        audit_result = record.audit_result
+        parsed = record.parsed_content or {}
+        transcript = record.input_transcript or parsed.get('original_text') or ''
+        date_match = MEETING_DATE_PATTERN.search(transcript)
+        values = (
+            date_match.group(1) if date_match else None,
+            audit_result.risk_score,
+            audit_result.confidence,
+            audit_result.summary,
+            parsed.get('word_count'),
+            parsed.get('paragraph_count'),
+            ', '.join(parsed.get('key_terms_found') or []) or None,
+            time.time()
+        )
+
+        row = self._conn.execute("SELECT id FROM meetings WHERE name = ?", (record.test_name,)).fetchone()
+        if row is None:
+            meeting_id = self._conn.execute(
+                "INSERT INTO meetings (meeting_date, risk_score, confidence, summary, word_count,"
+                " paragraph_count, key_terms, indexed_at, name) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (*values, record.test_name)
+            ).lastrowid
+        else:
+            # Keep the ID, so re-indexing a results file does not reorder the meetings.
+            meeting_id = row[0]
+            self._conn.execute(
+                "UPDATE meetings SET meeting_date = ?, risk_score = ?, confidence = ?, summary = ?,"
+                " word_count = ?, paragraph_count = ?, key_terms = ?, indexed_at = ? WHERE id = ?",
+                (*values, meeting_id)
+            )
+            for table in ('participants', *_ITEM_TABLES):
+                self._conn.execute(f"DELETE FROM {table} WHERE meeting_id = ?", (meeting_id,))
+
+        report = record.meeting_report
+        participants: Dict[str, int] = {}
+        if report is not None:
+            for task in report.tasks:
+                deadline = self._text(task.deadline)
+                date = ISO_DATE_PATTERN.search(deadline) if deadline else None
+                self._insert_item('tasks', meeting_id, (
+                    self._text(task.assigner), self._text(task.assignee), self._text(task.task), deadline,
+                    date.group(1) if date else None, self._text(task.extra.get('status'))
+                ))
+            for question in report.questions:
+                self._insert_item('questions', meeting_id, (
+                    self._text(question.questioner), self._text(question.responder),
+                    self._text(question.question), self._text(question.answer)
+                ))
+            for meeting in report.meetings:
+                self._insert_item('scheduled_meetings', meeting_id, (
+                    self._text(meeting.scheduler), self._text(meeting.location), self._text(meeting.datetime),
+                    self._text(meeting.purpose)
+                ))
+            for item in (*report.tasks, *report.questions, *report.meetings):
+                for name in (getattr(item, 'assigner', None), getattr(item, 'assignee', None),
+                             getattr(item, 'questioner', None), getattr(item, 'responder', None),
+                             getattr(item, 'scheduler', None)):
+                    name = self._text(name)
+                    if name:
+                        participants.setdefault(name, 0)
+
+        turns = self._speaker_turns(transcript)
+        counts: Dict[str, int] = {}
+        for speaker, _ in turns:
+            counts[speaker] = counts.get(speaker, 0) + 1
+        # One-off "Name:" lines are headers such as "Date:" unless the report names the speaker.
+        turns = [(speaker, text) for speaker, text in turns if counts[speaker] > 1 or speaker in participants]
+        for speaker, _ in turns:
+            participants[speaker] = participants.get(speaker, 0) + 1
+        if self.index_turns:
+            self._conn.executemany(
+                "INSERT INTO turns (meeting_id, turn_index, speaker, utterance) VALUES (?, ?, ?, ?)",
+                [(meeting_id, index, speaker, text) for index, (speaker, text) in enumerate(turns)]
+            )
+
+        merged: Dict[str, Tuple[str, int]] = {}
+        for name, count in participants.items():
+            key = name.casefold()
+            first, total = merged.get(key, (name, 0))
+            merged[key] = (first, total + count)
+        self._conn.executemany(
+            "INSERT INTO participants (speaker, meeting_id, turns) VALUES (?, ?, ?)",
+            [(name, meeting_id, count) for name, count in merged.values()]
+        )
+
+    def _insert_item(self, table: str, meeting_id: int, values: Tuple[Any, ...]):
+        columns = _ITEM_TABLES[table][0]
+        self._conn.execute(
+            f"INSERT INTO {table} (meeting_id, {', '.join(columns)}) VALUES (?, {', '.join('?' * len(columns))})",
+            (meeting_id, *values)
+        )
+
+    def _speaker_turns(self, transcript: str) -> List[Tuple[str, str]]:
+        """Split a transcript into (speaker, utterance) turns; unlabelled lines continue the last turn."""
+        turns: List[List[str]] = []
+        for line in self.text_parser.split_paragraphs(transcript):
+            match = SPEAKER_TURN_PATTERN.match(line)
+            if match:
+                turns.append([line[:match.end()].rstrip()[:-1].strip(), line[match.end():].strip()])
+            elif turns:
+                turns[-1][1] += ' ' + line
+        return [(speaker, text) for speaker, text in turns if speaker]
+
+    @staticmethod
+    def _text(value: Any) -> Optional[str]:
+        if value is None:
+            return None
+        return value.strip() if isinstance(value, str) else str(value)
+
+    def _query_items(self, table: str, where: List[str], params: List[Any], text: Optional[str],
+                     limit: Optional[int], meeting_filters: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Select rows of an item table joined with their meeting."""
+        meeting_where, meeting_params = self._meeting_filters(**meeting_filters)
+        where = where + meeting_where
+        params = params + meeting_params
+        if text:
+            where.append(f"i.id IN (SELECT rowid FROM {table}_fts WHERE {table}_fts MATCH ?)")
+            params.append(self._match_query(text))
+        columns = ', '.join(f"i.{column}" for column in _ITEM_TABLES[table][0])
+        sql = (
+            f"SELECT m.name AS meeting, m.meeting_date, m.risk_score, {columns}"
+            f" FROM {table} i JOIN meetings m ON m.id = i.meeting_id{self._where(where)}"
+            f" ORDER BY m.meeting_date DESC, m.id DESC, i.id{self._limit(limit, params)}"
+        )
+        return self._fetch(sql, params)
+
+    @staticmethod
+    def _match_query(text: str) -> str:
+        """Turn user text into an FTS5 query that matches rows containing every word.
+
+        Each whitespace-separated word is quoted as an FTS5 string, so punctuation
+        ("gateway-v2", "Marcus's") is searched for rather than parsed as query
+        syntax. A trailing ``*`` is kept as a prefix search.
+        """
+        terms = []
+        for word in text.split():
+            prefix = word.endswith('*') and len(word) > 1
+            word = word.rstrip('*') if prefix else word
+            terms.append('"' + word.replace('"', '""') + '"' + ('*' if prefix else ''))
+        return ' '.join(terms) or '""'
+
+    @staticmethod
+    def _meeting_filters(
+        speaker: Optional[str] = None,
+        min_risk: Optional[float] = None,
+        max_risk: Optional[float] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        last: Optional[int] = None
+    ) -> Tuple[List[str], List[Any]]:
+        where: List[str] = []
+        params: List[Any] = []
+        if speaker is not None:
+            where.append("m.id IN (SELECT meeting_id FROM participants WHERE speaker = ?)")
+            params.append(speaker)
+        if min_risk is not None or max_risk is not None:
+            # As a subquery the risk index is used even though the results are ordered by date.
+            where.append("m.id IN (SELECT id FROM meetings WHERE risk_score BETWEEN ? AND ?)")
+            params.extend((float('-inf') if min_risk is None else min_risk,
+                           float('inf') if max_risk is None else max_risk))
+        if since is not None:
+            where.append("m.meeting_date >= ?")
+            params.append(since)
+        if until is not None:
+            where.append("m.meeting_date <= ?")
+            params.append(until)
+        if last is not None:
+            where.append("m.id IN (SELECT id FROM meetings ORDER BY meeting_date DESC, id DESC LIMIT ?)")
+            params.append(last)
+        return where, params
+
+    @staticmethod
+    def _equal_filters(alias: str, **values) -> Tuple[List[str], List[Any]]:
+        where = [f"{alias}.{column} = ?" for column, value in values.items() if value is not None]
+        return where, [value for value in values.values() if value is not None]
+
+    @staticmethod
+    def _where(where: List[str]) -> str:
+        return f" WHERE {' AND '.join(where)}" if where else ''
+
+    @staticmethod
+    def _limit(limit: Optional[int], params: List[Any]) -> str:
+        if limit is None:
+            return ''
+        params.append(limit)
+        return " LIMIT ?"
+
+    def _fetch(self, sql: str, params: List[Any]) -> List[Dict[str, Any]]:
+        with self._lock:
+            return [dict(row) for row in self._conn.execute(sql, params)]
\ No newline at end of file
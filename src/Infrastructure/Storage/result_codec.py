@@ -0,0 +1,305 @@
+import json
+from typing import Any, Dict, Optional, Union
+from Core.Domain.domain_entities import (
+    AnalysisRecord,
+    AuditResult,
+    CostAnalysis,
+    MeetingReport,
+    Question,
+    ScheduledMeeting,
+    TaskAssignment
+)
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+_REPORT_ITEM_TYPES = {
+    'questions': Question,
+    'meetings': ScheduledMeeting,
+    'tasks': TaskAssignment
+}
+_REPORT_ITEM_FIELDS = {
+    section: tuple(name for name in item_type.__dataclass_fields__ if name not in ('extra', 'present'))
+    for section, item_type in _REPORT_ITEM_TYPES.items()
+}
+_REPORT_ITEM_TEXT_FIELD = {'questions': 'question', 'meetings': 'purpose', 'tasks': 'task'}
+_AUDIT_FIELDS = ('risk_score', 'risk_factors', 'recommendations', 'summary', 'confidence')
+_BREAKDOWN_FIELDS = ('risk_score', 'num_risk_factors', 'num_recommendations')
+
+
+def report_from_dict(data: Optional[Dict[str, Any]]) -> MeetingReport:
+    """Build a typed meeting report from its JSON form.
+
+    Unknown keys of questions, meetings and tasks are kept in their ``extra`` dict
+    and the known ones in ``present``, so nothing the model returned is lost.
+
+    Args:
+        data: Dict with ``questions``, ``meetings`` and ``tasks`` lists (None means empty)
+
+    Returns:
+        The MeetingReport
+    """
+    data = data or {}
+    sections = {}
+    for section, item_type in _REPORT_ITEM_TYPES.items():
+        fields = _REPORT_ITEM_FIELDS[section]
+        items = []
+        for item in data.get(section) or []:
+            if not isinstance(item, dict):
+                item = {_REPORT_ITEM_TEXT_FIELD[section]: item}
+            known = {name: item[name] for name in fields if name in item}
+            extra = {key: value for key, value in item.items() if key not in known}
+            items.append(item_type(**known, extra=extra, present=frozenset(known)))
+        sections[section] = items
+    return MeetingReport(**sections)
+
+
+def report_to_dict(report: MeetingReport) -> Dict[str, Any]:
+    """Convert a typed meeting report back to its JSON form.
+
+    Fields left unset (None and not in the item's ``present`` set) are omitted, so
+    a decoded report has exactly the keys of the document it was built from.
+
+    Args:
+        report: The MeetingReport
+
+    Returns:
+        Dict with ``questions``, ``meetings`` and ``tasks`` lists
+    """
+    data = {}
+    for section in _REPORT_ITEM_TYPES:
+        fields = _REPORT_ITEM_FIELDS[section]
+        data[section] = [
+            {**{name: getattr(item, name) for name in fields
+                if getattr(item, name) is not None or name in item.present}, **item.extra}
+            for item in getattr(report, section)
+        ]
+    return data
+
+
+def cost_from_dict(data: Dict[str, Any]) -> CostAnalysis:
+    """Build a typed cost analysis from StandardCostCalculator output."""
+    breakdown = data.get('cost_breakdown') or {}
+    return CostAnalysis(
+        base_cost=data.get('base_cost', 0.0),
+        risk_adjustment=data.get('risk_adjustment', 0.0),
+        recommendation_cost=data.get('recommendation_cost', 0.0),
+        total_cost=data.get('total_cost', 0.0),
+        **{name: breakdown[name] for name in _BREAKDOWN_FIELDS if name in breakdown}
+    )
+
+
+def cost_to_dict(cost: CostAnalysis) -> Dict[str, Any]:
+    """Convert a typed cost analysis back to the StandardCostCalculator layout."""
+    return {
+        'base_cost': cost.base_cost,
+        'risk_adjustment': cost.risk_adjustment,
+        'recommendation_cost': cost.recommendation_cost,
+        'total_cost': cost.total_cost,
+        'cost_breakdown': {name: getattr(cost, name) for name in _BREAKDOWN_FIELDS}
+    }
+
+
+def record_from_result(result: Dict[str, Any], slim: bool = False) -> AnalysisRecord:
+    """Build the typed record of a result produced by AnalyzeMeetingUseCase.
+
+    The meeting report is taken from ``audit_result.raw_report`` (or, for analyzers
+    that only fill ``details``, parsed from it) and stored once, on the record.
+
+    Args:
+        result: A result dict from ``execute``/``execute_many``
+        slim: Leave the raw transcript text out of the record
+
+    Returns:
+        The AnalysisRecord
+    """
+    audit_result = result.get('audit_result')
+    if not hasattr(audit_result, 'risk_score'):
+        audit_result = None
+    report = None
+    if audit_result is not None:
+        raw_report = audit_result.raw_report
+        if raw_report is None and audit_result.details:
+            try:
+                raw_report = json.loads(audit_result.details)
+            except (json.JSONDecodeError, TypeError):
+                raw_report = None
+        report = report_from_dict(raw_report) if isinstance(raw_report, dict) else None
+
+    parsed_content = result.get('parsed_content')
+    if hasattr(parsed_content, 'to_dict'):
+        parsed_content = parsed_content.to_dict(slim=slim)
+    cost_analysis = result.get('cost_analysis')
+
+    return AnalysisRecord(
+        test_name=result.get('test_name', ''),
+        success=bool(result.get('success')),
+        audit_result=audit_result,
+        meeting_report=report,
+        cost_analysis=cost_from_dict(cost_analysis) if isinstance(cost_analysis, dict) else None,
+        parsed_content=parsed_content,
+        input_transcript=None if slim else result.get('input_transcript'),
+        latency_seconds=result.get('latency_seconds'),
+        error=result.get('error'),
+        near_duplicate_of=result.get('near_duplicate_of'),
+        near_duplicate_similarity=result.get('near_duplicate_similarity')
+    )
+
+
+def record_to_dict(record: AnalysisRecord) -> Dict[str, Any]:
+    """Convert a record to its canonical JSON form.
+
+    The audit result holds only the risk analysis; the meeting report lives in the
+    top-level ``meeting_report`` key. Empty fields are left out.
+
+    Args:
+        record: The AnalysisRecord
+
+    Returns:
+        Plain dict of JSON-native values
+    """
+    data: Dict[str, Any] = {'test_name': record.test_name, 'success': record.success}
+    if record.error is not None:
+        data['error'] = record.error
+    if record.latency_seconds is not None:
+        data['latency_seconds'] = record.latency_seconds
+
+    if record.audit_result is not None:
+        audit = {name: getattr(record.audit_result, name) for name in _AUDIT_FIELDS}
+        if record.audit_result.details is not None:
+            audit['details'] = record.audit_result.details
+        if record.audit_result.truncated:
+            audit['truncated'] = True
+        data['audit_result'] = audit
+
+    report = record.meeting_report
+    if report is None and record.audit_result is not None and record.audit_result.raw_report is not None:
+        report = report_from_dict(record.audit_result.raw_report)
+    if report is not None:
+        data['meeting_report'] = report_to_dict(report)
+
+    if record.cost_analysis is not None:
+        data['cost_analysis'] = cost_to_dict(record.cost_analysis)
+    if record.parsed_content is not None:
+        data['parsed_content'] = record.parsed_content
+    if record.input_transcript is not None:
+        data['input_transcript'] = record.input_transcript
+    if record.near_duplicate_of is not None:
+        data['near_duplicate_of'] = record.near_duplicate_of
+        data['near_duplicate_similarity'] = record.near_duplicate_similarity
+    return data
+
+
+def record_from_dict(data: Dict[str, Any]) -> AnalysisRecord:
+    """Build a record from its canonical JSON form.
+
+    The audit result gets the meeting report back as ``raw_report``. Results files
+    written before the typed schema (where ``audit_result`` was stringified) decode
+    with ``audit_result`` set to None.
+
+    Args:
+        data: Dict as produced by record_to_dict
+
+    Returns:
+        The AnalysisRecord
+    """
+    report_data = data.get('meeting_report')
+    report = report_from_dict(report_data) if isinstance(report_data, dict) else None
+
+    audit_result = None
+    audit_data = data.get('audit_result')
+    if isinstance(audit_data, dict):
+        audit_result = AuditResult(
+            risk_score=audit_data.get('risk_score', 0.0),
+            risk_factors=list(audit_data.get('risk_factors', [])),
+            recommendations=list(audit_data.get('recommendations', [])),
+            summary=audit_data.get('summary', ''),
+            confidence=audit_data.get('confidence', 0.0),
+            details=audit_data.get('details'),
+            truncated=bool(audit_data.get('truncated', False)),
+            raw_report=report_to_dict(report) if report is not None else None
+        )
+
+    cost_data = data.get('cost_analysis')
+    return AnalysisRecord(
+        test_name=data.get('test_name', ''),
+        success=bool(data.get('success')),
+        audit_result=audit_result,
+        meeting_report=report,
+        cost_analysis=cost_from_dict(cost_data) if isinstance(cost_data, dict) else None,
+        parsed_content=data.get('parsed_content'),
+        input_transcript=data.get('input_transcript'),
+        latency_seconds=data.get('latency_seconds'),
+        error=data.get('error'),
+        near_duplicate_of=data.get('near_duplicate_of'),
+        near_duplicate_similarity=data.get('near_duplicate_similarity')
+    )
+
+
+def encode_json(record: Union[AnalysisRecord, Dict[str, Any]]) -> bytes:
+    """Serialize a record (or an already canonical dict) to compact UTF-8 JSON.
+
+    Uses orjson when it is installed and the standard library otherwise; both
+    produce the same document.
+
+    Args:
+        record: The AnalysisRecord or a dict of JSON-native values
+
+    Returns:
+        JSON bytes without a trailing newline
+    """
+    data = record_to_dict(record) if isinstance(record, AnalysisRecord) else record
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def loads_json(payload: Union[bytes, str]) -> Any:
+    """Parse JSON with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(payload)
+    return json.loads(payload)
+
+
+def decode_json(payload: Union[bytes, str]) -> AnalysisRecord:
+    """Deserialize a record written by encode_json."""
+    return record_from_dict(loads_json(payload))
+
+
+def encode_msgpack(record: Union[AnalysisRecord, Dict[str, Any]]) -> bytes:
+    """Serialize a record (or an already canonical dict) to MessagePack.
+
+    Args:
+        record: The AnalysisRecord or a dict of JSON-native values
+
+    Returns:
+        MessagePack bytes
+
+    Raises:
+        ImportError: If the optional msgpack package is not installed
+    """
+    _require_msgpack()
+    data = record_to_dict(record) if isinstance(record, AnalysisRecord) else record
+    return msgpack.packb(data, use_bin_type=True)
+
+
+def decode_msgpack(payload: bytes) -> AnalysisRecord:
+    """Deserialize a record written by encode_msgpack.
+
+    Raises:
+        ImportError: If the optional msgpack package is not installed
+    """
+    _require_msgpack()
+    return record_from_dict(msgpack.unpackb(payload, raw=False))
+
+
+def _require_msgpack():
+    if msgpack is None:
+        raise ImportError("MessagePack encoding requires the msgpack package (pip install msgpack)")
\ No newline at end of file
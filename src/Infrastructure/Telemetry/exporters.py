@@ -0,0 +1,188 @@
+import json
+import os
+import re
+import threading
+import time
+from typing import Optional
+from Core.Services.instrumentation import DURATION_BUCKETS, Instrumentation, Span
+
+METRIC_PREFIX = 'transcript_analyzer'
+_METRIC_NAME_PATTERN = re.compile(r"[^a-zA-Z0-9_]")
+
+
+def render_prometheus(instrumentation: Instrumentation) -> str:
+    """Render the per-stage measurements in the Prometheus text exposition format.
+
+    Every stage gets a duration histogram and an error counter; every numeric span
+    attribute (prompt_tokens, retries, cache_hits, bytes_in, alloc_bytes, ...) becomes
+    a ``<prefix>_stage_<attribute>_total`` counter labelled with the stage.
+
+    Args:
+        instrumentation: The instrumentation to read
+
+    Returns:
+        The metrics document
+    """
+    stages = instrumentation.stage_stats()
+    histogram = f"{METRIC_PREFIX}_stage_duration_seconds"
+    lines = [f"# HELP {histogram} Wall time of pipeline stages.", f"# TYPE {histogram} histogram"]
+    for stage, stats in sorted(stages.items()):
+        label = _label(stage)
+        cumulative = 0
+        for bound, count in zip(DURATION_BUCKETS, stats.bucket_counts):
+            cumulative += count
+            lines.append(f'{histogram}_bucket{{stage="{label}",le="{bound}"}} {cumulative}')
+        lines.append(f'{histogram}_bucket{{stage="{label}",le="+Inf"}} {stats.count}')
+        lines.append(f'{histogram}_sum{{stage="{label}"}} {stats.total_seconds}')
+        lines.append(f'{histogram}_count{{stage="{label}"}} {stats.count}')
+
+    errors = f"{METRIC_PREFIX}_stage_errors_total"
+    lines += [f"# HELP {errors} Pipeline stages that raised.", f"# TYPE {errors} counter"]
+    lines += [f'{errors}{{stage="{_label(stage)}"}} {stats.errors}' for stage, stats in sorted(stages.items())]
+
+    attributes = sorted({name for stats in stages.values() for name in stats.totals})
+    for attribute in attributes:
+        metric = f"{METRIC_PREFIX}_stage_{_METRIC_NAME_PATTERN.sub('_', attribute)}_total"
+        lines += [f"# HELP {metric} Sum of the {attribute} span attribute.", f"# TYPE {metric} counter"]
+        for stage, stats in sorted(stages.items()):
+            if attribute in stats.totals:
+                lines.append(f'{metric}{{stage="{_label(stage)}"}} {stats.totals[attribute]}')
+    return '\n'.join(lines) + '\n'
+
+
+def write_prometheus_textfile(instrumentation: Instrumentation, path: str):
+    """Write the metrics for node_exporter's textfile collector, replacing the file atomically."""
+    temporary = f"{path}.tmp"
+    with open(temporary, 'w', encoding='utf-8') as f:
+        f.write(render_prometheus(instrumentation))
+    os.replace(temporary, path)
+
+
+def _label(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+class PrometheusExporter:
+    """Serves the instrumentation's metrics on a local HTTP endpoint (``/metrics``)."""
+
+    def __init__(self, instrumentation: Instrumentation, port: int = 9464, host: str = '127.0.0.1'):
+        """Initialize the exporter and start serving in a daemon thread.
+
+        Args:
+            instrumentation: The instrumentation whose stage measurements are exposed
+            port: Port to listen on (0 picks a free port, see ``self.port``)
+            host: Interface to bind; the default keeps the endpoint local
+        """
+        # http.server pulls in the email package; only runs serving metrics need it.
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        self.instrumentation = instrumentation
+
+        exporter = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split('?')[0] != '/metrics':
+                    self.send_error(404)
+                    return
+                body = render_prometheus(exporter.instrumentation).encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        self._server.daemon_threads = True
+        self.host = host
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, name='prometheus-exporter', daemon=True)
+        self._thread.start()
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}/metrics"
+
+    def export(self, span: Span):
+        """Metrics are read from the aggregated stages on each scrape."""
+
+    def close(self):
+        """Stop serving."""
+        self._server.shutdown()
+        self._server.server_close()
+
+
+class JsonTraceExporter:
+    """Writes spans to a Chrome trace-event JSON file (chrome://tracing, Perfetto).
+
+    Events are appended as spans finish, so the file is usable even if the run dies:
+    the trace-event array format does not require the closing bracket. Each analyzed
+    transcript (root span) gets its own track.
+    """
+
+    def __init__(self, path: str):
+        """Initialize the exporter.
+
+        Args:
+            path: Path of the trace file (overwritten)
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._file = open(path, 'w', encoding='utf-8')
+        self._file.write('[\n')
+        self._first = True
+        self._pid = os.getpid()
+        # perf_counter has an arbitrary origin; anchor it to wall-clock microseconds.
+        self._origin = time.time() * 1e6 - time.perf_counter() * 1e6
+
+    def export(self, span: Span):
+        event = {
+            'name': span.name,
+            'cat': 'stage',
+            'ph': 'X',
+            'ts': round(self._origin + span.start * 1e6, 3),
+            'dur': round(span.duration * 1e6, 3),
+            'pid': self._pid,
+            'tid': span.root_id,
+            'args': {**span.attributes, 'span_id': span.span_id, 'parent_id': span.parent_id}
+        }
+        if span.error is not None:
+            event['args']['error'] = span.error
+        line = json.dumps(event, ensure_ascii=False, default=str)
+        with self._lock:
+            if self._file is None:
+                return
+            self._file.write(line if self._first else ',\n' + line)
+            self._first = False
+            self._file.flush()
+
+    def close(self):
+        """Terminate the JSON array and close the file."""
+        with self._lock:
+            if self._file is None:
+                return
+            self._file.write('\n]\n')
+            self._file.close()
+            self._file = None
+
+
+def create_exporters(instrumentation: Instrumentation, trace_path: Optional[str] = None,
+                     metrics_port: Optional[int] = None) -> Instrumentation:
+    """Attach the requested exporters to an instrumentation.
+
+    Args:
+        instrumentation: The instrumentation to export
+        trace_path: Write a JSON trace file here (optional)
+        metrics_port: Serve Prometheus metrics on this local port (optional)
+
+    Returns:
+        The instrumentation
+    """
+    if trace_path:
+        instrumentation.add_exporter(JsonTraceExporter(trace_path))
+    if metrics_port is not None:
+        instrumentation.add_exporter(PrometheusExporter(instrumentation, port=metrics_port))
+    return instrumentation
\ No newline at end of file
@@ -0,0 +1,48 @@
+import cProfile
+import io
+import pstats
+import tracemalloc
+from contextlib import contextmanager
+from typing import Iterator
+
+
+@contextmanager
+def profile_run(output_prefix: str, top: int = 25, trace_frames: int = 10) -> Iterator[None]:
+    """Profile a single run with cProfile and tracemalloc.
+
+    Writes ``<prefix>.prof`` (load with ``python -m pstats`` or snakeviz) and
+    ``<prefix>.alloc.txt`` with the allocation sites holding the most memory at the
+    end of the run, and prints the top functions by cumulative time. Both profilers
+    slow the run down considerably; use it on single runs, not in production.
+
+    Args:
+        output_prefix: Path prefix of the output files
+        top: Number of functions and allocation sites reported
+        trace_frames: Frames stored per allocation traceback
+    """
+    started_tracemalloc = not tracemalloc.is_tracing()
+    if started_tracemalloc:
+        tracemalloc.start(trace_frames)
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        snapshot = tracemalloc.take_snapshot()
+        current, peak = tracemalloc.get_traced_memory()
+        if started_tracemalloc:
+            tracemalloc.stop()
+
+        profiler.dump_stats(f"{output_prefix}.prof")
+        with open(f"{output_prefix}.alloc.txt", 'w', encoding='utf-8') as f:
+            f.write(f"traced memory: current={current} bytes peak={peak} bytes\n\n")
+            for stat in snapshot.statistics('traceback')[:top]:
+                f.write(f"{stat.size} bytes in {stat.count} blocks\n")
+                f.write('\n'.join(f"    {line}" for line in stat.traceback.format()) + '\n\n')
+
+        summary = io.StringIO()
+        pstats.Stats(profiler, stream=summary).sort_stats('cumulative').print_stats(top)
+        print(summary.getvalue())
+        print(f"Profile written to {output_prefix}.prof, allocations to {output_prefix}.alloc.txt "
+              f"(peak traced memory {peak / 1024 / 1024:.1f} MB)")
\ No newline at end of file
@@ -1,37 +1,85 @@
-from typing import Dict, Any
-from Core.Domain.domain_entities import AuditResult
+import asyncio
+import time
+from typing import Any, AsyncIterable, AsyncIterator, Callable, Dict, Iterable, List, Optional, Tuple, Union
+from Core.Domain.domain_entities import AuditResult, StreamedItem, StreamUpdate
+from Core.Domain.exceptions import LLMAnalysisError
+from Core.Services.instrumentation import Instrumentation, get_instrumentation
+from Core.Services.latency_stats import BatchRunStats
+from Core.Services.report_merger import REPORT_SECTIONS, SECTION_KEYS, SPEAKER_FIELDS, audit_result_items, dedupe_items
+from Infrastructure.Parsers.token_counter import estimate_tokens
 from src.Core.Services.standard_cost_calculator import StandardCostCalculator
 from src.Infrastructure.Parsers.simple_text_parser import SimpleTextParser
 
+_BATCH_DONE = object()
+
 
 class AnalyzeMeetingUseCase:
     """Use case for analyzing meeting transcripts using LLM and calculating costs."""
 
     def __init__(self, llm_adapter, cost_calculator: StandardCostCalculator = None,
-                 text_parser: SimpleTextParser = None):
+                 text_parser: SimpleTextParser = None, near_duplicate_index=None,
+                 revalidate_near_duplicates: bool = True, instrumentation: Instrumentation = None):
         """Initialize the use case.
 
         Args:
             llm_adapter: The LLM adapter for analysis
             cost_calculator: The cost calculator service
             text_parser: The text parser for preprocessing
+            near_duplicate_index: Index of earlier analyses whose results are reused for
+                near-duplicate transcripts (optional, every transcript is analyzed if None)
+            revalidate_near_duplicates: Only reuse a result if every participant it names
+                also appears in the new transcript
+            instrumentation: Receives the parse, analyze and cost stage spans
+                (optional, uses the process-wide instrumentation if None)
         """
         self.llm_adapter = llm_adapter
         self.cost_calculator = cost_calculator or StandardCostCalculator()
         self.text_parser = text_parser or SimpleTextParser()
+        self.near_duplicate_index = near_duplicate_index
+        self.revalidate_near_duplicates = revalidate_near_duplicates
+        self.instrumentation = instrumentation or get_instrumentation()
+        self.near_duplicates_rejected = 0
+        self.last_batch_stats: Optional[BatchRunStats] = None
 
-    async def execute(self, transcript: str) -> Dict[str, Any]:
+    async def execute(self, transcript: str,
+                      on_item: Optional[Callable[[StreamedItem], None]] = None) -> Dict[str, Any]:
         """Execute the meeting analysis use case.
 
+        When a near-duplicate index is configured, a transcript that closely matches an
+        earlier one reuses that analysis instead of calling the LLM; new analyses are
+        added to the index.
+
         Args:
             transcript: The meeting transcript to analyze
+            on_item: Called with each risk factor, recommendation, question, meeting and
+                task as soon as it is known (optional); the adapter's analyze_stream is
+                used when it has one, otherwise the items are reported once the analysis ends
 
         Returns:
-            Dict containing the analysis results and cost calculations
+            Dict containing the analysis results and cost calculations, plus
+            ``near_duplicate_of`` and ``near_duplicate_similarity`` when a result was reused
         """
-        parsed_content = self.text_parser.parse_transcript(transcript)
-        audit_result = await self.llm_adapter.analyze(transcript)
-        cost_analysis = self.cost_calculator.calculate_costs(audit_result)
+        instrumentation = self.instrumentation
+        with instrumentation.span('analyze_meeting'):
+            with instrumentation.span('parse', bytes_in=len(transcript.encode('utf-8'))) as span:
+                parsed_content = self.text_parser.parse_transcript(transcript)
+                span.set(words=parsed_content.word_count)
+
+            match = self._find_near_duplicate(transcript)
+            if match is not None:
+                audit_result = match.result
+                if on_item is not None:
+                    self._replay(audit_result, on_item)
+            else:
+                with instrumentation.span('analyze'):
+                    audit_result = await self._analyze(transcript, on_item)
+                # Truncated results miss part of the report and must not stand in for other transcripts.
+                if (self.near_duplicate_index is not None and audit_result.raw_report is not None
+                        and not audit_result.truncated):
+                    self.near_duplicate_index.add(transcript, audit_result)
+
+            with instrumentation.span('cost'):
+                cost_analysis = self.cost_calculator.calculate_costs(audit_result)
 
         result = {
             'audit_result': audit_result,
@@ -39,5 +87,256 @@ class AnalyzeMeetingUseCase:
             'parsed_content': parsed_content,
             'success': True
         }
+        if match is not None:
+            result['near_duplicate_of'] = match.doc_id
+            result['near_duplicate_similarity'] = match.similarity
+
+        return result
+
+    async def _analyze(self, transcript: str, on_item: Optional[Callable[[StreamedItem], None]]) -> AuditResult:
+        if on_item is None:
+            return await self.llm_adapter.analyze(transcript)
+        stream = getattr(self.llm_adapter, 'analyze_stream', None)
+        if stream is None:
+            audit_result = await self.llm_adapter.analyze(transcript)
+            self._replay(audit_result, on_item)
+            return audit_result
+        audit_result = None
+        async for item in stream(transcript):
+            if item.is_final:
+                audit_result = item.result
+            else:
+                on_item(item)
+        if audit_result is None:
+            raise RuntimeError("The analysis stream ended without a result")
+        return audit_result
+
+    @staticmethod
+    def _replay(audit_result: AuditResult, on_item: Callable[[StreamedItem], None]):
+        for item in audit_result_items(audit_result):
+            if not item.is_final:
+                on_item(item)
+
+    def _find_near_duplicate(self, transcript: str):
+        """Return a reusable earlier analysis of a near-identical transcript, if any."""
+        if self.near_duplicate_index is None:
+            return None
+        with self.instrumentation.span('near_duplicate_lookup') as span:
+            match = self.near_duplicate_index.find(transcript)
+            span.set(hit=match is not None)
+        if match is None:
+            return None
+        if self.revalidate_near_duplicates and not self._names_present(match.result, transcript):
+            self.near_duplicates_rejected += 1
+            return None
+        return match
+
+    @staticmethod
+    def _names_present(audit_result: AuditResult, transcript: str) -> bool:
+        """Check that every participant named in a report occurs in the transcript."""
+        lowered = transcript.lower()
+        for section in REPORT_SECTIONS:
+            for item in (audit_result.raw_report or {}).get(section, []):
+                if not isinstance(item, dict):
+                    continue
+                for name_field in SPEAKER_FIELDS:
+                    name = item.get(name_field)
+                    if isinstance(name, str) and name.strip() and name.strip().lower() not in ('unknown', 'none'):
+                        if name.strip().lower() not in lowered:
+                            return False
+        return True
+
+    async def execute_many(
+        self,
+        transcripts: Iterable[Union[str, Dict[str, Any]]],
+        max_concurrency: int = 8,
+        stats: Optional[BatchRunStats] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Analyze many transcripts concurrently, yielding results in completion order.
+
+        At most ``max_concurrency`` transcripts are in flight at once and the input
+        iterable is consumed lazily, so arbitrarily large batches can be streamed
+        through. A failure in one transcript never aborts the others: it is reported
+        as a result with ``success`` set to False and the error message attached.
+
+        Args:
+            transcripts: Raw transcript strings or dicts with ``transcript`` and ``name`` keys
+            max_concurrency: Maximum number of concurrent analyses
+            stats: Optional stats collector; a new one is created when omitted
+
+        Returns:
+            Async iterator over per-transcript result dicts, each carrying
+            ``test_name``, ``input_transcript`` and ``latency_seconds``
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        stats = stats if stats is not None else BatchRunStats()
+        self.last_batch_stats = stats
+        # The semaphore slot is held until the consumer takes the result, which bounds
+        # both in-flight analyses and results waiting to be consumed.
+        semaphore = asyncio.Semaphore(max_concurrency)
+        completed: asyncio.Queue = asyncio.Queue()
+        in_flight = set()
+
+        async def run_one(name: str, transcript: str):
+            started = time.perf_counter()
+            try:
+                result = await self.execute(transcript)
+                success = True
+            except Exception as e:
+                result = {'success': False, 'error': f"{type(e).__name__}: {e}"}
+                success = False
+            latency = time.perf_counter() - started
+            stats.record(latency, success)
+            result['test_name'] = name
+            result['input_transcript'] = transcript
+            result['latency_seconds'] = latency
+            completed.put_nowait(result)
+
+        async def produce():
+            try:
+                for index, item in enumerate(transcripts):
+                    name, transcript = self._unpack_batch_item(index, item)
+                    await semaphore.acquire()
+                    stats.submitted += 1
+                    task = asyncio.create_task(run_one(name, transcript))
+                    in_flight.add(task)
+                    task.add_done_callback(in_flight.discard)
+                while in_flight:
+                    await asyncio.wait(set(in_flight))
+            finally:
+                completed.put_nowait(_BATCH_DONE)
+
+        stats.started_at = time.perf_counter()
+        producer = asyncio.create_task(produce())
+        try:
+            while True:
+                result = await completed.get()
+                if result is _BATCH_DONE:
+                    break
+                semaphore.release()
+                yield result
+            await producer
+        finally:
+            stats.finished_at = time.perf_counter()
+            if not producer.done():
+                producer.cancel()
+            for task in list(in_flight):
+                task.cancel()
+
+    async def stream(
+        self,
+        lines: AsyncIterable[str],
+        cadence_lines: int = 10,
+        cadence_seconds: Optional[float] = None,
+        context_lines: int = 2
+    ) -> AsyncIterator[StreamUpdate]:
+        """Analyze a live transcript incrementally as its lines arrive.
+
+        Lines are buffered until ``cadence_lines`` have arrived or ``cadence_seconds``
+        have passed since the first buffered line, then only that new segment (plus a
+        few lines of preceding context) is sent to the LLM. Each update carries just
+        the questions, meetings and tasks not reported before, together with the
+        running risk score and parser statistics. A segment whose analysis fails
+        yields an update with ``error`` set and no new items; its lines are kept
+        and sent again with the next segment.
+
+        Args:
+            lines: Async iterable of transcript lines
+            cadence_lines: Number of new lines that triggers an analysis
+            cadence_seconds: Maximum time a buffered line waits before an analysis (optional)
+            context_lines: Number of previous lines repeated before each segment for context
+
+        Returns:
+            Async iterator over StreamUpdate deltas; the last one has ``is_final`` set
+        """
+        if cadence_lines < 1:
+            raise ValueError("cadence_lines must be at least 1")
+
+        loop = asyncio.get_running_loop()
+        iterator = lines.__aiter__()
+        seen = {section: set() for section in REPORT_SECTIONS}
+        seen_factors = set()
+        state = {'statistics': None, 'context': [], 'unanalyzed': [], 'segment_index': 0,
+                 'risk_weighted': 0.0, 'weight': 0.0}
+
+        async def analyze_segment(new_lines: List[str], is_final: bool) -> StreamUpdate:
+            state['statistics'] = self.text_parser.parse_increment(new_lines, state['statistics'])
+            update = StreamUpdate(
+                segment_index=state['segment_index'],
+                risk_score=state['risk_weighted'] / state['weight'] if state['weight'] else 0.0,
+                statistics=state['statistics'],
+                is_final=is_final
+            )
+            state['segment_index'] += 1
+            new_lines = state['unanalyzed'] + new_lines
+            if not any(line.strip() for line in new_lines):
+                return update
+
+            segment = '\n'.join(state['context'] + new_lines)
+            try:
+                audit_result = await self.llm_adapter.analyze(segment)
+            except LLMAnalysisError as e:
+                state['unanalyzed'] = new_lines
+                update.error = f"{type(e).__name__}: {e}"
+                return update
+            state['unanalyzed'] = []
+            state['context'] = (state['context'] + new_lines)[-context_lines:] if context_lines else []
+
+            weight = estimate_tokens(segment) * max(audit_result.confidence, 0.0)
+            state['risk_weighted'] += audit_result.risk_score * weight
+            state['weight'] += weight
+            if state['weight']:
+                update.risk_score = state['risk_weighted'] / state['weight']
+
+            report = audit_result.raw_report or {}
+            update.new_questions = dedupe_items(report.get('questions', []), SECTION_KEYS['questions'], seen['questions'])
+            update.new_meetings = dedupe_items(report.get('meetings', []), SECTION_KEYS['meetings'], seen['meetings'])
+            update.new_tasks = dedupe_items(report.get('tasks', []), SECTION_KEYS['tasks'], seen['tasks'])
+            for factor in audit_result.risk_factors:
+                if factor not in seen_factors:
+                    seen_factors.add(factor)
+                    update.new_risk_factors.append(factor)
+            return update
+
+        pending: List[str] = []
+        deadline = None
+        next_line = None
+        exhausted = False
+        try:
+            while not exhausted:
+                if next_line is None:
+                    next_line = asyncio.ensure_future(iterator.__anext__())
+                timeout = max(0.0, deadline - loop.time()) if deadline is not None else None
+                done, _ = await asyncio.wait({next_line}, timeout=timeout)
+
+                if next_line in done:
+                    try:
+                        line = next_line.result()
+                    except StopAsyncIteration:
+                        exhausted = True
+                    else:
+                        if not pending and cadence_seconds is not None:
+                            deadline = loop.time() + cadence_seconds
+                        pending.append(line)
+                    next_line = None
+                    if exhausted:
+                        break
+                    if len(pending) < cadence_lines and (deadline is None or loop.time() < deadline):
+                        continue
+
+                segment, pending, deadline = pending, [], None
+                yield await analyze_segment(segment, is_final=False)
+
+            yield await analyze_segment(pending, is_final=True)
+        finally:
+            if next_line is not None:
+                next_line.cancel()
 
-        return result
\ No newline at end of file
+    @staticmethod
+    def _unpack_batch_item(index: int, item: Union[str, Dict[str, Any]]) -> Tuple[str, str]:
+        """Normalize a batch item into a (name, transcript) pair."""
+        if isinstance(item, str):
+            return f"transcript-{index + 1}", item
+        return str(item.get('name', f"transcript-{index + 1}")), item['transcript']
\ No newline at end of file
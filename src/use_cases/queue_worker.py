@@ -0,0 +1,169 @@
+import asyncio
+import time
+from typing import Any, Dict, Optional
+from Core.Domain.domain_entities import WorkItem
+from Core.Domain.exceptions import PermanentLLMError
+from Core.Interfaces.interfaces import IWorkQueue
+from Infrastructure.Queue.work_items import default_worker_id
+from Infrastructure.Storage.result_codec import encode_json, record_from_result
+
+
+class QueueWorker:
+    """Analyzes transcripts claimed from a work queue until it is drained or stopped.
+
+    Each worker leases up to ``concurrency`` jobs and runs them through the use case.
+    While a job is in flight its lease is extended every ``heartbeat_interval``
+    seconds, so only jobs of workers that died are delivered again; that is what
+    keeps LLM calls from being paid twice. Results are stored as result-file
+    records. Transient failures are retried by any worker after ``retry_delay``
+    seconds, up to ``max_attempts`` deliveries; permanent ones fail the job at once,
+    and so does a lease expiring after the last delivery (the job keeps killing its
+    worker). Queue calls run in a thread, since they may wait on another process's
+    lock, so the analyses in flight are not stalled.
+    """
+
+    def __init__(
+        self,
+        queue: IWorkQueue,
+        use_case,
+        worker_id: Optional[str] = None,
+        concurrency: int = 4,
+        lease_seconds: float = 300.0,
+        heartbeat_interval: Optional[float] = None,
+        poll_interval: float = 1.0,
+        max_attempts: int = 3,
+        retry_delay: float = 30.0,
+        slim_results: bool = False
+    ):
+        """Initialize the worker.
+
+        Args:
+            queue: The work queue to claim jobs from
+            use_case: The AnalyzeMeetingUseCase that analyzes each transcript
+            worker_id: Unique name of this worker (optional, defaults to ``<host>:<pid>``)
+            concurrency: Jobs analyzed at the same time
+            lease_seconds: Visibility timeout of a claimed job
+            heartbeat_interval: Seconds between lease extensions (optional, a third of the lease if None)
+            poll_interval: Seconds to wait before polling an empty queue again
+            max_attempts: Deliveries of a job before a transient failure becomes permanent
+            retry_delay: Seconds before a job that failed transiently becomes available again
+            slim_results: Leave the transcript text out of the stored records
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        self.queue = queue
+        self.use_case = use_case
+        self.worker_id = worker_id or default_worker_id()
+        self.concurrency = concurrency
+        self.lease_seconds = lease_seconds
+        self.heartbeat_interval = heartbeat_interval or lease_seconds / 3
+        self.poll_interval = poll_interval
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+        self.slim_results = slim_results
+        self.processed = 0
+        self.duplicates = 0
+        self.retried = 0
+        self.failed = 0
+        self.leases_lost = 0
+        self._stopping = False
+
+    def stop(self):
+        """Finish the jobs in flight, then return from run()."""
+        self._stopping = True
+
+    async def run(self, exit_when_empty: bool = False, max_jobs: Optional[int] = None) -> Dict[str, Any]:
+        """Claim and analyze jobs.
+
+        Args:
+            exit_when_empty: Return once no job is pending or leased to any worker
+            max_jobs: Return after claiming this many jobs (optional)
+
+        Returns:
+            The worker's counters (see stats())
+        """
+        in_flight: Dict[asyncio.Task, WorkItem] = {}
+        claimed = 0
+        last_heartbeat = 0.0
+        try:
+            while True:
+                while (not self._stopping and len(in_flight) < self.concurrency
+                       and (max_jobs is None or claimed < max_jobs)):
+                    item = await asyncio.to_thread(self.queue.claim, self.worker_id, self.lease_seconds,
+                                                   self.max_attempts)
+                    if item is None:
+                        break
+                    claimed += 1
+                    in_flight[asyncio.create_task(self._process(item))] = item
+
+                now = time.monotonic()
+                if now - last_heartbeat >= self.heartbeat_interval:
+                    last_heartbeat = now
+                    await self._heartbeat(in_flight)
+
+                if not in_flight:
+                    if self._stopping or (max_jobs is not None and claimed >= max_jobs):
+                        break
+                    if exit_when_empty and await self._drained():
+                        break
+                    await asyncio.sleep(min(self.poll_interval, self.heartbeat_interval))
+                    continue
+
+                done, _ = await asyncio.wait(in_flight, timeout=min(self.poll_interval, self.heartbeat_interval),
+                                             return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    del in_flight[task]
+                    task.result()
+        finally:
+            for task in in_flight:
+                task.cancel()
+            await asyncio.to_thread(self.queue.heartbeat, self.worker_id, **self.stats(), in_flight=0, stopped=True)
+        return self.stats()
+
+    async def _heartbeat(self, in_flight: Dict[asyncio.Task, WorkItem]):
+        for item in list(in_flight.values()):
+            if not await asyncio.to_thread(self.queue.extend_lease, item.job_id, self.worker_id, self.lease_seconds):
+                # Another worker may take it over; whichever result lands first is kept.
+                self.leases_lost += 1
+        await asyncio.to_thread(self.queue.heartbeat, self.worker_id, **self.stats(), in_flight=len(in_flight))
+
+    async def _drained(self) -> bool:
+        stats = await asyncio.to_thread(self.queue.stats)
+        return stats['pending'] == 0 and stats['leased'] == 0
+
+    async def _process(self, item: WorkItem):
+        started = time.perf_counter()
+        try:
+            result = await self.use_case.execute(item.transcript)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+            retry = not isinstance(e, PermanentLLMError) and item.attempts < self.max_attempts
+            if await asyncio.to_thread(self.queue.fail, item.job_id, self.worker_id, error,
+                                       self.retry_delay if retry else None):
+                self.retried += 1
+            else:
+                self.failed += 1
+            print(f"Job {item.name} failed (attempt {item.attempts}): {error}")
+            return
+
+        result['test_name'] = item.name
+        result['input_transcript'] = item.transcript
+        result['latency_seconds'] = time.perf_counter() - started
+        record = record_from_result(result, slim=self.slim_results)
+        if await asyncio.to_thread(self.queue.complete, item.job_id, self.worker_id, encode_json(record)):
+            self.processed += 1
+        else:
+            self.duplicates += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Return this worker's counters: processed, duplicates (result already stored),
+        retried, failed and leases_lost."""
+        return {
+            'processed': self.processed,
+            'duplicates': self.duplicates,
+            'retried': self.retried,
+            'failed': self.failed,
+            'leases_lost': self.leases_lost
+        }
\ No newline at end of file
@@ -0,0 +1,10 @@
+import pathlib
+import sys
+
+ROOT = pathlib.Path(__file__).resolve().parent.parent
+
+# Same import roots as main.py (src.*) and the modules themselves (Core.*, Infrastructure.*);
+# benchmarks/ holds the reference parser and the synthetic transcript generator.
+for path in (ROOT, ROOT / "src", ROOT / "benchmarks"):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
\ No newline at end of file
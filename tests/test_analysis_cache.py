@@ -0,0 +1,129 @@
+"""AnalysisCache expiry and eviction, and the CachedLLMAnalyzer around it."""
+import asyncio
+import dataclasses
+import types
+
+import pytest
+
+from Core.Domain.domain_entities import AuditResult
+from Infrastructure.Cache import analysis_cache
+from Infrastructure.Cache.analysis_cache import AnalysisCache
+from Infrastructure.LLM.cached_analyzer import CachedLLMAnalyzer
+from Infrastructure.LLM.fake_provider import FakeLLMAnalyzer
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def time(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(analysis_cache, 'time', types.SimpleNamespace(time=clock.time))
+    return clock
+
+
+def make_result(summary='Outage review', **changes):
+    result = AuditResult(risk_score=0.7, risk_factors=['Outage'], recommendations=['Add monitoring'],
+                         summary=summary, confidence=0.9,
+                         raw_report={'questions': [], 'meetings': [], 'tasks': [{'assignee': 'Marcus'}]})
+    return dataclasses.replace(result, **changes)
+
+
+def test_round_trip_and_counters(tmp_path):
+    cache = AnalysisCache(str(tmp_path / 'cache.db'))
+    assert cache.get('a') is None
+    cache.put('a', make_result())
+    assert cache.get('a') == make_result()
+    stats = cache.stats()
+    assert (stats['hits'], stats['misses'], stats['entries']) == (1, 1, 1)
+    assert stats['hit_rate'] == 0.5
+
+
+def test_entries_persist_across_instances(tmp_path):
+    path = str(tmp_path / 'cache.db')
+    first = AnalysisCache(path)
+    first.put('a', make_result())
+    first.close()
+    assert AnalysisCache(path).get('a') == make_result()
+
+
+def test_expired_entry_is_a_miss_and_deleted(tmp_path, clock):
+    cache = AnalysisCache(str(tmp_path / 'cache.db'), ttl_seconds=60)
+    cache.put('a', make_result())
+    clock.now += 59
+    assert cache.get('a') is not None
+    clock.now += 2
+    assert cache.get('a') is None
+    assert cache.stats()['entries'] == 0
+    assert cache.evictions == 1
+
+
+def test_ttl_none_never_expires(tmp_path, clock):
+    cache = AnalysisCache(str(tmp_path / 'cache.db'), ttl_seconds=None)
+    cache.put('a', make_result())
+    clock.now += 10 * 365 * 24 * 3600
+    assert cache.get('a') is not None
+
+
+def test_least_recently_used_entry_is_evicted(tmp_path, clock):
+    cache = AnalysisCache(str(tmp_path / 'cache.db'), max_entries=2)
+    cache.put('a', make_result('a'))
+    clock.now += 1
+    cache.put('b', make_result('b'))
+    clock.now += 1
+    assert cache.get('a') is not None  # 'a' is now more recently used than 'b'
+    clock.now += 1
+    cache.put('c', make_result('c'))
+    assert cache.get('b') is None
+    assert cache.get('a').summary == 'a'
+    assert cache.get('c').summary == 'c'
+    assert cache.evictions == 1
+
+
+def test_byte_limit_evicts_oldest_entries(tmp_path, clock):
+    size = len(AnalysisCache._encode(make_result('x' * 100)).encode('utf-8'))
+    cache = AnalysisCache(str(tmp_path / 'cache.db'), max_bytes=2 * size)
+    for key in 'abc':
+        cache.put(key, make_result('x' * 100))
+        clock.now += 1
+    assert cache.get('a') is None
+    assert cache.stats()['bytes'] <= 2 * size
+
+
+def test_key_ignores_whitespace_but_not_configuration():
+    key = AnalysisCache.make_key("Sarah:  Hello\n\n  Alex: Hi ", 'gpt', 'openai', '1')
+    assert key == AnalysisCache.make_key("Sarah: Hello\nAlex: Hi", 'gpt', 'openai', '1')
+    assert key != AnalysisCache.make_key("Sarah: Hello\nAlex: Hi", 'gpt', 'openai', '2')
+    assert key != AnalysisCache.make_key("Sarah: Hello\nAlex: Hi", 'claude', 'anthropic', '1')
+    assert key != AnalysisCache.make_key("Sarah: Hello\nAlex: Hey", 'gpt', 'openai', '1')
+
+
+def test_cached_analyzer_calls_the_llm_once(tmp_path):
+    analyzer = FakeLLMAnalyzer()
+    cached = CachedLLMAnalyzer(analyzer, AnalysisCache(str(tmp_path / 'cache.db')))
+
+    async def run():
+        first = await cached.analyze("Sarah: Hello")
+        second = await cached.analyze("Sarah:   Hello\n")
+        return first, second
+
+    first, second = asyncio.run(run())
+    assert first == second
+    assert analyzer.calls == 1
+
+
+def test_cached_analyzer_does_not_store_truncated_results(tmp_path):
+    class TruncatingAnalyzer(FakeLLMAnalyzer):
+        async def analyze(self, transcript):
+            return dataclasses.replace(await super().analyze(transcript), truncated=True)
+
+    analyzer = TruncatingAnalyzer()
+    cached = CachedLLMAnalyzer(analyzer, AnalysisCache(str(tmp_path / 'cache.db')))
+    asyncio.run(cached.analyze("Sarah: Hello"))
+    asyncio.run(cached.analyze("Sarah: Hello"))
+    assert analyzer.calls == 2
\ No newline at end of file
@@ -0,0 +1,118 @@
+"""TranscriptChunker windows, merge_audit_results and ChunkedLLMAnalyzer."""
+import asyncio
+
+import pytest
+
+from Core.Domain.domain_entities import AuditResult
+from Core.Domain.exceptions import TransientLLMError
+from Core.Services.report_merger import merge_audit_results
+from Infrastructure.LLM.chunked_analyzer import ChunkedLLMAnalyzer
+from Infrastructure.Parsers.transcript_chunker import TranscriptChunker
+
+HEADER = ["Meeting transcript:", "Attendees: Sarah, Marcus, Elena", "Date: 2024-04-12"]
+SPEAKERS = ["Sarah", "Marcus", "Elena"]
+
+
+def make_transcript(turns=60):
+    lines = [f"{SPEAKERS[i % 3]}: Turn {i} is about the payment gateway rollout and its risks." for i in range(turns)]
+    return '\n'.join(HEADER + lines)
+
+
+def make_result(risk_score=0.5, confidence=1.0, tasks=(), factors=()):
+    return AuditResult(risk_score=risk_score, risk_factors=list(factors), recommendations=[], summary='',
+                       confidence=confidence, raw_report={'questions': [], 'meetings': [], 'tasks': list(tasks)})
+
+
+def test_every_chunk_repeats_the_whole_header():
+    chunks = TranscriptChunker(max_tokens=200, overlap_turns=2).split(make_transcript())
+    assert len(chunks) > 2
+    for chunk in chunks:
+        assert chunk.text.splitlines()[:3] == HEADER
+        assert chunk.tokens <= 200
+
+
+def test_chunks_cover_every_turn_with_overlap():
+    chunks = TranscriptChunker(max_tokens=200, overlap_turns=2).split(make_transcript())
+    assert chunks[0].first_turn == 0
+    assert chunks[-1].last_turn == 59
+    for previous, chunk in zip(chunks, chunks[1:]):
+        assert chunk.first_turn == previous.last_turn + 1 - 2
+
+
+def test_speaker_with_a_single_turn_after_the_header_is_not_preamble():
+    text = '\n'.join(HEADER + ["Sarah: Hi", "Marcus: Hello", "Sarah: Let's start", "Marcus: Sure"])
+    chunks = TranscriptChunker(max_tokens=12, overlap_turns=0).split(text)
+    assert all(chunk.text.startswith('\n'.join(HEADER)) for chunk in chunks)
+    assert "Sarah: Hi" in chunks[0].text
+    assert all("Sarah: Hi" not in chunk.text for chunk in chunks[1:])
+
+
+def test_transcript_without_turns_is_not_all_preamble():
+    text = "Just some notes\nwithout any speaker labels\nat all"
+    chunks = TranscriptChunker(max_tokens=3, overlap_turns=0).split(text)
+    assert [chunk.text for chunk in chunks] == text.splitlines()
+
+
+def test_merge_weights_by_tokens_and_confidence_and_dedupes():
+    task = {'assigner': 'Sarah', 'assignee': 'Marcus', 'task': 'Rewrite the service', 'deadline': 'Friday'}
+    merged = merge_audit_results(
+        [make_result(0.2, 1.0, [task], ['Outage']), make_result(0.8, 0.5, [dict(task, task='rewrite  the SERVICE')],
+                                                                ['outage', 'Staffing'])],
+        [100, 100]
+    )
+    assert merged.risk_score == pytest.approx((0.2 * 100 + 0.8 * 50) / 150, abs=1e-4)
+    assert merged.confidence == 0.75
+    assert merged.raw_report['tasks'] == [task]
+    assert merged.risk_factors == ['Outage', 'Staffing']
+
+
+def test_merge_requires_one_weight_per_result():
+    with pytest.raises(ValueError):
+        merge_audit_results([make_result()], [1, 2])
+
+
+class ScriptedAnalyzer:
+    def __init__(self, fail_on=()):
+        self.fail_on = set(fail_on)
+        self.calls = 0
+        self.config = {}
+
+    async def analyze(self, transcript):
+        index = self.calls
+        self.calls += 1
+        if index in self.fail_on:
+            raise TransientLLMError("503")
+        return make_result(0.5, 1.0, [{'assignee': 'Marcus', 'task': f'task {index}'}])
+
+
+def test_short_transcripts_are_analyzed_directly():
+    analyzer = ScriptedAnalyzer()
+    result = asyncio.run(ChunkedLLMAnalyzer(analyzer, TranscriptChunker(max_tokens=10_000)).analyze(make_transcript()))
+    assert analyzer.calls == 1
+    assert not result.truncated
+
+
+def test_all_chunks_are_merged():
+    analyzer = ScriptedAnalyzer()
+    chunked = ChunkedLLMAnalyzer(analyzer, TranscriptChunker(max_tokens=200), max_concurrency=1)
+    result = asyncio.run(chunked.analyze(make_transcript()))
+    assert analyzer.calls > 2
+    assert len(result.raw_report['tasks']) == analyzer.calls
+    assert not result.truncated
+
+
+def test_failed_chunks_leave_a_truncated_partial_result():
+    analyzer = ScriptedAnalyzer(fail_on={1})
+    chunked = ChunkedLLMAnalyzer(analyzer, TranscriptChunker(max_tokens=200), max_concurrency=1)
+    result = asyncio.run(chunked.analyze(make_transcript()))
+    assert result.truncated
+    assert chunked.failed_chunks == 1
+    assert len(result.raw_report['tasks']) == analyzer.calls - 1
+    assert 0 < result.confidence < 1.0
+
+
+def test_error_is_raised_when_every_chunk_fails():
+    analyzer = ScriptedAnalyzer(fail_on=range(100))
+    chunked = ChunkedLLMAnalyzer(analyzer, TranscriptChunker(max_tokens=200))
+    with pytest.raises(TransientLLMError):
+        asyncio.run(chunked.analyze(make_transcript()))
\ No newline at end of file
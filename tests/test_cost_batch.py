@@ -0,0 +1,92 @@
+"""calculate_costs_batch equals calculate_costs bit for bit, and the cost command uses it."""
+import json
+import random
+
+import pytest
+
+import main
+from Core.Domain.domain_entities import AuditResult
+from Core.Services.standard_cost_calculator import CostModel, StandardCostCalculator
+from Infrastructure.Storage.result_codec import encode_json, record_from_result
+
+np = pytest.importorskip("numpy")
+
+COST_FIELDS = ('base_cost', 'risk_adjustment', 'recommendation_cost', 'total_cost')
+
+
+def make_results(count, seed=0):
+    rng = random.Random(seed)
+    edge_scores = [0.0, 1.0, 0.1, 0.7, 1 / 3, 5e-324, 0.30000000000000004]
+    return [
+        AuditResult(
+            risk_score=edge_scores[i] if i < len(edge_scores) else rng.random(),
+            risk_factors=['factor'] * rng.randint(0, 5),
+            recommendations=['recommendation'] * rng.randint(0, 12),
+            summary='',
+            confidence=0.9
+        )
+        for i in range(count)
+    ]
+
+
+@pytest.mark.parametrize("cost_model", [None, CostModel(base_cost=1234.5, risk_weight=0.37, recommendation_cost=70)])
+def test_batch_matches_scalar_bit_for_bit(cost_model):
+    calculator = StandardCostCalculator(cost_model)
+    results = make_results(2000)
+    batch = calculator.calculate_costs_for(results)
+    assert len(batch) == len(results)
+    for index, result in enumerate(results):
+        scalar = calculator.calculate_costs(result)
+        row = batch.row(index)
+        for name in COST_FIELDS:
+            # Equality, not approx: the batch path must run the same IEEE operations.
+            assert float(row[name]) == scalar[name], (index, name)
+            assert float(row[name]).hex() == float(scalar[name]).hex()
+
+
+def test_batch_rejects_columns_of_different_lengths():
+    with pytest.raises(ValueError):
+        StandardCostCalculator().calculate_costs_batch([0.1, 0.2], [1])
+
+
+def write_results(path, results, failed=0):
+    records = [record_from_result({'test_name': f"{path.stem}-{i}", 'success': True, 'audit_result': result})
+               for i, result in enumerate(results)]
+    records += [record_from_result({'test_name': f"failed-{i}", 'success': False, 'error': 'timeout'})
+                for i in range(failed)]
+    path.write_bytes(b''.join(encode_json(record) + b'\n' for record in records))
+    return str(path)
+
+
+def test_cost_command_recalculates_results_files_in_one_batch(tmp_path):
+    first, second = make_results(30, seed=1), make_results(10, seed=2)
+    paths = [write_results(tmp_path / 'team-a.jsonl', first, failed=2),
+             write_results(tmp_path / 'team-b.jsonl', second)]
+    calculator = StandardCostCalculator(CostModel(risk_weight=0.8))
+
+    rows, aggregates = main.calculate_result_costs(paths, by_file=True, risk_weight=0.8)
+
+    assert [row['name'] for row in rows] == [f"team-a-{i}" for i in range(30)] + [f"team-b-{i}" for i in range(10)]
+    for row, result in zip(rows, first + second):
+        assert row['total_cost'] == calculator.calculate_costs(result)['total_cost']
+    totals = [row['total_cost'] for row in rows]
+    assert aggregates['count'] == 40
+    assert aggregates['total_cost'] == pytest.approx(sum(totals))
+    assert aggregates['percentiles']['p50'] == pytest.approx(float(np.percentile(totals, 50)))
+    assert {name: rollup['count'] for name, rollup in aggregates['by_team'].items()} == dict(zip(paths, (30, 10)))
+    assert aggregates['by_team'][paths[1]]['max_total_cost'] == max(totals[30:])
+
+
+def test_cost_command_prints_the_aggregates(tmp_path, capsys):
+    path = write_results(tmp_path / 'results.jsonl', make_results(5))
+    main.main(['cost', path, '--json'])
+    lines = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert len(lines) == 6
+    assert lines[-1]['aggregates']['count'] == 5
+    assert 'by_team' not in lines[-1]['aggregates']
+
+    main.main(['cost', path, '--by-file'])
+    out = capsys.readouterr().out
+    assert "5 meeting(s), total cost" in out
+    assert "p95" in out
+    assert f"{path}\t5\t" in out
\ No newline at end of file
@@ -0,0 +1,81 @@
+"""HedgedLLMAnalyzer races a second request against slow ones within its hedge budget."""
+import asyncio
+
+import pytest
+
+from Infrastructure.LLM.fake_provider import FakeLLMAnalyzer
+from Infrastructure.LLM.hedged_analyzer import HedgedLLMAnalyzer
+
+PRIMARY = {'risk_analysis': {'score': 0.1}}
+FALLBACK = {'risk_analysis': {'score': 0.9}}
+
+
+class FailingAnalyzer:
+    def __init__(self, latency=0.0):
+        self.latency = latency
+        self.calls = 0
+
+    async def analyze(self, transcript):
+        self.calls += 1
+        await asyncio.sleep(self.latency)
+        raise TimeoutError('provider timed out')
+
+
+def test_fast_requests_are_not_hedged():
+    fallback = FakeLLMAnalyzer(response=FALLBACK)
+    hedged = HedgedLLMAnalyzer(FakeLLMAnalyzer(response=PRIMARY), fallback=fallback, initial_delay=1.0)
+    assert asyncio.run(hedged.analyze("Sarah: Hi.")).risk_score == 0.1
+    assert fallback.calls == 0
+    assert hedged.stats()['hedges'] == 0
+
+
+def test_hedge_wins_over_a_slow_primary():
+    primary = FakeLLMAnalyzer(response=PRIMARY, latency=5.0)
+    fallback = FakeLLMAnalyzer(response=FALLBACK)
+    hedged = HedgedLLMAnalyzer(primary, fallback=fallback, initial_delay=0.02)
+    result = asyncio.run(hedged.analyze("Sarah: Hi."))
+    assert result.risk_score == 0.9
+    assert (primary.calls, fallback.calls) == (1, 1)
+    assert (hedged.hedges, hedged.hedge_wins) == (1, 1)
+    # The cancelled primary's elapsed time is recorded as well, as a lower bound of its latency.
+    assert len(hedged._latencies) == 2
+    assert max(hedged._latencies) >= 0.02
+
+
+def test_a_failed_request_does_not_end_the_race():
+    primary = FakeLLMAnalyzer(response=PRIMARY, latency=0.1)
+    hedged = HedgedLLMAnalyzer(primary, fallback=FailingAnalyzer(), initial_delay=0.02)
+    assert asyncio.run(hedged.analyze("Sarah: Hi.")).risk_score == 0.1
+    assert (hedged.hedges, hedged.hedge_wins) == (1, 0)
+
+
+def test_the_first_error_is_raised_when_both_requests_fail():
+    hedged = HedgedLLMAnalyzer(FailingAnalyzer(latency=0.05), fallback=FailingAnalyzer(), initial_delay=0.01)
+    with pytest.raises(TimeoutError):
+        asyncio.run(hedged.analyze("Sarah: Hi."))
+
+
+def test_hedges_are_capped_by_the_budget():
+    fallback = FakeLLMAnalyzer(response=FALLBACK)
+    hedged = HedgedLLMAnalyzer(FakeLLMAnalyzer(response=PRIMARY, latency=0.05), fallback=fallback,
+                               max_hedge_ratio=0.0, burst=1.0, initial_delay=0.01)
+
+    async def run():
+        return [await hedged.analyze("Sarah: Hi.") for _ in range(3)]
+
+    assert [result.risk_score for result in asyncio.run(run())] == [0.9, 0.1, 0.1]
+    assert (hedged.hedges, hedged.budget_denied) == (1, 2)
+
+
+def test_hedge_delay_follows_the_observed_latencies():
+    hedged = HedgedLLMAnalyzer(FakeLLMAnalyzer(response=PRIMARY), min_samples=3, min_delay=0.25)
+    assert hedged.hedge_delay() is None
+
+    async def run():
+        for _ in range(3):
+            await hedged.analyze("Sarah: Hi.")
+
+    asyncio.run(run())
+    # The fake answers at once, so the percentile is below the floor.
+    assert hedged.hedge_delay() == 0.25
+    assert hedged.stats()['requests'] == 3
\ No newline at end of file
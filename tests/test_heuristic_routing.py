@@ -0,0 +1,130 @@
+"""HeuristicExtractor rules and the routing of transcripts between rules and LLM."""
+import asyncio
+
+from Infrastructure.LLM.fake_provider import FakeLLMAnalyzer
+from Infrastructure.LLM.routing_analyzer import ROUTE_FULL, ROUTE_SEGMENTS, ROUTE_SKIP, HeuristicRoutingAnalyzer
+from Infrastructure.Parsers.heuristic_extractor import HeuristicExtractor
+
+SIMPLE = """Meeting transcript:
+Date: 2024-04-12
+Sarah: Marcus, can you rewrite the retry logic by Friday?
+Marcus: Yes, I will.
+Elena: Is the gateway stable now?
+Marcus: No, we had another outage this morning.
+Sarah: Let's meet on Tuesday at 10am via Zoom to review the rollout.
+Elena: I will update the runbook by tomorrow."""
+
+FILLER = '\n'.join(f"{'Sarah' if i % 2 else 'Marcus'}: Point {i} of the long discussion about the migration."
+                   for i in range(12))
+
+
+def extract(transcript):
+    return HeuristicExtractor().extract(transcript)
+
+
+def items(extraction, section):
+    return [item.data for item in extraction.items if item.section == section]
+
+
+def test_requests_commitments_questions_and_meetings_are_extracted():
+    extraction = extract(SIMPLE)
+    assert [turn.speaker for turn in extraction.turns] == ['Sarah', 'Marcus', 'Elena', 'Marcus', 'Sarah', 'Elena']
+    assert items(extraction, 'tasks') == [
+        {'assigner': 'Sarah', 'assignee': 'Marcus', 'task': 'rewrite the retry logic', 'deadline': 'Friday'},
+        {'assigner': 'Elena', 'assignee': 'Elena', 'task': 'update the runbook', 'deadline': 'tomorrow'}
+    ]
+    assert items(extraction, 'meetings') == [
+        {'scheduler': 'Sarah', 'datetime': 'Tuesday 10am', 'location': 'Zoom', 'purpose': 'review the rollout'}
+    ]
+    assert items(extraction, 'questions')[1]['answer'] == 'No, we had another outage this morning.'
+    assert extraction.unresolved_turns == []
+    assert extraction.confidence >= 0.8
+    assert extraction.risk_factors
+
+
+def test_declined_request_is_not_a_task():
+    extraction = extract("Sarah: Marcus, can you cover the on-call shift?\nMarcus: No, I'm away that week.")
+    assert items(extraction, 'tasks') == []
+
+
+def test_unattributed_and_non_english_turns_are_unresolved():
+    extraction = extract(SIMPLE + "\nTom: Someone should handle the vendor contract."
+                                  "\nTom: Марина займётся бюджетом до пятницы.")
+    assert extraction.unresolved_turns == [6, 7]
+    assert extraction.confidence <= 0.5
+
+
+def test_turns_naming_an_owner_outside_any_item_are_unresolved():
+    extraction = extract(SIMPLE + "\nSarah: The budget review is assigned to Tom.")
+    assert extraction.unresolved_turns == [6]
+
+
+def test_nothing_extracted_means_no_confidence():
+    extraction = extract("Sarah: The weather was nice.\nMarcus: Indeed it was.")
+    assert extraction.items == []
+    assert extraction.confidence == 0.0
+
+
+def test_long_transcripts_get_lower_confidence():
+    assert extract(FILLER + '\n' + SIMPLE.split('\n', 2)[2] + '\n' + FILLER).confidence < extract(SIMPLE).confidence
+
+
+VENDOR_TASK = {'assigner': 'Tom', 'assignee': 'Tom', 'task': 'Handle the vendor contract', 'deadline': None}
+
+
+def make_router(**kwargs):
+    analyzer = FakeLLMAnalyzer(response={'risk_analysis': {'score': 0.4},
+                                         'meeting_report': {'tasks': [VENDOR_TASK]}})
+    return HeuristicRoutingAnalyzer(analyzer, **kwargs), analyzer
+
+
+def test_confident_extraction_skips_the_llm():
+    router, analyzer = make_router()
+    result = asyncio.run(router.analyze(SIMPLE))
+    assert analyzer.calls == 0
+    assert router.routes[ROUTE_SKIP] == 1
+    assert [task['assignee'] for task in result.raw_report['tasks']] == ['Marcus', 'Elena']
+    assert router.stats()['tokens_saved_ratio'] == 1.0
+
+
+def test_empty_extraction_is_analyzed_in_full():
+    router, analyzer = make_router()
+    transcript = "Sarah: The weather was nice.\nMarcus: Indeed it was."
+    assert router.route(router.extractor.extract(transcript), 100) == (ROUTE_FULL, None)
+    asyncio.run(router.analyze(transcript))
+    assert analyzer.calls == 1
+    assert router.routes[ROUTE_FULL] == 1
+
+
+def test_non_english_transcript_is_not_skipped():
+    router, analyzer = make_router()
+    # The question is found, but the answer's commitment is lost on the English rules.
+    asyncio.run(router.analyze("Марина: Кто займётся бюджетом?\nИван: Я займусь до пятницы."))
+    assert analyzer.calls == 1
+    assert router.routes[ROUTE_SKIP] == 0
+
+
+def test_only_unresolved_segments_are_sent_and_merged():
+    router, analyzer = make_router(context_turns=0)
+    transcript = SIMPLE + '\n' + FILLER + "\nTom: Someone should handle the vendor contract."
+    sent = []
+
+    async def analyze(text):
+        sent.append(text)
+        return await FakeLLMAnalyzer.analyze(analyzer, text)
+
+    analyzer.analyze = analyze
+    result = asyncio.run(router.analyze(transcript))
+    assert router.routes[ROUTE_SEGMENTS] == 1
+    assert sent == ["[... 18 turns omitted ...]\nTom: Someone should handle the vendor contract."]
+    # Rule items and the LLM's items are both in the merged report.
+    assert [task['task'] for task in result.raw_report['tasks']] == [
+        'rewrite the retry logic', 'update the runbook', 'Handle the vendor contract'
+    ]
+    assert router.tokens_sent < router.tokens_total
+
+
+def test_mostly_unresolved_transcript_is_analyzed_in_full():
+    router, analyzer = make_router(max_segment_ratio=0.1)
+    extraction = router.extractor.extract("Tom: Someone should handle the contract.\nSarah: Marcus owns it.")
+    assert router.route(extraction, 20)[0] == ROUTE_FULL
\ No newline at end of file
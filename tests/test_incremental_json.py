@@ -0,0 +1,95 @@
+"""IncrementalJsonParser and the recovery of truncated model responses."""
+import json
+
+import pytest
+
+from Infrastructure.LLM.fake_provider import DEFAULT_RESPONSE
+from Infrastructure.LLM.spoon_client import RESPONSE_SECTIONS, SpoonLLMClient
+from Infrastructure.Parsers.incremental_json import IncrementalJsonParser, recover_json_object
+
+RESPONSE = {
+    "risk_analysis": {
+        "score": 0.72,
+        "risk_factors": ["Payment gateway outage", "No \"documentation\" for the legacy service"],
+        "recommendations": ["Add monitoring"],
+        "summary": "Outage review.\nFollow-ups assigned.",
+        "confidence": 0.85
+    },
+    "meeting_report": {
+        "questions": [{"questioner": "Sarah", "responder": "Alex", "question": "Why?", "answer": "A leak."}],
+        "meetings": [],
+        "tasks": [
+            {"assigner": "Sarah", "assignee": "Marcus", "task": "Rewrite the service", "deadline": "Friday"},
+            {"assigner": "Sarah", "assignee": "Elena", "task": "Write the runbook", "deadline": None},
+            {"assigner": "Alex", "assignee": "Tom", "task": "Add alerts", "deadline": "2024-05-01"}
+        ]
+    }
+}
+TEXT = json.dumps(RESPONSE, indent=2, ensure_ascii=False)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 16, len(TEXT)])
+def test_chunked_feed_equals_json_loads(chunk_size):
+    parser = IncrementalJsonParser(RESPONSE_SECTIONS)
+    for start in range(0, len(TEXT), chunk_size):
+        parser.feed(TEXT[start:start + chunk_size])
+    assert parser.done
+    assert parser.error is None
+    assert parser.partial() == RESPONSE
+
+
+def test_watched_items_are_reported_as_soon_as_complete():
+    parser = IncrementalJsonParser({('meeting_report', 'tasks'): 'tasks'})
+    first_task_end = TEXT.index('}', TEXT.index('"Friday"')) + 1
+    assert parser.feed(TEXT[:first_task_end - 1]) == []
+    completed = parser.feed(TEXT[first_task_end - 1:first_task_end + 1])
+    assert completed == [('tasks', 0, RESPONSE['meeting_report']['tasks'][0])]
+    rest = parser.feed(TEXT[first_task_end + 1:])
+    assert [index for _, index, _ in rest] == [1, 2]
+
+
+def test_preamble_and_code_fence_are_ignored():
+    data, complete = recover_json_object(f"Here is the analysis:\n```json\n{TEXT}\n```\nThanks!")
+    assert complete
+    assert data == RESPONSE
+
+
+def test_truncated_response_keeps_completed_items_only():
+    cut = TEXT.index('"Write the runbook"')
+    data, complete = recover_json_object(TEXT[:cut], RESPONSE_SECTIONS)
+    assert not complete
+    assert data['risk_analysis'] == RESPONSE['risk_analysis']
+    assert data['meeting_report']['questions'] == RESPONSE['meeting_report']['questions']
+    # The task cut off halfway is dropped rather than reported half empty.
+    assert data['meeting_report']['tasks'] == RESPONSE['meeting_report']['tasks'][:1]
+
+
+@pytest.mark.parametrize("cut", range(1, len(TEXT), 7))
+def test_every_truncation_point_recovers_a_prefix(cut):
+    data, complete = recover_json_object(TEXT[:cut], RESPONSE_SECTIONS)
+    assert not complete
+    if data is None:
+        return
+    for name, items in (data.get('meeting_report') or {}).items():
+        expected = RESPONSE['meeting_report'][name]
+        assert items == expected[:len(items)]
+
+
+def test_client_marks_truncated_results():
+    client = SpoonLLMClient({'provider': 'fake', 'model': 'fake'})
+    text = json.dumps(DEFAULT_RESPONSE)
+    assert not client._parse_llm_json(text).truncated
+
+    cut = TEXT.index('"Write the runbook"')
+    result = client._parse_llm_json(TEXT[:cut])
+    assert result.truncated
+    assert result.risk_score == 0.72
+    assert len(result.raw_report['tasks']) == 1
+
+
+def test_invalid_json_sets_error():
+    parser = IncrementalJsonParser()
+    parser.feed('{"a": tru')
+    parser.feed('x}')
+    assert parser.error is not None
+    assert not parser.done
\ No newline at end of file
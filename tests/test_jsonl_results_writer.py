@@ -0,0 +1,70 @@
+"""JsonlResultsWriter torn-line repair and resume bookkeeping."""
+import json
+
+from Infrastructure.Storage.jsonl_results_writer import (
+    JsonlResultsWriter, completed_result_names, iter_jsonl_results
+)
+
+
+def write_records(path, records):
+    with JsonlResultsWriter(str(path)) as writer:
+        for record in records:
+            writer.write(record)
+        return writer.written
+
+
+def test_records_are_appended_one_per_line(tmp_path):
+    path = tmp_path / 'results.jsonl'
+    assert write_records(path, [{'test_name': 'a', 'success': True}]) == 1
+    write_records(path, [{'test_name': 'b', 'success': False, 'error': 'timeout'}])
+    lines = path.read_bytes().splitlines()
+    assert [json.loads(line)['test_name'] for line in lines] == ['a', 'b']
+
+
+def test_torn_last_line_is_truncated_before_appending(tmp_path):
+    path = tmp_path / 'results.jsonl'
+    write_records(path, [{'test_name': 'a', 'success': True}])
+    complete = path.read_bytes()
+    with open(path, 'ab') as f:
+        f.write(b'{"test_name": "b", "succ')
+
+    write_records(path, [{'test_name': 'c', 'success': True}])
+    data = path.read_bytes()
+    assert data.startswith(complete)
+    assert [record['test_name'] for record in iter_jsonl_results(str(path))] == ['a', 'c']
+
+
+def test_torn_line_longer_than_the_read_window_is_removed(tmp_path):
+    path = tmp_path / 'results.jsonl'
+    write_records(path, [{'test_name': 'a', 'success': True}])
+    with open(path, 'ab') as f:
+        f.write(b'{"summary": "' + b'x' * 200_000)
+    write_records(path, [])
+    assert [record['test_name'] for record in iter_jsonl_results(str(path))] == ['a']
+    assert path.read_bytes().endswith(b'\n')
+
+
+def test_file_with_only_a_torn_line_is_emptied(tmp_path):
+    path = tmp_path / 'results.jsonl'
+    path.write_bytes(b'{"test_name": "a"')
+    write_records(path, [])
+    assert path.read_bytes() == b''
+
+
+def test_reader_skips_blank_and_invalid_lines(tmp_path):
+    path = tmp_path / 'results.jsonl'
+    path.write_bytes(b'{"test_name": "a", "success": true}\n\nnot json\n{"test_name": "b", "success": true}\n')
+    assert [record['test_name'] for record in iter_jsonl_results(str(path))] == ['a', 'b']
+
+
+def test_resume_skips_only_successful_results(tmp_path):
+    path = tmp_path / 'results.jsonl'
+    assert completed_result_names(str(path)) == set()
+    write_records(path, [
+        {'test_name': 'ok', 'success': True},
+        {'test_name': 'failed', 'success': False, 'error': 'timeout'},
+        {'success': True},
+    ])
+    with open(path, 'ab') as f:
+        f.write(b'{"test_name": "torn", "success": tr')
+    assert completed_result_names(str(path)) == {'ok'}
\ No newline at end of file
@@ -0,0 +1,124 @@
+"""MeetingIndex ingestion and cross-meeting queries."""
+import sqlite3
+
+import pytest
+
+import main
+from Core.Domain.domain_entities import AuditResult
+from Infrastructure.Storage.meeting_index import MeetingIndex
+from Infrastructure.Storage.result_codec import record_from_result
+
+
+def make_record(name, date, risk_score, tasks=(), questions=(), meetings=(), transcript=None, summary='Review.'):
+    transcript = transcript or (f"Meeting transcript:\nDate: {date}\n"
+                                "Sarah: Can you rewrite the gateway-v2 service?\nMarcus: Yes, by Friday.\n"
+                                "Sarah: Thanks Marcus.\nMarcus: Marcus's team owns the budget.")
+    audit_result = AuditResult(risk_score=risk_score, risk_factors=[], recommendations=[], summary=summary,
+                               confidence=0.9, raw_report={'questions': list(questions), 'meetings': list(meetings),
+                                                           'tasks': list(tasks)})
+    return record_from_result({'test_name': name, 'success': True, 'audit_result': audit_result,
+                               'input_transcript': transcript})
+
+
+@pytest.fixture
+def index(tmp_path):
+    index = MeetingIndex(str(tmp_path / 'meetings.db'))
+    index.add_records([
+        make_record('m1', '2024-01-10', 0.2, summary='Gateway-v2 rollout planning.', tasks=[
+            {'assigner': 'Sarah', 'assignee': 'Marcus', 'task': 'Rewrite the gateway-v2 service',
+             'deadline': '2024-01-19'},
+            {'assigner': 'Sarah', 'assignee': 'Elena', 'task': 'Write the runbook', 'deadline': 'Friday',
+             'status': 'done'}
+        ], meetings=[{'scheduler': 'Sarah', 'datetime': '2024-01-12 10:00', 'location': 'Zoom',
+                      'purpose': 'Design review'}]),
+        make_record('m2', '2024-02-20', 0.9, summary='Budget overrun.', tasks=[
+            {'assigner': 'Elena', 'assignee': 'marcus', 'task': "Check Marcus's budget", 'deadline': '2024-03-01'}
+        ], questions=[{'questioner': 'Sarah', 'responder': 'Marcus', 'question': 'Is the budget approved?',
+                       'answer': 'Not yet.'}],
+            meetings=[{'scheduler': 'Elena', 'datetime': 'next Tuesday', 'purpose': 'Budget sync'},
+                      {'datetime': 'Friday', 'purpose': 'Retro'}]),
+        record_from_result({'test_name': 'failed', 'success': False, 'error': 'timeout'})
+    ])
+    yield index
+    index.close()
+
+
+def test_failed_records_are_skipped(index):
+    assert index.stats()['meetings'] == 2
+    assert index.stats()['scheduled_meetings'] == 3
+
+
+def test_task_filters(index):
+    assert [row['task'] for row in index.tasks(assignee='MARCUS')] == [
+        "Check Marcus's budget", 'Rewrite the gateway-v2 service'
+    ]
+    assert [row['assignee'] for row in index.tasks(open_only=True)] == ['marcus', 'Marcus']
+    assert [row['meeting'] for row in index.tasks(due_before='2024-02-01')] == ['m1']
+    assert [row['meeting'] for row in index.tasks(min_risk=0.5)] == ['m2']
+    assert index.tasks(assigner='Elena', since='2024-02-01')[0]['deadline_date'] == '2024-03-01'
+
+
+def test_text_search_treats_punctuation_as_text(index):
+    assert [row['meeting'] for row in index.tasks(text='gateway-v2')] == ['m1']
+    assert [row['meeting'] for row in index.tasks(text="Marcus's")] == ['m2']
+    assert [row['meeting'] for row in index.tasks(text='run*')] == ['m1']
+    assert index.tasks(text='AND OR NOT "') == []
+    assert [row['meeting'] for row in index.meetings(text='rollout')] == ['m1']
+
+
+def test_questions_and_turns(index):
+    assert index.questions(responder='marcus')[0]['answer'] == 'Not yet.'
+    turns = index.turns(speaker='Marcus', text='Friday')
+    assert [(row['meeting'], row['utterance']) for row in turns] == [('m2', 'Yes, by Friday.'),
+                                                                     ('m1', 'Yes, by Friday.')]
+    # "Date:" is a header line, not a speaker.
+    assert index.turns(speaker='Date') == []
+
+
+def test_scheduled_meetings_by_scheduler(index):
+    rows = index.scheduled_meetings(scheduler='sarah')
+    assert [(row['meeting'], row['scheduler'], row['purpose']) for row in rows] == [('m1', 'Sarah', 'Design review')]
+    assert [row['purpose'] for row in index.scheduled_meetings(scheduler='Elena')] == ['Budget sync']
+    assert len(index.scheduled_meetings()) == 3
+
+
+def test_scheduler_lookup_uses_an_index(index):
+    plan = index._conn.execute(
+        "EXPLAIN QUERY PLAN SELECT id FROM scheduled_meetings WHERE scheduler = ?", ('Sarah',)
+    ).fetchall()
+    assert any('idx_scheduled_meetings_scheduler' in row['detail'] for row in plan)
+
+
+def test_meeting_filters(index):
+    assert [row['meeting'] for row in index.meetings()] == ['m2', 'm1']
+    assert [row['meeting'] for row in index.meetings(last=1)] == ['m2']
+    assert [row['meeting'] for row in index.meetings(until='2024-01-31')] == ['m1']
+    assert [row['meeting'] for row in index.meetings(speaker='elena')] == ['m2', 'm1']
+
+
+def test_reindexing_replaces_a_meeting(index):
+    index.add_record(make_record('m1', '2024-01-10', 0.4, tasks=[{'assignee': 'Tom', 'task': 'New task'}]))
+    assert index.stats()['meetings'] == 2
+    assert [row['task'] for row in index.tasks() if row['meeting'] == 'm1'] == ['New task']
+    assert index.scheduled_meetings(scheduler='Sarah') == []
+
+
+def test_index_without_a_scheduler_column_is_upgraded(tmp_path):
+    path = str(tmp_path / 'old.db')
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE scheduled_meetings (id INTEGER PRIMARY KEY, meeting_id INTEGER NOT NULL,"
+                 " location TEXT, datetime TEXT, purpose TEXT)")
+    conn.commit()
+    conn.close()
+
+    index = MeetingIndex(path)
+    index.add_record(make_record('m1', '2024-01-10', 0.2, meetings=[{'scheduler': 'Sarah', 'purpose': 'Sync'}]))
+    assert [row['purpose'] for row in index.scheduled_meetings(scheduler='SARAH')] == ['Sync']
+
+
+def test_query_command_filters_by_scheduler(index, capsys):
+    args = main.build_arg_parser().parse_args(['query', 'scheduled', '--db', index.path, '--scheduler', 'Elena',
+                                               '--json'])
+    rows = main.query_index(args)
+    assert [row['purpose'] for row in rows] == ['Budget sync']
+    assert '"scheduler": "Elena"' in capsys.readouterr().out
\ No newline at end of file
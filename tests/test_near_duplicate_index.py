@@ -0,0 +1,128 @@
+"""MinHash signatures, the LSH index and near-duplicate reuse in AnalyzeMeetingUseCase."""
+import asyncio
+import random
+
+import pytest
+
+from Core.Domain.domain_entities import AuditResult
+from Infrastructure.Cache.near_duplicate_index import MinHasher, NearDuplicateIndex, optimal_bands
+from Infrastructure.LLM.fake_provider import FakeLLMAnalyzer
+from src.use_cases.analyze_meeting import AnalyzeMeetingUseCase
+
+WORDS = ("gateway payment outage retry service deploy rollback monitor alert owner deadline budget vendor "
+         "contract review sprint ticket release database migration latency capacity incident").split()
+
+
+def make_transcript(lines=40, seed=0, speakers=("Sarah", "Marcus", "Elena")):
+    rng = random.Random(seed)
+    return '\n'.join(f"{speakers[i % len(speakers)]}: {' '.join(rng.choice(WORDS) for _ in range(12))}."
+                     for i in range(lines))
+
+
+def make_result():
+    return AuditResult(risk_score=0.6, risk_factors=['Outage'], recommendations=[], summary='Review.',
+                       confidence=0.9, raw_report={'questions': [], 'meetings': [],
+                                                   'tasks': [{'assigner': 'Sarah', 'assignee': 'Marcus',
+                                                              'task': 'Rewrite the service'}]})
+
+
+def jaccard(first, second):
+    return len(first & second) / len(first | second)
+
+
+def test_signature_similarity_estimates_jaccard():
+    hasher = MinHasher(num_perm=256)
+    first = make_transcript(seed=1)
+    lines = first.splitlines()
+    second = '\n'.join(lines[:30] + make_transcript(lines=10, seed=2).splitlines())
+    expected = jaccard(hasher.shingles(first), hasher.shingles(second))
+    estimate = hasher.similarity(hasher.signature(first), hasher.signature(second))
+    assert estimate == pytest.approx(expected, abs=0.1)
+
+
+def test_formatting_does_not_change_the_signature():
+    hasher = MinHasher()
+    transcript = make_transcript()
+    reformatted = '\n\n'.join('  ' + line.upper().replace('.', '!') for line in transcript.splitlines())
+    assert hasher.signature(transcript) == hasher.signature(reformatted)
+
+
+def test_non_latin_transcripts_are_told_apart():
+    hasher = MinHasher()
+    first = "Марина: Давайте обсудим риски миграции базы данных до пятницы и назначим ответственных."
+    second = "Иван: Бюджет проекта превышен, поставщик задерживает контракт, релиз переносится на месяц."
+    assert hasher.similarity(hasher.signature(first), hasher.signature(second)) < 0.2
+
+
+def test_optimal_bands_fit_the_signature():
+    for threshold in (0.5, 0.8, 0.9, 0.95):
+        bands, rows = optimal_bands(128, threshold)
+        assert bands * rows <= 128
+        # A pair exactly at the threshold is almost always a candidate.
+        assert 1 - (1 - threshold ** rows) ** bands > 0.95
+
+
+def test_near_duplicate_is_found_and_distinct_transcript_is_not(tmp_path):
+    index = NearDuplicateIndex(str(tmp_path / 'index.db'), threshold=0.8)
+    transcript = make_transcript()
+    doc_id = index.add(transcript, make_result())
+    assert doc_id == NearDuplicateIndex.make_doc_id(transcript)
+
+    lines = transcript.splitlines()
+    lines[5] = "Sarah: one line changed in the export."
+    match = index.find('\n'.join(lines))
+    assert match is not None
+    assert match.doc_id == doc_id
+    assert match.similarity >= 0.8
+    assert match.result == make_result()
+
+    assert index.find(make_transcript(seed=7)) is None
+    assert (index.stats()['hits'], index.stats()['misses']) == (1, 1)
+
+
+def test_short_transcripts_are_skipped(tmp_path):
+    index = NearDuplicateIndex(str(tmp_path / 'index.db'))
+    assert index.add("Sarah: Ok.", make_result()) is None
+    assert index.find("Sarah: Ok.") is None
+    assert index.stats()['skipped'] == 1
+    assert index.stats()['entries'] == 0
+
+
+def test_namespaces_never_match_each_other(tmp_path):
+    path = str(tmp_path / 'index.db')
+    transcript = make_transcript()
+    NearDuplicateIndex(path, namespace='gpt-4|v1').add(transcript, make_result())
+    assert NearDuplicateIndex(path, namespace='gpt-4|v2').find(transcript) is None
+    assert NearDuplicateIndex(path, namespace='gpt-4|v1').find(transcript) is not None
+
+
+def test_index_rejects_a_different_signature_layout(tmp_path):
+    path = str(tmp_path / 'index.db')
+    NearDuplicateIndex(path, num_perm=64).close()
+    with pytest.raises(ValueError):
+        NearDuplicateIndex(path, num_perm=128)
+
+
+def test_use_case_reuses_near_duplicates_only_if_participants_match(tmp_path):
+    analyzer = FakeLLMAnalyzer(response={'risk_analysis': {'score': 0.6},
+                                         'meeting_report': {'tasks': [{'assigner': 'Sarah', 'assignee': 'Marcus',
+                                                                       'task': 'Rewrite the service'}]}})
+    index = NearDuplicateIndex(str(tmp_path / 'index.db'), threshold=0.8)
+    use_case = AnalyzeMeetingUseCase(analyzer, near_duplicate_index=index)
+    lines = make_transcript(speakers=("Sarah", "Elena")).splitlines()
+    lines[3] = "Marcus: I will rewrite the service."
+    transcript = '\n'.join(lines)
+    lines[5] = "Sarah: a small edit."
+    edited = '\n'.join(lines)
+    renamed = edited.replace("Marcus", "Tom")
+
+    first = asyncio.run(use_case.execute(transcript))
+    second = asyncio.run(use_case.execute(edited))
+    third = asyncio.run(use_case.execute(renamed))
+
+    assert 'near_duplicate_of' not in first
+    assert second['near_duplicate_of'] == NearDuplicateIndex.make_doc_id(transcript)
+    # The reused report assigns a task to Marcus, who is not in the renamed transcript.
+    assert 'near_duplicate_of' not in third
+    assert use_case.near_duplicates_rejected == 1
+    assert analyzer.calls == 2
\ No newline at end of file
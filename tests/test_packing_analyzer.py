@@ -0,0 +1,117 @@
+"""PackingLLMAnalyzer bundles short transcripts and falls back for the ones a pack did not deliver."""
+import asyncio
+import json
+
+import pytest
+
+from Core.Domain.domain_entities import AuditResult
+from Infrastructure.LLM.fake_provider import DEFAULT_RESPONSE, FakeLLMAnalyzer, FakeLLMProvider, FakeProviderRegistry
+from Infrastructure.LLM.packing_analyzer import PackingLLMAnalyzer
+from Infrastructure.LLM.provider_pool import ProviderPool
+from Infrastructure.LLM.spoon_client import PACKED_STATIC_PROMPT_TOKENS, STATIC_PROMPT_TOKENS, SpoonLLMClient
+from Infrastructure.Parsers.token_counter import estimate_tokens
+
+STANDUPS = [f"{name}: I will ship ticket {i} by Friday." for i, name in enumerate(("Sarah", "Marcus", "Elena"))]
+
+
+def packed_result(transcript):
+    return AuditResult(risk_score=0.2, risk_factors=[], recommendations=[], summary=f"Packed: {transcript}",
+                       confidence=0.9)
+
+
+class FakePackingClient:
+    """Answers packed requests with ``answer(transcripts)``, by default one result per transcript."""
+
+    def __init__(self, answer=None):
+        self.answer = answer or (lambda transcripts: [packed_result(transcript) for transcript in transcripts])
+        self.packs = []
+        self.config = {'provider': 'fake', 'model': 'fake'}
+
+    async def analyze_packed(self, transcripts):
+        self.packs.append(list(transcripts))
+        return self.answer(transcripts)
+
+
+def analyze_all(analyzer, transcripts):
+    async def run():
+        return await asyncio.gather(*(analyzer.analyze(transcript) for transcript in transcripts))
+
+    return asyncio.run(run())
+
+
+def test_concurrent_short_transcripts_share_one_request():
+    client, fallback = FakePackingClient(), FakeLLMAnalyzer()
+    analyzer = PackingLLMAnalyzer(client, fallback=fallback)
+    results = analyze_all(analyzer, STANDUPS)
+    assert client.packs == [STANDUPS]
+    assert [result.summary for result in results] == [f"Packed: {transcript}" for transcript in STANDUPS]
+    assert fallback.calls == 0
+    stats = analyzer.stats()
+    assert (stats['packed_requests'], stats['packed_transcripts']) == (1, 3)
+    assert stats['prompt_tokens_saved'] == 3 * STATIC_PROMPT_TOKENS - PACKED_STATIC_PROMPT_TOKENS
+
+
+def test_missing_analyses_fall_back_and_never_count_as_savings():
+    client = FakePackingClient(lambda transcripts: [packed_result(transcripts[0])] + [None] * (len(transcripts) - 1))
+    fallback = FakeLLMAnalyzer()
+    analyzer = PackingLLMAnalyzer(client, fallback=fallback)
+    results = analyze_all(analyzer, STANDUPS)
+    assert results[0].summary == f"Packed: {STANDUPS[0]}"
+    assert fallback.calls == 2
+    stats = analyzer.stats()
+    assert (stats['packed_transcripts'], stats['fallbacks']) == (1, 2)
+    # One delivered result does not make up for the longer packed prompt.
+    assert STATIC_PROMPT_TOKENS < PACKED_STATIC_PROMPT_TOKENS
+    assert stats['prompt_tokens_saved'] == 0
+
+
+def test_a_failed_pack_falls_back_for_every_transcript():
+    def fail(transcripts):
+        raise ConnectionError("provider down")
+
+    fallback = FakeLLMAnalyzer()
+    analyzer = PackingLLMAnalyzer(FakePackingClient(fail), fallback=fallback)
+    analyze_all(analyzer, STANDUPS)
+    assert fallback.calls == 3
+    assert (analyzer.failed_packs, analyzer.packed_requests, analyzer.prompt_tokens_saved) == (1, 0, 0)
+
+
+def test_long_transcripts_and_lone_ones_are_sent_alone():
+    client, fallback = FakePackingClient(), FakeLLMAnalyzer()
+    analyzer = PackingLLMAnalyzer(client, fallback=fallback, max_pack_tokens=40)
+    long_transcript = "Sarah: " + "We reviewed the rollout plan in detail. " * 10
+    analyze_all(analyzer, [long_transcript])
+    analyze_all(analyzer, [STANDUPS[0]])
+    assert client.packs == []
+    assert fallback.calls == 2
+    assert analyzer.single_transcripts == 2
+
+
+def test_packs_are_limited_by_items_and_tokens():
+    client = FakePackingClient()
+    analyzer = PackingLLMAnalyzer(client, max_items=2, max_wait=10.0)
+    analyze_all(analyzer, STANDUPS + STANDUPS[:1])
+    assert [len(pack) for pack in client.packs] == [2, 2]
+
+    client = FakePackingClient()
+    tokens = max(estimate_tokens(transcript) for transcript in STANDUPS)
+    analyzer = PackingLLMAnalyzer(client, max_pack_tokens=2 * tokens, max_transcript_tokens=tokens)
+    analyze_all(analyzer, STANDUPS + STANDUPS)
+    assert [len(pack) for pack in client.packs] == [2, 2, 2]
+
+
+def test_packed_response_with_one_valid_entry():
+    pytest.importorskip("spoon_ai")
+    analysis = json.loads(json.dumps(DEFAULT_RESPONSE))
+    provider = FakeLLMProvider(responder=lambda messages: {'transcripts': {'T1': analysis, 'T2': 'not an analysis'}})
+    pool = ProviderPool(registry=FakeProviderRegistry(provider))
+    client = SpoonLLMClient({'provider': 'fake', 'model': 'fake'}, pool=pool)
+    results = asyncio.run(client.analyze_packed(STANDUPS))
+    assert results[0] is not None
+    assert results[1:] == [None, None]
+
+    fallback = FakeLLMAnalyzer()
+    analyzer = PackingLLMAnalyzer(client, fallback=fallback)
+    analyze_all(analyzer, STANDUPS)
+    assert fallback.calls == 2
+    assert analyzer.stats()['prompt_tokens_saved'] == 0
\ No newline at end of file
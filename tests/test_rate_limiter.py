@@ -0,0 +1,153 @@
+"""Rate limiting, retries and error classification against FakeLLMProvider."""
+import asyncio
+import time
+
+import pytest
+
+from Core.Domain.exceptions import PermanentLLMError, RateLimitError, TransientLLMError
+from Infrastructure.LLM.fake_provider import FakeLLMProvider, FakeProviderError, FakeProviderRegistry
+from Infrastructure.LLM.provider_pool import ProviderPool
+from Infrastructure.LLM.rate_limiter import AdaptiveRateLimiter, RetryPolicy, TokenBucket, classify_error
+from Infrastructure.LLM.spoon_client import SpoonLLMClient
+
+
+def make_client(provider, rate_limiter=None, max_attempts=5):
+    pool = ProviderPool(registry=FakeProviderRegistry(provider))
+    return SpoonLLMClient({'provider': 'fake', 'model': 'fake'}, pool=pool, rate_limiter=rate_limiter,
+                          retry_policy=RetryPolicy(max_attempts=max_attempts, base_delay=0.001, jitter=False))
+
+
+def chat(client, provider, tokens=100):
+    return asyncio.run(client._chat_with_retries(provider, [], tokens))
+
+
+def test_classify_error_maps_status_codes():
+    throttled = classify_error(FakeProviderError(429, retry_after=2))
+    assert isinstance(throttled, RateLimitError)
+    assert throttled.retry_after == 2.0
+    assert type(classify_error(FakeProviderError(503))) is TransientLLMError
+    assert type(classify_error(FakeProviderError(401))) is PermanentLLMError
+    assert type(classify_error(FakeProviderError(400))) is PermanentLLMError
+
+
+def test_classify_error_without_status_code():
+    assert type(classify_error(asyncio.TimeoutError())) is TransientLLMError
+    assert type(classify_error(ConnectionError("reset"))) is TransientLLMError
+    assert isinstance(classify_error(RuntimeError("Rate limit reached")), RateLimitError)
+    assert type(classify_error(ValueError("unsupported model"))) is PermanentLLMError
+
+
+def test_retry_policy_backs_off_exponentially_and_honors_retry_after():
+    policy = RetryPolicy(base_delay=1.0, max_delay=5.0, jitter=False)
+    assert [policy.delay(attempt) for attempt in range(4)] == [1.0, 2.0, 4.0, 5.0]
+    assert policy.delay(0, retry_after=3.0) == 3.0
+
+
+def test_aimd_concurrency_limit():
+    limiter = AdaptiveRateLimiter(max_concurrency=8, min_concurrency=2)
+    limiter.on_throttle()
+    assert limiter.limit == 4.0
+    limiter.on_throttle()
+    limiter.on_throttle()
+    assert limiter.limit == 2.0
+    for _ in range(4):
+        limiter.on_success()
+    assert 2.0 < limiter.limit < 4.0
+    for _ in range(200):
+        limiter.on_success()
+    assert limiter.limit == 8.0
+
+
+def test_concurrency_limit_bounds_calls_in_flight():
+    provider = FakeLLMProvider(latency=0.02)
+    client = make_client(provider, AdaptiveRateLimiter(max_concurrency=2))
+
+    async def run():
+        await asyncio.gather(*(client._chat_with_retries(provider, [], 10) for _ in range(8)))
+
+    asyncio.run(run())
+    assert provider.calls == 8
+    assert provider.peak_in_flight == 2
+
+
+def test_token_bucket_waits_for_refill():
+    async def run():
+        bucket = TokenBucket(rate_per_minute=6000)  # 100 tokens per second
+        await bucket.acquire(6000)
+        started = time.monotonic()
+        await bucket.acquire(20)
+        return time.monotonic() - started
+
+    assert 0.15 <= asyncio.run(run()) < 1.0
+
+
+def test_request_and_token_budgets_are_separate():
+    async def run():
+        limiter = AdaptiveRateLimiter(tokens_per_minute=6000)
+        assert limiter.request_bucket is None
+        started = time.monotonic()
+        for _ in range(50):
+            # Calls without a token estimate only count against the request budget, which is unlimited.
+            async with limiter.slot(0):
+                pass
+        async with limiter.slot(6000):
+            pass
+        fast = time.monotonic() - started
+        async with limiter.slot(20):
+            pass
+        return fast, time.monotonic() - started - fast
+
+    fast, slow = asyncio.run(run())
+    assert fast < 0.1
+    assert slow >= 0.15
+
+
+def test_transient_failure_recovers():
+    provider = FakeLLMProvider(failures=[FakeProviderError(503), FakeProviderError(502)])
+    limiter = AdaptiveRateLimiter(max_concurrency=4)
+    client = make_client(provider, limiter)
+    response = chat(client, provider)
+    assert response.content
+    assert provider.calls == 3
+    assert client.retries == 2
+    # Server errors are not throttling, so the concurrency limit stays where it was.
+    assert limiter.throttled == 0
+    assert limiter.limit == 4.0
+
+
+def test_rate_limit_honors_retry_after_and_halves_concurrency():
+    provider = FakeLLMProvider(failures=[FakeProviderError(429, retry_after=0.2)])
+    limiter = AdaptiveRateLimiter(requests_per_minute=6000, max_concurrency=4)
+    client = make_client(provider, limiter)
+    started = time.monotonic()
+    chat(client, provider)
+    assert time.monotonic() - started >= 0.2
+    assert provider.calls == 2
+    assert limiter.throttled == 1
+    assert limiter.limit == pytest.approx(2.0 + 1 / 2.0)
+
+
+def test_permanent_failure_is_not_retried():
+    provider = FakeLLMProvider(failures=[FakeProviderError(401, "invalid api key")])
+    client = make_client(provider, AdaptiveRateLimiter())
+    with pytest.raises(PermanentLLMError, match="invalid api key"):
+        chat(client, provider)
+    assert provider.calls == 1
+    assert client.retries == 0
+
+
+def test_transient_failure_gives_up_after_max_attempts():
+    provider = FakeLLMProvider(failures=[FakeProviderError(503)] * 5)
+    client = make_client(provider, max_attempts=3)
+    with pytest.raises(TransientLLMError):
+        chat(client, provider)
+    assert provider.calls == 3
+
+
+def test_analyze_retries_end_to_end():
+    pytest.importorskip("spoon_ai")
+    provider = FakeLLMProvider(failures=[FakeProviderError(429, retry_after=0.01), FakeProviderError(503)])
+    client = make_client(provider, AdaptiveRateLimiter())
+    result = asyncio.run(client.analyze("Sarah: Can you send the report by Friday?\nMarcus: Yes."))
+    assert result.risk_score == 0.5
+    assert provider.calls == 3
\ No newline at end of file
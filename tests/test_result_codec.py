@@ -0,0 +1,106 @@
+"""result_codec round trips are loss-free, with or without orjson and msgpack."""
+import copy
+
+import pytest
+
+import report_generator
+from Core.Domain.domain_entities import AnalysisRecord, AuditResult, MeetingReport, TaskAssignment
+from Infrastructure.Storage import result_codec
+
+REPORT = {
+    'questions': [
+        {'questioner': 'Sarah', 'question': 'Is the fix deployed?'},
+        {'questioner': 'Alex', 'responder': 'Sarah', 'question': 'Why?', 'answer': 'A leak.', 'topic': 'gateway'}
+    ],
+    'meetings': [
+        {'datetime': 'Friday 10:00', 'purpose': 'Follow-up'},
+        {'scheduler': 'Sarah', 'location': None, 'datetime': '2024-05-01', 'purpose': 'Retro'}
+    ],
+    'tasks': [
+        {'assigner': 'Sarah', 'assignee': 'Marcus', 'task': 'Rewrite the service'},
+        {'assignee': 'Elena', 'task': 'Write the runbook', 'deadline': None, 'status': 'open'}
+    ]
+}
+
+
+def make_result():
+    audit_result = AuditResult(risk_score=0.7, risk_factors=['Outage'], recommendations=['Add monitoring'],
+                               summary='Outage review.', confidence=0.85, raw_report=copy.deepcopy(REPORT))
+    return {
+        'test_name': 'meeting-1',
+        'success': True,
+        'audit_result': audit_result,
+        'cost_analysis': {'base_cost': 1000.0, 'risk_adjustment': 700.0, 'recommendation_cost': 50.0,
+                          'total_cost': 1750.0, 'cost_breakdown': {'risk_score': 0.7, 'num_risk_factors': 1,
+                                                                    'num_recommendations': 1}},
+        'input_transcript': 'Sarah: Is the fix deployed?',
+        'latency_seconds': 1.25
+    }
+
+
+def test_report_round_trip_keeps_exactly_the_keys_sent():
+    report = result_codec.report_from_dict(copy.deepcopy(REPORT))
+    assert result_codec.report_to_dict(report) == REPORT
+
+
+def test_unknown_keys_go_to_extra_and_missing_ones_stay_unset():
+    report = result_codec.report_from_dict(REPORT)
+    task = report.tasks[1]
+    assert task.extra == {'status': 'open'}
+    assert task.assigner is None
+    assert 'assigner' not in result_codec.report_to_dict(report)['tasks'][1]
+    # An explicit null is kept as one.
+    assert result_codec.report_to_dict(report)['tasks'][1]['deadline'] is None
+
+
+def test_items_built_in_code_leave_out_unset_fields():
+    report = MeetingReport(tasks=[TaskAssignment(assignee='Marcus', task='Rewrite the service')])
+    assert result_codec.report_to_dict(report) == {
+        'questions': [], 'meetings': [], 'tasks': [{'assignee': 'Marcus', 'task': 'Rewrite the service'}]
+    }
+
+
+def test_plain_string_items_become_their_text_field():
+    report = result_codec.report_from_dict({'tasks': ['Rewrite the service'], 'questions': None})
+    assert report.tasks[0].task == 'Rewrite the service'
+    assert report.questions == []
+
+
+@pytest.mark.parametrize("use_orjson", [False, True])
+def test_json_record_round_trip(monkeypatch, use_orjson):
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(result_codec, 'orjson', None)
+    record = result_codec.record_from_result(make_result())
+    decoded = result_codec.decode_json(result_codec.encode_json(record))
+    assert decoded == record
+    assert decoded.audit_result.raw_report == REPORT
+    assert result_codec.record_to_dict(decoded) == result_codec.record_to_dict(record)
+
+
+def test_msgpack_record_round_trip():
+    pytest.importorskip("msgpack")
+    record = result_codec.record_from_result(make_result())
+    assert result_codec.decode_msgpack(result_codec.encode_msgpack(record)) == record
+
+
+def test_slim_records_leave_the_transcript_out():
+    record = result_codec.record_from_result(make_result(), slim=True)
+    assert 'input_transcript' not in result_codec.record_to_dict(record)
+
+
+def test_failed_results_have_no_audit_result():
+    record = result_codec.record_from_result({'test_name': 'x', 'success': False, 'error': 'timeout',
+                                              'audit_result': 'Error: timeout'})
+    assert result_codec.record_to_dict(record) == {'test_name': 'x', 'success': False, 'error': 'timeout'}
+    assert isinstance(result_codec.decode_json(result_codec.encode_json(record)), AnalysisRecord)
+
+
+def test_report_shows_defaults_for_fields_the_model_did_not_send():
+    record = result_codec.record_from_result(make_result())
+    meeting = result_codec.loads_json(result_codec.encode_json(record))
+    texts = [text for text, _ in report_generator._meeting_body_blocks(meeting)]
+    # The first meeting and the first task were sent without a location and a deadline.
+    assert [text for text in texts if text.startswith("Location:")][0] == "Location: Not specified"
+    assert [text for text in texts if text.startswith("Deadline:")][0] == "Deadline: No deadline"
\ No newline at end of file
@@ -0,0 +1,36 @@
+"""SimpleTextParser produces exactly what the original multi-pass parser did."""
+import pytest
+
+from bench_parser import legacy_parse_transcript, make_transcript
+from Infrastructure.Parsers.simple_text_parser import SimpleTextParser
+
+EDGE_CASES = [
+    "",
+    "\n\n  \n",
+    "One line without a newline",
+    "Sarah: Is there a risk?\r\nAlex: No, the fix is done.\r\n",
+    "  indented\n\ttabbed line\n\nDOUBLE   spaced   words  ",
+    "Марина: Обсудим риск? Tom: The DECISION is final!!! ...and then?",
+    "do\ntask\naction step\nmeeting risk solution decision",
+]
+
+
+@pytest.mark.parametrize("text", EDGE_CASES)
+def test_matches_legacy_parser_on_edge_cases(text):
+    assert SimpleTextParser().parse_transcript(text) == legacy_parse_transcript(text)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_matches_legacy_parser_on_synthetic_transcripts(seed):
+    text = make_transcript(20_000, seed=seed)
+    assert SimpleTextParser().parse_transcript(text) == legacy_parse_transcript(text)
+
+
+def test_parsed_fields_match_legacy_individually():
+    text = make_transcript(5_000, seed=42)
+    parsed = SimpleTextParser().parse_transcript(text)
+    legacy = legacy_parse_transcript(text)
+    assert parsed['paragraphs'] == legacy['paragraphs']
+    assert parsed['sentences'] == legacy['sentences']
+    assert parsed['structured_content'] == legacy['structured_content']
+    assert parsed.word_count == legacy['word_count']
\ No newline at end of file
@@ -0,0 +1,58 @@
+"""AnalyzeMeetingUseCase.stream keeps going when a segment's analysis fails."""
+import asyncio
+
+from Core.Domain.domain_entities import AuditResult
+from Core.Domain.exceptions import TransientLLMError
+from src.use_cases.analyze_meeting import AnalyzeMeetingUseCase
+
+
+class FlakyAdapter:
+    """Fails the first ``failures`` calls, then reports one task per analyzed segment."""
+
+    def __init__(self, failures=1):
+        self.failures = failures
+        self.segments = []
+
+    async def analyze(self, transcript: str) -> AuditResult:
+        self.segments.append(transcript)
+        if self.failures:
+            self.failures -= 1
+            raise TransientLLMError("503 Service Unavailable")
+        tasks = [{'assigner': 'Sarah', 'assignee': line.split(':')[0], 'task': line, 'deadline': None}
+                 for line in transcript.splitlines()]
+        return AuditResult(risk_score=0.4, risk_factors=[], recommendations=[], summary='', confidence=1.0,
+                           raw_report={'questions': [], 'meetings': [], 'tasks': tasks})
+
+
+async def lines_of(lines):
+    for line in lines:
+        yield line
+
+
+def run_stream(adapter, lines, **kwargs):
+    async def collect():
+        use_case = AnalyzeMeetingUseCase(adapter)
+        return [update async for update in use_case.stream(lines_of(lines), **kwargs)]
+
+    return asyncio.run(collect())
+
+
+def test_failed_segment_is_reported_and_retried_with_the_next_one():
+    adapter = FlakyAdapter(failures=1)
+    lines = ["Marcus: first", "Elena: second", "Tom: third", "Ana: fourth"]
+    updates = run_stream(adapter, lines, cadence_lines=2, context_lines=0)
+
+    assert updates[0].error == "TransientLLMError: 503 Service Unavailable"
+    assert updates[0].new_tasks == []
+    assert updates[1].error is None
+    # The failed lines went out again together with the next segment.
+    assert adapter.segments[1] == "\n".join(lines)
+    assert [task['assignee'] for task in updates[1].new_tasks] == ["Marcus", "Elena", "Tom", "Ana"]
+    assert updates[-1].is_final
+
+
+def test_failed_final_segment_still_ends_the_stream():
+    adapter = FlakyAdapter(failures=5)
+    updates = run_stream(adapter, ["Marcus: first", "Elena: second"], cadence_lines=10)
+    assert updates[-1].is_final
+    assert updates[-1].error is not None
\ No newline at end of file
@@ -0,0 +1,126 @@
+"""TranscriptNormalizer and the restoring of speaker names in the results."""
+import asyncio
+
+import pytest
+
+from Core.Domain.domain_entities import AuditResult
+from Infrastructure.LLM.fake_provider import FakeLLMProvider, FakeProviderRegistry
+from Infrastructure.LLM.provider_pool import ProviderPool
+from Infrastructure.LLM.spoon_client import SpoonLLMClient, restore_result_speaker_names, restore_speaker_names
+from Infrastructure.Parsers.transcript_normalizer import OMISSION_MARKER, TranscriptNormalizer
+
+TRANSCRIPT = """Meeting transcript:
+Date: 2024-04-12
+[Recording started]
+Sarah Johnson:   Um, so the   payment gateway went down, uh, again.
+Marcus Chen: Mm-hmm.
+Sarah Johnson: Marcus, can you rewrite the retry logic by Friday?
+Marcus Chen: Yes.
+Sarah Johnson: Great. Elena will own the runbook.
+Marcus Chen: Um, I'll pair with Elena on it."""
+
+SPEAKERS = {'S1': 'Sarah Johnson', 'S2': 'Marcus Chen'}
+
+
+def test_filler_boilerplate_and_whitespace_are_removed():
+    normalized = TranscriptNormalizer(compact_speakers=False).normalize(TRANSCRIPT)
+    lines = normalized.text.splitlines()
+    assert lines[0] == "Date: 2024-04-12"
+    assert "Sarah Johnson: So the payment gateway went down again." in lines
+    assert "Marcus Chen: Yes." in lines
+    assert not any("Mm-hmm" in line or "Recording" in line for line in lines)
+    assert normalized.dropped_lines == 3
+    assert normalized.tokens_saved > 0
+
+
+def test_recurring_speakers_get_ids_and_headers_are_left_alone():
+    normalized = TranscriptNormalizer().normalize(TRANSCRIPT)
+    lines = normalized.text.splitlines()
+    assert normalized.speakers == SPEAKERS
+    assert lines[0] == "Speakers: S1=Sarah Johnson; S2=Marcus Chen"
+    assert lines[1] == "Date: 2024-04-12"
+    assert "S2: Yes." in lines
+    assert not any(line.startswith("Sarah Johnson:") for line in lines)
+
+
+def test_ids_are_not_used_when_the_legend_costs_more_than_it_saves():
+    normalized = TranscriptNormalizer().normalize("Al: Hi\nBo: Hello\nAl: Bye\nBo: Bye")
+    assert normalized.speakers == {}
+    assert normalized.text == "Al: Hi\nBo: Hello\nAl: Bye\nBo: Bye"
+
+
+def test_token_budget_keeps_both_ends_of_the_meeting():
+    transcript = '\n'.join(f"Speaker {i % 2}: Line number {i} of the meeting." for i in range(200))
+    normalized = TranscriptNormalizer(token_budget=200, compact_speakers=False).normalize(transcript)
+    lines = normalized.text.splitlines()
+    assert normalized.truncated
+    assert normalized.tokens_after <= 200
+    assert lines[0].endswith("Line number 0 of the meeting.")
+    assert lines[-1].endswith("Line number 199 of the meeting.")
+    omitted = 200 - (len(lines) - 1)
+    assert OMISSION_MARKER.format(count=omitted) in lines
+
+
+def test_restore_replaces_ids_in_every_string():
+    report = {
+        'tasks': [{'assigner': 'S1', 'assignee': 'S2', 'task': 'S2 will rewrite the retry logic', 'deadline': None}],
+        'questions': [{'questioner': 'S1', 'question': 'Can S2 do it?', 'answer': 'Yes, with S10'}]
+    }
+    restored = restore_speaker_names(report, SPEAKERS)
+    assert restored['tasks'][0] == {'assigner': 'Sarah Johnson', 'assignee': 'Marcus Chen',
+                                    'task': 'Marcus Chen will rewrite the retry logic', 'deadline': None}
+    assert restored['questions'][0]['question'] == 'Can Marcus Chen do it?'
+    # Only whole IDs of the legend are replaced.
+    assert restored['questions'][0]['answer'] == 'Yes, with S10'
+
+
+def test_restore_result_covers_the_risk_analysis():
+    result = AuditResult(risk_score=0.6, risk_factors=['S2 owns the gateway alone'],
+                         recommendations=['Pair S2 with Elena'], summary='S1 asked S2 for a rewrite.',
+                         confidence=0.8, raw_report={'meetings': [{'scheduler': 'S1', 'purpose': 'Review with S2'}]})
+    restore_result_speaker_names(result, SPEAKERS)
+    assert result.summary == 'Sarah Johnson asked Marcus Chen for a rewrite.'
+    assert result.risk_factors == ['Marcus Chen owns the gateway alone']
+    assert result.recommendations == ['Pair Marcus Chen with Elena']
+    assert result.raw_report == {'meetings': [{'scheduler': 'Sarah Johnson', 'purpose': 'Review with Marcus Chen'}]}
+
+
+ID_RESPONSE = {
+    "risk_analysis": {"score": 0.6, "risk_factors": ["S2 is the only gateway expert"],
+                      "recommendations": ["Let S1 find a backup for S2"], "summary": "S1 asked S2 for a rewrite.",
+                      "confidence": 0.8},
+    "meeting_report": {"questions": [], "meetings": [],
+                       "tasks": [{"assigner": "S1", "assignee": "S2", "task": "S2 rewrites the retry logic",
+                                  "deadline": "Friday"}]}
+}
+
+
+def make_client():
+    provider = FakeLLMProvider(response=ID_RESPONSE)
+    pool = ProviderPool(registry=FakeProviderRegistry(provider))
+    return SpoonLLMClient({'provider': 'fake', 'model': 'fake'}, pool=pool, normalizer=TranscriptNormalizer())
+
+
+def assert_names_restored(result):
+    assert result.summary == "Sarah Johnson asked Marcus Chen for a rewrite."
+    assert result.risk_factors == ["Marcus Chen is the only gateway expert"]
+    assert result.recommendations == ["Let Sarah Johnson find a backup for Marcus Chen"]
+    assert result.raw_report['tasks'][0]['task'] == "Marcus Chen rewrites the retry logic"
+    assert result.raw_report['tasks'][0]['assignee'] == "Marcus Chen"
+
+
+def test_normalized_analysis_reports_real_names():
+    pytest.importorskip("spoon_ai")
+    assert_names_restored(asyncio.run(make_client().analyze(TRANSCRIPT)))
+
+
+def test_normalized_streamed_analysis_reports_real_names():
+    pytest.importorskip("spoon_ai")
+
+    async def run():
+        return [item async for item in make_client().analyze_stream(TRANSCRIPT)]
+
+    items = asyncio.run(run())
+    assert_names_restored(items[-1].result)
+    factors = [item.item for item in items if item.section == 'risk_factors']
+    assert factors == ["Marcus Chen is the only gateway expert"]
\ No newline at end of file
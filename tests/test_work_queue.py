@@ -0,0 +1,151 @@
+"""Leases, retries and idempotent results of the work queues, and QueueWorker on top of them."""
+import asyncio
+
+import pytest
+
+from Core.Domain.exceptions import PermanentLLMError
+from Infrastructure.LLM.fake_provider import FakeLLMAnalyzer
+from Infrastructure.Queue.local_redis import LocalRedis
+from Infrastructure.Queue.redis_work_queue import RedisWorkQueue
+from Infrastructure.Queue.sqlite_work_queue import SqliteWorkQueue
+from Infrastructure.Queue.work_items import make_job_id
+from Infrastructure.Storage.result_codec import decode_json
+from src.use_cases.analyze_meeting import AnalyzeMeetingUseCase
+from src.use_cases.queue_worker import QueueWorker
+
+# A negative lease is already expired when claim returns, as if the worker died at once.
+EXPIRED = -1.0
+
+
+@pytest.fixture(params=['sqlite', 'redis'])
+def queue(request, tmp_path):
+    if request.param == 'sqlite':
+        queue = SqliteWorkQueue(str(tmp_path / 'queue.db'))
+    else:
+        queue = RedisWorkQueue(LocalRedis(), namespace='test')
+    yield queue
+    queue.close()
+
+
+def test_enqueue_is_idempotent(queue):
+    assert queue.enqueue([('m1', 'Sarah: Hi.'), ('m2', 'Marcus: Hello.')]) == 2
+    assert queue.enqueue([('m1', 'Sarah: Hi.'), ('m3', 'Elena: Hey.')]) == 1
+    assert queue.stats()['pending'] == 3
+
+
+def test_a_leased_job_is_not_claimed_twice(queue):
+    queue.enqueue([('m1', 'Sarah: Hi.')])
+    item = queue.claim('w1', lease_seconds=60)
+    assert (item.job_id, item.name, item.attempts) == (make_job_id('m1', 'Sarah: Hi.'), 'm1', 1)
+    assert queue.claim('w2', lease_seconds=60) is None
+    assert (queue.stats()['pending'], queue.stats()['leased']) == (0, 1)
+
+
+def test_an_expired_lease_is_delivered_again(queue):
+    queue.enqueue([('m1', 'Sarah: Hi.')])
+    first = queue.claim('w1', lease_seconds=EXPIRED)
+    assert queue.stats()['pending'] == 1
+    second = queue.claim('w2', lease_seconds=60)
+    assert second.job_id == first.job_id
+    assert second.attempts == 2
+    # The first worker lost its lease and can no longer extend or release it.
+    assert not queue.extend_lease(first.job_id, 'w1', 60)
+    assert not queue.fail(first.job_id, 'w1', 'late', retry_delay=0)
+    assert queue.extend_lease(second.job_id, 'w2', 60)
+
+
+def test_expired_leases_fail_after_max_attempts(queue):
+    queue.enqueue([('m1', 'Sarah: Hi.')])
+    queue.claim('w1', lease_seconds=EXPIRED, max_attempts=2)
+    queue.claim('w2', lease_seconds=EXPIRED, max_attempts=2)
+    assert queue.claim('w3', lease_seconds=60, max_attempts=2) is None
+    assert queue.stats()['failed'] == 1
+    [(name, error)] = list(queue.failures())
+    assert name == 'm1'
+    assert 'Lease expired after 2 attempts' in error
+
+
+def test_only_the_first_result_of_a_job_is_kept(queue):
+    queue.enqueue([('m1', 'Sarah: Hi.')])
+    first = queue.claim('w1', lease_seconds=EXPIRED)
+    second = queue.claim('w2', lease_seconds=60)
+    assert queue.complete(second.job_id, 'w2', b'{"from": "w2"}')
+    # The worker whose lease expired finishes too late; its result is dropped.
+    assert not queue.complete(first.job_id, 'w1', b'{"from": "w1"}')
+    assert list(queue.results()) == [b'{"from": "w2"}']
+    assert queue.stats()['done'] == 1
+
+
+def test_transient_failures_are_retried_and_permanent_ones_are_not(queue):
+    queue.enqueue([('m1', 'Sarah: Hi.')])
+    first = queue.claim('w1', lease_seconds=60)
+    assert queue.fail(first.job_id, 'w1', 'TimeoutError', retry_delay=0)
+    second = queue.claim('w1', lease_seconds=60)
+    assert (second.job_id, second.attempts) == (first.job_id, 2)
+    assert not queue.fail(second.job_id, 'w1', 'PermanentLLMError: bad key')
+    assert queue.claim('w1', lease_seconds=60) is None
+    assert list(queue.failures()) == [('m1', 'PermanentLLMError: bad key')]
+
+
+def test_heartbeats_list_the_live_workers(queue):
+    queue.heartbeat('w1', processed=3)
+    assert [(worker['worker_id'], worker['processed']) for worker in queue.stats()['workers']] == [('w1', 3)]
+
+
+class FailingUseCase:
+    def __init__(self, error):
+        self.error = error
+        self.calls = 0
+
+    async def execute(self, transcript):
+        self.calls += 1
+        raise self.error
+
+
+def test_worker_drains_the_queue_into_result_records(queue):
+    queue.enqueue([(f"m{i}", f"Sarah: Meeting {i}.") for i in range(5)])
+    analyzer = FakeLLMAnalyzer()
+    worker = QueueWorker(queue, AnalyzeMeetingUseCase(analyzer), worker_id='w1', concurrency=2, poll_interval=0.01)
+    stats = asyncio.run(worker.run(exit_when_empty=True))
+    assert stats['processed'] == 5
+    assert analyzer.calls == 5
+    records = [decode_json(payload) for payload in queue.results()]
+    assert sorted(record.test_name for record in records) == [f"m{i}" for i in range(5)]
+    assert all(record.success and record.input_transcript for record in records)
+
+
+def test_worker_retries_transient_failures_up_to_max_attempts(queue):
+    queue.enqueue([('m1', 'Sarah: Hi.')])
+    use_case = FailingUseCase(TimeoutError('slow provider'))
+    worker = QueueWorker(queue, use_case, worker_id='w1', poll_interval=0.01, max_attempts=3, retry_delay=0)
+    stats = asyncio.run(worker.run(exit_when_empty=True))
+    assert use_case.calls == 3
+    assert (stats['retried'], stats['failed']) == (2, 1)
+    assert list(queue.failures()) == [('m1', 'TimeoutError: slow provider')]
+
+
+def test_worker_fails_permanent_errors_at_once(queue):
+    queue.enqueue([('m1', 'Sarah: Hi.')])
+    use_case = FailingUseCase(PermanentLLMError('invalid API key'))
+    worker = QueueWorker(queue, use_case, worker_id='w1', poll_interval=0.01, retry_delay=0)
+    stats = asyncio.run(worker.run(exit_when_empty=True))
+    assert use_case.calls == 1
+    assert stats['failed'] == 1
+
+
+def test_worker_counts_a_result_another_worker_stored_first(queue):
+    queue.enqueue([('m1', 'Sarah: Hi.')])
+    stale = queue.claim('w0', lease_seconds=EXPIRED)
+    use_case = AnalyzeMeetingUseCase(FakeLLMAnalyzer())
+    execute = use_case.execute
+
+    async def finish_stale_worker_first(transcript):
+        # The worker whose lease expired was only slow, and stores its result during the analysis.
+        assert queue.complete(stale.job_id, 'w0', b'{"from": "w0"}')
+        return await execute(transcript)
+
+    use_case.execute = finish_stale_worker_first
+    worker = QueueWorker(queue, use_case, worker_id='w1', poll_interval=0.01)
+    stats = asyncio.run(worker.run(exit_when_empty=True))
+    assert (stats['processed'], stats['duplicates']) == (0, 1)
+    assert list(queue.results()) == [b'{"from": "w0"}']
\ No newline at end of file